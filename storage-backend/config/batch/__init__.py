@@ -11,6 +11,13 @@ from config.batch.defaults import (
     BATCH_MAX_REQUESTS_OPENAI,
     BATCH_POLLING_INTERVAL_SECONDS,
     BATCH_RESULT_EXPIRY_DAYS,
+    BATCH_RESULT_PERSIST_CHUNK_SIZE,
+    BATCH_SCHEDULER_BACKOFF_FACTOR,
+    BATCH_SCHEDULER_ENABLED,
+    BATCH_SCHEDULER_LIST_MAX_PAGES,
+    BATCH_SCHEDULER_MAX_ACTIVE_JOBS,
+    BATCH_SCHEDULER_MAX_POLLING_INTERVAL_SECONDS,
+    BATCH_SCHEDULER_REFRESH_INTERVAL_SECONDS,
     BATCH_TIMEOUT_SECONDS,
 )
 from config.batch.provider_config import (
@@ -27,6 +34,13 @@ __all__ = [
     "BATCH_INITIAL_POLLING_DELAY_SECONDS",
     "BATCH_TIMEOUT_SECONDS",
     "BATCH_MAX_POLLING_ATTEMPTS",
+    "BATCH_SCHEDULER_ENABLED",
+    "BATCH_SCHEDULER_MAX_POLLING_INTERVAL_SECONDS",
+    "BATCH_SCHEDULER_BACKOFF_FACTOR",
+    "BATCH_SCHEDULER_REFRESH_INTERVAL_SECONDS",
+    "BATCH_SCHEDULER_MAX_ACTIVE_JOBS",
+    "BATCH_SCHEDULER_LIST_MAX_PAGES",
+    "BATCH_RESULT_PERSIST_CHUNK_SIZE",
     "BATCH_MAX_REQUESTS_OPENAI",
     "BATCH_MAX_REQUESTS_ANTHROPIC",
     "BATCH_MAX_REQUESTS_GEMINI",
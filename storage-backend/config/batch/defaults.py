@@ -1,5 +1,7 @@
 """Default configuration values for batch mode."""
 
+import os
+
 # Polling configuration
 BATCH_POLLING_INTERVAL_SECONDS = 10
 """How often to poll batch job status (in seconds)."""
@@ -13,6 +15,28 @@ BATCH_TIMEOUT_SECONDS = 86400
 BATCH_MAX_POLLING_ATTEMPTS = 8640
 """Maximum polling attempts (24 hours at 10s intervals)."""
 
+# Background scheduler configuration
+BATCH_SCHEDULER_ENABLED = os.getenv("BATCH_SCHEDULER_ENABLED", "true").lower() == "true"
+"""Run the background batch scheduler inside the API process."""
+
+BATCH_SCHEDULER_MAX_POLLING_INTERVAL_SECONDS = int(os.getenv("BATCH_SCHEDULER_MAX_POLLING_INTERVAL", "300"))
+"""Upper bound for the adaptive per-job polling interval (in seconds)."""
+
+BATCH_SCHEDULER_BACKOFF_FACTOR = float(os.getenv("BATCH_SCHEDULER_BACKOFF_FACTOR", "1.5"))
+"""Multiplier applied to a job's polling interval when its status is unchanged."""
+
+BATCH_SCHEDULER_REFRESH_INTERVAL_SECONDS = int(os.getenv("BATCH_SCHEDULER_REFRESH_INTERVAL", "60"))
+"""How often the scheduler reloads non-terminal jobs from the database (in seconds)."""
+
+BATCH_SCHEDULER_MAX_ACTIVE_JOBS = int(os.getenv("BATCH_SCHEDULER_MAX_ACTIVE_JOBS", "1000"))
+"""Maximum number of non-terminal jobs tracked by one scheduler."""
+
+BATCH_SCHEDULER_LIST_MAX_PAGES = 5
+"""Pages of the provider list-batches endpoint scanned per poll before falling back to retrieve."""
+
+BATCH_RESULT_PERSIST_CHUNK_SIZE = 500
+"""Number of streamed results persisted per database write."""
+
 # OpenAI limits (per API documentation)
 BATCH_MAX_REQUESTS_OPENAI = 50000
 """Maximum requests per OpenAI batch job."""
@@ -44,6 +68,13 @@ __all__ = [
     "BATCH_INITIAL_POLLING_DELAY_SECONDS",
     "BATCH_TIMEOUT_SECONDS",
     "BATCH_MAX_POLLING_ATTEMPTS",
+    "BATCH_SCHEDULER_ENABLED",
+    "BATCH_SCHEDULER_MAX_POLLING_INTERVAL_SECONDS",
+    "BATCH_SCHEDULER_BACKOFF_FACTOR",
+    "BATCH_SCHEDULER_REFRESH_INTERVAL_SECONDS",
+    "BATCH_SCHEDULER_MAX_ACTIVE_JOBS",
+    "BATCH_SCHEDULER_LIST_MAX_PAGES",
+    "BATCH_RESULT_PERSIST_CHUNK_SIZE",
     "BATCH_MAX_REQUESTS_OPENAI",
     "BATCH_MAX_REQUESTS_ANTHROPIC",
     "BATCH_MAX_REQUESTS_GEMINI",
@@ -1,4 +1,4 @@
-"""Database connection pool configuration."""
+"""Database connection pool and chart cache configuration."""
 
 from __future__ import annotations
 
@@ -11,6 +11,10 @@ CONNECT_TIMEOUT = int(os.getenv("DB_CONNECT_TIMEOUT", "5"))
 POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
 ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
 
+# Chart data fetched for chat (infrastructure/db/fetchers); 0 disables caching
+CHART_CACHE_TTL_SECONDS = float(os.getenv("CHART_CACHE_TTL_SECONDS", "300"))
+CHART_CACHE_MAX_ENTRIES = int(os.getenv("CHART_CACHE_MAX_ENTRIES", "256"))
+
 __all__ = [
     "POOL_SIZE",
     "MAX_OVERFLOW",
@@ -18,4 +22,6 @@ __all__ = [
     "CONNECT_TIMEOUT",
     "POOL_TIMEOUT",
     "ECHO",
+    "CHART_CACHE_TTL_SECONDS",
+    "CHART_CACHE_MAX_ENTRIES",
 ]
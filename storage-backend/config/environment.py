@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import os
-from typing import Literal
+from typing import FrozenSet, Literal, Optional
 
 Environment = Literal["development", "production", "test", "sherlock", "hetzner", "hetzner_nonprod"]
 DatabaseType = Literal["mysql", "postgresql"]
@@ -39,6 +39,19 @@ def get_database_type() -> DatabaseType:
     return "postgresql"
 
 
+def get_enabled_routers() -> Optional[FrozenSet[str]]:
+    """Return the feature routers to mount, or ``None`` to mount all of them.
+
+    Set via ``APP_ROUTERS`` as a comma-separated list of feature names
+    (e.g. ``chat,tts,audio``).  Routers left out are never imported, which
+    keeps their provider SDKs off the startup path of slim deployments.
+    """
+    raw = os.getenv("APP_ROUTERS", "").strip()
+    if not raw or raw.lower() == "all":
+        return None
+    return frozenset(name.strip().lower() for name in raw.split(",") if name.strip())
+
+
 ENVIRONMENT: Environment = get_node_env()
 IS_DEVELOPMENT = ENVIRONMENT == "development"
 IS_PRODUCTION = ENVIRONMENT == "production"
@@ -52,6 +65,8 @@ DATABASE_TYPE: DatabaseType = get_database_type()
 IS_POSTGRESQL = DATABASE_TYPE == "postgresql"
 IS_MYSQL = DATABASE_TYPE == "mysql"
 
+ENABLED_ROUTERS = get_enabled_routers()
+
 __all__ = [
     "Environment",
     "DatabaseType",
@@ -65,6 +80,8 @@ __all__ = [
     "IS_HETZNER_NONPROD",
     "IS_POSTGRESQL",
     "IS_MYSQL",
+    "ENABLED_ROUTERS",
     "get_node_env",
     "get_database_type",
+    "get_enabled_routers",
 ]
@@ -14,10 +14,20 @@ from config.proactive_agent.defaults import (
     DEFAULT_RESEARCH_MODEL,
     ESTIMATED_RESEARCH_TIME_SECONDS,
     INTERNAL_API_KEY,
+    LONG_POLL_MAX_WAIT_SECONDS,
     MAX_CONCURRENT_JOBS_PER_USER,
+    POLLER_STREAM_MAX_BATCH_FRAMES,
     POLLER_STREAM_QUEUE_SIZE,
     POLLER_STREAM_QUEUE_TIMEOUT,
+    PUSH_BUS_BACKEND,
+    PUSH_BUS_URL,
+    PUSH_HEARTBEAT_SECONDS,
+    PUSH_PRESENCE_TTL_SECONDS,
     RESEARCH_RESULTS_DIR,
+    SSE_KEEPALIVE_SECONDS,
+    SSE_MAX_DURATION_SECONDS,
+    WS_OUTBOUND_QUEUE_SIZE,
+    WS_SEND_TIMEOUT_SECONDS,
 )
 
 __all__ = [
@@ -37,4 +47,17 @@ __all__ = [
     # Poller stream
     "POLLER_STREAM_QUEUE_SIZE",
     "POLLER_STREAM_QUEUE_TIMEOUT",
+    "POLLER_STREAM_MAX_BATCH_FRAMES",
+    # Push bus
+    "PUSH_BUS_BACKEND",
+    "PUSH_BUS_URL",
+    "PUSH_PRESENCE_TTL_SECONDS",
+    "PUSH_HEARTBEAT_SECONDS",
+    # Outbound queues
+    "WS_OUTBOUND_QUEUE_SIZE",
+    "WS_SEND_TIMEOUT_SECONDS",
+    # Long-poll / SSE
+    "LONG_POLL_MAX_WAIT_SECONDS",
+    "SSE_KEEPALIVE_SECONDS",
+    "SSE_MAX_DURATION_SECONDS",
 ]
@@ -84,6 +84,53 @@ POLLER_STREAM_QUEUE_TIMEOUT = int(
     os.getenv("POLLER_STREAM_QUEUE_TIMEOUT", "30")
 )
 
+# Queued frames the consumer drains into one parse/emit pass when it falls
+# behind (adjacent text deltas in the pass are merged before they are pushed)
+POLLER_STREAM_MAX_BATCH_FRAMES = int(
+    os.getenv("POLLER_STREAM_MAX_BATCH_FRAMES", "64")
+)
+
+# =============================================================================
+# Cross-instance Push Bus
+# =============================================================================
+
+# Backend that routes pushes to the worker holding the user's WebSocket:
+# "none" (single process), "memory" (tests), "redis" or "postgres"
+PUSH_BUS_BACKEND = os.getenv("PROACTIVE_PUSH_BUS", "none").strip().lower()
+
+# Connection URL for the push bus; defaults to REDIS_URL / MAIN_DB_URL
+PUSH_BUS_URL = os.getenv("PROACTIVE_PUSH_BUS_URL", "")
+
+# Seconds a presence entry stays valid without a heartbeat refresh
+PUSH_PRESENCE_TTL_SECONDS = int(os.getenv("PROACTIVE_PUSH_PRESENCE_TTL", "90"))
+
+# Seconds between presence refreshes for locally connected users
+PUSH_HEARTBEAT_SECONDS = int(os.getenv("PROACTIVE_PUSH_HEARTBEAT", "30"))
+
+# =============================================================================
+# WebSocket Outbound Queues
+# =============================================================================
+
+# Messages buffered per proactive connection before it is evicted as a slow
+# consumer; 0 sends inline (no writer tasks)
+WS_OUTBOUND_QUEUE_SIZE = int(os.getenv("PROACTIVE_WS_OUTBOUND_QUEUE_SIZE", "256"))
+
+# Seconds a single WebSocket send may take before the connection is evicted
+WS_SEND_TIMEOUT_SECONDS = float(os.getenv("PROACTIVE_WS_SEND_TIMEOUT", "10"))
+
+# =============================================================================
+# Long-poll / SSE Message Delivery
+# =============================================================================
+
+# Upper bound for ?wait= on GET /messages/{session_id}/poll
+LONG_POLL_MAX_WAIT_SECONDS = int(os.getenv("PROACTIVE_AGENT_LONG_POLL_MAX_WAIT", "30"))
+
+# Comment line sent on idle SSE streams to keep proxies from closing them
+SSE_KEEPALIVE_SECONDS = float(os.getenv("PROACTIVE_AGENT_SSE_KEEPALIVE", "15"))
+
+# SSE streams end after this long; clients reconnect with Last-Event-ID
+SSE_MAX_DURATION_SECONDS = float(os.getenv("PROACTIVE_AGENT_SSE_MAX_DURATION", "300"))
+
 __all__ = [
     # Deep research
     "RESEARCH_RESULTS_DIR",
@@ -101,4 +148,17 @@ __all__ = [
     # Poller stream
     "POLLER_STREAM_QUEUE_SIZE",
     "POLLER_STREAM_QUEUE_TIMEOUT",
+    "POLLER_STREAM_MAX_BATCH_FRAMES",
+    # Push bus
+    "PUSH_BUS_BACKEND",
+    "PUSH_BUS_URL",
+    "PUSH_PRESENCE_TTL_SECONDS",
+    "PUSH_HEARTBEAT_SECONDS",
+    # Outbound queues
+    "WS_OUTBOUND_QUEUE_SIZE",
+    "WS_SEND_TIMEOUT_SECONDS",
+    # Long-poll / SSE
+    "LONG_POLL_MAX_WAIT_SECONDS",
+    "SSE_KEEPALIVE_SECONDS",
+    "SSE_MAX_DURATION_SECONDS",
 ]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from typing import Optional
 
@@ -10,6 +11,11 @@ from .providers import google, openai
 DEFAULT_PROVIDER = "openai"
 DEFAULT_SAMPLE_RATE = openai.DEFAULT_SAMPLE_RATE
 
+# Metrics (features/realtime/metrics.py)
+RECENT_SESSIONS_LIMIT = int(os.getenv("REALTIME_RECENT_SESSIONS_LIMIT", "200"))
+# Distinct model label values before further models are reported as "other".
+METRICS_MAX_MODEL_LABELS = int(os.getenv("REALTIME_METRICS_MAX_MODEL_LABELS", "20"))
+
 
 @dataclass(slots=True)
 class RealtimeSettings:
@@ -34,4 +40,10 @@ class RealtimeSettings:
                 self.voice = google.DEFAULT_VOICE
 
 
-__all__ = ["DEFAULT_PROVIDER", "DEFAULT_SAMPLE_RATE", "RealtimeSettings"]
+__all__ = [
+    "DEFAULT_PROVIDER",
+    "DEFAULT_SAMPLE_RATE",
+    "METRICS_MAX_MODEL_LABELS",
+    "RECENT_SESSIONS_LIMIT",
+    "RealtimeSettings",
+]
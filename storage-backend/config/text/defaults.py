@@ -1,5 +1,19 @@
 """Cross-provider text generation defaults."""
 
+import os
+
+
+def _parse_chains(raw: str) -> dict[str, tuple[str, ...]]:
+    """Parse ``class=model,model;class=model`` into fallback chains."""
+
+    chains: dict[str, tuple[str, ...]] = {}
+    for entry in raw.split(";"):
+        name, _, models = entry.partition("=")
+        if name.strip() and models.strip():
+            chains[name.strip().lower()] = tuple(m.strip() for m in models.split(",") if m.strip())
+    return chains
+
+
 # Global text generation defaults
 DEFAULT_TEMPERATURE = 0.7
 DEFAULT_MAX_TOKENS = 4096
@@ -13,6 +27,52 @@ STREAM_TIMEOUT = 300  # seconds
 MAX_RETRIES = 3
 RETRY_DELAY = 1  # seconds
 
+# Provider routing (core/providers/text_routing.py): failover before the first
+# token, optional hedged requests and the rolling per-model scoreboard.
+# Opt-in: the chains send prompts to other vendors than the one configured.
+FAILOVER_ENABLED = os.getenv("TEXT_FAILOVER_ENABLED", "false").strip().lower() in {"1", "true", "yes", "on"}
+HEDGING_ENABLED = os.getenv("TEXT_HEDGING_ENABLED", "false").strip().lower() in {"1", "true", "yes", "on"}
+# Fallback chains per capability class ("standard", "reasoning", "search").
+FALLBACK_CHAINS = {
+    "standard": ("claude-sonnet", "gpt-4.1", "gemini-flash"),
+    "reasoning": ("gpt-5.1", "claude-opus", "gemini-pro"),
+    **_parse_chains(os.getenv("TEXT_FALLBACK_CHAINS", "")),
+}
+HEDGE_DEFAULT_DELAY_MS = float(os.getenv("TEXT_HEDGE_DEFAULT_DELAY_MS", "4000"))
+HEDGE_MIN_DELAY_MS = float(os.getenv("TEXT_HEDGE_MIN_DELAY_MS", "750"))
+HEDGE_MAX_DELAY_MS = float(os.getenv("TEXT_HEDGE_MAX_DELAY_MS", "10000"))
+HEDGE_MIN_SAMPLES = int(os.getenv("TEXT_HEDGE_MIN_SAMPLES", "20"))
+SCOREBOARD_WINDOW = int(os.getenv("TEXT_SCOREBOARD_WINDOW", "200"))
+SCOREBOARD_MAX_AGE = float(os.getenv("TEXT_SCOREBOARD_MAX_AGE", "900"))  # seconds
+DEGRADED_ERROR_RATE = float(os.getenv("TEXT_DEGRADED_ERROR_RATE", "0.5"))
+DEGRADED_MIN_SAMPLES = int(os.getenv("TEXT_DEGRADED_MIN_SAMPLES", "5"))
+RATE_LIMIT_COOLDOWN = float(os.getenv("TEXT_RATE_LIMIT_COOLDOWN", "30"))  # seconds
+
+# Provider resolution cache (core/providers/resolver_cache.py)
+PROVIDER_CACHE_ENABLED = os.getenv("TEXT_PROVIDER_CACHE_ENABLED", "true").strip().lower() not in {"0", "false", "no", "off"}
+PROVIDER_CACHE_MAX_ENTRIES = int(os.getenv("TEXT_PROVIDER_CACHE_MAX_ENTRIES", "256"))
+
+# Provider-side prompt caching (core/providers/text/prompt_cache.py)
+PROMPT_CACHE_ENABLED = os.getenv("TEXT_PROMPT_CACHE_ENABLED", "true").strip().lower() not in {"0", "false", "no", "off"}
+# Rough size (~1024 tokens) below which a prefix is too short for Anthropic to cache.
+PROMPT_CACHE_MIN_CHARS = int(os.getenv("TEXT_PROMPT_CACHE_MIN_CHARS", "4096"))
+
+# Server-side chat history assembly (features/chat/services/history/compaction.py)
+HISTORY_COMPACTION_ENABLED = os.getenv("CHAT_HISTORY_COMPACTION_ENABLED", "true").strip().lower() not in {"0", "false", "no", "off"}
+# History never exceeds this many tokens, however large the context window is.
+HISTORY_MAX_TOKENS = int(os.getenv("CHAT_HISTORY_MAX_TOKENS", "16000"))
+HISTORY_MIN_TOKENS = 1000
+HISTORY_CONTEXT_FRACTION = 0.5  # of the model context window
+HISTORY_DEFAULT_CONTEXT_WINDOW = 128_000  # when ModelConfig.context_window is unset
+# Once over budget, compact down to this fraction so the window start stays put
+# for several turns (keeps the prompt prefix cacheable).
+HISTORY_COMPACT_TARGET_RATIO = 0.6
+HISTORY_PAGE_SIZE = 50
+HISTORY_SUMMARY_MODEL = os.getenv("CHAT_HISTORY_SUMMARY_MODEL", "gpt-5-nano")
+HISTORY_SUMMARY_MAX_TOKENS = 800
+HISTORY_SUMMARY_BATCH_TOKENS = 8000  # transcript tokens folded per summary call
+HISTORY_MAX_SESSIONS = 1000  # rolling summaries kept in memory
+
 __all__ = [
     "DEFAULT_TEMPERATURE",
     "DEFAULT_MAX_TOKENS",
@@ -21,4 +81,31 @@ __all__ = [
     "STREAM_TIMEOUT",
     "MAX_RETRIES",
     "RETRY_DELAY",
+    "FAILOVER_ENABLED",
+    "HEDGING_ENABLED",
+    "FALLBACK_CHAINS",
+    "HEDGE_DEFAULT_DELAY_MS",
+    "HEDGE_MIN_DELAY_MS",
+    "HEDGE_MAX_DELAY_MS",
+    "HEDGE_MIN_SAMPLES",
+    "SCOREBOARD_WINDOW",
+    "SCOREBOARD_MAX_AGE",
+    "DEGRADED_ERROR_RATE",
+    "DEGRADED_MIN_SAMPLES",
+    "RATE_LIMIT_COOLDOWN",
+    "PROVIDER_CACHE_ENABLED",
+    "PROVIDER_CACHE_MAX_ENTRIES",
+    "PROMPT_CACHE_ENABLED",
+    "PROMPT_CACHE_MIN_CHARS",
+    "HISTORY_COMPACTION_ENABLED",
+    "HISTORY_MAX_TOKENS",
+    "HISTORY_MIN_TOKENS",
+    "HISTORY_CONTEXT_FRACTION",
+    "HISTORY_DEFAULT_CONTEXT_WINDOW",
+    "HISTORY_COMPACT_TARGET_RATIO",
+    "HISTORY_PAGE_SIZE",
+    "HISTORY_SUMMARY_MODEL",
+    "HISTORY_SUMMARY_MAX_TOKENS",
+    "HISTORY_SUMMARY_BATCH_TOKENS",
+    "HISTORY_MAX_SESSIONS",
 ]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from typing import Dict, Optional
 
@@ -11,6 +12,12 @@ DEFAULT_PROVIDER = "openai"
 DEFAULT_AUDIO_FORMAT = openai.DEFAULT_AUDIO_FORMAT
 DEFAULT_QUALITY = "hd"
 
+# Content-addressed result cache (features/tts/cache.py)
+CACHE_ENABLED = os.getenv("TTS_CACHE_ENABLED", "true").strip().lower() not in {"0", "false", "no", "off"}
+CACHE_MAX_ENTRIES = int(os.getenv("TTS_CACHE_MAX_ENTRIES", "2048"))
+CACHE_MAX_CLIP_BYTES = int(os.getenv("TTS_CACHE_MAX_CLIP_BYTES", str(512 * 1024)))
+CACHE_MAX_AUDIO_BYTES = int(os.getenv("TTS_CACHE_MAX_AUDIO_BYTES", str(64 * 1024 * 1024)))
+
 
 @dataclass(slots=True)
 class TTSSettings:
@@ -43,6 +50,10 @@ __all__ = [
     "DEFAULT_PROVIDER",
     "DEFAULT_AUDIO_FORMAT",
     "DEFAULT_QUALITY",
+    "CACHE_ENABLED",
+    "CACHE_MAX_ENTRIES",
+    "CACHE_MAX_CLIP_BYTES",
+    "CACHE_MAX_AUDIO_BYTES",
     "TTSSettings",
     "VOICE_REGISTRY",
 ]
@@ -56,6 +56,11 @@ DEFAULT_INACTIVITY_TIMEOUT = 180  # seconds
 STREAM_TIMEOUT = 30  # seconds for REST streaming timeouts
 BUFFER_SIZE = 1024  # bytes per chunk for streaming
 
+# Pre-warmed stream-input websockets (per voice/model/format URI)
+WEBSOCKET_POOL_SIZE = int(os.getenv("ELEVENLABS_WS_POOL_SIZE", "1"))
+WEBSOCKET_POOL_MAX_IDLE = float(os.getenv("ELEVENLABS_WS_POOL_MAX_IDLE", "120"))  # seconds
+WEBSOCKET_POOL_PING_AFTER = float(os.getenv("ELEVENLABS_WS_POOL_PING_AFTER", "20"))  # seconds
+
 __all__ = [
     "API_KEY",
     "DEFAULT_MODEL",
@@ -72,4 +77,7 @@ __all__ = [
     "DEFAULT_INACTIVITY_TIMEOUT",
     "STREAM_TIMEOUT",
     "BUFFER_SIZE",
+    "WEBSOCKET_POOL_SIZE",
+    "WEBSOCKET_POOL_MAX_IDLE",
+    "WEBSOCKET_POOL_PING_AFTER",
 ]
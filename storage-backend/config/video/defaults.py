@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+
 # Global defaults for video flows
 DEFAULT_PROVIDER = "gemini"
 DEFAULT_DURATION = 5  # seconds
@@ -22,10 +24,29 @@ ASPECT_RATIOS = {
     "cinematic": "21:9",
 }
 
+# Background video jobs (features/video/jobs.py)
+VIDEO_JOB_POLLER_ENABLED = os.getenv("VIDEO_JOB_POLLER_ENABLED", "true").lower() == "true"
+VIDEO_JOB_POLL_INTERVAL_SECONDS = 5.0
+VIDEO_JOB_MAX_POLL_INTERVAL_SECONDS = 30.0
+VIDEO_JOB_BACKOFF_FACTOR = 1.5
+VIDEO_JOB_REFRESH_INTERVAL_SECONDS = 60.0
+VIDEO_JOB_TIMEOUT_SECONDS = 20 * 60
+VIDEO_JOB_MAX_ACTIVE_JOBS = 500
+# Caps concurrent provider requests (polls and downloads) issued by the poller
+VIDEO_JOB_MAX_CONCURRENCY = 4
+
 __all__ = [
     "DEFAULT_PROVIDER",
     "DEFAULT_DURATION",
     "DEFAULT_ASPECT_RATIO",
     "DURATION_PRESETS",
     "ASPECT_RATIOS",
+    "VIDEO_JOB_POLLER_ENABLED",
+    "VIDEO_JOB_POLL_INTERVAL_SECONDS",
+    "VIDEO_JOB_MAX_POLL_INTERVAL_SECONDS",
+    "VIDEO_JOB_BACKOFF_FACTOR",
+    "VIDEO_JOB_REFRESH_INTERVAL_SECONDS",
+    "VIDEO_JOB_TIMEOUT_SECONDS",
+    "VIDEO_JOB_MAX_ACTIVE_JOBS",
+    "VIDEO_JOB_MAX_CONCURRENCY",
 ]
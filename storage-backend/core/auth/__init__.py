@@ -1,17 +1,21 @@
 """Authentication helpers and dependencies."""
 
 from .jwt import (
+    ADMIN_ROLE,
     AuthContext,
     AuthenticationError,
     authenticate_bearer_token,
     create_auth_token,
+    is_admin,
     require_auth_context,
 )
 
 __all__ = [
+    "ADMIN_ROLE",
     "AuthContext",
     "AuthenticationError",
     "authenticate_bearer_token",
     "create_auth_token",
+    "is_admin",
     "require_auth_context",
 ]
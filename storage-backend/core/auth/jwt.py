@@ -35,6 +35,10 @@ class AuthenticationError(Exception):
         return self.message
 
 
+ADMIN_ROLE = "admin"
+"""Value of the token's ``role`` claim that grants cross-customer access."""
+
+
 @lru_cache(maxsize=1)
 def _get_secret() -> str:
     secret = get_env("MY_AUTH_TOKEN", required=True)
@@ -47,6 +51,7 @@ def create_auth_token(
     customer_id: int,
     email: str | None = None,
     expires_delta: timedelta = timedelta(days=90),
+    role: str | None = None,
 ) -> str:
     """Create a JWT token for the given customer.
 
@@ -54,6 +59,7 @@ def create_auth_token(
         customer_id: The customer's ID (stored as 'id' in payload)
         email: Optional email to include in token
         expires_delta: Token validity period (default 90 days)
+        role: Optional role claim, e.g. ``ADMIN_ROLE``
 
     Returns:
         Encoded JWT token string
@@ -65,6 +71,8 @@ def create_auth_token(
         "email": email,
         "exp": expire,
     }
+    if role:
+        payload["role"] = role
     return jwt.encode(payload, secret, algorithm="HS256")
 
 
@@ -135,10 +143,18 @@ def require_auth_context(
     return authenticate_bearer_token(authorization=authorization, query_token=token)
 
 
+def is_admin(context: AuthContext) -> bool:
+    """Return True when the token carries the admin role."""
+
+    return (context.get("payload") or {}).get("role") == ADMIN_ROLE
+
+
 __all__ = [
+    "ADMIN_ROLE",
     "AuthContext",
     "AuthenticationError",
     "authenticate_bearer_token",
     "create_auth_token",
+    "is_admin",
     "require_auth_context",
 ]
@@ -1,21 +1,27 @@
-"""Initialise AI provider clients used across the application."""
+"""AI provider clients used across the application.
+
+Clients are constructed lazily.  At import time only the environment is
+inspected: every provider whose credentials are configured gets a factory in
+:data:`ai_clients`, and the vendor SDK is imported and the client built on the
+first lookup (``ai_clients.get("openai_async")`` or a ``get_*_client()``
+accessor).  Workers that only serve chat therefore never pay for the Gemini,
+xAI (gRPC) or other SDK imports.
+"""
 
 from __future__ import annotations
 
 import asyncio
 import atexit
 import logging
+import threading
 from inspect import isawaitable
-from typing import Dict
-
-from anthropic import Anthropic, AsyncAnthropic
-from google import genai
-from openai import AsyncOpenAI, OpenAI
-from xai_sdk import AsyncClient as XaiAsyncClient
-from xai_sdk import Client as XaiClient
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 
 from core.utils.env import get_env
-from .xai_adapters import XaiAsyncClientAdapter, XaiClientAdapter
+
+if TYPE_CHECKING:
+    from anthropic import Anthropic, AsyncAnthropic
+    from openai import AsyncOpenAI, OpenAI
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +35,73 @@ def _get_env(key: str, required: bool = False) -> str | None:
     return value
 
 
-ai_clients: Dict[str, object] = {}
+ClientFactory = Callable[[], object]
+
+
+class LazyClientRegistry(dict):
+    """Mapping of client name to client that builds clients on first lookup.
+
+    The dict itself only holds clients that have been constructed (or that
+    tests assigned directly); ``in`` also reports names with a registered
+    factory, i.e. providers that are configured.  ``clear()`` forgets both, so
+    a cleared registry behaves as "nothing configured".
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._factories: Dict[str, ClientFactory] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, factory: ClientFactory) -> None:
+        self._factories[name] = factory
+
+    def configured(self) -> list[str]:
+        """Return the names of every available client, built or not."""
+
+        return sorted(set(self._factories) | set(dict.keys(self)))
+
+    def built(self, name: str) -> Optional[object]:
+        """Return ``name`` only if it has already been constructed."""
+
+        return dict.get(self, name)
+
+    def get(self, name: str, default: Any = None) -> Any:  # type: ignore[override]
+        if dict.__contains__(self, name):
+            return dict.__getitem__(self, name)
+        client = self._build(name)
+        return default if client is None else client
+
+    def __missing__(self, name: str) -> object:
+        client = self._build(name)
+        if client is None:
+            raise KeyError(name)
+        return client
+
+    def __contains__(self, name: object) -> bool:
+        return dict.__contains__(self, name) or name in self._factories
+
+    def clear(self) -> None:
+        super().clear()
+        self._factories.clear()
+
+    def _build(self, name: str) -> Optional[object]:
+        factory = self._factories.get(name)
+        if factory is None:
+            return None
+        with self._lock:
+            if dict.__contains__(self, name):
+                return dict.__getitem__(self, name)
+            try:
+                client = factory()
+            except Exception as exc:
+                logger.error("Error initialising AI client %s: %s", name, exc)
+                raise
+            dict.__setitem__(self, name, client)
+        logger.info("Initialised %s client", name)
+        return client
+
+
+ai_clients = LazyClientRegistry()
 _xai_shutdown_registered = False
 
 
@@ -62,7 +134,7 @@ def _register_xai_shutdown() -> None:
         return
 
     def _shutdown_xai_clients() -> None:
-        sync_client = ai_clients.get("xai")
+        sync_client = ai_clients.built("xai")
         if sync_client is not None:
             close_fn = getattr(sync_client, "close", None)
             if callable(close_fn):
@@ -71,7 +143,7 @@ def _register_xai_shutdown() -> None:
                 except Exception:  # pragma: no cover - best-effort cleanup
                     logger.debug("Failed to close xAI client", exc_info=True)
 
-        async_client = ai_clients.get("xai_async")
+        async_client = ai_clients.built("xai_async")
         if async_client is not None:
             close_fn = getattr(async_client, "close", None)
             if callable(close_fn):
@@ -100,129 +172,174 @@ def _register_xai_shutdown() -> None:
     atexit.register(_shutdown_xai_clients)
     _xai_shutdown_registered = True
 
-try:
-    if _get_env("OPENAI_API_KEY"):
-        ai_clients["openai"] = OpenAI()
-        ai_clients["openai_async"] = AsyncOpenAI()
-        logger.info("Initialised OpenAI clients")
-
-    if _get_env("CLAUDE_KEY"):
-        ai_clients["anthropic"] = Anthropic(api_key=_get_env("CLAUDE_KEY"))
-        ai_clients["anthropic_async"] = AsyncAnthropic(api_key=_get_env("CLAUDE_KEY"))
-        logger.info("Initialised Anthropic clients")
-
-    if _get_env("GOOGLE_API_KEY"):
-        ai_clients["gemini"] = genai.Client(api_key=_get_env("GOOGLE_API_KEY"))
-        logger.info("Initialised Gemini client")
-
-    if _get_env("GROQ_API_KEY"):
-        ai_clients["groq"] = OpenAI(api_key=_get_env("GROQ_API_KEY"), base_url="https://api.groq.com/openai/v1")
-        ai_clients["groq_async"] = AsyncOpenAI(
-            api_key=_get_env("GROQ_API_KEY"),
-            base_url="https://api.groq.com/openai/v1",
-        )
-        logger.info("Initialised Groq clients")
-
-    if _get_env("PERPLEXITY_API_KEY"):
-        ai_clients["perplexity"] = OpenAI(
-            api_key=_get_env("PERPLEXITY_API_KEY"),
-            base_url="https://api.perplexity.ai",
-        )
-        ai_clients["perplexity_async"] = AsyncOpenAI(
-            api_key=_get_env("PERPLEXITY_API_KEY"),
-            base_url="https://api.perplexity.ai",
-        )
-        logger.info("Initialised Perplexity clients")
-
-    if _get_env("DEEPSEEK_API_KEY"):
-        ai_clients["deepseek"] = OpenAI(
-            api_key=_get_env("DEEPSEEK_API_KEY"),
-            base_url="https://api.deepseek.com/",
-        )
-        ai_clients["deepseek_async"] = AsyncOpenAI(
-            api_key=_get_env("DEEPSEEK_API_KEY"),
-            #base_url="https://api.deepseek.com/v3.2_speciale_expires_on_20251215",
-            base_url="https://api.deepseek.com/",
-        )
-        logger.info("Initialised DeepSeek clients")
-
-    xai_api_key = _get_env("XAI_API_KEY")
-    if xai_api_key:
-        xai_kwargs: Dict[str, object] = {}
-
-        if host := _get_env("XAI_API_HOST"):
-            xai_kwargs["api_host"] = host
-
-        if management_host := _get_env("XAI_MANAGEMENT_API_HOST"):
-            xai_kwargs["management_api_host"] = management_host
-
-        if management_key := _get_env("XAI_MANAGEMENT_KEY"):
-            xai_kwargs["management_api_key"] = management_key
-
-        timeout_value = _parse_float_env(_get_env("XAI_TIMEOUT"))
-        if timeout_value is not None:
-            xai_kwargs["timeout"] = timeout_value
-
-        insecure_value = _parse_bool_env(_get_env("XAI_USE_INSECURE_CHANNEL"))
-        if insecure_value is not None:
-            xai_kwargs["use_insecure_channel"] = insecure_value
-
-        ai_clients["xai"] = XaiClientAdapter(XaiClient(api_key=xai_api_key, **xai_kwargs))
-        ai_clients["xai_async"] = XaiAsyncClientAdapter(
-            XaiAsyncClient(api_key=xai_api_key, **xai_kwargs)
-        )
-        _register_xai_shutdown()
-        logger.info("Initialised xAI SDK clients")
-except Exception as exc:  # pragma: no cover - init failure should crash fast
-    logger.error("Error initialising AI clients: %s", exc)
-    raise
-
-logger.info("Initialised %s AI client(s)", len(ai_clients))
-
-
-def get_openai_client() -> OpenAI:
-    """Return a cached synchronous OpenAI client."""
-
-    client = ai_clients.get("openai")
-    if client is not None:
-        return client  # type: ignore[return-value]
+# Environment variable that enables each client.
+_CLIENT_ENV: Dict[str, str] = {
+    "openai": "OPENAI_API_KEY",
+    "openai_async": "OPENAI_API_KEY",
+    "anthropic": "CLAUDE_KEY",
+    "anthropic_async": "CLAUDE_KEY",
+    "gemini": "GOOGLE_API_KEY",
+    "groq": "GROQ_API_KEY",
+    "groq_async": "GROQ_API_KEY",
+    "perplexity": "PERPLEXITY_API_KEY",
+    "perplexity_async": "PERPLEXITY_API_KEY",
+    "deepseek": "DEEPSEEK_API_KEY",
+    "deepseek_async": "DEEPSEEK_API_KEY",
+    "xai": "XAI_API_KEY",
+    "xai_async": "XAI_API_KEY",
+}
 
-    api_key = _get_env("OPENAI_API_KEY", required=True)
-    client = OpenAI(api_key=api_key)
-    ai_clients["openai"] = client
-    logger.info("Initialised OpenAI client via helper")
-    return client
+_OPENAI_COMPATIBLE_BASE_URLS: Dict[str, str] = {
+    "groq": "https://api.groq.com/openai/v1",
+    "perplexity": "https://api.perplexity.ai",
+    "deepseek": "https://api.deepseek.com/",
+}
 
 
-def get_openai_async_client() -> AsyncOpenAI:
-    """Return a cached asynchronous OpenAI client."""
+def _build_openai(name: str) -> object:
+    from openai import AsyncOpenAI, OpenAI
 
-    client = ai_clients.get("openai_async")
-    if client is not None:
-        return client  # type: ignore[return-value]
+    vendor, _, variant = name.partition("_")
+    client_cls = AsyncOpenAI if variant == "async" else OpenAI
+    if vendor == "openai":
+        return client_cls()
+    return client_cls(api_key=_get_env(_CLIENT_ENV[name]), base_url=_OPENAI_COMPATIBLE_BASE_URLS[vendor])
+
+
+def _build_anthropic(name: str) -> object:
+    from anthropic import Anthropic, AsyncAnthropic
+
+    client_cls = AsyncAnthropic if name.endswith("_async") else Anthropic
+    return client_cls(api_key=_get_env("CLAUDE_KEY"))
+
+
+def _build_gemini(name: str) -> object:
+    from google import genai
+
+    return genai.Client(api_key=_get_env("GOOGLE_API_KEY"))
+
+
+def _xai_kwargs() -> Dict[str, object]:
+    xai_kwargs: Dict[str, object] = {}
+
+    if host := _get_env("XAI_API_HOST"):
+        xai_kwargs["api_host"] = host
+
+    if management_host := _get_env("XAI_MANAGEMENT_API_HOST"):
+        xai_kwargs["management_api_host"] = management_host
+
+    if management_key := _get_env("XAI_MANAGEMENT_KEY"):
+        xai_kwargs["management_api_key"] = management_key
+
+    timeout_value = _parse_float_env(_get_env("XAI_TIMEOUT"))
+    if timeout_value is not None:
+        xai_kwargs["timeout"] = timeout_value
+
+    insecure_value = _parse_bool_env(_get_env("XAI_USE_INSECURE_CHANNEL"))
+    if insecure_value is not None:
+        xai_kwargs["use_insecure_channel"] = insecure_value
+
+    return xai_kwargs
 
-    api_key = _get_env("OPENAI_API_KEY", required=True)
-    client = AsyncOpenAI(api_key=api_key)
-    ai_clients["openai_async"] = client
-    logger.info("Initialised OpenAI async client via helper")
+
+def _build_xai(name: str) -> object:
+    from xai_sdk import AsyncClient as XaiAsyncClient
+    from xai_sdk import Client as XaiClient
+
+    from .xai_adapters import XaiAsyncClientAdapter, XaiClientAdapter
+
+    api_key = _get_env("XAI_API_KEY")
+    if name == "xai_async":
+        client: object = XaiAsyncClientAdapter(XaiAsyncClient(api_key=api_key, **_xai_kwargs()))
+    else:
+        client = XaiClientAdapter(XaiClient(api_key=api_key, **_xai_kwargs()))
+    _register_xai_shutdown()
     return client
 
 
-def get_google_client():
-    """Return an initialised Google Generative AI client."""
+_BUILDERS: Dict[str, Callable[[str], object]] = {
+    "openai": _build_openai,
+    "groq": _build_openai,
+    "perplexity": _build_openai,
+    "deepseek": _build_openai,
+    "anthropic": _build_anthropic,
+    "gemini": _build_gemini,
+    "xai": _build_xai,
+}
+
+
+def _register_client(name: str) -> None:
+    builder = _BUILDERS[name.partition("_")[0]]
+    ai_clients.register(name, lambda: builder(name))
+
+
+def register_configured_clients() -> list[str]:
+    """Register factories for every client whose credentials are set."""
 
-    client = ai_clients.get("gemini")
+    for name, env_key in _CLIENT_ENV.items():
+        if _get_env(env_key):
+            _register_client(name)
+    # Validate xAI options up front so a bad value fails at startup, not mid-request.
+    if _get_env("XAI_API_KEY"):
+        _xai_kwargs()
+    return ai_clients.configured()
+
+
+logger.info("Configured AI clients (built on first use): %s", ", ".join(register_configured_clients()) or "none")
+
+
+def get_client(name: str) -> Any:
+    """Return the ``name`` client, building it on first use.
+
+    Raises ``ValueError`` when the provider's credentials are not configured.
+    """
+
+    client = ai_clients.get(name)
     if client is not None:
         return client
 
-    api_key = _get_env("GOOGLE_API_KEY", required=True)
-    client = genai.Client(api_key=api_key)
-    ai_clients["gemini"] = client
-    logger.info("Initialised Gemini client via helper")
-    return client
+    _get_env(_CLIENT_ENV[name], required=True)
+    _register_client(name)
+    return ai_clients[name]
+
+
+def get_openai_client() -> "OpenAI":
+    """Return the cached synchronous OpenAI client."""
+
+    return get_client("openai")
+
+
+def get_openai_async_client() -> "AsyncOpenAI":
+    """Return the cached asynchronous OpenAI client."""
+
+    return get_client("openai_async")
+
+
+def get_anthropic_client() -> "Anthropic":
+    """Return the cached synchronous Anthropic client."""
+
+    return get_client("anthropic")
+
+
+def get_anthropic_async_client() -> "AsyncAnthropic":
+    """Return the cached asynchronous Anthropic client."""
+
+    return get_client("anthropic_async")
+
+
+def get_google_client():
+    """Return an initialised Google Generative AI client."""
+
+    return get_client("gemini")
 
 
 def get_gemini_client():
     """Alias around :func:`get_google_client` for clarity."""
 
     return get_google_client()
+
+
+def get_xai_async_client():
+    """Return the cached asynchronous xAI SDK client adapter."""
+
+    return get_client("xai_async")
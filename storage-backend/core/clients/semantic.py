@@ -4,16 +4,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
+from typing import TYPE_CHECKING
 
-try:
+if TYPE_CHECKING:
     from qdrant_client import AsyncQdrantClient
-except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency
-    AsyncQdrantClient = Any  # type: ignore[assignment]
-    _IMPORT_ERROR: ModuleNotFoundError | None = exc
-else:
-    _IMPORT_ERROR = None
-
 
 logger = logging.getLogger(__name__)
 
@@ -25,14 +19,17 @@ def get_qdrant_client() -> AsyncQdrantClient:
 
     global _qdrant_client
 
-    if _IMPORT_ERROR is not None:
-        raise RuntimeError(
-            "qdrant_client package is required for semantic search"
-        ) from _IMPORT_ERROR
-
     if _qdrant_client is not None:
         return _qdrant_client
 
+    # The SDK is imported on first use to keep it off the startup path.
+    try:
+        from qdrant_client import AsyncQdrantClient
+    except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency
+        raise RuntimeError(
+            "qdrant_client package is required for semantic search"
+        ) from exc
+
     # Lazy import to avoid circular dependency
     from core.config import settings
 
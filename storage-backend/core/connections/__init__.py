@@ -9,10 +9,26 @@ from core.connections.proactive_registry import (
     ProactiveConnectionRegistry,
     get_proactive_registry,
 )
+from core.connections.push_bus import (
+    InMemoryPushBus,
+    InMemoryPushHub,
+    PushBus,
+    PushEnvelope,
+    create_push_bus,
+    start_push_bus,
+    stop_push_bus,
+)
 
 __all__ = [
     "ConnectionInfo",
+    "InMemoryPushBus",
+    "InMemoryPushHub",
     "ProactiveConnectionRegistry",
+    "PushBus",
+    "PushEnvelope",
+    "create_push_bus",
     "get_proactive_registry",
     "get_server_id",
+    "start_push_bus",
+    "stop_push_bus",
 ]
@@ -9,9 +9,13 @@ import os
 import uuid
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Optional
 
 from fastapi import WebSocket
 
+if TYPE_CHECKING:
+    from .outbound import OutboundWriter
+
 # Stable per-process identifier for debugging multi-instance deployments
 _SERVER_ID = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
 
@@ -26,6 +30,7 @@ class ConnectionInfo:
     client_id: str | None = None  # e.g., "kotlin-xxx" or "react-xxx"
     connected_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     last_ping: datetime = field(default_factory=lambda: datetime.now(UTC))
+    writer: Optional["OutboundWriter"] = field(default=None, repr=False, compare=False)
 
 
 def get_server_id() -> str:
@@ -0,0 +1,138 @@
+"""Per-connection outbound queues for proactive WebSockets.
+
+Each registered connection owns a bounded queue drained by a dedicated writer
+task, so fan-out in ``push_to_user`` is a non-blocking enqueue.  A client that
+stops reading (full TCP window, suspended app) only fills its own queue:
+
+- a send that exceeds ``PROACTIVE_WS_SEND_TIMEOUT`` seconds, or
+- a queue that reaches ``PROACTIVE_WS_OUTBOUND_QUEUE_SIZE`` messages
+
+evicts the connection (closed with code 1013 so the client reconnects and
+resyncs through polling) without delaying the user's other devices.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Optional
+
+from config.proactive_agent.defaults import (
+    WS_OUTBOUND_QUEUE_SIZE,
+    WS_SEND_TIMEOUT_SECONDS,
+)
+
+if TYPE_CHECKING:
+    from .connection_info import ConnectionInfo
+
+logger = logging.getLogger(__name__)
+
+SLOW_CONSUMER_CLOSE_CODE = 1013  # "Try Again Later"
+
+EvictionCallback = Callable[["ConnectionInfo", str], Awaitable[None]]
+
+
+class OutboundWriter:
+    """Bounded FIFO of messages for one connection, sent by a single task."""
+
+    def __init__(
+        self,
+        conn: "ConnectionInfo",
+        on_evict: EvictionCallback,
+        *,
+        max_queue: int = WS_OUTBOUND_QUEUE_SIZE,
+        send_timeout: float = WS_SEND_TIMEOUT_SECONDS,
+    ) -> None:
+        self.conn = conn
+        self.send_timeout = send_timeout
+        self._on_evict = on_evict
+        self._queue: asyncio.Queue[Dict[str, Any]] = asyncio.Queue(maxsize=max(1, max_queue))
+        self._task: Optional[asyncio.Task[None]] = None
+        self._eviction: Optional[asyncio.Task[None]] = None
+        self._closed = False
+        self.sent = 0
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(
+                self._run(), name=f"proactive-writer-{self.conn.user_id}"
+            )
+
+    def enqueue(self, message: Dict[str, Any]) -> bool:
+        """Queue ``message`` without waiting; False if the connection is gone or full."""
+        if self._closed:
+            return False
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self._evict("outbound queue full")
+            return False
+        return True
+
+    def stop(self) -> None:
+        """Stop the writer and drop anything still queued (safe from the writer itself)."""
+        self._closed = True
+        task = self._task
+        if task is not None and task is not asyncio.current_task() and not task.done():
+            task.cancel()
+
+    async def _run(self) -> None:
+        conn = self.conn
+        while not self._closed:
+            message = await self._queue.get()
+            try:
+                async with asyncio.timeout(self.send_timeout):
+                    await conn.websocket.send_json(message)
+            except TimeoutError:
+                self._evict(f"send timed out after {self.send_timeout:.1f}s")
+                return
+            except Exception as exc:
+                logger.warning("Failed to push to user %s connection: %s", conn.user_id, exc)
+                self._evict("send failed", close=False)
+                return
+            self.sent += 1
+            # Log stream_end specifically to debug completion signal issues
+            if message.get("type") == "stream_end":
+                logger.info(
+                    "Pushed stream_end to user %s (session=%s, client=%s)",
+                    conn.user_id,
+                    conn.session_id[:8] if conn.session_id else "none",
+                    conn.client_id[:12] if conn.client_id else "none",
+                )
+
+    def _evict(self, reason: str, *, close: bool = True) -> None:
+        if self._closed:
+            return
+        conn = self.conn
+        if close:
+            logger.warning(
+                "Evicting slow proactive connection: user=%s client=%s (%s, %d queued)",
+                conn.user_id,
+                (conn.client_id or "none")[:12],
+                reason,
+                self._queue.qsize(),
+            )
+        self.stop()
+        self._eviction = asyncio.get_running_loop().create_task(self._finish_eviction(reason, close))
+
+    async def _finish_eviction(self, reason: str, close: bool) -> None:
+        if close:
+            try:
+                await asyncio.wait_for(
+                    self.conn.websocket.close(code=SLOW_CONSUMER_CLOSE_CODE, reason="Slow consumer"),
+                    timeout=self.send_timeout,
+                )
+            except Exception:
+                pass  # Already closed or unresponsive
+        await self._on_evict(self.conn, reason)
+
+
+__all__ = ["OutboundWriter", "SLOW_CONSUMER_CLOSE_CODE"]
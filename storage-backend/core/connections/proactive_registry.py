@@ -6,6 +6,9 @@ When an agent notification arrives, we check this registry to push in real-time.
 Supports multiple connections per user (e.g., React and Kotlin clients simultaneously).
 
 This registry is used by the unified /chat/ws?mode=proactive endpoint.
+
+With a push bus attached (see ``push_bus.py``), pushes for users connected to
+another worker are forwarded to that worker instead of being dropped.
 """
 
 from __future__ import annotations
@@ -13,11 +16,21 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import UTC, datetime
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
 
 from fastapi import WebSocket
 
+from config.proactive_agent.defaults import (
+    PUSH_HEARTBEAT_SECONDS,
+    WS_OUTBOUND_QUEUE_SIZE,
+    WS_SEND_TIMEOUT_SECONDS,
+)
+
 from .connection_info import ConnectionInfo, get_server_id
+from .outbound import OutboundWriter
+
+if TYPE_CHECKING:
+    from .push_bus import PushBus, PushEnvelope
 
 logger = logging.getLogger(__name__)
 
@@ -29,11 +42,94 @@ class ProactiveConnectionRegistry:
     - Multiple connections per user supported (React + Kotlin can connect simultaneously)
     - Notifications pushed to ALL connected clients for a user
     - Optimized for lookup by user_id (primary use case: push on notification)
+    - Each connection has its own outbound queue and writer task, so a slow
+      client cannot delay pushes to the user's other devices (see outbound.py)
+    - Optional push bus: presence is announced for the first local connection
+      of a user and withdrawn with the last one; pushes are delivered locally
+      and forwarded to other servers listed in the presence directory
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        bus: Optional["PushBus"] = None,
+        *,
+        outbound_queue_size: int = WS_OUTBOUND_QUEUE_SIZE,
+        send_timeout: float = WS_SEND_TIMEOUT_SECONDS,
+    ) -> None:
         self._connections: Dict[int, List[ConnectionInfo]] = {}
         self._lock = asyncio.Lock()
+        self._outbound_queue_size = outbound_queue_size
+        self._send_timeout = send_timeout
+        self._bus: Optional["PushBus"] = bus
+        self._heartbeat_task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def bus(self) -> Optional["PushBus"]:
+        return self._bus
+
+    async def attach_bus(
+        self, bus: "PushBus", heartbeat_seconds: float = PUSH_HEARTBEAT_SECONDS
+    ) -> None:
+        """Start ``bus`` and use it for presence and cross-server delivery."""
+        await bus.start(self._deliver_forwarded, snapshot=self.presence_snapshot)
+        self._bus = bus
+        await self._refresh_presence()
+        if heartbeat_seconds > 0:
+            self._heartbeat_task = asyncio.create_task(
+                self._heartbeat(heartbeat_seconds), name="proactive-push-heartbeat"
+            )
+
+    async def detach_bus(self) -> None:
+        """Withdraw local presence and close the bus (no-op without one)."""
+        bus, self._bus = self._bus, None
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
+        if bus is None:
+            return
+        for user_id in list(self._connections):
+            try:
+                await bus.withdraw(user_id)
+            except Exception as exc:
+                logger.debug("Presence withdraw failed for user %s: %s", user_id, exc)
+        await bus.close()
+
+    def presence_snapshot(self) -> Dict[int, Set[str]]:
+        """Locally connected users mapped to their session ids."""
+        return {
+            user_id: {conn.session_id for conn in conns}
+            for user_id, conns in self._connections.items()
+        }
+
+    async def _publish_presence(self, user_id: int) -> None:
+        """Announce or withdraw ``user_id`` on the bus; bus errors never fail callers.
+
+        Called after releasing ``self._lock`` so a slow bus never blocks other
+        registrations; it publishes the user's connections as of the call.
+        """
+        if self._bus is None:
+            return
+        conns = self._connections.get(user_id)
+        try:
+            if conns:
+                await self._bus.announce(user_id, {conn.session_id for conn in conns})
+            else:
+                await self._bus.withdraw(user_id)
+        except Exception as exc:
+            logger.warning("Presence update failed for user %s: %s", user_id, exc)
+
+    async def _refresh_presence(self) -> None:
+        for user_id in list(self._connections):
+            await self._publish_presence(user_id)
+
+    async def _heartbeat(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await self._refresh_presence()
 
     async def register(
         self,
@@ -80,6 +176,7 @@ class ProactiveConnectionRegistry:
                     session_id[:8] if session_id else "none",
                     (old_conn.client_id or "none")[:12],
                 )
+                _stop_writer(old_conn)
                 try:
                     await old_conn.websocket.close(
                         code=1000, reason="Replaced by new connection"
@@ -107,6 +204,14 @@ class ProactiveConnectionRegistry:
                 session_id=session_id,
                 client_id=client_id,
             )
+            if self._outbound_queue_size > 0:
+                new_conn.writer = OutboundWriter(
+                    new_conn,
+                    self._evict,
+                    max_queue=self._outbound_queue_size,
+                    send_timeout=self._send_timeout,
+                )
+                new_conn.writer.start()
             self._connections[user_id].append(new_conn)
 
             conn_count = len(self._connections[user_id])
@@ -117,7 +222,8 @@ class ProactiveConnectionRegistry:
                 (client_id or "none")[:12],
                 conn_count,
             )
-            return None
+        await self._publish_presence(user_id)
+        return None
 
     async def unregister(
         self, user_id: int, websocket: Optional[WebSocket] = None
@@ -131,33 +237,50 @@ class ProactiveConnectionRegistry:
         Returns True if a connection was removed.
         """
         async with self._lock:
-            if user_id not in self._connections:
-                return False
-
-            if websocket is None:
-                del self._connections[user_id]
-                logger.info("Unregistered all proactive connections for user %s", user_id)
-                return True
-
-            original_count = len(self._connections[user_id])
-            self._connections[user_id] = [
-                conn
-                for conn in self._connections[user_id]
-                if conn.websocket is not websocket
-            ]
-            removed = len(self._connections[user_id]) < original_count
-
-            if not self._connections[user_id]:
-                del self._connections[user_id]
-                logger.info("Unregistered last proactive connection for user %s", user_id)
-            elif removed:
-                logger.info(
-                    "Unregistered proactive connection for user %s (remaining: %d)",
-                    user_id,
-                    len(self._connections[user_id]),
-                )
+            removed = self._remove_connections(user_id, websocket)
+        if removed:
+            await self._publish_presence(user_id)
+        return removed
+
+    def _remove_connections(self, user_id: int, websocket: Optional[WebSocket]) -> bool:
+        """Drop ``websocket`` (or all) of ``user_id``'s connections; caller holds the lock."""
+        if user_id not in self._connections:
+            return False
 
-            return removed
+        if websocket is None:
+            for conn in self._connections.pop(user_id):
+                _stop_writer(conn)
+            logger.info("Unregistered all proactive connections for user %s", user_id)
+            return True
+
+        original_count = len(self._connections[user_id])
+        kept = []
+        for conn in self._connections[user_id]:
+            if conn.websocket is websocket:
+                _stop_writer(conn)
+            else:
+                kept.append(conn)
+        self._connections[user_id] = kept
+        removed = len(kept) < original_count
+
+        if not self._connections[user_id]:
+            del self._connections[user_id]
+            logger.info("Unregistered last proactive connection for user %s", user_id)
+        elif removed:
+            logger.info(
+                "Unregistered proactive connection for user %s (remaining: %d)",
+                user_id,
+                len(self._connections[user_id]),
+            )
+        return removed
+
+    async def _evict(self, conn: ConnectionInfo, reason: str) -> None:
+        """Writer callback: drop a connection that failed or fell behind."""
+        removed = await self.unregister(conn.user_id, conn.websocket)
+        if removed:
+            logger.info(
+                "Evicted proactive connection for user %s: %s", conn.user_id, reason
+            )
 
     async def get_connection(self, user_id: int) -> Optional[ConnectionInfo]:
         """Get first connection info for a user (for backwards compatibility)."""
@@ -190,16 +313,70 @@ class ProactiveConnectionRegistry:
                 the message's session_id. If False, push to ALL user connections
                 regardless of session (used for cross-session notifications).
 
-        Returns True if message was sent to at least one connection.
+        Returns True if message was sent to at least one connection (local, or
+        handed to another server holding one when a push bus is attached).
         """
+        delivered = await self._push_local(user_id, message, session_scoped)
+        if self._bus is None:
+            return delivered
+        forwarded = await self._push_remote(user_id, message, session_scoped)
+        return delivered or forwarded
+
+    async def _push_remote(
+        self, user_id: int, message: Dict[str, Any], session_scoped: bool
+    ) -> bool:
+        """Forward to the other servers that hold a matching connection."""
+        from .push_bus import PushEnvelope
+
+        bus = self._bus
+        if bus is None:
+            return False
+        try:
+            servers = await bus.locate(user_id)
+        except Exception as exc:
+            logger.warning("Presence lookup failed for user %s: %s", user_id, exc)
+            return False
+        target_session_id = _target_session_id(message) if session_scoped else None
+        if target_session_id:
+            servers = {
+                server_id: sessions
+                for server_id, sessions in servers.items()
+                if target_session_id in sessions or "*" in sessions
+            }
+        if not servers:
+            return False
+
+        envelope = PushEnvelope(
+            user_id=user_id,
+            message=message,
+            session_scoped=session_scoped,
+            origin=bus.server_id,
+        )
+        forwarded = False
+        for server_id in servers:
+            try:
+                forwarded = await bus.publish(server_id, envelope) or forwarded
+            except Exception as exc:
+                logger.warning(
+                    "Forwarding push for user %s to %s failed: %s", user_id, server_id, exc
+                )
+        return forwarded
+
+    async def _deliver_forwarded(self, envelope: "PushEnvelope") -> bool:
+        """Deliver a push forwarded by another server to local connections only."""
+        return await self._push_local(
+            envelope.user_id, envelope.message, envelope.session_scoped
+        )
+
+    async def _push_local(
+        self, user_id: int, message: Dict[str, Any], session_scoped: bool
+    ) -> bool:
         conns = self._connections.get(user_id, [])
         if not conns:
             return False
 
         if session_scoped:
-            target_session_id = message.get("session_id") or message.get("data", {}).get(
-                "session_id"
-            )
+            target_session_id = _target_session_id(message)
             if target_session_id:
                 conns = [
                     conn for conn in conns if conn.session_id == target_session_id
@@ -211,11 +388,18 @@ class ProactiveConnectionRegistry:
                     return False
 
         success_count = 0
+        queued = False
         failed_websockets = []
 
         event_type = message.get("type", "unknown")
 
         for conn in conns:
+            if conn.writer is not None:
+                # Non-blocking: a stalled client only fills its own queue.
+                if conn.writer.enqueue(message):
+                    success_count += 1
+                    queued = True
+                continue
             try:
                 await conn.websocket.send_json(message)
                 success_count += 1
@@ -234,6 +418,10 @@ class ProactiveConnectionRegistry:
         for ws in failed_websockets:
             await self.unregister(user_id, ws)
 
+        if queued:
+            # Yield once so idle writers start sending before the caller moves on.
+            await asyncio.sleep(0)
+
         return success_count > 0
 
     async def update_last_ping(
@@ -260,6 +448,15 @@ class ProactiveConnectionRegistry:
         return list(self._connections.keys())
 
 
+def _stop_writer(conn: ConnectionInfo) -> None:
+    if conn.writer is not None:
+        conn.writer.stop()
+
+
+def _target_session_id(message: Dict[str, Any]) -> Optional[str]:
+    return message.get("session_id") or (message.get("data") or {}).get("session_id")
+
+
 # Global singleton instance
 _registry: Optional[ProactiveConnectionRegistry] = None
 
@@ -0,0 +1,586 @@
+"""Cross-instance delivery for proactive WebSocket pushes.
+
+Each worker only holds the WebSockets that connected to it.  A push bus lets a
+worker that produced a notification hand it to the worker that holds the
+user's connection:
+
+- a *presence directory* maps ``user_id`` to the server ids (see
+  :func:`get_server_id`) with live connections for that user, plus the
+  session ids connected there, so session-scoped pushes are only forwarded
+  where they can be delivered;
+- every server listens on its own channel; a forwarded push is a
+  :class:`PushEnvelope` published to the owning server's channel, which
+  delivers it to its local connections;
+- *signals* are small ``(topic, key)`` broadcasts on a shared channel that
+  every other server passes to the handler registered with
+  :func:`on_signal` (e.g. waking long-poll waiters of a chat session).
+
+Backends:
+
+- ``memory``: :class:`InMemoryPushBus` instances sharing an
+  :class:`InMemoryPushHub`; simulates several workers inside one process.
+- ``redis``: Redis pub/sub, presence stored in one hash per user.  Requires
+  the optional ``redis`` package.
+- ``postgres``: ``LISTEN``/``NOTIFY`` on the main database.  Presence is
+  broadcast on a shared channel and replicated in memory on every server.
+  ``NOTIFY`` payloads are limited to 8000 bytes; larger pushes are not
+  forwarded and the client picks the message up by polling, as before.
+
+Presence entries expire after ``PROACTIVE_PUSH_PRESENCE_TTL`` seconds unless
+the registry refreshes them, so a crashed worker stops receiving pushes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from config.proactive_agent.defaults import (
+    PUSH_BUS_BACKEND,
+    PUSH_BUS_URL,
+    PUSH_PRESENCE_TTL_SECONDS,
+)
+from core.exceptions import ConfigurationError
+
+from .connection_info import get_server_id
+
+try:  # pragma: no cover - optional dependency guard
+    import redis.asyncio as redis_asyncio  # type: ignore
+except Exception:  # pragma: no cover - dependency guard
+    redis_asyncio = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "proactive_push"
+PRESENCE_CHANNEL = f"{CHANNEL_PREFIX}_presence"
+SIGNAL_CHANNEL = f"{CHANNEL_PREFIX}_signal"
+NOTIFY_PAYLOAD_LIMIT = 7999  # PostgreSQL rejects payloads of 8000 bytes or more
+
+
+@dataclass(slots=True)
+class PushEnvelope:
+    """A push forwarded to another server."""
+
+    user_id: int
+    message: Dict[str, Any]
+    session_scoped: bool = True
+    origin: str = ""
+
+    def encode(self) -> str:
+        return json.dumps(asdict(self), default=str, separators=(",", ":"))
+
+    @classmethod
+    def decode(cls, raw: str | bytes) -> "PushEnvelope":
+        data = json.loads(raw)
+        return cls(
+            user_id=int(data["user_id"]),
+            message=data["message"],
+            session_scoped=bool(data.get("session_scoped", True)),
+            origin=data.get("origin", ""),
+        )
+
+
+PushHandler = Callable[[PushEnvelope], Awaitable[bool]]
+PresenceSnapshot = Callable[[], Dict[int, Set[str]]]
+SignalHandler = Callable[[str], Any]
+
+_signal_handlers: Dict[str, SignalHandler] = {}
+
+
+def on_signal(topic: str, handler: SignalHandler) -> None:
+    """Call ``handler(key)`` for every ``topic`` signal sent by another server."""
+
+    _signal_handlers[topic] = handler
+
+
+def channel_for(server_id: str) -> str:
+    """Channel a server listens on for forwarded pushes."""
+
+    return f"{CHANNEL_PREFIX}_{server_id}"
+
+
+class PushBus(ABC):
+    """Presence directory plus point-to-point delivery between servers."""
+
+    name = "base"
+
+    def __init__(
+        self,
+        *,
+        server_id: Optional[str] = None,
+        presence_ttl: float = PUSH_PRESENCE_TTL_SECONDS,
+    ) -> None:
+        self.server_id = server_id or get_server_id()
+        self.presence_ttl = presence_ttl
+        self._handler: Optional[PushHandler] = None
+        self._snapshot: Optional[PresenceSnapshot] = None
+        self._tasks: Set[asyncio.Task[Any]] = set()
+
+    async def start(
+        self,
+        handler: PushHandler,
+        snapshot: Optional[PresenceSnapshot] = None,
+    ) -> None:
+        """Start receiving pushes addressed to this server.
+
+        ``snapshot`` returns the locally connected users and their session ids;
+        backends that replicate presence use it to answer peers that join later.
+        """
+
+        self._handler = handler
+        self._snapshot = snapshot
+
+    async def close(self) -> None:
+        """Stop receiving pushes and release connections."""
+
+        for task in list(self._tasks):
+            task.cancel()
+        self._handler = None
+
+    @abstractmethod
+    async def announce(self, user_id: int, session_ids: Iterable[str]) -> None:
+        """Record (or refresh) that ``user_id`` is connected to this server."""
+
+    @abstractmethod
+    async def withdraw(self, user_id: int) -> None:
+        """Record that ``user_id`` has no connections left on this server."""
+
+    @abstractmethod
+    async def locate(self, user_id: int) -> Dict[str, Set[str]]:
+        """Return ``{server_id: session_ids}`` for *other* servers holding the user."""
+
+    @abstractmethod
+    async def publish(self, server_id: str, envelope: PushEnvelope) -> bool:
+        """Forward ``envelope`` to ``server_id``; True if a listener received it."""
+
+    @abstractmethod
+    async def _send_signal(self, payload: str) -> None:
+        """Broadcast an encoded signal on :data:`SIGNAL_CHANNEL`."""
+
+    async def signal(self, topic: str, key: str) -> None:
+        """Broadcast ``key`` under ``topic`` to every other server."""
+
+        await self._send_signal(json.dumps({"topic": topic, "key": key, "origin": self.server_id}))
+
+    def signal_nowait(self, topic: str, key: str) -> None:
+        """Schedule :meth:`signal` from synchronous code; failures are logged."""
+
+        self._spawn(self._signal_quietly(topic, key))
+
+    async def _signal_quietly(self, topic: str, key: str) -> None:
+        try:
+            await self.signal(topic, key)
+        except Exception as exc:
+            logger.warning("Signal %s for %s failed: %s", topic, key, exc)
+
+    def _receive_signal(self, payload: str | bytes) -> None:
+        try:
+            event = json.loads(payload)
+            topic, key, origin = event["topic"], str(event["key"]), event.get("origin")
+        except (ValueError, KeyError, TypeError) as exc:
+            logger.warning("Dropping malformed signal: %s", exc)
+            return
+        handler = _signal_handlers.get(topic)
+        if handler is None or origin == self.server_id:
+            return
+        try:
+            handler(key)
+        except Exception as exc:  # pragma: no cover - defensive logging
+            logger.warning("Signal handler for %s failed: %s", topic, exc)
+
+    def _spawn(self, coro: Awaitable[Any]) -> None:
+        # Callers are synchronous; keep a reference until the task is done.
+        task = asyncio.get_running_loop().create_task(coro)  # type: ignore[arg-type]
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, envelope: PushEnvelope) -> bool:
+        handler = self._handler
+        if handler is None:
+            return False
+        try:
+            return await handler(envelope)
+        except Exception as exc:  # pragma: no cover - defensive logging
+            logger.warning("Forwarded push for user %s failed: %s", envelope.user_id, exc)
+            return False
+
+
+class InMemoryPushHub:
+    """Shared state for :class:`InMemoryPushBus` instances in one process."""
+
+    def __init__(self) -> None:
+        self.presence: Dict[int, Dict[str, tuple[Set[str], float]]] = {}
+        self.buses: Dict[str, "InMemoryPushBus"] = {}
+
+
+class InMemoryPushBus(PushBus):
+    """Push bus backed by an in-process hub (tests and single-host setups)."""
+
+    name = "memory"
+
+    def __init__(self, hub: Optional[InMemoryPushHub] = None, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.hub = hub or InMemoryPushHub()
+
+    async def start(self, handler: PushHandler, snapshot: Optional[PresenceSnapshot] = None) -> None:
+        await super().start(handler, snapshot)
+        self.hub.buses[self.server_id] = self
+
+    async def close(self) -> None:
+        self.hub.buses.pop(self.server_id, None)
+        for servers in self.hub.presence.values():
+            servers.pop(self.server_id, None)
+        await super().close()
+
+    async def announce(self, user_id: int, session_ids: Iterable[str]) -> None:
+        expires = time.monotonic() + self.presence_ttl
+        self.hub.presence.setdefault(user_id, {})[self.server_id] = (set(session_ids), expires)
+
+    async def withdraw(self, user_id: int) -> None:
+        servers = self.hub.presence.get(user_id)
+        if servers is not None:
+            servers.pop(self.server_id, None)
+            if not servers:
+                del self.hub.presence[user_id]
+
+    async def locate(self, user_id: int) -> Dict[str, Set[str]]:
+        now = time.monotonic()
+        servers = self.hub.presence.get(user_id, {})
+        return {
+            server_id: set(sessions)
+            for server_id, (sessions, expires) in servers.items()
+            if server_id != self.server_id and expires > now
+        }
+
+    async def publish(self, server_id: str, envelope: PushEnvelope) -> bool:
+        target = self.hub.buses.get(server_id)
+        if target is None:
+            return False
+        # Round-trip through JSON so tests see what a real transport delivers.
+        return await target._dispatch(PushEnvelope.decode(envelope.encode()))
+
+    async def _send_signal(self, payload: str) -> None:
+        for bus in list(self.hub.buses.values()):
+            bus._receive_signal(payload)
+
+
+class RedisPushBus(PushBus):
+    """Redis pub/sub transport; presence lives in ``proactive_push:presence:<user_id>`` hashes."""
+
+    name = "redis"
+
+    def __init__(self, url: str, **kwargs: Any) -> None:
+        if redis_asyncio is None:
+            raise ConfigurationError(
+                "PROACTIVE_PUSH_BUS=redis requires the 'redis' package",
+                key="PROACTIVE_PUSH_BUS",
+            )
+        super().__init__(**kwargs)
+        self.url = url
+        self._client: Any = None
+        self._pubsub: Any = None
+        self._listener: Optional[asyncio.Task[None]] = None
+
+    @staticmethod
+    def presence_key(user_id: int) -> str:
+        return f"{CHANNEL_PREFIX}:presence:{user_id}"
+
+    async def start(self, handler: PushHandler, snapshot: Optional[PresenceSnapshot] = None) -> None:
+        await super().start(handler, snapshot)
+        self._client = redis_asyncio.from_url(self.url, decode_responses=True)
+        self._pubsub = self._client.pubsub()
+        await self._pubsub.subscribe(channel_for(self.server_id), SIGNAL_CHANNEL)
+        self._listener = asyncio.create_task(self._listen(), name="proactive-push-redis")
+
+    async def _listen(self) -> None:
+        async for item in self._pubsub.listen():
+            if item.get("type") != "message":
+                continue
+            if item.get("channel") == SIGNAL_CHANNEL:
+                self._receive_signal(item["data"])
+                continue
+            try:
+                envelope = PushEnvelope.decode(item["data"])
+            except (ValueError, KeyError, TypeError) as exc:
+                logger.warning("Dropping malformed push envelope: %s", exc)
+                continue
+            await self._dispatch(envelope)
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._listener = None
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.unsubscribe()
+                await self._pubsub.aclose()
+            except Exception as exc:  # pragma: no cover - best effort shutdown
+                logger.debug("Redis pubsub close failed: %s", exc)
+            self._pubsub = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        await super().close()
+
+    async def announce(self, user_id: int, session_ids: Iterable[str]) -> None:
+        key = self.presence_key(user_id)
+        entry = json.dumps({"sessions": sorted(session_ids), "expires": time.time() + self.presence_ttl})
+        pipe = self._client.pipeline(transaction=False)
+        pipe.hset(key, self.server_id, entry)
+        pipe.expire(key, int(self.presence_ttl) + 1)
+        await pipe.execute()
+
+    async def withdraw(self, user_id: int) -> None:
+        await self._client.hdel(self.presence_key(user_id), self.server_id)
+
+    async def locate(self, user_id: int) -> Dict[str, Set[str]]:
+        entries = await self._client.hgetall(self.presence_key(user_id))
+        now = time.time()
+        located: Dict[str, Set[str]] = {}
+        stale = []
+        for server_id, raw in entries.items():
+            if server_id == self.server_id:
+                continue
+            try:
+                entry = json.loads(raw)
+            except ValueError:
+                stale.append(server_id)
+                continue
+            if entry.get("expires", 0) <= now:
+                stale.append(server_id)
+                continue
+            located[server_id] = set(entry.get("sessions") or ())
+        if stale:
+            await self._client.hdel(self.presence_key(user_id), *stale)
+        return located
+
+    async def publish(self, server_id: str, envelope: PushEnvelope) -> bool:
+        receivers = await self._client.publish(channel_for(server_id), envelope.encode())
+        return int(receivers) > 0
+
+    async def _send_signal(self, payload: str) -> None:
+        await self._client.publish(SIGNAL_CHANNEL, payload)
+
+
+class PostgresPushBus(PushBus):
+    """``LISTEN``/``NOTIFY`` transport with presence replicated in memory."""
+
+    name = "postgres"
+
+    def __init__(self, url: str, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.dsn = self.to_dsn(url)
+        self._listen_conn: Any = None
+        self._pool: Any = None
+        self._presence: Dict[int, Dict[str, tuple[Set[str], float]]] = {}
+
+    @staticmethod
+    def to_dsn(url: str) -> str:
+        """Turn the SQLAlchemy URL into a plain libpq DSN.
+
+        Connection parameters such as ``sslmode`` are kept.  ``options``
+        (``-csearch_path=...``) is dropped: asyncpg rejects it, and LISTEN/NOTIFY
+        does not touch any schema.
+        """
+
+        parts = urlsplit(url.replace("+asyncpg", "", 1))
+        query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if key != "options"]
+        return urlunsplit(parts._replace(query=urlencode(query)))
+
+    async def start(self, handler: PushHandler, snapshot: Optional[PresenceSnapshot] = None) -> None:
+        import asyncpg
+
+        await super().start(handler, snapshot)
+        self._listen_conn = await asyncpg.connect(self.dsn)
+        self._pool = await asyncpg.create_pool(self.dsn, min_size=1, max_size=4)
+        await self._listen_conn.add_listener(channel_for(self.server_id), self._on_push)
+        await self._listen_conn.add_listener(PRESENCE_CHANNEL, self._on_presence)
+        await self._listen_conn.add_listener(SIGNAL_CHANNEL, self._on_signal)
+        # Ask peers to re-announce so the replica is complete straight away.
+        await self._notify(PRESENCE_CHANNEL, json.dumps({"op": "sync", "server_id": self.server_id}))
+
+    async def close(self) -> None:
+        if self._listen_conn is not None:
+            try:
+                await self._listen_conn.close()
+            except Exception as exc:  # pragma: no cover - best effort shutdown
+                logger.debug("LISTEN connection close failed: %s", exc)
+            self._listen_conn = None
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+        self._presence.clear()
+        await super().close()
+
+    async def _notify(self, channel: str, payload: str) -> bool:
+        if len(payload.encode("utf-8")) > NOTIFY_PAYLOAD_LIMIT:
+            return False
+        await self._pool.execute("SELECT pg_notify($1, $2)", channel, payload)
+        return True
+
+    def _on_push(self, _conn: Any, _pid: int, _channel: str, payload: str) -> None:
+        try:
+            envelope = PushEnvelope.decode(payload)
+        except (ValueError, KeyError, TypeError) as exc:
+            logger.warning("Dropping malformed push envelope: %s", exc)
+            return
+        self._spawn(self._dispatch(envelope))
+
+    def _on_signal(self, _conn: Any, _pid: int, _channel: str, payload: str) -> None:
+        self._receive_signal(payload)
+
+    def _on_presence(self, _conn: Any, _pid: int, _channel: str, payload: str) -> None:
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            return
+        server_id = event.get("server_id")
+        if not server_id or server_id == self.server_id:
+            return
+        op = event.get("op")
+        if op == "sync":
+            self._spawn(self._announce_all())
+            return
+        user_id = int(event.get("user_id", 0))
+        if op == "announce":
+            expires = time.monotonic() + float(event.get("ttl", self.presence_ttl))
+            self._presence.setdefault(user_id, {})[server_id] = (set(event.get("sessions") or ()), expires)
+        elif op == "withdraw":
+            servers = self._presence.get(user_id)
+            if servers is not None:
+                servers.pop(server_id, None)
+                if not servers:
+                    del self._presence[user_id]
+
+    async def _announce_all(self) -> None:
+        if self._snapshot is None:
+            return
+        for user_id, session_ids in self._snapshot().items():
+            await self.announce(user_id, session_ids)
+
+    async def announce(self, user_id: int, session_ids: Iterable[str]) -> None:
+        event = {
+            "op": "announce",
+            "server_id": self.server_id,
+            "user_id": user_id,
+            "sessions": sorted(session_ids),
+            "ttl": self.presence_ttl,
+        }
+        if not await self._notify(PRESENCE_CHANNEL, json.dumps(event)):
+            # Too many sessions to list: advertise the user without them and let the
+            # owning server apply session scoping on delivery.
+            event["sessions"] = ["*"]
+            await self._notify(PRESENCE_CHANNEL, json.dumps(event))
+
+    async def withdraw(self, user_id: int) -> None:
+        event = {"op": "withdraw", "server_id": self.server_id, "user_id": user_id}
+        await self._notify(PRESENCE_CHANNEL, json.dumps(event))
+
+    async def locate(self, user_id: int) -> Dict[str, Set[str]]:
+        now = time.monotonic()
+        servers = self._presence.get(user_id, {})
+        return {
+            server_id: set(sessions)
+            for server_id, (sessions, expires) in servers.items()
+            if expires > now
+        }
+
+    async def publish(self, server_id: str, envelope: PushEnvelope) -> bool:
+        payload = envelope.encode()
+        if not await self._notify(channel_for(server_id), payload):
+            logger.info(
+                "Push for user %s too large for NOTIFY (%d bytes); client will poll",
+                envelope.user_id,
+                len(payload),
+            )
+            return False
+        # NOTIFY does not report listeners; presence says the server is alive.
+        return True
+
+    async def _send_signal(self, payload: str) -> None:
+        await self._notify(SIGNAL_CHANNEL, payload)
+
+
+def create_push_bus(
+    backend: Optional[str] = None,
+    url: Optional[str] = None,
+    **kwargs: Any,
+) -> Optional[PushBus]:
+    """Build the push bus selected by ``PROACTIVE_PUSH_BUS`` (None when disabled)."""
+
+    backend = (backend if backend is not None else PUSH_BUS_BACKEND).strip().lower()
+    url = url if url is not None else PUSH_BUS_URL
+    if backend in ("", "none", "off"):
+        return None
+    if backend == "memory":
+        return InMemoryPushBus(**kwargs)
+    if backend == "redis":
+        return RedisPushBus(url or os.getenv("REDIS_URL", "redis://localhost:6379/0"), **kwargs)
+    if backend == "postgres":
+        if not url:
+            from config.database.urls import MAIN_DB_URL
+
+            url = MAIN_DB_URL
+        if not url.startswith("postgresql"):
+            raise ConfigurationError(
+                "PROACTIVE_PUSH_BUS=postgres requires a PostgreSQL URL",
+                key="PROACTIVE_PUSH_BUS_URL",
+            )
+        return PostgresPushBus(url, **kwargs)
+    raise ConfigurationError(f"Unknown push bus backend: {backend}", key="PROACTIVE_PUSH_BUS")
+
+
+async def start_push_bus() -> Optional[PushBus]:
+    """Create the configured bus and attach it to the global proactive registry.
+
+    A bus that cannot connect is logged and skipped: pushes then reach local
+    connections only and other clients fall back to polling.
+    """
+
+    from .proactive_registry import get_proactive_registry
+
+    bus = create_push_bus()
+    if bus is None:
+        return None
+    try:
+        await get_proactive_registry().attach_bus(bus)
+    except Exception as exc:
+        logger.warning("Proactive push bus (%s) unavailable, pushes stay local: %s", bus.name, exc)
+        await bus.close()
+        return None
+    logger.info("Proactive push bus started: backend=%s server=%s", bus.name, bus.server_id)
+    return bus
+
+
+async def stop_push_bus() -> None:
+    """Detach and close the global registry's bus, if any."""
+
+    from .proactive_registry import get_proactive_registry
+
+    await get_proactive_registry().detach_bus()
+
+
+__all__ = [
+    "InMemoryPushBus",
+    "InMemoryPushHub",
+    "PostgresPushBus",
+    "PushBus",
+    "PushEnvelope",
+    "RedisPushBus",
+    "channel_for",
+    "create_push_bus",
+    "on_signal",
+    "start_push_bus",
+    "stop_push_bus",
+]
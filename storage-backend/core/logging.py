@@ -1,10 +1,18 @@
 """Centralised logging configuration for the BetterAI backend."""
 from __future__ import annotations
 
+import atexit
+import copy
+import json
 import logging
 import logging.config
+import queue
+import threading
+import time
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Dict
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from core.utils.env import get_env
 
@@ -13,6 +21,22 @@ _ORIGINAL_LOG_RECORD_FACTORY = logging.getLogRecordFactory()
 _LOG_RECORD_FACTORY_CONFIGURED = False
 
 _LOGGING_CONFIGURED = False
+_QUEUE_LISTENERS: List[QueueListener] = []
+_THROTTLED_LOGGERS: List[str] = []
+
+# Hot-path loggers that are thinned out unless overridden through
+# BACKEND_LOG_SAMPLING / BACKEND_LOG_RATE_LIMITS.  Warnings and errors always pass.
+DEFAULT_LOG_SAMPLING: Dict[str, int] = {
+    "features.chat.utils.websocket_streaming.chunks": 10,
+}
+DEFAULT_LOG_RATE_LIMITS: Dict[str, float] = {
+    "core.providers.semantic.embeddings.calls": 5.0,
+}
+
+# Attributes every LogRecord carries; anything else came from ``extra=``.
+_STANDARD_RECORD_ATTRS = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", None, None)).keys()
+) | {"message", "asctime", "shortpathname", "taskName"}
 
 
 class _NoBinaryFilter(logging.Filter):
@@ -58,6 +82,174 @@ class _NoPingPongFilter(logging.Filter):
         return not any(token in message for token in self._BLACKLIST)
 
 
+class LogThrottleFilter(logging.Filter):
+    """Sample and rate-limit records below WARNING for one chatty logger.
+
+    ``sample_every`` keeps one record out of N; ``max_per_second`` caps the
+    records that pass within any one-second window.  The number of records
+    dropped since the last one that passed is attached as ``suppressed``.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_every: int = 1,
+        max_per_second: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__()
+        self.sample_every = max(1, int(sample_every))
+        self.max_per_second = max_per_second if max_per_second and max_per_second > 0 else None
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._seen = 0
+        self._suppressed = 0
+        self._window_start = 0.0
+        self._window_count = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+
+        with self._lock:
+            self._seen += 1
+            keep = (self._seen - 1) % self.sample_every == 0
+            if keep and self.max_per_second is not None:
+                now = self._clock()
+                if now - self._window_start >= 1.0:
+                    self._window_start = now
+                    self._window_count = 0
+                keep = self._window_count < self.max_per_second
+                if keep:
+                    self._window_count += 1
+            if not keep:
+                self._suppressed += 1
+                return False
+            if self._suppressed:
+                record.suppressed = self._suppressed
+                self._suppressed = 0
+        return True
+
+
+class JsonLogFormatter(logging.Formatter):
+    """Render records as single-line JSON documents including ``extra`` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, object] = {
+            "timestamp": datetime.fromtimestamp(record.created, UTC).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "location": f"{getattr(record, 'shortpathname', record.pathname)}:{record.lineno}",
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _STANDARD_RECORD_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exception"] = record.exc_text
+        if record.stack_info:
+            payload["stack"] = record.stack_info
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """Hand records to a listener thread without formatting them twice.
+
+    The stock ``prepare`` bakes the traceback into ``msg``; here the message
+    arguments are merged and the traceback is kept in ``exc_text`` so the
+    downstream formatter (text or JSON) decides how to render it.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _parse_logger_map(raw: Optional[str], cast: Callable[[str], float]) -> Dict[str, float]:
+    """Parse ``name=value,name2=value`` pairs from an environment variable."""
+
+    parsed: Dict[str, float] = {}
+    for entry in (raw or "").split(","):
+        name, sep, value = entry.partition("=")
+        if not sep or not name.strip():
+            continue
+        try:
+            parsed[name.strip()] = cast(value.strip())
+        except ValueError:
+            continue
+    return parsed
+
+
+def configure_log_throttling(
+    sampling: Mapping[str, int],
+    rate_limits: Mapping[str, float],
+) -> None:
+    """Attach a :class:`LogThrottleFilter` to each configured logger."""
+
+    for name in _THROTTLED_LOGGERS:
+        target = logging.getLogger(name)
+        for existing in [f for f in target.filters if isinstance(f, LogThrottleFilter)]:
+            target.removeFilter(existing)
+    _THROTTLED_LOGGERS.clear()
+
+    for name in sorted(set(sampling) | set(rate_limits)):
+        logging.getLogger(name).addFilter(
+            LogThrottleFilter(
+                sample_every=int(sampling.get(name, 1)),
+                max_per_second=rate_limits.get(name),
+            )
+        )
+        _THROTTLED_LOGGERS.append(name)
+
+
+def _stop_queue_listeners() -> None:
+    while _QUEUE_LISTENERS:
+        listener = _QUEUE_LISTENERS.pop()
+        try:
+            listener.stop()
+        except Exception:  # pragma: no cover - interpreter shutdown
+            pass
+
+
+def install_queue_logging(loggers: Iterable[logging.Logger]) -> List[QueueListener]:
+    """Move the handlers of ``loggers`` behind queue listeners.
+
+    Callers only enqueue records; formatting and console/file I/O happen on
+    listener threads.  Loggers sharing the same handlers share one listener.
+    """
+
+    groups: Dict[Tuple[int, ...], Tuple[List[logging.Handler], QueueHandler]] = {}
+    listeners: List[QueueListener] = []
+    for target in loggers:
+        handlers = [h for h in target.handlers if not isinstance(h, QueueHandler)]
+        if not handlers:
+            continue
+        key = tuple(sorted(id(h) for h in handlers))
+        if key not in groups:
+            log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+            listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+            listener.start()
+            listeners.append(listener)
+            groups[key] = (handlers, _NonBlockingQueueHandler(log_queue))
+        for handler in handlers:
+            target.removeHandler(handler)
+        target.addHandler(groups[key][1])
+
+    _QUEUE_LISTENERS.extend(listeners)
+    return listeners
+
+
+atexit.register(_stop_queue_listeners)
+
+
 def _resolve_level(value: str, default: str) -> str:
     value = (value or "").strip().upper()
     if value and getattr(logging, value, None) is not None:
@@ -65,6 +257,10 @@ def _resolve_level(value: str, default: str) -> str:
     return default
 
 
+def _resolve_format(value: Optional[str]) -> str:
+    return "json" if (value or "").strip().lower() == "json" else "standard"
+
+
 def _install_log_record_factory() -> None:
     """Install a log record factory that exposes trimmed paths."""
 
@@ -93,6 +289,7 @@ def setup_logging(force: bool = False) -> None:
     global _LOGGING_CONFIGURED
     if _LOGGING_CONFIGURED and not force:
         return
+    _stop_queue_listeners()
 
     node_env = get_env("NODE_ENV")
     inside_docker = bool(node_env)
@@ -103,11 +300,14 @@ def setup_logging(force: bool = False) -> None:
     )
     file_level = _resolve_level(get_env("BACKEND_LOG_FILE_LEVEL", default=log_level), log_level)
 
+    console_format = _resolve_format(get_env("BACKEND_LOG_CONSOLE_FORMAT", default="text"))
+    file_format = _resolve_format(get_env("BACKEND_LOG_FILE_FORMAT", default="json"))
+
     handlers: Dict[str, object] = {
         "console": {
             "class": "logging.StreamHandler",
             "level": console_level,
-            "formatter": "standard",
+            "formatter": console_format,
             "stream": "ext://sys.stdout",
         },
     }
@@ -121,7 +321,7 @@ def setup_logging(force: bool = False) -> None:
         handlers["file"] = {
             "class": "logging.handlers.TimedRotatingFileHandler",
             "level": file_level,
-            "formatter": "standard",
+            "formatter": file_format,
             "filename": str(log_file),
             "when": "midnight",
             "backupCount": int(get_env("BACKEND_LOG_RETENTION", default="7") or "7"),
@@ -151,6 +351,9 @@ def setup_logging(force: bool = False) -> None:
                 "format": fmt,
                 "datefmt": datefmt,
             },
+            "json": {
+                "()": JsonLogFormatter,
+            },
         },
         "handlers": handlers,
         "root": {
@@ -254,7 +457,25 @@ def setup_logging(force: bool = False) -> None:
 
     logging.getLogger("h11").addFilter(_NoBinaryFilter())
 
+    configure_log_throttling(
+        {**DEFAULT_LOG_SAMPLING, **_parse_logger_map(get_env("BACKEND_LOG_SAMPLING"), int)},
+        {**DEFAULT_LOG_RATE_LIMITS, **_parse_logger_map(get_env("BACKEND_LOG_RATE_LIMITS"), float)},
+    )
+
+    if (get_env("BACKEND_LOG_ASYNC", default="true") or "true").lower() in {"1", "true", "yes", "on"}:
+        install_queue_logging(
+            logging.getLogger(name) for name in ("", "uvicorn", "uvicorn.error", "uvicorn.access")
+        )
+
     _LOGGING_CONFIGURED = True
 
 
-__all__ = ["setup_logging"]
+__all__ = [
+    "DEFAULT_LOG_RATE_LIMITS",
+    "DEFAULT_LOG_SAMPLING",
+    "JsonLogFormatter",
+    "LogThrottleFilter",
+    "configure_log_throttling",
+    "install_queue_logging",
+    "setup_logging",
+]
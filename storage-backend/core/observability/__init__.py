@@ -5,6 +5,7 @@ from .metrics import (
     record_transcription_success,
 )
 from .request_logging import (
+    HttpRequestLoggingMiddleware,
     log_websocket_request,
     register_http_request_logging,
     render_payload_preview,
@@ -13,6 +14,7 @@ from .request_logging import (
 __all__ = [
     "record_transcription_failure",
     "record_transcription_success",
+    "HttpRequestLoggingMiddleware",
     "log_websocket_request",
     "register_http_request_logging",
     "render_payload_preview",
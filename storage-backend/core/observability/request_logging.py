@@ -5,9 +5,12 @@ import json
 import logging
 from typing import Any, Iterable, Mapping
 
-from fastapi import FastAPI, Request, WebSocket
+from fastapi import FastAPI, WebSocket
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 _PAYLOAD_PREVIEW_LIMIT = 4096
+# Request bodies with these content types are never buffered for previews.
+_UNPREVIEWED_CONTENT_TYPES = ("multipart/", "application/octet-stream", "audio/", "video/", "image/")
 _SENSITIVE_HEADERS = {"authorization", "cookie", "x-api-key"}
 # Paths to skip HTTP request logging (high-frequency internal endpoints)
 _QUIET_PATH_PREFIXES = ("/api/v1/proactive-agent/",)
@@ -46,21 +49,31 @@ def _format_client_address(client: tuple[str, int] | None) -> str:
     return f"{host}:{port}" if port is not None else host
 
 
-def _format_body_preview(body: bytes) -> str:
-    if not body:
+def _decode_preview(snippet: bytes, *, truncated: bool) -> str | None:
+    # A capped snippet may end in the middle of a multi-byte character.
+    for trim in range(4 if truncated else 1):
+        try:
+            return snippet[: len(snippet) - trim].decode("utf-8")
+        except UnicodeDecodeError:
+            continue
+    return None
+
+
+def _format_body_preview(body: bytes, *, total_size: int | None = None) -> str:
+    total = len(body) if total_size is None else total_size
+    if not total:
         return "<empty>"
 
-    is_truncated = len(body) > _PAYLOAD_PREVIEW_LIMIT
+    is_truncated = total > _PAYLOAD_PREVIEW_LIMIT
     snippet = body[:_PAYLOAD_PREVIEW_LIMIT]
 
-    try:
-        text = snippet.decode("utf-8")
-    except UnicodeDecodeError:
-        return f"<binary {len(body)} bytes>"
+    text = _decode_preview(snippet, truncated=is_truncated)
+    if text is None:
+        return f"<binary {total} bytes>"
 
     text = " ".join(text.split())
     if is_truncated:
-        return f"{text}… ({len(body)} bytes)"
+        return f"{text}… ({total} bytes)"
     return text
 
 
@@ -157,44 +170,95 @@ def render_payload_preview(payload: Any) -> str:
     return _format_body_preview(serialized.encode("utf-8", errors="ignore"))
 
 
+class HttpRequestLoggingMiddleware:
+    """ASGI middleware logging each HTTP request with a capped body preview.
+
+    The body is never read on behalf of the application: the preview is
+    copied from the ``http.request`` messages as the endpoint consumes them,
+    keeping at most ``_PAYLOAD_PREVIEW_LIMIT`` bytes.  Uploads and other
+    binary content types are summarised by their declared length only.
+    """
+
+    def __init__(self, app: ASGIApp, *, logger_name: str = "core.http") -> None:
+        self.app = app
+        self.logger = logging.getLogger(logger_name)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope.get("path", "")
+        if any(path.startswith(prefix) for prefix in _QUIET_PATH_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        method = scope.get("method", "")
+        self.logger.info("HTTP %s %s from %s", method, path, _format_client_address(scope.get("client")))
+
+        query = scope.get("query_string", b"").decode("latin-1")
+        headers = {key.lower(): value for key, value in scope.get("headers", ())}
+        content_type = headers.get(b"content-type", b"").decode("latin-1").lower()
+        content_length = headers.get(b"content-length", b"").decode("latin-1")
+
+        def _emit(body_part: str | None) -> None:
+            parts: list[str] = []
+            if query:
+                parts.append(f"query={_format_query(query)}")
+            if body_part:
+                parts.append(f"body={body_part}")
+            self.logger.info("HTTP %s %s payload %s", method, path, "; ".join(parts) if parts else "<none>")
+
+        if content_type.startswith(_UNPREVIEWED_CONTENT_TYPES):
+            size = f"{content_length} bytes" if content_length else "unknown size"
+            _emit(f"<{content_type.split(';', 1)[0]} {size}, not previewed>")
+            await self.app(scope, receive, send)
+            return
+
+        preview = bytearray()
+        total = 0
+        logged = False
+
+        def _flush() -> None:
+            nonlocal logged
+            if logged:
+                return
+            logged = True
+            _emit(_format_body_preview(bytes(preview), total_size=total) if total else None)
+
+        async def _receive() -> Message:
+            nonlocal total
+            message = await receive()
+            if message["type"] == "http.request":
+                chunk = message.get("body", b"")
+                total += len(chunk)
+                room = _PAYLOAD_PREVIEW_LIMIT - len(preview)
+                if room > 0 and chunk:
+                    preview.extend(chunk[:room])
+                if not message.get("more_body", False):
+                    _flush()
+            elif message["type"] == "http.disconnect":
+                _flush()
+            return message
+
+        async def _send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                _flush()
+            await send(message)
+
+        try:
+            await self.app(scope, _receive, _send)
+        finally:
+            _flush()
+
+
 def register_http_request_logging(app: FastAPI, *, logger_name: str = "core.http") -> None:
     """Attach middleware that logs every HTTP request."""
 
     if getattr(app.state, "_http_request_logging_installed", False):  # pragma: no cover - idempotence
         return
 
-    logger = logging.getLogger(logger_name)
-
-    @app.middleware("http")
-    async def _log_request(request: Request, call_next):  # type: ignore[override]
-        path = request.url.path
-        is_quiet = any(path.startswith(prefix) for prefix in _QUIET_PATH_PREFIXES)
-
-        body = await request.body()
-        if body:
-            request._body = body  # type: ignore[attr-defined]  # Allow downstream handlers to re-read
-
-        if not is_quiet:
-            client = request.client
-            client_addr = _format_client_address((client.host, client.port) if client else None)
-            logger.info("HTTP %s %s from %s", request.method, path, client_addr)
-
-            debug_parts: list[str] = []
-            if request.url.query:
-                debug_parts.append(f"query={_format_query(request.url.query)}")
-            if body:
-                debug_parts.append(f"body={render_payload_preview(body)}")
-
-            logger.info(
-                "HTTP %s %s payload %s",
-                request.method,
-                path,
-                "; ".join(debug_parts) if debug_parts else "<none>",
-            )
-
-        response = await call_next(request)
-        return response
-
+    app.add_middleware(HttpRequestLoggingMiddleware, logger_name=logger_name)
     app.state._http_request_logging_installed = True
 
 
@@ -228,4 +292,9 @@ def log_websocket_request(
         log.debug("%s request details: %s", name, "; ".join(debug_parts))
 
 
-__all__ = ["log_websocket_request", "register_http_request_logging", "render_payload_preview"]
+__all__ = [
+    "HttpRequestLoggingMiddleware",
+    "log_websocket_request",
+    "register_http_request_logging",
+    "render_payload_preview",
+]
@@ -30,6 +30,7 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional
 
 if TYPE_CHECKING:
@@ -160,6 +161,26 @@ class BaseImageProvider(ABC):
         raise NotImplementedError
 
 
+@dataclass(slots=True)
+class VideoOperationStatus:
+    """Normalised status of a background video generation.
+
+    ``state`` is one of ``processing``, ``completed`` or ``failed``.  ``asset``
+    carries whatever the provider needs to stream the finished video and is
+    only meaningful while the status object is in memory.
+    """
+
+    state: str
+    provider_status: Optional[str] = None
+    progress: Optional[float] = None
+    asset: Any = None
+    error: Optional[str] = None
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.state in {"completed", "failed"}
+
+
 class BaseVideoProvider(ABC):
     """Base interface for video generation providers."""
 
@@ -191,3 +212,35 @@ class BaseVideoProvider(ABC):
                 f"{self.__class__.__name__} doesn't support image-to-video"
             )
         raise NotImplementedError
+
+    async def start_generation(
+        self,
+        prompt: str,
+        *,
+        image_url: str | None = None,
+        model: str | None = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Submit a generation without waiting for it.
+
+        Returns a JSON-serialisable handle that :meth:`check_generation`
+        accepts, so the operation can be resumed after a restart.
+        """
+
+        raise NotImplementedError(
+            f"{self.__class__.__name__} doesn't support background generation"
+        )
+
+    async def check_generation(self, handle: Dict[str, Any]) -> VideoOperationStatus:
+        """Fetch the current status of a submitted generation."""
+
+        raise NotImplementedError(
+            f"{self.__class__.__name__} doesn't support background generation"
+        )
+
+    def stream_generation(self, status: VideoOperationStatus) -> AsyncIterator[bytes]:
+        """Stream the finished video of a completed generation in chunks."""
+
+        raise NotImplementedError(
+            f"{self.__class__.__name__} doesn't support background generation"
+        )
@@ -5,12 +5,14 @@ from __future__ import annotations
 import asyncio
 import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, AsyncIterator, Collection, Dict, List, Optional
 
-from anthropic import AsyncAnthropic
+if TYPE_CHECKING:
+    from anthropic import AsyncAnthropic
 
 from config.batch.defaults import (
     BATCH_POLLING_INTERVAL_SECONDS,
+    BATCH_SCHEDULER_LIST_MAX_PAGES,
     BATCH_TIMEOUT_SECONDS,
 )
 from core.exceptions import ProviderError
@@ -96,11 +98,57 @@ class AnthropicBatchOperations:
 
             await asyncio.sleep(polling_interval)
 
-    async def download_results(self, batch_id: str) -> List[Dict[str, Any]]:
-        """Download Anthropic batch results."""
+    async def retrieve_batch(self, batch_id: str) -> Any:
+        """Return the current provider record for ``batch_id``."""
+
+        try:
+            return await self.client.messages.batches.retrieve(batch_id)
+        except Exception as exc:  # pragma: no cover - network failure
+            logger.exception("Failed to retrieve Anthropic batch status")
+            raise ProviderError("Anthropic batch polling failed", provider="anthropic", original_error=exc) from exc
+
+    async def list_batches(
+        self,
+        batch_ids: Collection[str],
+        *,
+        page_size: int = 100,
+        max_pages: int = BATCH_SCHEDULER_LIST_MAX_PAGES,
+    ) -> Dict[str, Any]:
+        """Return provider records for ``batch_ids`` via the list endpoint.
+
+        Ids not found in the first ``max_pages`` pages are retrieved individually.
+        """
+
+        wanted = set(batch_ids)
+        found: Dict[str, Any] = {}
+        after_id: Optional[str] = None
+        for _ in range(max(0, max_pages)):
+            if not wanted - found.keys():
+                break
+            params: Dict[str, Any] = {"limit": page_size}
+            if after_id:
+                params["after_id"] = after_id
+            try:
+                page = await self.client.messages.batches.list(**params)
+            except Exception as exc:  # pragma: no cover - network failure
+                logger.exception("Failed to list Anthropic batches")
+                raise ProviderError("Anthropic batch listing failed", provider="anthropic", original_error=exc) from exc
+
+            data = list(getattr(page, "data", None) or [])
+            for batch in data:
+                if batch.id in wanted:
+                    found[batch.id] = batch
+            after_id = getattr(page, "last_id", None) or (data[-1].id if data else None)
+            if not data or not getattr(page, "has_more", False) or not after_id:
+                break
+
+        for batch_id in wanted - found.keys():
+            found[batch_id] = await self.retrieve_batch(batch_id)
+        return found
+
+    async def iter_results(self, batch_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """Stream Anthropic batch results one entry at a time."""
 
-        logger.info("Downloading results for Anthropic batch %s", batch_id)
-        results: List[Dict[str, Any]] = []
         try:
             # results() is a coroutine that returns an async iterator
             result_iterator = await self.client.messages.batches.results(batch_id)
@@ -108,13 +156,6 @@ class AnthropicBatchOperations:
                 custom_id = getattr(result, "custom_id", None)
                 result_data = getattr(result, "result", None)
 
-                results.append(
-                    {
-                        "custom_id": custom_id,
-                        "result": result_data,
-                    }
-                )
-
                 logger.debug(
                     "Processed Anthropic batch result",
                     extra={
@@ -123,10 +164,17 @@ class AnthropicBatchOperations:
                         "has_error": bool(getattr(result_data, "error", None)) if result_data else False,
                     },
                 )
+                yield {"custom_id": custom_id, "result": result_data}
         except Exception as exc:  # pragma: no cover - network failure
             logger.exception("Failed to download Anthropic batch results")
             raise ProviderError("Failed to download Anthropic batch results", provider="anthropic", original_error=exc) from exc
 
+    async def download_results(self, batch_id: str) -> List[Dict[str, Any]]:
+        """Download Anthropic batch results."""
+
+        logger.info("Downloading results for Anthropic batch %s", batch_id)
+        results = [result async for result in self.iter_results(batch_id)]
+
         logger.info("Downloaded %d Anthropic batch results", len(results))
         if not results:
             logger.warning("Anthropic batch %s returned no results", batch_id)
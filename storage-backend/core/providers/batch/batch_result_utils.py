@@ -1,10 +1,13 @@
 """Utilities for batch result processing."""
 
+from __future__ import annotations
+
 import json
 import logging
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List
 
-from openai import AsyncOpenAI
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
 
 from core.exceptions import ProviderError
 
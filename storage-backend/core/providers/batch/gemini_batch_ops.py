@@ -6,7 +6,7 @@ import asyncio
 import json
 import tempfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from google import genai  # type: ignore
 from google.genai import types  # type: ignore
@@ -175,27 +175,49 @@ class GeminiBatchOperations:
 
             await asyncio.sleep(polling_interval)
 
-    async def download_results(self, destination: Any) -> List[Dict[str, Any]]:
-        """Download Gemini batch results."""
+    async def get_batch(self, batch_name: str) -> Any:
+        """Return the current provider record for ``batch_name``."""
+
+        try:
+            return await self._run_in_thread(lambda: self.client.batches.get(name=batch_name))
+        except Exception as exc:  # pragma: no cover - network failure
+            logger.exception("Failed to retrieve Gemini batch status")
+            raise ProviderError("Gemini batch polling failed", provider="google", original_error=exc) from exc
+
+    async def iter_results(self, destination: Any) -> AsyncIterator[Dict[str, Any]]:
+        """Yield Gemini batch results in request order."""
 
-        results: List[Dict[str, Any]] = []
         if hasattr(destination, "inlined_responses") and destination.inlined_responses:
             logger.info("Processing inline Gemini batch results")
             for response in destination.inlined_responses:
-                results.append(
-                    {
-                        "key": getattr(response, "key", None),
-                        "response": getattr(response, "response", None),
-                        "error": getattr(response, "error", None),
-                    }
-                )
-            return results
+                yield {
+                    "key": getattr(response, "key", None),
+                    "response": getattr(response, "response", None),
+                    "error": getattr(response, "error", None),
+                }
+            return
 
         file_name = getattr(destination, "file_name", None)
         if not file_name:
             logger.info("No Gemini batch results to download")
-            return results
+            return
+
+        # The Files API only offers whole-file downloads; parse it line by line.
+        content = await self._download_result_file(file_name)
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logger.debug("Skipping invalid Gemini batch result line: %s", line)
+
+    async def download_results(self, destination: Any) -> List[Dict[str, Any]]:
+        """Download Gemini batch results."""
+
+        return [result async for result in self.iter_results(destination)]
 
+    async def _download_result_file(self, file_name: str) -> str:
         logger.info("Downloading Gemini batch results from file %s", file_name)
 
         def _download():
@@ -207,16 +229,7 @@ class GeminiBatchOperations:
             logger.exception("Failed to download Gemini batch results")
             raise ProviderError("Gemini batch result download failed", provider="google", original_error=exc) from exc
 
-        content = file_content.decode("utf-8") if isinstance(file_content, bytes) else str(file_content)
-        for line in content.strip().split("\n"):
-            if not line:
-                continue
-            try:
-                results.append(json.loads(line))
-            except json.JSONDecodeError:
-                logger.debug("Skipping invalid Gemini batch result line: %s", line)
-
-        return results
+        return file_content.decode("utf-8") if isinstance(file_content, bytes) else str(file_content)
 
     async def submit_and_wait(
         self,
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from openai import AsyncOpenAI
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
 
 from config.batch import OPENAI_BATCH_COMPLETION_WINDOW, OPENAI_BATCH_ENDPOINT
 from core.exceptions import ProviderError
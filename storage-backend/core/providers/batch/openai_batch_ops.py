@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Collection, Dict, List, Optional
 
-from openai import AsyncOpenAI
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
 
 from config.batch import OPENAI_BATCH_ENDPOINT
 from .file_operations import BatchFileOperations
@@ -75,6 +76,44 @@ class OpenAIBatchOperations:
         """Download and parse batch results from OpenAI."""
         return await self.result_ops.download_results(output_file_id)
 
+    async def list_batches(self, batch_ids: Collection[str]) -> Dict[str, Any]:
+        """Return provider records for several batches in one listing pass."""
+        return await self.polling_ops.list_batches(batch_ids)
+
+    def iter_results(self, file_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """Stream parsed result lines from an output or error file."""
+        return self.result_ops.iter_results(file_id)
+
+    async def submit(
+        self,
+        requests: List[Dict[str, Any]],
+        *,
+        description: Optional[str] = None,
+        endpoint: str = OPENAI_BATCH_ENDPOINT,
+    ) -> Dict[str, str]:
+        """Upload ``requests`` and create a batch without waiting for it.
+
+        Returns the batch id and the uploaded input file id; the input file
+        must be kept until the batch ends and removed with :meth:`cleanup_file`.
+        """
+
+        temp_file = await self.create_jsonl_file(requests, endpoint=endpoint)
+        try:
+            input_file_id = await self.upload_batch_file(temp_file)
+        finally:
+            temp_file.unlink(missing_ok=True)
+
+        try:
+            batch_id = await self.create_batch_job(
+                input_file_id,
+                description=description,
+                endpoint=endpoint,
+            )
+        except Exception:
+            await self.cleanup_file(input_file_id)
+            raise
+        return {"batch_id": batch_id, "input_file_id": input_file_id}
+
     async def cleanup_file(self, file_id: Optional[str]) -> None:
         """Delete an uploaded file."""
         await self.file_ops.cleanup_file(file_id)
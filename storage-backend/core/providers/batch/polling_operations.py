@@ -4,11 +4,17 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Collection, Dict, Optional
 
-from openai import AsyncOpenAI
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
 
-from config.batch import BATCH_INITIAL_POLLING_DELAY_SECONDS, BATCH_POLLING_INTERVAL_SECONDS, BATCH_TIMEOUT_SECONDS
+from config.batch import (
+    BATCH_INITIAL_POLLING_DELAY_SECONDS,
+    BATCH_POLLING_INTERVAL_SECONDS,
+    BATCH_SCHEDULER_LIST_MAX_PAGES,
+    BATCH_TIMEOUT_SECONDS,
+)
 from core.exceptions import ProviderError
 from .batch_result_utils import download_batch_results, process_batch_error_file
 
@@ -176,5 +182,55 @@ class BatchPollingOperations:
             )
             await asyncio.sleep(polling_interval)
 
+    async def retrieve_batch(self, batch_id: str) -> Any:
+        """Return the current provider record for ``batch_id``."""
+
+        try:
+            return await self.client.batches.retrieve(batch_id)
+        except Exception as exc:  # pragma: no cover - network failure
+            logger.exception("Error retrieving batch status", extra={"batch_id": batch_id})
+            raise ProviderError("Batch polling failed", provider="openai", original_error=exc) from exc
+
+    async def list_batches(
+        self,
+        batch_ids: Collection[str],
+        *,
+        page_size: int = 100,
+        max_pages: int = BATCH_SCHEDULER_LIST_MAX_PAGES,
+    ) -> Dict[str, Any]:
+        """Return provider records for ``batch_ids`` using as few requests as possible.
+
+        Recent batches are listed newest first, so a handful of pages covers
+        every in-flight job; ids that were not seen in the scanned pages are
+        retrieved individually.
+        """
+
+        wanted = set(batch_ids)
+        found: Dict[str, Any] = {}
+        after: Optional[str] = None
+        for _ in range(max(0, max_pages)):
+            if not wanted - found.keys():
+                break
+            params: Dict[str, Any] = {"limit": page_size}
+            if after:
+                params["after"] = after
+            try:
+                page = await self.client.batches.list(**params)
+            except Exception as exc:  # pragma: no cover - network failure
+                logger.exception("Error listing batches")
+                raise ProviderError("Batch listing failed", provider="openai", original_error=exc) from exc
+
+            data = list(getattr(page, "data", None) or [])
+            for batch in data:
+                if batch.id in wanted:
+                    found[batch.id] = batch
+            if not data or not getattr(page, "has_more", False):
+                break
+            after = data[-1].id
+
+        for batch_id in wanted - found.keys():
+            found[batch_id] = await self.retrieve_batch(batch_id)
+        return found
+
 
 __all__ = ["BatchPollingOperations"]
\ No newline at end of file
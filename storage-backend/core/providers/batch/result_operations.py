@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List
 
-from openai import AsyncOpenAI
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
 
 from core.exceptions import ProviderError
 
@@ -82,5 +83,35 @@ class BatchResultOperations:
 
         return results
 
+    async def iter_results(self, file_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """Stream parsed result lines from ``file_id`` without buffering the file."""
+
+        if not file_id:
+            raise ProviderError("No output_file_id provided - cannot download results", provider="openai")
+
+        try:
+            async with self.client.files.with_streaming_response.content(file_id) as response:
+                line_number = 0
+                async for line in response.iter_lines():
+                    line_number += 1
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning(
+                            "Failed to parse batch result line",
+                            extra={
+                                "output_file_id": file_id,
+                                "line_number": line_number,
+                                "line_preview": line[:100],
+                            },
+                        )
+        except ProviderError:
+            raise
+        except Exception as exc:  # pragma: no cover - network failure
+            logger.exception("Failed to stream batch results", extra={"output_file_id": file_id})
+            raise ProviderError("Failed to download batch results", provider="openai", original_error=exc) from exc
+
 
 __all__ = ["BatchResultOperations"]
\ No newline at end of file
@@ -30,6 +30,10 @@ Provider Resolution Strategies:
         - Model-based inference ("eleven" / "xi-" → ElevenLabs)
         - Default → OpenAI
         NOTE: Voice takes precedence over model
+Resolution Caching:
+    - Text providers are cached per (model, enable_reasoning) and shared
+    - Image/video/TTS providers hold per-request state and are built per call
+    - invalidate_provider_caches() drops the cache (runs on (re-)registration)
 Registration Pattern:
     # In core/providers/__init__.py
     register_text_provider("openai", OpenAITextProvider)
@@ -57,11 +61,13 @@ from core.providers.registries import (
     register_tts_provider,
     register_video_provider,
 )
+from core.providers.resolver_cache import invalidate_provider_caches
 from core.providers.resolvers import (
     get_image_provider,
     get_text_provider,
     get_tts_provider,
     get_video_provider,
+    resolve_text_provider,
 )
 
 logger = logging.getLogger(__name__)
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable, Mapping, MutableMapping
@@ -40,6 +41,8 @@ class GarminConnectClient(GarminDatasetMixin, GarminProfileMixin):
     _client: GarthHttpClient = field(init=False, repr=False)
     _authenticated: bool = field(default=False, init=False, repr=False)
     _profile_cache: MutableMapping[str, Any] = field(default_factory=dict, init=False, repr=False)
+    # Dataset fetches run concurrently on a thread pool; serialise (re-)authentication.
+    _auth_lock: threading.RLock = field(default_factory=threading.RLock, init=False, repr=False)
 
     def __post_init__(self) -> None:
         self.session_path = Path(self.session_path)
@@ -68,6 +71,13 @@ class GarminConnectClient(GarminDatasetMixin, GarminProfileMixin):
     def authenticate(self, *, force: bool = False) -> None:
         """Ensure a valid Garmin session is loaded."""
 
+        if self._authenticated and not force:
+            return
+
+        with self._auth_lock:
+            self._authenticate_locked(force=force)
+
+    def _authenticate_locked(self, *, force: bool) -> None:
         if self._authenticated and not force:
             return
 
@@ -44,6 +44,17 @@ class ModelRegistry:
         if not self._initialised:
             self._initialize_models()
 
+    def reload(self) -> None:
+        """Re-read the model configuration and drop cached provider resolutions."""
+
+        from core.providers.resolver_cache import invalidate_provider_caches
+
+        self._models.clear()
+        self._aliases.clear()
+        self._initialised = False
+        self._initialize_models()
+        invalidate_provider_caches()
+
     def get_model_config(self, model_name: str, enable_reasoning: bool = False) -> ModelConfig:
         """Resolve a model configuration by name, handling aliases and reasoning modes.
 
@@ -0,0 +1,121 @@
+"""Memoisation for text provider resolution.
+
+``get_text_provider`` used to resolve the model configuration (alias lookup,
+reasoning counterpart) and construct a new provider on every call.  Batch
+polling and group chat resolve the same handful of models in tight loops, so
+resolutions are kept in a bounded LRU of :class:`ResolvedTextProvider` entries
+keyed by ``(model, enable_reasoning)``.  Text providers only hold an SDK
+client, their capabilities and the attached :class:`ModelConfig`, so one
+instance can serve concurrent requests.
+
+Image and TTS providers are not cached: their instances carry per-request
+state (``configure()``, ``last_quality``), and their name matching is already
+cheaper than a cache lookup.
+
+The cache is dropped by :func:`invalidate_provider_caches`, which runs when a
+provider is (re-)registered or the model registry is reloaded.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Hashable, Optional
+
+from config.text.defaults import PROVIDER_CACHE_ENABLED, PROVIDER_CACHE_MAX_ENTRIES
+
+if TYPE_CHECKING:
+    from core.providers.base import BaseTextProvider
+    from core.providers.capabilities import ProviderCapabilities
+    from core.providers.registry import ModelConfig
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class ResolvedTextProvider:
+    """A text provider resolved for one ``(model, enable_reasoning)`` pair."""
+
+    provider_name: str
+    model_config: "ModelConfig"
+    provider: "BaseTextProvider"
+    capabilities: Optional["ProviderCapabilities"]
+
+
+class ResolverCache:
+    """Thread-safe LRU cache with hit/miss counters."""
+
+    def __init__(self, max_entries: int = PROVIDER_CACHE_MAX_ENTRIES) -> None:
+        self._max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[object]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: object) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+text_provider_cache = ResolverCache()
+
+
+def cached_text_provider(key: Hashable, resolve: Callable[[], ResolvedTextProvider]) -> ResolvedTextProvider:
+    """Return the shared text provider for ``key``, calling ``resolve`` on a miss.
+
+    Providers built without an SDK client (credentials missing at the time)
+    are returned but not cached, so configuring the key later takes effect.
+    """
+
+    if not PROVIDER_CACHE_ENABLED:
+        return resolve()
+    resolved = text_provider_cache.get(key)
+    if resolved is None:
+        resolved = resolve()
+        if getattr(resolved.provider, "client", True) is not None:
+            text_provider_cache.put(key, resolved)
+    return resolved  # type: ignore[return-value]
+
+
+def invalidate_provider_caches() -> None:
+    """Drop every cached resolution (call after changing model or provider config)."""
+
+    text_provider_cache.clear()
+    logger.debug("Provider resolution caches invalidated")
+
+
+__all__ = [
+    "ResolvedTextProvider",
+    "ResolverCache",
+    "cached_text_provider",
+    "invalidate_provider_caches",
+    "text_provider_cache",
+]
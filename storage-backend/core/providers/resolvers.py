@@ -18,18 +18,13 @@ from core.providers.registries import (
     _tts_providers,
     _video_providers,
 )
+from core.providers.resolver_cache import ResolvedTextProvider, cached_text_provider, text_provider_cache
 from core.providers.tts.utils._elevenlabs_helpers import VOICE_NAME_TO_ID, KNOWN_VOICE_IDS
 
 logger = logging.getLogger(__name__)
 
 
-def get_text_provider(settings: Dict[str, object]) -> "BaseTextProvider":
-    """Return a text provider instance using the model registry for resolution."""
-
-    text_settings = settings.get("text", {}) if settings else {}
-    model = str(text_settings.get("model", "gpt-4o-mini"))
-    enable_reasoning = bool(text_settings.get("enable_reasoning", False))
-
+def _build_text_provider(model: str, enable_reasoning: bool) -> ResolvedTextProvider:
     model_config = get_model_config(model, enable_reasoning=enable_reasoning)
     provider_name = model_config.provider_name.lower()
 
@@ -43,7 +38,38 @@ def get_text_provider(settings: Dict[str, object]) -> "BaseTextProvider":
     provider = provider_class()
     if hasattr(provider, "set_model_config"):
         provider.set_model_config(model_config)
-    return provider
+    return ResolvedTextProvider(
+        provider_name=provider_name,
+        model_config=model_config,
+        provider=provider,
+        capabilities=getattr(provider, "capabilities", None),
+    )
+
+
+def resolve_text_provider(settings: Dict[str, object]) -> ResolvedTextProvider:
+    """Resolve the text provider for ``settings`` together with its model config.
+
+    Resolutions are cached per ``(model, enable_reasoning)``; the returned
+    provider instance is shared and must not be mutated by callers.
+    """
+
+    text_settings = settings.get("text", {}) if settings else {}
+    model = str(text_settings.get("model", "gpt-4o-mini"))
+    enable_reasoning = bool(text_settings.get("enable_reasoning", False))
+
+    key = (model.lower().strip(), enable_reasoning)
+    resolved = cached_text_provider(key, lambda: _build_text_provider(model, enable_reasoning))
+    if _text_providers.get(resolved.provider_name) is not type(resolved.provider):
+        # The registry was edited in place since this entry was cached.
+        text_provider_cache.discard(key)
+        resolved = cached_text_provider(key, lambda: _build_text_provider(model, enable_reasoning))
+    return resolved
+
+
+def get_text_provider(settings: Dict[str, object]) -> "BaseTextProvider":
+    """Return a text provider instance using the model registry for resolution."""
+
+    return resolve_text_provider(settings).provider
 
 
 def get_image_provider(settings: Dict[str, object]) -> "BaseImageProvider":
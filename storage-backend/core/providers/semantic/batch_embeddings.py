@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from openai import AsyncOpenAI
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
 
 from config.semantic_search.embeddings import (
     DIMENSIONS as DEFAULT_EMBEDDING_DIMENSIONS,
@@ -45,6 +46,8 @@ class BatchEmbeddingProvider:
         if client is None:
             if not api_key:
                 raise ValueError("OpenAI API key is required")
+            from openai import AsyncOpenAI
+
             client = AsyncOpenAI(api_key=api_key)
 
         self.client = client
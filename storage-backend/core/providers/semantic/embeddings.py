@@ -6,9 +6,10 @@ import hashlib
 import logging
 from abc import ABC, abstractmethod
 from collections import OrderedDict
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from openai import AsyncOpenAI
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
 
 from config.semantic_search.embeddings import (
     DIMENSIONS as DEFAULT_EMBEDDING_DIMENSIONS,
@@ -19,6 +20,8 @@ from config.api_keys import OPENAI_API_KEY
 from core.exceptions import ProviderError
 
 logger = logging.getLogger(__name__)
+# Per-request records are rate limited (see core.logging.DEFAULT_LOG_RATE_LIMITS).
+call_logger = logging.getLogger(f"{__name__}.calls")
 
 # LRU cache for embeddings (limit: 1000 queries ≈ ~2MB)
 _embedding_cache: OrderedDict[str, list[float]] = OrderedDict()
@@ -96,14 +99,14 @@ def cached_embedding(func):
         if cache_key in _embedding_cache:
             _cache_hits += 1
             _embedding_cache.move_to_end(cache_key)
-            logger.debug(
+            call_logger.debug(
                 "Embedding cache HIT",
                 extra={"hit_rate": f"{get_cache_hit_rate():.1%}"},
             )
             return _embedding_cache[cache_key]
 
         _cache_misses += 1
-        logger.debug(
+        call_logger.debug(
             "Embedding cache miss, generating new embedding",
             extra={"hit_rate": f"{get_cache_hit_rate():.1%}"},
         )
@@ -149,6 +152,8 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
         if client is None:
             if not api_key:
                 raise ValueError("OpenAI API key is required for embeddings")
+            from openai import AsyncOpenAI
+
             client = AsyncOpenAI(api_key=api_key)
 
         self.client = client
@@ -185,10 +190,12 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
 
         embedding = response.data[0].embedding  # type: ignore[index]
         text_preview = text[:50] + "..." if len(text) > 50 else text
-        logger.info(
-            f"🔍 EMBEDDING GENERATED: model={self.model}, "
-            f"requested_dims={self.dimensions}, actual_length={len(embedding)}, "
-            f"query='{text_preview}'"
+        call_logger.info(
+            "🔍 EMBEDDING GENERATED: model=%s, requested_dims=%s, actual_length=%s, query='%s'",
+            self.model,
+            self.dimensions,
+            len(embedding),
+            text_preview,
         )
         return list(embedding)
 
@@ -238,7 +245,7 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
 
             batch_embeddings = [list(item.embedding) for item in response.data]
             embeddings.extend(batch_embeddings)
-            logger.debug(
+            call_logger.debug(
                 "Generated batch embeddings",
                 extra={
                     "batch_index": start // batch_size + 1,
@@ -5,8 +5,6 @@ from __future__ import annotations
 import logging
 from typing import Dict, Type
 
-from openai import AsyncOpenAI
-
 from config.semantic_search import defaults as semantic_defaults
 from config.semantic_search.embeddings import (
     DIMENSIONS as SEMANTIC_EMBEDDING_DIMENSIONS,
@@ -51,6 +49,8 @@ def get_semantic_provider(provider_name: str = "qdrant") -> BaseSemanticProvider
 
     provider_class = _PROVIDER_REGISTRY[normalised]
 
+    from openai import AsyncOpenAI
+
     openai_client = ai_clients.get("openai_async")
     client_instance = openai_client if isinstance(openai_client, AsyncOpenAI) else None
 
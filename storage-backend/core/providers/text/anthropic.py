@@ -22,6 +22,7 @@ from config.batch.defaults import (
 from .anthropic_batch import prepare_anthropic_batch_requests, process_anthropic_batch_response
 from .anthropic_params import build_api_params, prepare_messages
 from .anthropic_streaming import stream_anthropic
+from .prompt_cache import record_prompt_cache_usage
 
 logger = logging.getLogger(__name__)
 
@@ -106,6 +107,11 @@ class AnthropicTextProvider(BaseTextProvider):
             logger.error("Anthropic generate error: %s", exc)
             raise ProviderError(f"Anthropic error: {exc}", provider="anthropic") from exc
 
+        record_prompt_cache_usage(
+            provider="anthropic",
+            model=api_params["model"],
+            usage=getattr(response, "usage", None),
+        )
         log_tool_usage(
             "Anthropic",
             getattr(response, "content", None),
@@ -7,6 +7,8 @@ from typing import Any, Dict, List, Optional
 
 from config.text.providers.anthropic import defaults as anthropic_defaults
 
+from .prompt_cache import apply_anthropic_cache_control
+
 logger = logging.getLogger(__name__)
 
 
@@ -53,7 +55,7 @@ def build_api_params(
             if key not in params:
                 params[key] = value
 
-    return params
+    return apply_anthropic_cache_control(params)
 
 
 def _apply_reasoning_config(
@@ -16,6 +16,7 @@ from core.providers.text.utils import log_tool_usage
 from core.streaming.manager import StreamingManager
 from .anthropic_events import emit_anthropic_tool_events, iter_tool_call_payloads
 from .anthropic_params import build_api_params, prepare_messages
+from .prompt_cache import record_prompt_cache_usage
 
 logger = logging.getLogger(__name__)
 
@@ -153,6 +154,11 @@ async def stream_anthropic(
                 else:
                     if final_message:
                         content_blocks = getattr(final_message, "content", None)
+                        record_prompt_cache_usage(
+                            provider="anthropic",
+                            model=api_params["model"],
+                            usage=getattr(final_message, "usage", None),
+                        )
     except asyncio.CancelledError:
         # Propagate cancellation after cleanup
         raise
@@ -9,11 +9,13 @@ from __future__ import annotations
 import logging
 from typing import Any, Optional
 
+from config.text.defaults import PROMPT_CACHE_ENABLED
 from core.exceptions import ProviderError, RateLimitError
 from core.providers.registry.model_config import ModelConfig
 from core.pydantic_schemas import ProviderResponse
 
 from .openai_responses import generate_responses_api
+from .prompt_cache import openai_prompt_cache_key, record_prompt_cache_usage
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +74,8 @@ async def generate_text(
         "messages": final_messages,
         **kwargs,
     }
+    if PROMPT_CACHE_ENABLED:
+        params.setdefault("prompt_cache_key", openai_prompt_cache_key(model, final_messages))
 
     if is_reasoning_model:
         params["max_completion_tokens"] = max_tokens
@@ -114,6 +118,8 @@ async def generate_text(
             original_error=exc,
         ) from exc
 
+    record_prompt_cache_usage(provider="openai", model=model, usage=getattr(response, "usage", None))
+
     message = response.choices[0].message
     text = getattr(message, "content", "")
     reasoning = getattr(message, "reasoning_content", None)
@@ -7,6 +7,7 @@ from typing import Any
 
 from core.exceptions import ProviderError, RateLimitError
 from core.providers.registry.model_config import ModelConfig
+from core.providers.text.prompt_cache import record_prompt_cache_usage
 from core.providers.text.responses_utils import (
     build_responses_params,
     extract_fallback_output_text,
@@ -78,6 +79,8 @@ async def generate_responses_api(
     if not text:
         text = extract_fallback_output_text(response)
 
+    record_prompt_cache_usage(provider="openai", model=model, usage=getattr(response, "usage", None))
+
     metadata = {
         "finish_reason": getattr(response, "finish_reason", None),
         "usage": getattr(response, "usage", None),
@@ -7,6 +7,7 @@ from typing import Any, AsyncIterator, Dict, List, Sequence, Set
 
 from core.exceptions import ProviderError, RateLimitError
 from core.providers.registry.model_config import ModelConfig
+from core.providers.text.prompt_cache import record_prompt_cache_usage
 from core.providers.text.responses_utils import build_responses_params
 from core.providers.text.utils import log_responses_tool_calls
 from core.streaming.manager import StreamingManager
@@ -260,6 +261,7 @@ async def stream_responses_api(
                     usage = getattr(response_obj, "usage", None) or (
                         response_obj.get("usage") if isinstance(response_obj, dict) else None
                     )
+                    record_prompt_cache_usage(provider="openai", model=model, usage=usage)
                     if finish_reason == "incomplete":
                         incomplete_details = getattr(response_obj, "incomplete_details", None) or (
                             response_obj.get("incomplete_details") if isinstance(response_obj, dict) else None
@@ -0,0 +1,263 @@
+"""Provider-side prompt-prefix caching.
+
+Chat requests resend the same system prompt, tool definitions and conversation
+history on every turn.  Anthropic and OpenAI can both serve that prefix from a
+cache, which cuts input cost and time-to-first-token, but only when the prefix
+is byte-identical between requests:
+
+* Anthropic caches up to explicit ``cache_control`` breakpoints.
+  :func:`apply_anthropic_cache_control` marks the end of the static prefix
+  (tools + system prompt), the previous user turn (read what the last request
+  wrote) and the current turn (write for the next request).
+* OpenAI caches automatically; :func:`openai_prompt_cache_key` derives a
+  ``prompt_cache_key`` from the conversation head so requests sharing a prefix
+  are routed to the same cache shard.
+
+:func:`record_prompt_cache_usage` normalises the usage payloads of both
+vendors and emits cache read/write token metrics.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from config.text.defaults import PROMPT_CACHE_ENABLED, PROMPT_CACHE_MIN_CHARS
+from core.observability.metrics import track_metric
+
+logger = logging.getLogger(__name__)
+
+EPHEMERAL = {"type": "ephemeral"}
+# Anthropic rejects requests with more than four breakpoints.
+MAX_BREAKPOINTS = 4
+
+# Blocks that cannot carry a breakpoint themselves.
+_UNCACHEABLE_BLOCKS = frozenset({"thinking", "redacted_thinking"})
+
+
+def _size(value: Any) -> int:
+    if isinstance(value, str):
+        return len(value)
+    return len(json.dumps(value, sort_keys=True, separators=(",", ":"), default=str))
+
+
+def _has_cache_control(params: Dict[str, Any]) -> bool:
+    """Return True when the caller already placed its own breakpoints."""
+
+    candidates: List[Any] = list(params.get("tools") or [])
+    system = params.get("system")
+    if isinstance(system, list):
+        candidates.extend(system)
+    for message in params.get("messages") or []:
+        content = message.get("content") if isinstance(message, dict) else None
+        if isinstance(content, list):
+            candidates.extend(content)
+    return any(isinstance(block, dict) and "cache_control" in block for block in candidates)
+
+
+def _mark_blocks(content: Any) -> Optional[List[Any]]:
+    """Return a copy of ``content`` with a breakpoint on its last cacheable block."""
+
+    if isinstance(content, str):
+        if not content:
+            return None
+        return [{"type": "text", "text": content, "cache_control": dict(EPHEMERAL)}]
+    if not isinstance(content, list):
+        return None
+    blocks = list(content)
+    for index in range(len(blocks) - 1, -1, -1):
+        block = blocks[index]
+        if isinstance(block, dict) and block.get("type") not in _UNCACHEABLE_BLOCKS:
+            blocks[index] = {**block, "cache_control": dict(EPHEMERAL)}
+            return blocks
+    return None
+
+
+def _mark_message(messages: List[Any], index: int) -> bool:
+    message = messages[index]
+    if not isinstance(message, dict):
+        return False
+    blocks = _mark_blocks(message.get("content"))
+    if blocks is None:
+        return False
+    messages[index] = {**message, "content": blocks}
+    return True
+
+
+def apply_anthropic_cache_control(
+    params: Dict[str, Any],
+    *,
+    min_chars: Optional[int] = None,
+    enabled: Optional[bool] = None,
+) -> Dict[str, Any]:
+    """Place ``cache_control`` breakpoints on an Anthropic Messages payload.
+
+    Breakpoints are only added once the prefix they close is long enough to be
+    cached (``min_chars`` is a rough character proxy for Anthropic's token
+    minimum), so short prompts keep their plain shape.  Messages, blocks and
+    tools are copied, never mutated in place.  Payloads that already carry
+    ``cache_control`` are returned untouched.
+    """
+
+    if enabled is None:
+        enabled = PROMPT_CACHE_ENABLED
+    if min_chars is None:
+        min_chars = PROMPT_CACHE_MIN_CHARS
+    if not enabled or _has_cache_control(params):
+        return params
+
+    budget = MAX_BREAKPOINTS
+    tools = params.get("tools") or []
+    system = params.get("system")
+    prefix = _size(tools) if tools else 0
+    prefix += _size(system) if system else 0
+
+    if prefix >= min_chars:
+        marked = _mark_blocks(system) if system else None
+        if marked is not None:
+            params["system"] = marked
+            budget -= 1
+        elif tools and isinstance(tools[-1], dict):
+            params["tools"] = [*tools[:-1], {**tools[-1], "cache_control": dict(EPHEMERAL)}]
+            budget -= 1
+
+    messages = list(params.get("messages") or [])
+    if not messages:
+        return params
+
+    # Previous user turn first (the point the last request wrote), then the
+    # current turn (the point the next request will read).
+    sizes = [_size(message.get("content", "")) if isinstance(message, dict) else 0 for message in messages]
+    last = len(messages) - 1
+    previous_user = next(
+        (
+            index
+            for index in range(last - 1, -1, -1)
+            if isinstance(messages[index], dict) and messages[index].get("role") == "user"
+        ),
+        None,
+    )
+    for index in (previous_user, last):
+        if index is None or budget <= 0:
+            continue
+        if prefix + sum(sizes[: index + 1]) < min_chars:
+            continue
+        if _mark_message(messages, index):
+            budget -= 1
+
+    params["messages"] = messages
+    return params
+
+
+def openai_prompt_cache_key(
+    model: str,
+    messages: List[Any],
+    *,
+    instructions: Optional[str] = None,
+) -> str:
+    """Return a ``prompt_cache_key`` for requests sharing a conversation head.
+
+    The key covers the model, the system prompt (``instructions`` or a leading
+    system/developer message) and the first conversational message, which stay
+    constant for the lifetime of a chat session.
+    """
+
+    head: List[Any] = []
+    system = instructions
+    for message in messages:
+        role = message.get("role") if isinstance(message, dict) else None
+        if role in {"system", "developer"}:
+            if system is None:
+                system = message.get("content")
+            continue
+        head.append(message.get("content") if isinstance(message, dict) else message)
+        break
+    payload = json.dumps([model, system, head], sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+@dataclass(slots=True)
+class PromptCacheUsage:
+    """Input token accounting normalised across vendors."""
+
+    input_tokens: int
+    cached_tokens: int = 0
+    cache_write_tokens: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        return self.cached_tokens / self.input_tokens if self.input_tokens else 0.0
+
+
+def _field(obj: Any, name: str) -> Any:
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def _as_int(value: Any) -> int:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return 0
+    return int(value)
+
+
+def parse_prompt_cache_usage(usage: Any) -> Optional[PromptCacheUsage]:
+    """Normalise Anthropic, Chat Completions and Responses usage payloads."""
+
+    if usage is None:
+        return None
+
+    prompt_tokens = _as_int(_field(usage, "prompt_tokens"))
+    if prompt_tokens:  # Chat Completions
+        cached = _as_int(_field(_field(usage, "prompt_tokens_details"), "cached_tokens"))
+        return PromptCacheUsage(input_tokens=prompt_tokens, cached_tokens=cached)
+
+    input_tokens = _as_int(_field(usage, "input_tokens"))
+    details = _field(usage, "input_tokens_details")
+    if details is not None and input_tokens:  # Responses API
+        return PromptCacheUsage(input_tokens=input_tokens, cached_tokens=_as_int(_field(details, "cached_tokens")))
+
+    # Anthropic reports uncached, cache-read and cache-write tokens separately.
+    read = _as_int(_field(usage, "cache_read_input_tokens"))
+    write = _as_int(_field(usage, "cache_creation_input_tokens"))
+    total = input_tokens + read + write
+    if not total:
+        return None
+    return PromptCacheUsage(input_tokens=total, cached_tokens=read, cache_write_tokens=write)
+
+
+def record_prompt_cache_usage(*, provider: str, model: Optional[str], usage: Any) -> Optional[PromptCacheUsage]:
+    """Emit prompt cache metrics for a completed request; returns the parsed usage."""
+
+    parsed = parse_prompt_cache_usage(usage)
+    if parsed is None:
+        return None
+
+    tags = {"provider": provider, "model": model or "unknown", "hit": parsed.cached_tokens > 0}
+    track_metric("text.prompt_input_tokens", parsed.input_tokens, tags=tags)
+    track_metric("text.prompt_cache_read_tokens", parsed.cached_tokens, tags=tags)
+    if parsed.cache_write_tokens:
+        track_metric("text.prompt_cache_write_tokens", parsed.cache_write_tokens, tags=tags)
+    logger.debug(
+        "Prompt cache %s/%s: input=%d cached=%d written=%d",
+        provider,
+        model,
+        parsed.input_tokens,
+        parsed.cached_tokens,
+        parsed.cache_write_tokens,
+    )
+    return parsed
+
+
+__all__ = [
+    "PromptCacheUsage",
+    "apply_anthropic_cache_control",
+    "openai_prompt_cache_key",
+    "parse_prompt_cache_usage",
+    "record_prompt_cache_usage",
+]
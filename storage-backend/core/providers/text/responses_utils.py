@@ -10,7 +10,9 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from config.text.defaults import PROMPT_CACHE_ENABLED
 from core.providers.registry.model_config import ModelConfig
+from core.providers.text.prompt_cache import openai_prompt_cache_key
 from core.providers.text.utils import convert_to_responses_format
 
 logger = logging.getLogger(__name__)
@@ -86,6 +88,12 @@ def build_responses_params(
     if system_instruction:
         params["instructions"] = system_instruction
 
+    prompt_cache_key = extra_kwargs.get("prompt_cache_key")
+    if prompt_cache_key is None and PROMPT_CACHE_ENABLED:
+        prompt_cache_key = openai_prompt_cache_key(model, responses_input, instructions=system_instruction)
+    if prompt_cache_key:
+        params["prompt_cache_key"] = prompt_cache_key
+
     if model_config and model_config.supports_temperature:
         params["temperature"] = temperature
 
@@ -15,12 +15,14 @@ from typing import TYPE_CHECKING, Any, AsyncIterator, Optional, Set, Tuple
 if TYPE_CHECKING:
     from features.chat.utils.websocket_runtime import WorkflowRuntime
 
+from config.text.defaults import PROMPT_CACHE_ENABLED
 from core.exceptions import ProviderError, RateLimitError
 from core.providers.registry.model_config import ModelConfig
 from core.streaming.manager import StreamingManager
 from features.chat.services.streaming.events import emit_tool_use_event
 
 from .openai_responses import stream_responses_api
+from .prompt_cache import openai_prompt_cache_key, record_prompt_cache_usage
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +87,10 @@ async def stream_text(
         "stream": True,
         **kwargs,
     }
+    if PROMPT_CACHE_ENABLED:
+        params.setdefault("prompt_cache_key", openai_prompt_cache_key(model, final_messages))
+        # The final chunk then carries usage, including cached prompt tokens.
+        params.setdefault("stream_options", {"include_usage": True})
 
     if is_reasoning_model:
         params["max_completion_tokens"] = max_tokens
@@ -137,6 +143,12 @@ async def stream_text(
                 )
                 break  # Exit loop, close stream
 
+            if not chunk.choices:
+                record_prompt_cache_usage(
+                    provider="openai", model=model, usage=getattr(chunk, "usage", None)
+                )
+                continue
+
             choice = chunk.choices[0]
             delta = getattr(choice, "delta", None)
 
@@ -0,0 +1,537 @@
+"""Latency-aware failover and hedged requests for text providers.
+
+:func:`route_text_provider` wraps the provider resolved for a chat request in a
+:class:`RoutedTextProvider` that knows a fallback chain for the model's
+capability class (``FALLBACK_CHAINS`` in ``config/text/defaults.py``, one model
+per other provider).  The wrapper:
+
+* records TTFT, errors and 429s on the shared :mod:`text_scoreboard`;
+* tries healthy candidates before degraded ones and fails over to the next
+  candidate when a call fails *before* any output was produced;
+* optionally hedges streams: when the first chunk has not arrived within the
+  candidate's p95 TTFT it starts the next candidate and keeps whichever
+  produces output first, cancelling the other.
+
+Failures after the first streamed chunk are re-raised; the partial answer has
+already reached the client and cannot be spliced onto another model's output.
+
+Routing is opt-in (``TEXT_FAILOVER_ENABLED``) because fallbacks send the
+prompt to other vendors.  Reasoning, audio and batch calls always go to the
+primary provider: their parameters are provider specific.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import time
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, List, Mapping, Optional
+
+from config.text.defaults import (
+    FAILOVER_ENABLED,
+    FALLBACK_CHAINS,
+    HEDGE_DEFAULT_DELAY_MS,
+    HEDGE_MAX_DELAY_MS,
+    HEDGE_MIN_DELAY_MS,
+    HEDGE_MIN_SAMPLES,
+    HEDGING_ENABLED,
+)
+from core.exceptions import ConfigurationError, ProviderError, RateLimitError
+from core.observability.metrics import track_metric
+from core.providers.base import BaseTextProvider
+from core.providers.registry import ModelConfig, get_model_config
+from core.providers.text_scoreboard import ProviderScoreboard, get_text_scoreboard
+from core.pydantic_schemas import ProviderResponse
+
+logger = logging.getLogger(__name__)
+
+# Errors that make another provider worth trying.  ``OSError`` covers
+# connection failures and timeouts raised outside the provider wrappers.
+FAILOVER_ERRORS = (ProviderError, OSError)
+
+# Providers that take the system prompt outside the messages array.
+_SEPARATE_SYSTEM_PROMPT = {"anthropic", "gemini"}
+
+_EMPTY = object()
+
+ProviderResolver = Callable[[Dict[str, Any]], BaseTextProvider]
+
+
+def capability_class(config: ModelConfig) -> str:
+    """Return the fallback-chain class for ``config``."""
+
+    if config.supports_citations:
+        return "search"
+    if config.is_reasoning_model:
+        return "reasoning"
+    return "standard"
+
+
+def is_rate_limited(exc: BaseException) -> bool:
+    """Return True when ``exc`` represents an upstream 429."""
+
+    if isinstance(exc, RateLimitError):
+        return True
+    original = getattr(exc, "original_error", None)
+    for source in (exc, original):
+        if getattr(source, "status_code", None) == 429:
+            return True
+    message = str(exc).lower()
+    return "429" in message or "rate limit" in message
+
+
+@dataclass(slots=True)
+class _Candidate:
+    model_key: str
+    config: ModelConfig
+    provider: Optional[BaseTextProvider] = None
+    primary: bool = False
+
+    @property
+    def score_key(self) -> str:
+        return ProviderScoreboard.key(self.config.provider_name, self.config.model_name)
+
+    @property
+    def tags(self) -> Dict[str, str]:
+        return {"provider": self.config.provider_name, "model": self.config.model_name}
+
+
+@dataclass(slots=True)
+class _OpenedStream:
+    candidate: _Candidate
+    stream: Any
+    first: Any
+    ttft_ms: float
+
+
+async def _aclose(stream: Any) -> None:
+    close = getattr(stream, "aclose", None)
+    if close is not None:
+        with suppress(Exception):
+            await close()
+
+
+def _clamp_temperature(config: ModelConfig, temperature: Any) -> Any:
+    if temperature is None:
+        return None
+    if not config.supports_temperature:
+        return 1.0
+    return max(config.temperature_min, min(config.temperature_max, float(temperature)))
+
+
+def _adapt_messages(
+    messages: List[Dict[str, Any]],
+    *,
+    system_prompt: Optional[str],
+    target_provider: str,
+) -> Optional[tuple[List[Dict[str, Any]], Optional[str]]]:
+    """Re-home the system prompt for ``target_provider``.
+
+    Returns ``None`` for multimodal histories: content blocks are provider
+    specific, so those requests only fail over within the same format.
+    """
+
+    adapted: List[Dict[str, Any]] = []
+    for message in messages:
+        if not isinstance(message, dict) or not isinstance(message.get("content", ""), str):
+            return None
+        if message.get("role") == "system":
+            system_prompt = system_prompt or message.get("content")
+            continue
+        adapted.append(message)
+    if system_prompt and target_provider not in _SEPARATE_SYSTEM_PROMPT:
+        adapted.insert(0, {"role": "system", "content": system_prompt})
+    return adapted, system_prompt
+
+
+class RoutedTextProvider(BaseTextProvider):
+    """Text provider that fails over (and optionally hedges) across a chain.
+
+    Attributes not defined here are delegated to the primary provider, so the
+    wrapper can stand in wherever the resolved provider was used before.
+    """
+
+    def __init__(
+        self,
+        primary: BaseTextProvider,
+        fallbacks: List[_Candidate],
+        *,
+        hedging: bool = HEDGING_ENABLED,
+        scoreboard: Optional[ProviderScoreboard] = None,
+        resolver: Optional[ProviderResolver] = None,
+    ) -> None:
+        config = primary.get_model_config()
+        self._primary = primary
+        self._candidates = [_Candidate(config.model_name, config, primary, primary=True), *fallbacks]
+        self.hedging = hedging
+        self._scoreboard = scoreboard or get_text_scoreboard()
+        self._resolver = resolver
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "_primary":
+            raise AttributeError(name)
+        return getattr(self._primary, name)
+
+    @property
+    def fallback_models(self) -> List[str]:
+        return [candidate.config.model_name for candidate in self._candidates[1:]]
+
+    def set_model_config(self, config: ModelConfig) -> None:
+        self._primary.set_model_config(config)
+
+    def get_model_config(self) -> Optional[ModelConfig]:
+        return self._primary.get_model_config()
+
+    async def generate_batch(self, requests: List[Dict[str, Any]], **kwargs: Any) -> List[ProviderResponse]:
+        return await self._primary.generate_batch(requests, **kwargs)
+
+    async def generate_with_reasoning(
+        self,
+        prompt: str,
+        reasoning_effort: str = "medium",
+        **kwargs: Any,
+    ) -> ProviderResponse:
+        return await self._primary.generate_with_reasoning(prompt, reasoning_effort=reasoning_effort, **kwargs)
+
+    async def generate_with_audio(
+        self,
+        audio_data: bytes,
+        prompt: str | None = None,
+        **kwargs: Any,
+    ) -> ProviderResponse:
+        return await self._primary.generate_with_audio(audio_data, prompt=prompt, **kwargs)
+
+    async def generate(
+        self,
+        prompt: str,
+        model: str | None = None,
+        temperature: float = 0.1,
+        max_tokens: int = 4096,
+        **kwargs: Any,
+    ) -> ProviderResponse:
+        request = dict(kwargs, prompt=prompt, model=model, temperature=temperature, max_tokens=max_tokens)
+        last_error: Optional[BaseException] = None
+        for candidate, call in self._plan(request):
+            try:
+                response = await self._provider_for(candidate).generate(**call)
+            except FAILOVER_ERRORS as exc:
+                self._record_failure(candidate, exc)
+                last_error = exc
+                continue
+            self._scoreboard.record_success(candidate.score_key, None)
+            if not candidate.primary:
+                self._note_failover(candidate)
+            return response
+        assert last_error is not None
+        raise last_error
+
+    async def stream(
+        self,
+        prompt: str,
+        model: str | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        system_prompt: Optional[str] = None,
+        messages: Optional[list[dict[str, Any]]] = None,
+        runtime: Any = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str | dict[str, str]]:
+        request = dict(
+            kwargs,
+            prompt=prompt,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            system_prompt=system_prompt,
+            messages=messages,
+        )
+        if runtime is not None:
+            request["runtime"] = runtime
+
+        opened = await self._open_first(request)
+        candidate = opened.candidate
+        if not candidate.primary:
+            self._note_failover(candidate)
+            await self._announce(request.get("manager"), candidate)
+
+        failed = False
+        try:
+            if opened.first is not _EMPTY:
+                yield opened.first
+            async for chunk in opened.stream:
+                yield chunk
+        except FAILOVER_ERRORS as exc:
+            failed = True
+            self._record_failure(candidate, exc)
+            raise
+        finally:
+            if not failed:
+                self._scoreboard.record_success(candidate.score_key, opened.ttft_ms)
+            await _aclose(opened.stream)
+
+    # ------------------------------------------------------------------ routing
+
+    def _plan(self, request: Dict[str, Any]) -> List[tuple[_Candidate, Dict[str, Any]]]:
+        """Return ``(candidate, kwargs)`` pairs, healthy candidates first."""
+
+        ordered = sorted(self._candidates, key=lambda c: self._scoreboard.is_degraded(c.score_key))
+        plan = []
+        for candidate in ordered:
+            call = self._call_kwargs(candidate, request)
+            if call is not None:
+                plan.append((candidate, call))
+        return plan
+
+    def _call_kwargs(self, candidate: _Candidate, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if candidate.primary:
+            return request
+
+        call = dict(request)
+        config = candidate.config
+        call["model"] = config.model_name
+        call["temperature"] = _clamp_temperature(config, request.get("temperature"))
+        # Reasoning values are provider specific (effort names vs token budgets).
+        call.pop("enable_reasoning", None)
+        call.pop("reasoning_value", None)
+
+        settings = request.get("settings")
+        if isinstance(settings, Mapping):
+            text_settings = dict(settings.get("text") or {})
+            text_settings["model"] = candidate.model_key
+            text_settings.pop("enable_reasoning", None)
+            call["settings"] = {**settings, "text": text_settings}
+
+        messages = request.get("messages")
+        if messages is not None:
+            adapted = _adapt_messages(
+                messages,
+                system_prompt=request.get("system_prompt"),
+                target_provider=config.provider_name,
+            )
+            if adapted is None:
+                return None
+            call["messages"], call["system_prompt"] = adapted
+        return call
+
+    def _provider_for(self, candidate: _Candidate) -> BaseTextProvider:
+        if candidate.provider is None:
+            resolver = self._resolver
+            if resolver is None:
+                from core.providers.resolvers import get_text_provider as resolver
+            try:
+                candidate.provider = resolver({"text": {"model": candidate.model_key}})
+            except ConfigurationError as exc:
+                raise ProviderError(str(exc), provider=candidate.config.provider_name) from exc
+        return candidate.provider
+
+    def _hedge_delay(self, candidate: _Candidate) -> float:
+        stats = self._scoreboard.stats(candidate.score_key)
+        delay_ms = HEDGE_DEFAULT_DELAY_MS
+        if stats.ttft_samples >= HEDGE_MIN_SAMPLES and stats.ttft_p95_ms is not None:
+            delay_ms = min(HEDGE_MAX_DELAY_MS, max(HEDGE_MIN_DELAY_MS, stats.ttft_p95_ms))
+        return delay_ms / 1000
+
+    async def _open_first(self, request: Dict[str, Any]) -> _OpenedStream:
+        plan = self._plan(request)
+        # Tool calls have side effects, so never run two of them at once.
+        hedge = self.hedging and not request.get("tool_settings")
+        last_error: Optional[BaseException] = None
+        index = 0
+        while index < len(plan):
+            try:
+                if hedge and index + 1 < len(plan):
+                    return await self._open_hedged(plan[index], plan[index + 1])
+                return await self._open(*plan[index])
+            except FAILOVER_ERRORS as exc:
+                last_error = exc
+                index += 2 if hedge and index + 1 < len(plan) else 1
+        assert last_error is not None
+        raise last_error
+
+    async def _open(self, candidate: _Candidate, call: Dict[str, Any]) -> _OpenedStream:
+        """Start streaming from ``candidate`` and wait for its first chunk."""
+
+        started = time.perf_counter()
+        stream: Any = None
+        try:
+            stream = self._provider_for(candidate).stream(**call)
+            if inspect.isawaitable(stream):
+                stream = await stream
+            stream = stream.__aiter__()
+            try:
+                first = await stream.__anext__()
+            except StopAsyncIteration:
+                first = _EMPTY
+        except asyncio.CancelledError:
+            await _aclose(stream)
+            raise
+        except FAILOVER_ERRORS as exc:
+            await _aclose(stream)
+            self._record_failure(candidate, exc)
+            raise
+
+        ttft_ms = (time.perf_counter() - started) * 1000
+        track_metric("text.time_to_first_token_ms", ttft_ms, tags=candidate.tags)
+        return _OpenedStream(candidate, stream, first, ttft_ms)
+
+    async def _open_hedged(
+        self,
+        first: tuple[_Candidate, Dict[str, Any]],
+        backup: tuple[_Candidate, Dict[str, Any]],
+    ) -> _OpenedStream:
+        """Race ``backup`` against ``first`` once ``first`` exceeds its p95 TTFT."""
+
+        delay = self._hedge_delay(first[0])
+        first_task = asyncio.create_task(self._open(*first))
+        done, _ = await asyncio.wait({first_task}, timeout=delay)
+        if done:
+            if first_task.exception() is None:
+                return first_task.result()
+            if not isinstance(first_task.exception(), FAILOVER_ERRORS):
+                raise first_task.exception()
+            return await self._open(*backup)
+
+        logger.info(
+            "Hedging %s with %s after no first token within %.0fms",
+            first[0].config.model_name,
+            backup[0].config.model_name,
+            delay * 1000,
+        )
+        backup_task = asyncio.create_task(self._open(*backup))
+        pending = {first_task, backup_task}
+        winner: Optional[_OpenedStream] = None
+        last_error: Optional[BaseException] = None
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    exc = task.exception()
+                    if exc is not None:
+                        if not isinstance(exc, FAILOVER_ERRORS):
+                            raise exc
+                        last_error = exc
+                    elif winner is None:
+                        winner = task.result()
+                    else:
+                        await _aclose(task.result().stream)
+        finally:
+            for task in pending:
+                task.cancel()
+            for task in pending:
+                with suppress(asyncio.CancelledError, Exception):
+                    await _aclose((await task).stream)
+
+        if winner is None:
+            assert last_error is not None
+            raise last_error
+        track_metric(
+            "text.hedge",
+            tags={**first[0].tags, "winner": "backup" if winner.candidate is backup[0] else "primary"},
+        )
+        return winner
+
+    # ------------------------------------------------------------ bookkeeping
+
+    def _record_failure(self, candidate: _Candidate, exc: BaseException) -> None:
+        rate_limited = is_rate_limited(exc)
+        self._scoreboard.record_failure(candidate.score_key, rate_limited=rate_limited)
+        track_metric(
+            "text.provider_error",
+            tags={**candidate.tags, "rate_limited": rate_limited},
+        )
+        logger.warning(
+            "Text provider %s (%s) failed%s: %s",
+            candidate.config.provider_name,
+            candidate.config.model_name,
+            " (rate limited)" if rate_limited else "",
+            exc,
+        )
+
+    def _note_failover(self, candidate: _Candidate) -> None:
+        primary = self._candidates[0]
+        logger.warning(
+            "Served request from fallback %s instead of %s",
+            candidate.config.model_name,
+            primary.config.model_name,
+        )
+        track_metric(
+            "text.failover",
+            tags={"from": primary.config.model_name, "to": candidate.config.model_name},
+        )
+
+    async def _announce(self, manager: Any, candidate: _Candidate) -> None:
+        """Tell the client which model is answering after a failover."""
+
+        send = getattr(manager, "send_to_queues", None)
+        if send is None:
+            return
+        await send(
+            {
+                "type": "custom_event",
+                "content": {
+                    "type": "aiTextModelInUse",
+                    "message": "aiTextModelFailover",
+                    "aiTextModel": candidate.config.model_name,
+                    "provider": candidate.config.provider_name,
+                },
+            }
+        )
+
+
+def route_text_provider(
+    provider: BaseTextProvider,
+    settings: Optional[Dict[str, Any]] = None,
+    *,
+    chains: Optional[Mapping[str, tuple[str, ...]]] = None,
+    hedging: Optional[bool] = None,
+    scoreboard: Optional[ProviderScoreboard] = None,
+    resolver: Optional[ProviderResolver] = None,
+) -> BaseTextProvider:
+    """Wrap ``provider`` in a :class:`RoutedTextProvider` when routing applies.
+
+    Routing is skipped when ``TEXT_FAILOVER_ENABLED`` is off, when the request
+    sets ``text.failover`` to ``False`` or when the provider carries no
+    registry configuration.  The chain keeps at most one model per provider
+    and never repeats the primary's provider.
+    """
+
+    config = provider.get_model_config() if hasattr(provider, "get_model_config") else None
+    if not FAILOVER_ENABLED or not isinstance(config, ModelConfig):
+        return provider
+    text_settings = (settings or {}).get("text") if isinstance(settings, dict) else None
+    if isinstance(text_settings, dict) and text_settings.get("failover") is False:
+        return provider
+
+    chain = (FALLBACK_CHAINS if chains is None else chains).get(capability_class(config), ())
+    seen_providers = {config.provider_name}
+    fallbacks: List[_Candidate] = []
+    for model_key in chain:
+        try:
+            candidate_config = get_model_config(model_key)
+        except ValueError:
+            logger.warning("Ignoring unknown fallback model %s", model_key)
+            continue
+        if candidate_config.provider_name in seen_providers or not candidate_config.supports_streaming:
+            continue
+        seen_providers.add(candidate_config.provider_name)
+        fallbacks.append(_Candidate(model_key, candidate_config))
+
+    return RoutedTextProvider(
+        provider,
+        fallbacks,
+        hedging=HEDGING_ENABLED if hedging is None else hedging,
+        scoreboard=scoreboard,
+        resolver=resolver,
+    )
+
+
+__all__ = [
+    "FAILOVER_ERRORS",
+    "RoutedTextProvider",
+    "capability_class",
+    "is_rate_limited",
+    "route_text_provider",
+]
@@ -0,0 +1,167 @@
+"""Rolling health scoreboard for text providers.
+
+Every routed request records its time-to-first-token (TTFT) or failure under a
+``"<provider>:<model>"`` key.  The routing layer reads the scoreboard to order
+fallback candidates and to derive the hedging delay, and the admin API exposes
+:meth:`ProviderScoreboard.snapshot` for dashboards.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Deque, Dict, Optional
+
+from config.text.defaults import (
+    DEGRADED_ERROR_RATE,
+    DEGRADED_MIN_SAMPLES,
+    RATE_LIMIT_COOLDOWN,
+    SCOREBOARD_MAX_AGE,
+    SCOREBOARD_WINDOW,
+)
+
+OUTCOME_OK = "ok"
+OUTCOME_ERROR = "error"
+OUTCOME_RATE_LIMITED = "rate_limited"
+
+
+@dataclass(slots=True)
+class _Sample:
+    at: float
+    outcome: str
+    ttft_ms: Optional[float] = None
+
+
+@dataclass(slots=True)
+class ProviderStats:
+    """Aggregated view of the samples currently in the window."""
+
+    requests: int = 0
+    errors: int = 0
+    rate_limited: int = 0
+    error_rate: float = 0.0
+    ttft_samples: int = 0
+    ttft_p50_ms: Optional[float] = None
+    ttft_p95_ms: Optional[float] = None
+    last_rate_limited_s: Optional[float] = None  # seconds ago
+    degraded: bool = False
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    index = max(0, math.ceil(fraction * len(ordered)) - 1)
+    return ordered[index]
+
+
+class ProviderScoreboard:
+    """Sliding window of recent outcomes per provider/model."""
+
+    def __init__(
+        self,
+        *,
+        window: int = SCOREBOARD_WINDOW,
+        max_age: float = SCOREBOARD_MAX_AGE,
+        degraded_error_rate: float = DEGRADED_ERROR_RATE,
+        degraded_min_samples: int = DEGRADED_MIN_SAMPLES,
+        rate_limit_cooldown: float = RATE_LIMIT_COOLDOWN,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.window = max(1, window)
+        self.max_age = max_age
+        self.degraded_error_rate = degraded_error_rate
+        self.degraded_min_samples = degraded_min_samples
+        self.rate_limit_cooldown = rate_limit_cooldown
+        self._clock = clock
+        self._samples: Dict[str, Deque[_Sample]] = {}
+        self._last_rate_limited: Dict[str, float] = {}
+
+    @staticmethod
+    def key(provider: str, model: str) -> str:
+        return f"{provider}:{model}"
+
+    def record_success(self, key: str, ttft_ms: Optional[float]) -> None:
+        self._append(key, _Sample(self._clock(), OUTCOME_OK, ttft_ms))
+
+    def record_failure(self, key: str, *, rate_limited: bool = False) -> None:
+        now = self._clock()
+        if rate_limited:
+            self._last_rate_limited[key] = now
+        self._append(key, _Sample(now, OUTCOME_RATE_LIMITED if rate_limited else OUTCOME_ERROR))
+
+    def stats(self, key: str) -> ProviderStats:
+        samples = self._fresh(key)
+        stats = ProviderStats(requests=len(samples))
+        latencies = []
+        for sample in samples:
+            if sample.outcome == OUTCOME_ERROR:
+                stats.errors += 1
+            elif sample.outcome == OUTCOME_RATE_LIMITED:
+                stats.rate_limited += 1
+            elif sample.ttft_ms is not None:
+                latencies.append(sample.ttft_ms)
+
+        if samples:
+            stats.error_rate = (stats.errors + stats.rate_limited) / len(samples)
+        if latencies:
+            latencies.sort()
+            stats.ttft_samples = len(latencies)
+            stats.ttft_p50_ms = _percentile(latencies, 0.5)
+            stats.ttft_p95_ms = _percentile(latencies, 0.95)
+
+        limited_at = self._last_rate_limited.get(key)
+        if limited_at is not None:
+            stats.last_rate_limited_s = self._clock() - limited_at
+        stats.degraded = self._is_degraded(stats)
+        return stats
+
+    def is_degraded(self, key: str) -> bool:
+        return self.stats(key).degraded
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return JSON-friendly stats for every key seen in the window."""
+
+        return {key: asdict(self.stats(key)) for key in sorted(self._samples)}
+
+    def reset(self) -> None:
+        self._samples.clear()
+        self._last_rate_limited.clear()
+
+    def _is_degraded(self, stats: ProviderStats) -> bool:
+        if stats.last_rate_limited_s is not None and stats.last_rate_limited_s < self.rate_limit_cooldown:
+            return True
+        return stats.requests >= self.degraded_min_samples and stats.error_rate >= self.degraded_error_rate
+
+    def _append(self, key: str, sample: _Sample) -> None:
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+        samples.append(sample)
+
+    def _fresh(self, key: str) -> Deque[_Sample]:
+        samples = self._samples.get(key)
+        if samples is None:
+            return deque()
+        cutoff = self._clock() - self.max_age
+        while samples and samples[0].at < cutoff:
+            samples.popleft()
+        return samples
+
+
+_scoreboard: Optional[ProviderScoreboard] = None
+
+
+def get_text_scoreboard() -> ProviderScoreboard:
+    """Return the process-wide text provider scoreboard."""
+
+    global _scoreboard
+    if _scoreboard is None:
+        _scoreboard = ProviderScoreboard()
+    return _scoreboard
+
+
+__all__ = [
+    "ProviderScoreboard",
+    "ProviderStats",
+    "get_text_scoreboard",
+]
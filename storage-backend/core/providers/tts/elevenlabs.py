@@ -16,6 +16,7 @@ from core.exceptions import ConfigurationError
 from core.providers.tts_base import BaseTTSProvider, TTSRequest, TTSResult
 
 from .elevenlabs_rest import fetch_billing, perform_rest_generation, stream_rest_generation
+from .elevenlabs_websocket import prewarm_text_queue_stream
 from .elevenlabs_websocket import stream_from_text_queue as websocket_stream_from_queue
 from .elevenlabs_websocket import stream_via_websocket
 from .utils import (
@@ -195,6 +196,17 @@ class ElevenLabsTTSProvider(BaseTTSProvider):
         ):
             yield chunk
 
+    def prewarm_stream(
+        self,
+        *,
+        voice: str,
+        model: Optional[str] = None,
+        audio_format: str = "pcm_24000",
+    ) -> None:
+        """Open the queue-streaming websocket ahead of :meth:`stream_from_text_queue`."""
+
+        prewarm_text_queue_stream(self, voice=voice, model=model, audio_format=audio_format)
+
     # ------------------------------------------------------------------
     # Backwards compatibility helpers
     # ------------------------------------------------------------------
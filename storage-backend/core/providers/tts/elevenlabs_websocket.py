@@ -16,6 +16,7 @@ from .utils import (
     stream_websocket_audio_from_queue,
     websocket_format_for,
 )
+from .utils.websocket_pool import get_websocket_pool
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
     from .elevenlabs import ElevenLabsTTSProvider
@@ -25,6 +26,17 @@ if TYPE_CHECKING:  # pragma: no cover - typing only
 logger = logging.getLogger(__name__)
 
 
+def stream_input_uri(voice: str, model: str, websocket_format: str) -> str:
+    """Return the ElevenLabs ``stream-input`` URI for a voice/model/format."""
+
+    return (
+        f"wss://api.elevenlabs.io/v1/text-to-speech/{voice}/stream-input"
+        f"?model_id={model}"
+        f"&inactivity_timeout=360"
+        f"&output_format={websocket_format}"
+    )
+
+
 async def stream_via_websocket(
     provider: "ElevenLabsTTSProvider",
     request: "TTSRequest",
@@ -60,12 +72,7 @@ async def stream_via_websocket(
     )
     ensure_websocket_defaults(voice_settings)
 
-    uri = (
-        f"wss://api.elevenlabs.io/v1/text-to-speech/{voice}/stream-input"
-        f"?model_id={model}"
-        f"&inactivity_timeout=360"
-        f"&output_format={websocket_format}"
-    )
+    uri = stream_input_uri(voice, model, websocket_format)
 
     logger.info(
         "Connecting to ElevenLabs WebSocket (model=%s voice=%s format=%s)",
@@ -86,6 +93,37 @@ async def stream_via_websocket(
         yield chunk
 
 
+def _queue_stream_uri(
+    provider: "ElevenLabsTTSProvider",
+    *,
+    voice: str,
+    model: Optional[str],
+    audio_format: str,
+) -> str:
+    resolved_voice = provider.resolve_voice(voice)
+    resolved_model = model or provider.last_settings.get("model") or provider.default_model
+    return stream_input_uri(resolved_voice, resolved_model, websocket_format_for(audio_format))
+
+
+def prewarm_text_queue_stream(
+    provider: "ElevenLabsTTSProvider",
+    *,
+    voice: str,
+    model: Optional[str] = None,
+    audio_format: str = "pcm_24000",
+) -> int:
+    """Start the stream-input handshake before the first text chunk exists.
+
+    :func:`stream_from_text_queue` called with the same arguments picks the
+    warmed socket up from the shared pool.
+    """
+
+    uri = _queue_stream_uri(provider, voice=voice, model=model, audio_format=audio_format)
+    started = get_websocket_pool().prewarm(uri)
+    logger.debug("Pre-warming ElevenLabs websocket (uri=%s started=%d)", uri, started)
+    return started
+
+
 async def stream_from_text_queue(
     provider: "ElevenLabsTTSProvider",
     *,
@@ -99,9 +137,7 @@ async def stream_from_text_queue(
 ) -> AsyncIterator[str]:
     """Stream audio while consuming text chunks from a queue."""
 
-    resolved_voice = provider.resolve_voice(voice)
-    resolved_model = model or provider.last_settings.get("model") or provider.default_model
-    websocket_format = websocket_format_for(audio_format)
+    uri = _queue_stream_uri(provider, voice=voice, model=model, audio_format=audio_format)
 
     if chunk_length_schedule is None:
         schedule = provider.parse_chunk_schedule(provider.last_settings.get("chunk_length_schedule"))
@@ -115,19 +151,7 @@ async def stream_from_text_queue(
         final_voice_settings = dict(voice_settings)
     ensure_websocket_defaults(final_voice_settings)
 
-    uri = (
-        f"wss://api.elevenlabs.io/v1/text-to-speech/{resolved_voice}/stream-input"
-        f"?model_id={resolved_model}"
-        f"&inactivity_timeout=360"
-        f"&output_format={websocket_format}"
-    )
-
-    logger.info(
-        "Starting ElevenLabs queue-based streaming (voice=%s model=%s format=%s)",
-        resolved_voice,
-        resolved_model,
-        websocket_format,
-    )
+    logger.info("Starting ElevenLabs queue-based streaming (uri=%s)", uri)
 
     async for audio_bytes in stream_websocket_audio_from_queue(
         uri=uri,
@@ -142,6 +166,8 @@ async def stream_from_text_queue(
 
 
 __all__ = [
+    "prewarm_text_queue_stream",
+    "stream_input_uri",
     "stream_via_websocket",
     "stream_from_text_queue",
 ]
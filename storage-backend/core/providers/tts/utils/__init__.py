@@ -15,6 +15,7 @@ from ._elevenlabs_streaming import (
     stream_websocket_audio,
     stream_websocket_audio_from_queue,
 )
+from .websocket_pool import WebSocketConnectionPool, close_websocket_pool, get_websocket_pool
 
 __all__ = [
     "API_BASE",
@@ -28,4 +29,7 @@ __all__ = [
     "stream_rest_audio",
     "stream_websocket_audio",
     "stream_websocket_audio_from_queue",
+    "WebSocketConnectionPool",
+    "close_websocket_pool",
+    "get_websocket_pool",
 ]
@@ -14,6 +14,8 @@ import websockets
 
 from core.exceptions import ProviderError
 
+from .websocket_pool import WebSocketConnectionPool, get_websocket_pool
+
 if TYPE_CHECKING:
     from features.chat.utils.websocket_runtime import WorkflowRuntime
 
@@ -30,9 +32,15 @@ async def stream_websocket_audio_from_queue(
     chunk_length_schedule: list[int],
     provider_name: str,
     runtime: Optional["WorkflowRuntime"] = None,
+    connection_pool: Optional[WebSocketConnectionPool] = None,
 ) -> AsyncIterator[bytes]:
-    """Yield audio bytes produced by the ElevenLabs websocket endpoint using a text queue."""
+    """Yield audio bytes produced by the ElevenLabs websocket endpoint using a text queue.
+
+    The socket comes from ``connection_pool`` (the shared pool by default), so
+    a connection pre-warmed for ``uri`` skips the handshake.
+    """
 
+    pool = connection_pool or get_websocket_pool()
     loop = asyncio.get_running_loop()
     audio_queue: asyncio.Queue[object] = asyncio.Queue()
     sentinel = object()
@@ -75,7 +83,7 @@ async def stream_websocket_audio_from_queue(
         """Manage websocket connection lifecycle while sending queued text chunks."""
 
         try:
-            async with websockets.connect(uri) as ws:
+            async with pool.connection(uri) as ws:
                 initial_message = {
                     "text": " ",
                     "voice_settings": dict(voice_settings),
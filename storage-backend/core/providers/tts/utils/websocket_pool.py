@@ -0,0 +1,263 @@
+"""Pre-warmed websocket connections for streaming TTS providers.
+
+Opening the ElevenLabs ``stream-input`` socket costs a DNS lookup, a TLS
+handshake and the websocket upgrade, all of which used to land directly on
+time-to-first-audio.  :class:`WebSocketConnectionPool` lets callers start that
+handshake as soon as a TTS-enabled request is accepted (while the LLM is still
+working on its first token) and keeps a few idle, already-open sockets per
+URI so later turns skip the handshake entirely.
+
+Stream-input sockets are single use: :meth:`WebSocketConnectionPool.connection`
+hands a socket out once and closes it when the ``async with`` block exits.  Idle connections are discarded
+once they exceed ``max_idle_seconds`` and are pinged before reuse when they
+have been idle for longer than ``ping_after_seconds``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Tuple
+
+import websockets
+
+from config.tts.providers import elevenlabs as elevenlabs_config
+from core.observability.metrics import track_metric
+
+logger = logging.getLogger(__name__)
+
+# ``websockets.connect``-compatible factory returning an async context manager.
+Connector = Callable[[str], Any]
+_Opened = Tuple[Any, Any]  # (context manager, websocket)
+
+
+@dataclass(slots=True)
+class _IdleConnection:
+    context: Any
+    websocket: Any
+    opened_at: float
+
+
+def _is_open(websocket: Any) -> bool:
+    state = getattr(websocket, "state", None)
+    if state is not None:
+        return getattr(state, "name", str(state)) == "OPEN"
+    return bool(getattr(websocket, "open", True))
+
+
+async def _close_quietly(context: Any) -> None:
+    with suppress(Exception):
+        await context.__aexit__(None, None, None)
+
+
+class WebSocketConnectionPool:
+    """Per-URI pool of warmed, single-use websocket connections."""
+
+    def __init__(
+        self,
+        *,
+        idle_size: int = elevenlabs_config.WEBSOCKET_POOL_SIZE,
+        max_idle_seconds: float = elevenlabs_config.WEBSOCKET_POOL_MAX_IDLE,
+        ping_after_seconds: float = elevenlabs_config.WEBSOCKET_POOL_PING_AFTER,
+        ping_timeout: float = 2.0,
+        connect: Optional[Connector] = None,
+        clock: Callable[[], float] = time.monotonic,
+        name: str = "elevenlabs",
+    ) -> None:
+        self.idle_size = max(0, idle_size)
+        self.max_idle_seconds = max_idle_seconds
+        self.ping_after_seconds = ping_after_seconds
+        self.ping_timeout = ping_timeout
+        self.name = name
+        self._connect = connect
+        self._clock = clock
+        self._idle: Dict[str, Deque[_IdleConnection]] = {}
+        self._pending: Dict[str, List[asyncio.Task[Any]]] = {}
+        self._closed = False
+
+    def idle_count(self, uri: str) -> int:
+        return len(self._idle.get(uri, ()))
+
+    def pending_count(self, uri: str) -> int:
+        return len(self._pending.get(uri, ()))
+
+    def prewarm(self, uri: str, *, count: Optional[int] = None) -> int:
+        """Start opening connections for ``uri`` in the background.
+
+        ``count`` defaults to ``max(1, idle_size)``; connections already idle or
+        in flight count towards it.  Returns the number of handshakes started.
+        """
+
+        if self._closed:
+            return 0
+        self._prune()
+        target = max(1, self.idle_size) if count is None else count
+        missing = target - self.idle_count(uri) - self.pending_count(uri)
+        for _ in range(max(0, missing)):
+            task = asyncio.create_task(self._open(uri), name=f"{self.name}-ws-prewarm")
+            self._pending.setdefault(uri, []).append(task)
+            task.add_done_callback(partial(self._on_prewarmed, uri))
+        return max(0, missing)
+
+    @asynccontextmanager
+    async def connection(self, uri: str) -> AsyncIterator[Any]:
+        """Yield an open connection for ``uri`` and close it on exit."""
+
+        context, websocket = await self._acquire(uri)
+        try:
+            yield websocket
+        except BaseException as exc:
+            await context.__aexit__(type(exc), exc, exc.__traceback__)
+            raise
+        else:
+            await context.__aexit__(None, None, None)
+
+    async def _acquire(self, uri: str) -> _Opened:
+        started = self._clock()
+        source = "idle"
+        opened = await self._take_idle(uri)
+
+        if opened is None:
+            pending = self._pending.get(uri)
+            if pending:
+                source = "prewarming"
+                task = pending.pop(0)
+                try:
+                    opened = await task
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:
+                    logger.warning("Pre-warmed %s websocket failed, reconnecting: %s", self.name, exc)
+
+        if opened is None:
+            source = "cold"
+            opened = await self._open(uri)
+
+        if self.idle_size:
+            self.prewarm(uri, count=self.idle_size)
+
+        wait_ms = (self._clock() - started) * 1000
+        logger.debug("Acquired %s websocket (source=%s wait=%.1fms)", self.name, source, wait_ms)
+        track_metric(
+            "tts.websocket_acquire_ms",
+            wait_ms,
+            tags={"provider": self.name, "source": source},
+        )
+        return opened
+
+    async def aclose(self) -> None:
+        """Cancel in-flight handshakes and close idle connections."""
+
+        self._closed = True
+        pending = [task for tasks in self._pending.values() for task in tasks]
+        self._pending.clear()
+        for task in pending:
+            task.cancel()
+        for task in pending:
+            with suppress(asyncio.CancelledError, Exception):
+                context, _ = await task
+                await _close_quietly(context)
+
+        idle = [entry for entries in self._idle.values() for entry in entries]
+        self._idle.clear()
+        for entry in idle:
+            await _close_quietly(entry.context)
+
+    async def _open(self, uri: str) -> _Opened:
+        connect = self._connect or websockets.connect
+        context = connect(uri)
+        websocket = await context.__aenter__()
+        return context, websocket
+
+    def _on_prewarmed(self, uri: str, task: asyncio.Task[Any]) -> None:
+        pending = self._pending.get(uri)
+        if pending is None or task not in pending:
+            return  # claimed by acquire(), which owns the result
+        pending.remove(task)
+        if not pending:
+            self._pending.pop(uri, None)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.warning("Failed to pre-warm %s websocket: %s", self.name, exc)
+            return
+        context, websocket = task.result()
+        if self._closed:
+            asyncio.create_task(_close_quietly(context))
+            return
+        self._idle.setdefault(uri, deque()).append(_IdleConnection(context, websocket, self._clock()))
+
+    async def _take_idle(self, uri: str) -> Optional[_Opened]:
+        entries = self._idle.get(uri)
+        while entries:
+            entry = entries.pop()
+            idle_for = self._clock() - entry.opened_at
+            if idle_for > self.max_idle_seconds or not _is_open(entry.websocket):
+                await _close_quietly(entry.context)
+                continue
+            if idle_for > self.ping_after_seconds and not await self._ping(entry.websocket):
+                await _close_quietly(entry.context)
+                continue
+            return entry.context, entry.websocket
+        return None
+
+    async def _ping(self, websocket: Any) -> bool:
+        try:
+            pong = await websocket.ping()
+            await asyncio.wait_for(pong, timeout=self.ping_timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            return False
+        return True
+
+    def _prune(self) -> None:
+        now = self._clock()
+        for uri in list(self._idle):
+            entries = self._idle[uri]
+            fresh = deque(
+                entry
+                for entry in entries
+                if now - entry.opened_at <= self.max_idle_seconds and _is_open(entry.websocket)
+            )
+            for entry in entries:
+                if entry not in fresh:
+                    asyncio.create_task(_close_quietly(entry.context))
+            if fresh:
+                self._idle[uri] = fresh
+            else:
+                del self._idle[uri]
+
+
+_pool: Optional[WebSocketConnectionPool] = None
+
+
+def get_websocket_pool() -> WebSocketConnectionPool:
+    """Return the process-wide ElevenLabs stream-input connection pool."""
+
+    global _pool
+    if _pool is None:
+        _pool = WebSocketConnectionPool()
+    return _pool
+
+
+async def close_websocket_pool() -> None:
+    """Close the shared pool (application shutdown)."""
+
+    global _pool
+    if _pool is not None:
+        pool, _pool = _pool, None
+        await pool.aclose()
+
+
+__all__ = [
+    "WebSocketConnectionPool",
+    "close_websocket_pool",
+    "get_websocket_pool",
+]
@@ -3,15 +3,16 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
 from google.genai import types  # type: ignore
 
+from config.api_keys import GOOGLE_API_KEY
 from config.video.providers import gemini as gemini_config
 from core.clients.ai import get_google_client
 from core.exceptions import ProviderError, ValidationError
 from core.providers.capabilities import ProviderCapabilities
-from core.providers.base import BaseVideoProvider
+from core.providers.base import BaseVideoProvider, VideoOperationStatus
 from .utils.gemini import assets, options
 from .utils.gemini import operations as operations_utils
 from .utils.gemini import requests as request_utils
@@ -61,19 +62,8 @@ class GeminiVideoProvider(BaseVideoProvider):
             raise ProviderError("Prompt cannot be empty", provider="gemini_video")
 
         model_name = self._resolve_model_name(model)
-        generation_request = await request_utils.build_generation_request(
-            duration_seconds=duration_seconds,
-            aspect_ratio=aspect_ratio,
-            kwargs=kwargs,
-            number_of_videos=options.resolve_number_of_videos(
-                kwargs.get("number_of_videos", 1)
-            ),
-            available_aspect_ratios=self.available_aspect_ratios,
-            available_person_generation=self.available_person_generation,
-            available_resolutions=self.available_resolutions,
-            prepare_image=self._prepare_image,
-            resolve_reference_type=self._resolve_reference_type,
-            default_aspect_ratio="16:9",
+        generation_request = await self._text_generation_request(
+            duration_seconds, aspect_ratio, kwargs
         )
 
         logger.info(
@@ -126,18 +116,7 @@ class GeminiVideoProvider(BaseVideoProvider):
             image_url, provider_name="gemini_video"
         )
 
-        generation_request = await request_utils.build_generation_request(
-            duration_seconds=kwargs.get("duration_seconds", 5),
-            aspect_ratio=kwargs.get("aspect_ratio", "9:16"),
-            kwargs=kwargs,
-            number_of_videos=1,
-            available_aspect_ratios=self.available_aspect_ratios,
-            available_person_generation=self.available_person_generation,
-            available_resolutions=self.available_resolutions,
-            prepare_image=self._prepare_image,
-            resolve_reference_type=self._resolve_reference_type,
-            default_aspect_ratio="9:16",
-        )
+        generation_request = await self._image_generation_request(kwargs)
 
         logger.info(
             "Generating Gemini image-to-video: model=%s duration=%ss aspect_ratio=%s",
@@ -172,6 +151,100 @@ class GeminiVideoProvider(BaseVideoProvider):
                 original_error=exc,
             ) from exc
 
+    async def start_generation(
+        self,
+        prompt: str,
+        *,
+        image_url: str | None = None,
+        model: str | None = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Start a Veo operation and return its name without waiting."""
+
+        if not prompt or not prompt.strip():
+            raise ProviderError("Prompt cannot be empty", provider="gemini_video")
+
+        image = None
+        if image_url:
+            image = await source_utils.fetch_image_for_video(
+                image_url, provider_name="gemini_video"
+            )
+            generation_request = await self._image_generation_request(kwargs)
+            model_name = self._resolve_model_name(self.model)
+        else:
+            generation_request = await self._text_generation_request(
+                kwargs.get("duration_seconds", 5), kwargs.get("aspect_ratio", "16:9"), kwargs
+            )
+            model_name = self._resolve_model_name(model)
+
+        operation = await operations_utils.submit_generation(
+            self.client,
+            prompt=prompt,
+            model=model_name,
+            config=generation_request.config,
+            image=image,
+        )
+        name = getattr(operation, "name", None)
+        if not name:
+            raise ProviderError("Gemini returned an operation without a name", provider="gemini_video")
+        return {"operation_name": name}
+
+    async def check_generation(self, handle: Dict[str, Any]) -> VideoOperationStatus:
+        """Fetch the Veo operation and normalise its status."""
+
+        operation = await operations_utils.get_operation(self.client, handle["operation_name"])
+        if not getattr(operation, "done", False):
+            return VideoOperationStatus("processing", "running")
+
+        error = getattr(operation, "error", None)
+        if error:
+            message = error.get("message") if isinstance(error, dict) else str(error)
+            return VideoOperationStatus("failed", "error", error=message or "Gemini video generation failed")
+
+        generated_videos = getattr(getattr(operation, "response", None), "generated_videos", None)
+        if not generated_videos:
+            return VideoOperationStatus("failed", "done", error="No videos generated")
+        return VideoOperationStatus("completed", "done", asset=generated_videos[0])
+
+    def stream_generation(self, status: VideoOperationStatus) -> AsyncIterator[bytes]:
+        """Stream the generated video from the Files API."""
+
+        return operations_utils.stream_video_asset(
+            self.client, status.asset, api_key=GOOGLE_API_KEY or None
+        )
+
+    async def _text_generation_request(
+        self, duration_seconds: int, aspect_ratio: str, kwargs: Dict[str, Any]
+    ) -> Any:
+        return await request_utils.build_generation_request(
+            duration_seconds=duration_seconds,
+            aspect_ratio=aspect_ratio,
+            kwargs=kwargs,
+            number_of_videos=options.resolve_number_of_videos(
+                kwargs.get("number_of_videos", 1)
+            ),
+            available_aspect_ratios=self.available_aspect_ratios,
+            available_person_generation=self.available_person_generation,
+            available_resolutions=self.available_resolutions,
+            prepare_image=self._prepare_image,
+            resolve_reference_type=self._resolve_reference_type,
+            default_aspect_ratio="16:9",
+        )
+
+    async def _image_generation_request(self, kwargs: Dict[str, Any]) -> Any:
+        return await request_utils.build_generation_request(
+            duration_seconds=kwargs.get("duration_seconds", 5),
+            aspect_ratio=kwargs.get("aspect_ratio", "9:16"),
+            kwargs=kwargs,
+            number_of_videos=1,
+            available_aspect_ratios=self.available_aspect_ratios,
+            available_person_generation=self.available_person_generation,
+            available_resolutions=self.available_resolutions,
+            prepare_image=self._prepare_image,
+            resolve_reference_type=self._resolve_reference_type,
+            default_aspect_ratio="9:16",
+        )
+
     async def _prepare_image(self, source: Any) -> Optional[types.Image]:
         """Wrapper around :func:`assets.prepare_image` using the provider fetcher."""
 
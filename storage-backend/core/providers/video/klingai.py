@@ -1,18 +1,19 @@
 """KlingAI video generation provider."""
 
 import logging
-from typing import Optional, List
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from config.video.providers import klingai as klingai_config
 from core.exceptions import ConfigurationError
 from core.providers.capabilities import ProviderCapabilities
-from core.providers.base import BaseVideoProvider
+from core.providers.base import BaseVideoProvider, VideoOperationStatus
 from core.providers.video.utils.klingai import (
     KlingAIAuth,
     KlingAIClient,
     KlingAIModel,
     VideoMode,
     AspectRatio,
+    TaskStatus,
     generators_text,
     generators_image,
     generators_multi,
@@ -83,6 +84,51 @@ class KlingAIVideoProvider(BaseVideoProvider):
             self, prompt, image_url, model, runtime, **kwargs
         )
 
+    async def start_generation(
+        self,
+        prompt: str,
+        *,
+        image_url: Optional[str] = None,
+        model: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Create a text/image-to-video task and return its id without polling."""
+        if image_url:
+            endpoint = generators_image.ENDPOINT
+            payload = generators_image.build_image_to_video_payload(
+                self, prompt, image_url, model, **kwargs
+            )
+        else:
+            endpoint = generators_text.ENDPOINT
+            payload = generators_text.build_text_to_video_payload(
+                self, prompt, model, **kwargs
+            )
+        task_id = await self.client.create_task(endpoint=endpoint, payload=payload)
+        return {"endpoint": endpoint, "task_id": task_id}
+
+    async def check_generation(self, handle: Dict[str, Any]) -> VideoOperationStatus:
+        """Query the task and normalise its status."""
+        task_data = await self.client.get_task_status(handle["endpoint"], handle["task_id"])
+        status = task_data.get("task_status")
+
+        if status == TaskStatus.SUCCEED.value:
+            videos = (task_data.get("task_result") or {}).get("videos") or []
+            video_url = videos[0].get("url") if videos else None
+            if not video_url:
+                return VideoOperationStatus("failed", status, error="No video URL in task result")
+            return VideoOperationStatus("completed", status, asset=video_url)
+        if status == TaskStatus.FAILED.value:
+            return VideoOperationStatus(
+                "failed", status, error=f"Task failed: {task_data.get('task_status_msg', 'Unknown error')}"
+            )
+        if status in (TaskStatus.SUBMITTED.value, TaskStatus.PROCESSING.value):
+            return VideoOperationStatus("processing", status)
+        return VideoOperationStatus("failed", status, error=f"Unknown task status: {status}")
+
+    def stream_generation(self, status: VideoOperationStatus) -> AsyncIterator[bytes]:
+        """Stream the finished video from KlingAI's CDN."""
+        return self.client.stream_video(status.asset)
+
     async def generate_from_multiple_images(
         self,
         prompt: str,
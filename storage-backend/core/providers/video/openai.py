@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict
 
 from config.video.providers import openai as openai_config
 from core.clients.ai import ai_clients
 from core.exceptions import ProviderError
 from core.providers.capabilities import ProviderCapabilities
-from core.providers.base import BaseVideoProvider
+from core.providers.base import BaseVideoProvider, VideoOperationStatus
 from .utils.openai import operations as operations_utils
 from .utils.openai import options as options_utils
 from .utils.openai import references as references_utils
@@ -92,16 +92,15 @@ class OpenAIVideoProvider(BaseVideoProvider):
         self.available_sizes = openai_config.AVAILABLE_SIZES
         self.resolution_presets = openai_config.RESOLUTION_PRESETS
 
-    async def generate(
+    def _text_request(
         self,
         prompt: str,
-        model: str | None = None,
-        duration_seconds: int = 5,
-        aspect_ratio: str = "16:9",
-        runtime: Optional["WorkflowRuntime"] = None,
-        **kwargs: Any,
-    ) -> bytes:
-        """Generate a video from a text prompt using Sora."""
+        model: str | None,
+        duration_seconds: int,
+        aspect_ratio: str,
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Resolve the Sora request parameters for a text prompt."""
 
         if not prompt or not prompt.strip():
             raise ProviderError("Prompt cannot be empty", provider="openai_video")
@@ -116,66 +115,23 @@ class OpenAIVideoProvider(BaseVideoProvider):
             self.available_sizes,
             self.resolution_presets,
         )
+        return {"prompt": prompt.strip(), "model": model_name, "seconds": seconds, "size": size}
 
-        logger.info(
-            "Generating OpenAI Sora video: model=%s seconds=%s size=%s",
-            model_name,
-            seconds,
-            size,
-        )
-
-        poll_timeout_seconds = _coerce_positive_int(
-            kwargs.pop("poll_timeout_seconds", None),
-            default=openai_config.DEFAULT_POLL_TIMEOUT_SECONDS,
-        )
-        poll_interval_seconds = _coerce_positive_float(
-            kwargs.pop("poll_interval_seconds", None),
-            default=openai_config.DEFAULT_POLL_INTERVAL_SECONDS,
-        )
-
-        try:
-            video = await operations_utils.create_video_job(
-                self.client,
-                prompt=prompt.strip(),
-                model=model_name,
-                seconds=seconds,
-                size=size,
-                provider_name="openai_video",
-                poll_timeout_seconds=poll_timeout_seconds,
-                poll_interval_seconds=poll_interval_seconds,
-                runtime=runtime,
-            )
-        except ProviderError:
-            raise
-        except Exception as exc:  # pragma: no cover - defensive provider guard
-            logger.error("OpenAI Sora generation failed: %s", exc, exc_info=True)
-            raise ProviderError(
-                f"OpenAI Sora generation failed: {exc}",
-                provider="openai_video",
-                original_error=exc,
-            ) from exc
-
-        return await operations_utils.download_video_bytes(
-            self.client,
-            video,
-            provider_name="openai_video",
-        )
-
-    async def generate_from_image(
+    async def _image_request(
         self,
         prompt: str,
         image_url: str,
-        runtime: Optional["WorkflowRuntime"] = None,
-        **kwargs: Any,
-    ) -> bytes:
-        """Generate a video using an image reference."""
+        model: str | None,
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Resolve the Sora request parameters, including the reference image."""
 
         if not prompt or not prompt.strip():
             raise ProviderError("Prompt cannot be empty", provider="openai_video")
         if not image_url or not isinstance(image_url, str):
             raise ProviderError("Image URL is required for image-to-video", provider="openai_video")
 
-        model_name = (kwargs.get("model") or self.default_model).strip() or self.default_model
+        model_name = (model or self.default_model).strip() or self.default_model
         seconds = options_utils.resolve_seconds(
             kwargs.get("duration_seconds", 4),
             self.allowed_seconds,
@@ -218,11 +174,84 @@ class OpenAIVideoProvider(BaseVideoProvider):
         elif actual_dimensions:
             size = f"{actual_dimensions[0]}x{actual_dimensions[1]}"
 
+        return {
+            "prompt": prompt.strip(),
+            "model": model_name,
+            "seconds": seconds,
+            "size": size,
+            "input_reference": reference,
+        }
+
+    async def generate(
+        self,
+        prompt: str,
+        model: str | None = None,
+        duration_seconds: int = 5,
+        aspect_ratio: str = "16:9",
+        runtime: Optional["WorkflowRuntime"] = None,
+        **kwargs: Any,
+    ) -> bytes:
+        """Generate a video from a text prompt using Sora."""
+
+        request = self._text_request(prompt, model, duration_seconds, aspect_ratio, kwargs)
+
+        logger.info(
+            "Generating OpenAI Sora video: model=%s seconds=%s size=%s",
+            request["model"],
+            request["seconds"],
+            request["size"],
+        )
+
+        poll_timeout_seconds = _coerce_positive_int(
+            kwargs.pop("poll_timeout_seconds", None),
+            default=openai_config.DEFAULT_POLL_TIMEOUT_SECONDS,
+        )
+        poll_interval_seconds = _coerce_positive_float(
+            kwargs.pop("poll_interval_seconds", None),
+            default=openai_config.DEFAULT_POLL_INTERVAL_SECONDS,
+        )
+
+        try:
+            video = await operations_utils.create_video_job(
+                self.client,
+                **request,
+                provider_name="openai_video",
+                poll_timeout_seconds=poll_timeout_seconds,
+                poll_interval_seconds=poll_interval_seconds,
+                runtime=runtime,
+            )
+        except ProviderError:
+            raise
+        except Exception as exc:  # pragma: no cover - defensive provider guard
+            logger.error("OpenAI Sora generation failed: %s", exc, exc_info=True)
+            raise ProviderError(
+                f"OpenAI Sora generation failed: {exc}",
+                provider="openai_video",
+                original_error=exc,
+            ) from exc
+
+        return await operations_utils.download_video_bytes(
+            self.client,
+            video,
+            provider_name="openai_video",
+        )
+
+    async def generate_from_image(
+        self,
+        prompt: str,
+        image_url: str,
+        runtime: Optional["WorkflowRuntime"] = None,
+        **kwargs: Any,
+    ) -> bytes:
+        """Generate a video using an image reference."""
+
+        request = await self._image_request(prompt, image_url, kwargs.get("model"), kwargs)
+
         logger.info(
             "Generating OpenAI Sora image-to-video: model=%s seconds=%s size=%s",
-            model_name,
-            seconds,
-            size,
+            request["model"],
+            request["seconds"],
+            request["size"],
         )
 
         poll_timeout_seconds = _coerce_positive_int(
@@ -235,11 +264,7 @@ class OpenAIVideoProvider(BaseVideoProvider):
         try:
             video = await operations_utils.create_video_job(
                 self.client,
-                prompt=prompt.strip(),
-                model=model_name,
-                seconds=seconds,
-                size=size,
-                input_reference=reference,
+                **request,
                 provider_name="openai_video",
                 poll_timeout_seconds=poll_timeout_seconds,
                 poll_interval_seconds=poll_interval_seconds,
@@ -260,3 +285,62 @@ class OpenAIVideoProvider(BaseVideoProvider):
             video,
             provider_name="openai_video",
         )
+
+    async def start_generation(
+        self,
+        prompt: str,
+        *,
+        image_url: str | None = None,
+        model: str | None = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Create a Sora job and return its id without waiting."""
+
+        if image_url:
+            request = await self._image_request(prompt, image_url, model, kwargs)
+        else:
+            request = self._text_request(
+                prompt,
+                model,
+                kwargs.get("duration_seconds", 5),
+                kwargs.get("aspect_ratio", "16:9"),
+                kwargs,
+            )
+
+        video = await operations_utils.submit_video_job(
+            self.client, **request, provider_name="openai_video"
+        )
+        video_id = getattr(video, "id", None)
+        if not video_id:
+            raise ProviderError("OpenAI returned an invalid job identifier", provider="openai_video")
+        return {"video_id": video_id}
+
+    async def check_generation(self, handle: Dict[str, Any]) -> VideoOperationStatus:
+        """Retrieve the Sora job and normalise its status."""
+
+        video_id = handle["video_id"]
+        try:
+            video = await self.client.videos.retrieve(video_id)
+        except Exception as exc:  # pragma: no cover - provider surface
+            raise ProviderError(
+                f"Failed to poll OpenAI video status: {exc}",
+                provider="openai_video",
+                original_error=exc,
+            ) from exc
+
+        status = getattr(video, "status", None)
+        progress = getattr(video, "progress", None)
+        if status == "completed":
+            return VideoOperationStatus("completed", status, progress, asset=video_id)
+        if status in {"failed", "cancelled", "canceled"}:
+            error = getattr(video, "error", None)
+            message = getattr(error, "message", None) or f"OpenAI video generation {status}"
+            return VideoOperationStatus("failed", status, progress, error=message)
+        return VideoOperationStatus("processing", status, progress)
+
+    def stream_generation(self, status: VideoOperationStatus) -> AsyncIterator[bytes]:
+        """Stream the finished Sora MP4 straight from the content endpoint."""
+
+        return operations_utils.stream_video_content(
+            self.client, status.asset, provider_name="openai_video"
+        )
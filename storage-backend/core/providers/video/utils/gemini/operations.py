@@ -5,7 +5,9 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from typing import Any
+from typing import Any, AsyncIterator
+
+import httpx
 
 from google.genai import types  # type: ignore
 
@@ -14,18 +16,15 @@ from core.exceptions import ProviderError
 logger = logging.getLogger(__name__)
 
 
-async def execute_generation(
+async def submit_generation(
     client: Any,
     *,
     prompt: str,
     model: str,
     config: types.GenerateVideosConfig,
-    poll_interval: int,
-    timeout: int,
     image: Any | None = None,
-    runtime: Any = None,
-) -> bytes:
-    """Submit a Gemini generation request and return the resulting bytes."""
+) -> Any:
+    """Start a Gemini generation and return the long-running operation."""
 
     request_kwargs = {
         "model": model,
@@ -36,7 +35,7 @@ async def execute_generation(
         request_kwargs["image"] = image
 
     try:
-        operation = await asyncio.to_thread(
+        return await asyncio.to_thread(
             client.models.generate_videos,
             **request_kwargs,
         )
@@ -50,6 +49,40 @@ async def execute_generation(
             original_error=exc,
         ) from exc
 
+
+async def get_operation(client: Any, name: str) -> Any:
+    """Fetch the latest state of the operation called ``name``."""
+
+    try:
+        return await asyncio.to_thread(
+            client.operations.get,
+            types.GenerateVideosOperation(name=name),
+        )
+    except Exception as exc:  # pragma: no cover - provider surface
+        raise ProviderError(
+            f"Failed to poll Gemini video operation: {exc}",
+            provider="gemini_video",
+            original_error=exc,
+        ) from exc
+
+
+async def execute_generation(
+    client: Any,
+    *,
+    prompt: str,
+    model: str,
+    config: types.GenerateVideosConfig,
+    poll_interval: int,
+    timeout: int,
+    image: Any | None = None,
+    runtime: Any = None,
+) -> bytes:
+    """Submit a Gemini generation request and return the resulting bytes."""
+
+    operation = await submit_generation(
+        client, prompt=prompt, model=model, config=config, image=image
+    )
+
     return await poll_operation(
         client,
         operation,
@@ -164,4 +197,46 @@ async def download_video_asset(client: Any, generated_video: Any) -> bytes:
     return bytes(video_bytes)
 
 
-__all__ = ["download_video_asset", "execute_generation", "poll_operation"]
+async def stream_video_asset(
+    client: Any,
+    generated_video: Any,
+    *,
+    api_key: str | None,
+    chunk_size: int = 1024 * 1024,
+) -> AsyncIterator[bytes]:
+    """Yield a generated video in chunks.
+
+    Videos exposed through a Files API URI are streamed over HTTP; anything
+    else (inline bytes, missing key) falls back to :func:`download_video_asset`.
+    """
+
+    video_asset = getattr(generated_video, "video", None) or getattr(
+        generated_video, "media", None
+    )
+    uri = getattr(video_asset, "uri", None)
+    if not uri or not api_key or getattr(video_asset, "video_bytes", None):
+        yield await download_video_asset(client, generated_video)
+        return
+
+    try:
+        async with httpx.AsyncClient(timeout=120.0, follow_redirects=True) as http:
+            async with http.stream("GET", uri, headers={"x-goog-api-key": api_key}) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes(chunk_size):
+                    yield chunk
+    except httpx.HTTPError as exc:
+        raise ProviderError(
+            f"Failed to stream generated video: {exc}",
+            provider="gemini_video",
+            original_error=exc,
+        ) from exc
+
+
+__all__ = [
+    "download_video_asset",
+    "execute_generation",
+    "get_operation",
+    "poll_operation",
+    "stream_video_asset",
+    "submit_generation",
+]
@@ -1,7 +1,7 @@
 """Image-to-video generation for KlingAI."""
 
 import logging
-from typing import Optional, Any
+from typing import Any, Dict, Optional
 
 from config.video.providers import klingai as klingai_config
 from core.exceptions import ConfigurationError, ProviderError
@@ -19,46 +19,17 @@ from .validators_image import process_image_input
 
 logger = logging.getLogger(__name__)
 
+ENDPOINT = "/v1/videos/image2video"
 
-async def generate_image_to_video(
+
+def build_image_to_video_payload(
     provider,
     prompt: str,
     image_url: str,
     model: Optional[str] = None,
-    runtime: Any = None,
     **kwargs
-) -> bytes:
-    """
-    Generate video from image with optional text guidance.
-
-    Args:
-        provider: KlingAIVideoProvider instance
-        prompt: Text description (max 2500 chars, optional for KlingAI)
-        image_url: Reference image URL or Base64
-        model: Model name (default: kling-v1)
-        **kwargs: Additional parameters:
-            - image_tail: str (end frame image URL/Base64)
-            - negative_prompt: str (max 2500 chars)
-            - cfg_scale: float [0, 1] (v1 models only)
-            - mode: str ('std' or 'pro')
-            - duration_seconds: int (5 or 10)
-            - static_mask: str (static brush mask URL/Base64)
-            - dynamic_masks: list (dynamic brush configurations)
-            - camera_control: dict (camera movement)
-            - enable_audio: bool (V2.6/O1 models only - generates synchronized audio)
-
-    Returns:
-        Video bytes
-
-    Raises:
-        ConfigurationError: Invalid parameters
-        ProviderError: API errors, task failures
-
-    Note:
-        - At least one of image_url or image_tail must be provided
-        - image+image_tail, motion brush (static_mask/dynamic_masks), and camera_control are mutually exclusive
-        - V2.6 models support native audio generation with synchronized audio
-    """
+) -> Dict[str, Any]:
+    """Validate image-to-video parameters and build the task payload."""
     # Validate image
     if not image_url:
         raise ConfigurationError("image_url is required")
@@ -170,10 +141,54 @@ async def generate_image_to_video(
         f"has_motion_brush={has_motion_brush}"
     )
 
+    return payload
+
+
+async def generate_image_to_video(
+    provider,
+    prompt: str,
+    image_url: str,
+    model: Optional[str] = None,
+    runtime: Any = None,
+    **kwargs
+) -> bytes:
+    """
+    Generate video from image with optional text guidance.
+
+    Args:
+        provider: KlingAIVideoProvider instance
+        prompt: Text description (max 2500 chars, optional for KlingAI)
+        image_url: Reference image URL or Base64
+        model: Model name (default: kling-v1)
+        **kwargs: Additional parameters:
+            - image_tail: str (end frame image URL/Base64)
+            - negative_prompt: str (max 2500 chars)
+            - cfg_scale: float [0, 1] (v1 models only)
+            - mode: str ('std' or 'pro')
+            - duration_seconds: int (5 or 10)
+            - static_mask: str (static brush mask URL/Base64)
+            - dynamic_masks: list (dynamic brush configurations)
+            - camera_control: dict (camera movement)
+            - enable_audio: bool (V2.6/O1 models only - generates synchronized audio)
+
+    Returns:
+        Video bytes
+
+    Raises:
+        ConfigurationError: Invalid parameters
+        ProviderError: API errors, task failures
+
+    Note:
+        - At least one of image_url or image_tail must be provided
+        - image+image_tail, motion brush (static_mask/dynamic_masks), and camera_control are mutually exclusive
+        - V2.6 models support native audio generation with synchronized audio
+    """
+    payload = build_image_to_video_payload(provider, prompt, image_url, model, **kwargs)
+
     try:
         # Create task
         task_id = await provider.client.create_task(
-            endpoint="/v1/videos/image2video",
+            endpoint=ENDPOINT,
             payload=payload
         )
 
@@ -181,7 +196,7 @@ async def generate_image_to_video(
 
         # Poll until complete
         task_result = await provider.client.poll_until_complete(
-            endpoint="/v1/videos/image2video",
+            endpoint=ENDPOINT,
             task_id=task_id,
             runtime=runtime,
         )
@@ -1,7 +1,7 @@
 """Text-to-video generation for KlingAI."""
 
 import logging
-from typing import Optional, Any
+from typing import Any, Dict, Optional
 
 from config.video.providers import klingai as klingai_config
 from core.exceptions import ConfigurationError, ProviderError
@@ -18,43 +18,16 @@ from .builders import build_camera_control
 
 logger = logging.getLogger(__name__)
 
+ENDPOINT = "/v1/videos/text2video"
 
-async def generate_text_to_video(
+
+def build_text_to_video_payload(
     provider,
     prompt: str,
     model: Optional[str] = None,
-    runtime: Any = None,
     **kwargs
-) -> bytes:
-    """
-    Generate video from text prompt.
-
-    Args:
-        provider: KlingAIVideoProvider instance
-        prompt: Text description (max 2500 chars)
-        model: Model name (default: kling-v1)
-        **kwargs: Additional parameters:
-            - negative_prompt: str (max 2500 chars)
-            - cfg_scale: float [0, 1] (v1 models only)
-            - mode: str ('std' or 'pro')
-            - duration_seconds: int (5 or 10)
-            - aspect_ratio: str ('16:9', '9:16', or '1:1')
-            - camera_control: dict
-            - enable_audio: bool (V2.6/O1 models only - generates synchronized audio)
-            - callback_url: str (optional)
-            - external_task_id: str (optional)
-
-    Returns:
-        Video bytes
-
-    Raises:
-        ConfigurationError: Invalid parameters
-        ProviderError: API errors, task failures
-
-    Note:
-        V2.6 models support native audio generation with synchronized dialogue,
-        sound effects, and ambient sounds. Use enable_audio=True to activate.
-    """
+) -> Dict[str, Any]:
+    """Validate text-to-video parameters and build the task payload."""
     # Validate prompt
     if not prompt or len(prompt.strip()) == 0:
         raise ConfigurationError("Prompt cannot be empty")
@@ -143,10 +116,51 @@ async def generate_text_to_video(
         f"mode_in_payload={'mode' in payload}, payload_keys={list(payload.keys())}"
     )
 
+    return payload
+
+
+async def generate_text_to_video(
+    provider,
+    prompt: str,
+    model: Optional[str] = None,
+    runtime: Any = None,
+    **kwargs
+) -> bytes:
+    """
+    Generate video from text prompt.
+
+    Args:
+        provider: KlingAIVideoProvider instance
+        prompt: Text description (max 2500 chars)
+        model: Model name (default: kling-v1)
+        **kwargs: Additional parameters:
+            - negative_prompt: str (max 2500 chars)
+            - cfg_scale: float [0, 1] (v1 models only)
+            - mode: str ('std' or 'pro')
+            - duration_seconds: int (5 or 10)
+            - aspect_ratio: str ('16:9', '9:16', or '1:1')
+            - camera_control: dict
+            - enable_audio: bool (V2.6/O1 models only - generates synchronized audio)
+            - callback_url: str (optional)
+            - external_task_id: str (optional)
+
+    Returns:
+        Video bytes
+
+    Raises:
+        ConfigurationError: Invalid parameters
+        ProviderError: API errors, task failures
+
+    Note:
+        V2.6 models support native audio generation with synchronized dialogue,
+        sound effects, and ambient sounds. Use enable_audio=True to activate.
+    """
+    payload = build_text_to_video_payload(provider, prompt, model, **kwargs)
+
     try:
         # Create task
         task_id = await provider.client.create_task(
-            endpoint="/v1/videos/text2video",
+            endpoint=ENDPOINT,
             payload=payload
         )
 
@@ -154,7 +168,7 @@ async def generate_text_to_video(
 
         # Poll until complete
         task_result = await provider.client.poll_until_complete(
-            endpoint="/v1/videos/text2video",
+            endpoint=ENDPOINT,
             task_id=task_id,
             runtime=runtime,
         )
@@ -2,7 +2,7 @@
 
 import asyncio
 import time
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, AsyncIterator, Optional, List
 
 import httpx
 
@@ -223,3 +223,35 @@ class KlingAIClient:
             ) from e
         except Exception as e:
             raise ProviderError(f"Video download error: {str(e)}") from e
+
+    async def stream_video(
+        self,
+        video_url: str,
+        chunk_size: int = 1024 * 1024,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream video bytes from URL without holding the file in memory.
+
+        Args:
+            video_url: Video URL from KlingAI
+            chunk_size: Size of the yielded chunks in bytes
+
+        Yields:
+            Consecutive chunks of the video file
+
+        Raises:
+            ProviderError: On download errors
+        """
+        try:
+            async with httpx.AsyncClient(timeout=120.0) as client:
+                async with client.stream("GET", video_url) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        yield chunk
+
+        except httpx.HTTPStatusError as e:
+            raise ProviderError(
+                f"Video download failed ({e.response.status_code}): {e}"
+            ) from e
+        except httpx.HTTPError as e:
+            raise ProviderError(f"Video download error: {str(e)}") from e
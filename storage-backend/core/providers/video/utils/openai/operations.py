@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from typing import Any, Tuple
+from typing import Any, AsyncIterator, Tuple
 
 try:
     from openai.types.video import Video
@@ -19,7 +19,7 @@ from core.exceptions import ProviderError
 logger = logging.getLogger(__name__)
 
 
-async def create_video_job(
+async def submit_video_job(
     client: Any,
     *,
     prompt: str,
@@ -28,11 +28,8 @@ async def create_video_job(
     size: str,
     input_reference: Tuple[str, bytes, str] | None = None,
     provider_name: str = "openai_video",
-    poll_timeout_seconds: int = 240,
-    poll_interval_seconds: float = 5.0,
-    runtime: Any = None,
 ) -> Video:
-    """Submit an OpenAI Sora job and wait for completion."""
+    """Create an OpenAI Sora job and return it without waiting."""
 
     params: dict[str, Any] = {
         "prompt": prompt,
@@ -44,7 +41,7 @@ async def create_video_job(
         params["input_reference"] = input_reference
 
     try:
-        job = await client.videos.create(**params)
+        return await client.videos.create(**params)
     except Exception as exc:  # pragma: no cover - provider surface
         raise ProviderError(
             f"OpenAI Sora request failed: {exc}",
@@ -52,6 +49,32 @@ async def create_video_job(
             original_error=exc,
         ) from exc
 
+
+async def create_video_job(
+    client: Any,
+    *,
+    prompt: str,
+    model: str,
+    seconds: str,
+    size: str,
+    input_reference: Tuple[str, bytes, str] | None = None,
+    provider_name: str = "openai_video",
+    poll_timeout_seconds: int = 240,
+    poll_interval_seconds: float = 5.0,
+    runtime: Any = None,
+) -> Video:
+    """Submit an OpenAI Sora job and wait for completion."""
+
+    job = await submit_video_job(
+        client,
+        prompt=prompt,
+        model=model,
+        seconds=seconds,
+        size=size,
+        input_reference=input_reference,
+        provider_name=provider_name,
+    )
+
     if isinstance(job, Video) and getattr(job, "status", None) == "completed":
         return job
 
@@ -144,4 +167,34 @@ async def download_video_bytes(
     return bytes(video_bytes)
 
 
-__all__ = ["create_video_job", "download_video_bytes"]
+async def stream_video_content(
+    client: Any,
+    video_id: str,
+    *,
+    chunk_size: int = 1024 * 1024,
+    provider_name: str = "openai_video",
+) -> AsyncIterator[bytes]:
+    """Yield the MP4 payload of a completed Sora video without buffering it."""
+
+    try:
+        async with client.videos.with_streaming_response.download_content(
+            video_id, variant="video"
+        ) as response:
+            async for chunk in response.iter_bytes(chunk_size):
+                yield chunk
+    except ProviderError:
+        raise
+    except Exception as exc:  # pragma: no cover - provider surface
+        raise ProviderError(
+            f"Failed to stream OpenAI video content: {exc}",
+            provider=provider_name,
+            original_error=exc,
+        ) from exc
+
+
+__all__ = [
+    "create_video_job",
+    "download_video_bytes",
+    "stream_video_content",
+    "submit_video_job",
+]
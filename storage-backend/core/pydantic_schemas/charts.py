@@ -167,12 +167,16 @@ class DataQuery(BaseModel):
 
     source: DataSource = Field(..., description="Which data source to query")
     metric: str = Field(..., description="Metric to fetch (e.g., heart_rate)")
+    metrics: Optional[List[str]] = Field(
+        None, description="Additional metrics from the same source, plotted as extra series"
+    )
     time_range: Optional[TimeRange] = Field(
         None, description="Time period for the data"
     )
     filters: Optional[Dict[str, Any]] = Field(None, description="Additional filters")
     aggregation: Optional[str] = Field(
-        None, description="Aggregation level: daily, weekly, monthly, none"
+        None,
+        description="Aggregation level: daily, weekly, monthly, none, or rolling_<N>d (trailing N-day average)",
     )
     limit: int = Field(
         100, ge=1, le=1000, description="Maximum number of data points to return"
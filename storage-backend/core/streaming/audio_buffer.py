@@ -0,0 +1,229 @@
+"""Compact accumulation of streamed audio.
+
+Realtime turns and TTS streams used to keep every provider delta as a separate
+``bytes`` object (and a base64 copy next to it) before joining them into one
+payload for validation, WAV conversion and upload.  :class:`AudioAccumulator`
+keeps a single growable buffer instead, spills to an anonymous temporary file
+once it passes ``spill_threshold`` bytes, and exposes the contents as a
+``memoryview`` so consumers can read it without another copy.
+"""
+
+from __future__ import annotations
+
+import io
+import mmap
+import struct
+import tempfile
+from typing import IO, Optional
+
+from core.utils.env import get_env
+
+DEFAULT_SPILL_THRESHOLD = int(get_env("AUDIO_BUFFER_SPILL_BYTES", default=str(8 * 1024 * 1024)) or 0)
+
+
+class AudioAccumulator:
+    """Append-only audio buffer with zero-copy read access.
+
+    Views returned by :meth:`getbuffer` (and readers from :meth:`open_wav`)
+    show the audio accumulated when they were taken and stay valid across
+    later appends and :meth:`clear`.  While one is alive, growing the
+    in-memory buffer moves it to a new allocation and a spill mapping is only
+    unmapped once the last view is released, so release views
+    (``with accumulator.getbuffer() as view``) when done.
+    """
+
+    def __init__(self, *, spill_threshold: Optional[int] = None, initial_capacity: int = 0) -> None:
+        self.spill_threshold = DEFAULT_SPILL_THRESHOLD if spill_threshold is None else spill_threshold
+        self._buffer = bytearray(initial_capacity)
+        self._size = 0
+        self._file: Optional[IO[bytes]] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self.chunk_count = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    @property
+    def spilled(self) -> bool:
+        return self._file is not None
+
+    def append(self, chunk: bytes | bytearray | memoryview) -> None:
+        """Add ``chunk`` to the end of the buffer."""
+
+        length = len(chunk)
+        if not length:
+            return
+        self.chunk_count += 1
+
+        if self._file is None and self.spill_threshold and self._size + length > self.spill_threshold:
+            self._spill()
+
+        if self._file is not None:
+            self._close_mmap()
+            self._file.seek(self._size)
+            self._file.write(chunk)
+        else:
+            end = self._size + length
+            if end <= len(self._buffer):
+                self._buffer[self._size:end] = chunk
+            else:
+                # Past the preallocated capacity bytearray over-allocates on
+                # its own, so appends stay amortised O(1).
+                try:
+                    del self._buffer[self._size:]
+                    self._buffer += chunk
+                except BufferError:
+                    # A live view pins the buffer's size; continue in a copy.
+                    self._buffer = self._buffer[: self._size] + chunk
+        self._size += length
+
+    extend = append
+
+    def getbuffer(self) -> memoryview:
+        """Return a read-only view over the accumulated audio."""
+
+        if self._file is None:
+            return memoryview(self._buffer)[: self._size].toreadonly()
+        if not self._size:
+            return memoryview(b"")
+        if self._mmap is None:
+            self._file.flush()
+            self._mmap = mmap.mmap(self._file.fileno(), self._size, access=mmap.ACCESS_READ)
+        return memoryview(self._mmap)[: self._size]
+
+    def to_bytes(self) -> bytes:
+        """Return a copy of the accumulated audio as ``bytes``."""
+
+        with self.getbuffer() as view:
+            return view.tobytes()
+
+    def open_wav(self, *, sample_rate: int = 24_000, channels: int = 1, sample_width: int = 2) -> IO[bytes]:
+        """Return a seekable reader yielding a WAV file around the PCM payload.
+
+        The RIFF header is generated up front and the samples are served
+        straight from :meth:`getbuffer`, so no WAV copy is built in memory.
+        """
+
+        header = wav_header(
+            self._size,
+            sample_rate=sample_rate,
+            channels=channels,
+            sample_width=sample_width,
+        )
+        with self.getbuffer() as view:
+            return open_view_reader(view, prefix=header)
+
+    def clear(self) -> None:
+        """Drop the accumulated audio and any spill file."""
+
+        self._close_mmap()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._buffer = bytearray()
+        self._size = 0
+        self.chunk_count = 0
+
+    close = clear
+
+    def _spill(self) -> None:
+        spill = tempfile.TemporaryFile(prefix="audio-")
+        spill.write(memoryview(self._buffer)[: self._size])
+        self._file = spill
+        self._buffer = bytearray()
+
+    def _close_mmap(self) -> None:
+        mapping, self._mmap = self._mmap, None
+        if mapping is None:
+            return
+        try:
+            mapping.close()
+        except BufferError:
+            # Still exported to a view or reader; the mapping is unmapped when
+            # the last of them is released.
+            pass
+
+
+def wav_header(data_size: int, *, sample_rate: int, channels: int = 1, sample_width: int = 2) -> bytes:
+    """Return the 44-byte RIFF/WAVE header for ``data_size`` bytes of PCM."""
+
+    byte_rate = sample_rate * channels * sample_width
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        channels,
+        sample_rate,
+        byte_rate,
+        channels * sample_width,
+        sample_width * 8,
+        b"data",
+        data_size,
+    )
+
+
+def open_view_reader(view: bytes | bytearray | memoryview, *, prefix: bytes = b"") -> IO[bytes]:
+    """Return a seekable file object serving ``prefix`` followed by ``view``.
+
+    botocore accepts file objects but not bare ``memoryview`` bodies, so this
+    lets an upload stream straight from the accumulator's memory.
+    """
+
+    return io.BufferedReader(_ConcatReader(prefix, view))
+
+
+class _ConcatReader(io.RawIOBase):
+    """Seekable raw stream over a header followed by a memoryview body."""
+
+    def __init__(self, header: bytes, body: bytes | bytearray | memoryview) -> None:
+        # Own views keep the caller's view usable after this reader closes.
+        self._parts = (memoryview(header), memoryview(body).cast("B"))
+        self._length = len(header) + len(body)
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._position, io.SEEK_END: self._length}[whence]
+        self._position = max(0, min(self._length, base + offset))
+        return self._position
+
+    def close(self) -> None:
+        if not self.closed:
+            for part in self._parts:
+                part.release()
+        super().close()
+
+    def readinto(self, target) -> int:  # type: ignore[override]
+        written = 0
+        position = self._position
+        target = memoryview(target).cast("B")
+        for part in self._parts:
+            if written >= len(target):
+                break
+            if position >= len(part):
+                position -= len(part)
+                continue
+            chunk = part[position : position + len(target) - written]
+            target[written : written + len(chunk)] = chunk
+            written += len(chunk)
+            position = 0
+        self._position += written
+        return written
+
+
+__all__ = ["AudioAccumulator", "DEFAULT_SPILL_THRESHOLD", "open_view_reader", "wav_header"]
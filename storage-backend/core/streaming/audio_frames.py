@@ -0,0 +1,185 @@
+"""Binary WebSocket framing for streamed audio.
+
+Clients that negotiate ``audio_transport=binary`` receive audio as binary
+WebSocket messages instead of ``{"type": "audio_chunk", "content": "<base64>"}``
+JSON events.  Control events (``tts_started``, ``tts_completed`` …) stay JSON.
+
+Frame layout (network byte order, 8-byte header followed by raw audio)::
+
+    0      1        2          4              8
+    +------+--------+----------+--------------+----------------
+    | ver  | format | stream   | sequence     | audio bytes …
+    +------+--------+----------+--------------+----------------
+
+``stream`` identifies one audio stream (a TTS response or a realtime
+response) within the connection; ``sequence`` starts at 1 for each stream.
+``format`` is one of :data:`AUDIO_FORMAT_CODES`; the full format string
+(sample rate, bitrate) is announced by the surrounding JSON control events.
+"""
+
+from __future__ import annotations
+
+import base64
+import struct
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional
+
+AUDIO_FRAME_VERSION = 1
+AUDIO_TRANSPORT_JSON = "json"
+AUDIO_TRANSPORT_BINARY = "binary"
+
+AUDIO_FORMAT_CODES: dict[str, int] = {
+    "unknown": 0,
+    "mp3": 1,
+    "pcm": 2,
+    "opus": 3,
+    "wav": 4,
+    "ulaw": 5,
+    "aac": 6,
+    "flac": 7,
+}
+
+_HEADER = struct.Struct("!BBHI")
+_FORMAT_ALIASES = {"pcm16": "pcm", "mulaw": "ulaw", "ogg": "opus"}
+
+AUDIO_FRAME_HEADER_SIZE = _HEADER.size
+
+
+@dataclass(frozen=True, slots=True)
+class AudioFrame:
+    """Decoded binary audio frame."""
+
+    stream_id: int
+    sequence: int
+    format_code: int
+    audio: bytes
+
+
+def audio_format_code(audio_format: Optional[str]) -> int:
+    """Map provider format strings such as ``mp3_44100_128`` to a frame code."""
+
+    if not audio_format:
+        return AUDIO_FORMAT_CODES["unknown"]
+    family = str(audio_format).lower().split("_", 1)[0]
+    family = _FORMAT_ALIASES.get(family, family)
+    return AUDIO_FORMAT_CODES.get(family, AUDIO_FORMAT_CODES["unknown"])
+
+
+def encode_audio_frame(audio: bytes, *, stream_id: int, sequence: int, format_code: int) -> bytes:
+    """Return ``audio`` prefixed with the binary frame header."""
+
+    return _HEADER.pack(AUDIO_FRAME_VERSION, format_code, stream_id & 0xFFFF, sequence & 0xFFFFFFFF) + audio
+
+
+def decode_audio_frame(frame: bytes) -> AudioFrame:
+    """Parse a frame produced by :func:`encode_audio_frame`."""
+
+    if len(frame) < AUDIO_FRAME_HEADER_SIZE:
+        raise ValueError("Audio frame shorter than header")
+    version, format_code, stream_id, sequence = _HEADER.unpack_from(frame)
+    if version != AUDIO_FRAME_VERSION:
+        raise ValueError(f"Unsupported audio frame version {version}")
+    return AudioFrame(
+        stream_id=stream_id,
+        sequence=sequence,
+        format_code=format_code,
+        audio=bytes(frame[AUDIO_FRAME_HEADER_SIZE:]),
+    )
+
+
+def resolve_audio_transport(value: Any) -> str:
+    """Normalise a client-requested transport, defaulting to JSON."""
+
+    if isinstance(value, str) and value.strip().lower() == AUDIO_TRANSPORT_BINARY:
+        return AUDIO_TRANSPORT_BINARY
+    return AUDIO_TRANSPORT_JSON
+
+
+def requested_audio_transport(websocket: Any, requested: Any = None) -> str:
+    """Return the transport asked for explicitly or via ``?audio_transport=``."""
+
+    if requested is None:
+        query_params = getattr(websocket, "query_params", None)
+        if query_params is not None:
+            try:
+                requested = query_params.get("audio_transport")
+            except Exception:  # pragma: no cover - exotic websocket stubs
+                requested = None
+    return resolve_audio_transport(requested)
+
+
+def audio_bytes(content: Any) -> Optional[bytes]:
+    """Return raw audio for ``content`` given as bytes or a base64 string."""
+
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        return bytes(content)
+    if isinstance(content, str) and content:
+        try:
+            return base64.b64decode(content)
+        except (ValueError, TypeError):
+            return None
+    return None
+
+
+def audio_event_as_json(event: Mapping[str, Any]) -> dict[str, Any]:
+    """Return ``event`` with raw audio ``content`` base64-encoded for JSON clients."""
+
+    payload = dict(event)
+    content = payload.get("content")
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        payload["content"] = base64.b64encode(content).decode("ascii")
+    return payload
+
+
+class AudioFrameEncoder:
+    """Per-connection stream and sequence bookkeeping for binary audio frames."""
+
+    def __init__(self) -> None:
+        self._stream_id = 0
+        self._sequence = 0
+        self._stream_key: Any = None
+        self._started = False
+
+    @property
+    def stream_id(self) -> int:
+        return self._stream_id
+
+    def new_stream(self, stream_key: Any = None) -> int:
+        """Start a new audio stream and return its identifier."""
+
+        self._stream_id = (self._stream_id + 1) & 0xFFFF
+        self._sequence = 0
+        self._stream_key = stream_key
+        self._started = True
+        return self._stream_id
+
+    def encode(self, audio: bytes, *, audio_format: Optional[str] = None, stream_key: Any = None) -> bytes:
+        """Frame ``audio``; a different ``stream_key`` opens a new stream."""
+
+        if not self._started or (stream_key is not None and stream_key != self._stream_key):
+            self.new_stream(stream_key)
+        self._sequence += 1
+        return encode_audio_frame(
+            audio,
+            stream_id=self._stream_id,
+            sequence=self._sequence,
+            format_code=audio_format_code(audio_format),
+        )
+
+
+__all__ = [
+    "AUDIO_FORMAT_CODES",
+    "AUDIO_FRAME_HEADER_SIZE",
+    "AUDIO_FRAME_VERSION",
+    "AUDIO_TRANSPORT_BINARY",
+    "AUDIO_TRANSPORT_JSON",
+    "AudioFrame",
+    "AudioFrameEncoder",
+    "audio_bytes",
+    "audio_event_as_json",
+    "audio_format_code",
+    "decode_audio_frame",
+    "encode_audio_frame",
+    "requested_audio_transport",
+    "resolve_audio_transport",
+]
@@ -61,6 +61,14 @@ from core.utils.json_serialization import sanitize_for_json
 logger = logging.getLogger(__name__)
 
 
+def _is_raw_audio_event(data: Any) -> bool:
+    return (
+        isinstance(data, dict)
+        and data.get("type") == "audio_chunk"
+        and isinstance(data.get("content"), (bytes, bytearray))
+    )
+
+
 class StreamingManager:
     """Manage streaming queues and collected results."""
 
@@ -125,7 +133,12 @@ class StreamingManager:
                     else type(data.get("content")),
                 )
 
-            serialized_data = sanitize_for_json(data)
+            if _is_raw_audio_event(data):
+                # Raw audio stays bytes until the transport edge decides between
+                # a binary frame and base64 JSON.
+                serialized_data = dict(data)
+            else:
+                serialized_data = sanitize_for_json(data)
             if isinstance(serialized_data, dict):
                 self._attach_ai_message_id(serialized_data)
 
@@ -194,8 +207,11 @@ class StreamingManager:
 
         return self._tts_manager.get_chunks_sent()
 
-    def collect_chunk(self, chunk: str, chunk_type: str = "text") -> None:
-        """Store a streamed chunk for later aggregation."""
+    def collect_chunk(self, chunk: str | bytes, chunk_type: str = "text") -> None:
+        """Store a streamed chunk for later aggregation.
+
+        Audio chunks are raw bytes; every other chunk type is text.
+        """
 
         key = f"{chunk_type}_chunks"
         if key in self.results:
@@ -219,7 +235,7 @@ class StreamingManager:
         return {
             "text": "".join(self.results["text_chunks"]),
             "reasoning": "".join(self.results["reasoning_chunks"]),
-            "audio": "".join(self.results["audio_chunks"]),
+            "audio": b"".join(self.results["audio_chunks"]),
             "transcription": "".join(self.results["transcription_chunks"]),
             "translation": "".join(self.results["translation_chunks"]),
             "tool_calls": list(self.results.get("tool_calls", [])),
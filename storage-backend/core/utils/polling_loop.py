@@ -0,0 +1,267 @@
+"""Shared loop for background pollers that own many long-running jobs.
+
+The batch scheduler and the video job poller both keep every in-flight job in
+memory and advance them from one coroutine instead of one sleeping task per
+job.  :class:`JobPollingLoop` holds the parts they share:
+
+* the start/stop/notify lifecycle and the loop that sleeps until the earliest
+  due job or the next reload from the database;
+* per-job polling intervals that back off while nothing changes;
+* hand-offs, which run slow completion work (downloads, uploads) as separate
+  tasks so it never holds up polling of the other jobs;
+* the lease window: every worker runs a loop, so subclasses lease the jobs
+  they poll (``lease_owner``/``lease_expires_at``) to ``owner`` and renew the
+  leases on each reload; a worker that dies hands its jobs over once its
+  leases expire.
+
+Subclasses implement :meth:`JobPollingLoop._refresh` (reload jobs from the
+database) and :meth:`JobPollingLoop._tick` (submit and poll due jobs).
+:class:`ProcessLoop` keeps the process-wide instance started by the app
+lifespan.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, ClassVar, Dict, Generic, List, Optional, Protocol, TypeVar
+
+from core.connections.connection_info import get_server_id
+
+logger = logging.getLogger(__name__)
+
+LEASE_REFRESH_MULTIPLIER = 3
+"""Leases outlive this many reloads, so a busy pass does not hand a job over."""
+
+
+class PolledJob(Protocol):
+    """Scheduling state every tracked job carries."""
+
+    interval: float
+    next_poll_at: float
+
+
+TrackedT = TypeVar("TrackedT", bound=PolledJob)
+LoopT = TypeVar("LoopT", bound="JobPollingLoop[Any]")
+
+
+def as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Treat naive database timestamps as UTC."""
+
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class JobPollingLoop(ABC, Generic[TrackedT]):
+    """Single loop advancing every tracked job of one kind."""
+
+    display_name: ClassVar[str] = "Job poller"
+    task_name: ClassVar[str] = "job-poller"
+
+    def __init__(
+        self,
+        *,
+        base_interval: float,
+        max_interval: float,
+        backoff_factor: float,
+        refresh_interval: float,
+        clock: Callable[[], float] = time.monotonic,
+        owner: Optional[str] = None,
+        lease_seconds: Optional[float] = None,
+    ) -> None:
+        self._base_interval = max(0.0, base_interval)
+        self._max_interval = max(self._base_interval, max_interval)
+        self._backoff_factor = max(1.0, backoff_factor)
+        self._refresh_interval = refresh_interval
+        self._clock = clock
+        self._owner = owner or get_server_id()
+        self._lease_seconds = (
+            lease_seconds if lease_seconds is not None else LEASE_REFRESH_MULTIPLIER * max(refresh_interval, 1.0)
+        )
+
+        self._tracked: Dict[str, TrackedT] = {}
+        self._handoffs: Dict[str, asyncio.Task[None]] = {}
+        self._next_refresh = 0.0
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task[None]] = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def tracked_job_ids(self) -> List[str]:
+        return sorted(self._tracked)
+
+    def start(self) -> None:
+        """Start the polling loop on the running event loop."""
+
+        if self.running:
+            return
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name=self.task_name)
+        logger.info("%s started", self.display_name)
+
+    async def stop(self) -> None:
+        """Cancel the loop and pending hand-offs; in-flight jobs resume on next start."""
+
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        handoffs = list(self._handoffs.values())
+        for handoff in handoffs:
+            handoff.cancel()
+        await asyncio.gather(*handoffs, return_exceptions=True)
+        await self._on_stop()
+        logger.info("%s stopped", self.display_name, extra={"tracked_jobs": len(self._tracked)})
+
+    def notify(self) -> None:
+        """Wake the loop and reload jobs, e.g. right after a submission."""
+
+        self._next_refresh = 0.0
+        if self._wake is not None:
+            self._wake.set()
+
+    async def _run(self) -> None:
+        assert self._wake is not None
+        while True:
+            try:
+                delay = await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("%s tick failed", self.display_name)
+                delay = self._base_interval or 1.0
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=max(delay, 0.0))
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    async def _on_stop(self) -> None:
+        """Hook run once the loop has stopped."""
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    async def run_once(self) -> float:
+        """Run one pass and return the seconds until the next one."""
+
+        now = self._clock()
+        if now >= self._next_refresh:
+            await self._refresh(now)
+            self._next_refresh = now + self._refresh_interval
+
+        await self._tick()
+
+        deadlines = [tracked.next_poll_at for tracked in self._tracked.values()]
+        deadlines.append(self._next_refresh)
+        return max(0.0, min(deadlines) - self._clock())
+
+    @abstractmethod
+    async def _refresh(self, now: float) -> None:
+        """Reload the jobs this loop owns from the database."""
+
+    @abstractmethod
+    async def _tick(self) -> None:
+        """Submit queued jobs and poll the due ones."""
+
+    def _lease_window(self) -> Dict[str, datetime]:
+        """``now``/``until`` keyword arguments for the repositories' ``acquire_leases``."""
+
+        now = datetime.now(timezone.utc)
+        return {"now": now, "until": now + timedelta(seconds=self._lease_seconds)}
+
+    def _due(self, now: float) -> List[TrackedT]:
+        return [tracked for tracked in self._tracked.values() if tracked.next_poll_at <= now]
+
+    def _back_off(self, tracked: TrackedT, now: float) -> None:
+        tracked.interval = min(max(tracked.interval, 1.0) * self._backoff_factor, self._max_interval)
+        tracked.next_poll_at = now + tracked.interval
+
+    def _reset_interval(self, tracked: TrackedT, now: float) -> None:
+        tracked.interval = self._base_interval
+        tracked.next_poll_at = now + tracked.interval
+
+    # ------------------------------------------------------------------
+    # Hand-offs
+    # ------------------------------------------------------------------
+
+    def _hand_off(self, job_id: str, step: Awaitable[None]) -> None:
+        """Run ``step`` for ``job_id`` as its own task, outside the polling pass.
+
+        The job must already be untracked; :meth:`_is_handed_off` lets
+        :meth:`_refresh` skip it until the step has finished.
+        """
+
+        task = asyncio.create_task(self._run_handoff(job_id, step), name=f"{self.task_name}:{job_id}")
+        self._handoffs[job_id] = task
+        task.add_done_callback(lambda _task: self._handoffs.pop(job_id, None))
+
+    def _is_handed_off(self, job_id: str) -> bool:
+        return job_id in self._handoffs
+
+    async def wait_for_handoffs(self) -> None:
+        """Wait until every handed-off step has finished."""
+
+        while self._handoffs:
+            await asyncio.gather(*list(self._handoffs.values()), return_exceptions=True)
+
+    async def _run_handoff(self, job_id: str, step: Awaitable[None]) -> None:
+        try:
+            await step
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("%s hand-off failed", self.display_name, extra={"job_id": job_id})
+
+
+class ProcessLoop(Generic[LoopT]):
+    """Holds the process-wide instance of a polling loop."""
+
+    def __init__(self, factory: Callable[..., LoopT]) -> None:
+        self._factory = factory
+        self._instance: Optional[LoopT] = None
+
+    def get(self) -> Optional[LoopT]:
+        """Return the running instance, if one was started."""
+
+        return self._instance
+
+    def start(self, *args: Any, **kwargs: Any) -> LoopT:
+        """Create the instance on first use and start it."""
+
+        if self._instance is None:
+            self._instance = self._factory(*args, **kwargs)
+        self._instance.start()
+        return self._instance
+
+    async def stop(self) -> None:
+        """Stop and forget the instance if it is running."""
+
+        instance, self._instance = self._instance, None
+        if instance is not None:
+            await instance.stop()
+
+
+__all__ = [
+    "LEASE_REFRESH_MULTIPLIER",
+    "JobPollingLoop",
+    "PolledJob",
+    "ProcessLoop",
+    "as_utc",
+]
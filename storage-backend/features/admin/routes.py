@@ -7,9 +7,9 @@ import os
 from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
 from fastapi.responses import JSONResponse
 
 from config.audio.providers.openai import STREAMING_TRANSCRIPTION_MODEL_NAMES
@@ -20,8 +20,9 @@ from config.text.providers.openai.models import (
     get_model_voices,
     list_models_by_category,
 )
-from core.auth import AuthContext, require_auth_context
+from core.auth import AuthContext, is_admin, require_auth_context
 from core.providers.registry.model_config import ModelConfig
+from core.providers.text_scoreboard import get_text_scoreboard
 from core.pydantic_schemas import ok as api_ok
 
 logger = logging.getLogger(__name__)
@@ -96,6 +97,49 @@ async def get_openai_model_details(model: str) -> dict[str, Any]:
     return response
 
 
+@router.get("/providers/text/scoreboard")
+async def get_text_provider_scoreboard() -> dict[str, Any]:
+    """Return rolling TTFT, error-rate and rate-limit stats per text model."""
+
+    scoreboard = get_text_scoreboard()
+    return {
+        "window": scoreboard.window,
+        "max_age_seconds": scoreboard.max_age,
+        "providers": scoreboard.snapshot(),
+    }
+
+
+@router.get("/realtime/sessions/recent")
+async def list_recent_realtime_sessions(
+    limit: int = Query(50, ge=1, le=1000),
+    customer_id: Optional[int] = Query(None),
+    all_customers: bool = Query(False),
+    auth_context: AuthContext = Depends(require_auth_context),
+) -> dict[str, Any]:
+    """Return per-session stats for the most recently finished realtime sessions.
+
+    Sessions are limited to the caller's own; another ``customer_id`` or
+    ``all_customers=true`` requires the admin role.
+    """
+
+    caller_id = auth_context["customer_id"]
+    if (all_customers or customer_id not in (None, caller_id)) and not is_admin(auth_context):
+        raise HTTPException(status_code=403, detail="Access denied: admin role required")
+    if all_customers:
+        customer_id = None
+    elif customer_id is None:
+        customer_id = caller_id
+
+    # Imported here so the admin router does not pull in the realtime feature.
+    from features.realtime.metrics import get_recent_sessions
+
+    recent = get_recent_sessions()
+    return {
+        "capacity": recent.limit,
+        "sessions": recent.snapshot(limit=limit, customer_id=customer_id),
+    }
+
+
 @router.post("/logs/upload")
 async def upload_mobile_logs(
     file: UploadFile = File(..., description="Log file from mobile app"),
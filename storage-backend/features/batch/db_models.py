@@ -64,6 +64,10 @@ class BatchJob(Base):
 
     metadata_payload = Column("metadata", JSON, nullable=True)
 
+    # Worker currently polling/finishing the job (see BatchScheduler)
+    lease_owner = Column(String(64), nullable=True)
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True)
+
     __table_args__ = (
         Index("idx_status_provider", "status", "provider"),
         Index("idx_customer_created", "customer_id", "created_at"),
@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Collection, List, Optional
 
-from sqlalchemy import desc, select, update
+from sqlalchemy import desc, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from features.batch.db_models import BatchJob
@@ -149,6 +149,75 @@ class BatchJobRepository:
             await self.session.commit()
         return result.rowcount > 0
 
+    async def claim_for_submission(self, job_id: str, *, started_at: datetime, commit: bool = False) -> bool:
+        """Atomically move a queued job to ``processing``; ``False`` if another worker won."""
+
+        stmt = (
+            update(BatchJob)
+            .where(BatchJob.job_id == job_id, BatchJob.status == "queued")
+            .values(status="processing", started_at=started_at)
+        )
+        result = await self.session.execute(stmt)
+        if commit:
+            await self.session.commit()
+        return result.rowcount > 0
+
+    async def acquire_leases(
+        self,
+        job_ids: Collection[str],
+        *,
+        owner: str,
+        now: datetime,
+        until: datetime,
+    ) -> List[str]:
+        """Lease active jobs to ``owner`` until ``until``; return the ids it holds.
+
+        A lease is taken when the job has none, already belongs to ``owner``
+        or expired before ``now``, so a worker renews its own leases with the
+        same call.
+        """
+
+        if not job_ids:
+            return []
+        active = ["queued", "processing"]
+        stmt = (
+            update(BatchJob)
+            .where(
+                BatchJob.job_id.in_(list(job_ids)),
+                BatchJob.status.in_(active),
+                or_(
+                    BatchJob.lease_owner.is_(None),
+                    BatchJob.lease_owner == owner,
+                    BatchJob.lease_expires_at.is_(None),
+                    BatchJob.lease_expires_at < now,
+                ),
+            )
+            .values(lease_owner=owner, lease_expires_at=until)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(stmt)
+        held = await self.session.execute(
+            select(BatchJob.job_id).where(
+                BatchJob.job_id.in_(list(job_ids)),
+                BatchJob.status.in_(active),
+                BatchJob.lease_owner == owner,
+            )
+        )
+        return list(held.scalars().all())
+
+    async def release_leases(self, job_ids: Collection[str], *, owner: str) -> None:
+        """Drop ``owner``'s leases on ``job_ids`` so another worker can take them."""
+
+        if not job_ids:
+            return
+        stmt = (
+            update(BatchJob)
+            .where(BatchJob.job_id.in_(list(job_ids)), BatchJob.lease_owner == owner)
+            .values(lease_owner=None, lease_expires_at=None)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(stmt)
+
     async def get_pending_jobs(self, limit: int = 100) -> List[BatchJob]:
         stmt = (
             select(BatchJob)
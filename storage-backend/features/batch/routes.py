@@ -14,7 +14,7 @@ from features.batch.dependencies import get_batch_job_repository
 from features.batch.repositories.batch_job_repository import BatchJobRepository
 from features.batch.schemas.requests import CreateBatchRequest
 from features.batch.schemas.responses import BatchJobListResponse, BatchJobResponse
-from features.batch.services import BatchService
+from features.batch.services import BatchService, get_batch_scheduler
 
 router = APIRouter(prefix="/api/v1/batch", tags=["batch"])
 
@@ -29,17 +29,24 @@ async def submit_batch_job(
     auth_context: AuthContext = Depends(require_auth_context),
     repository: BatchJobRepository = Depends(get_batch_job_repository),
 ) -> Dict:
-    """Submit a new batch job and persist immediate results."""
+    """Queue a new batch job; the background scheduler submits and tracks it."""
 
     service = _get_service(repository)
+    scheduler = get_batch_scheduler()
     try:
-        batch_job = await service.submit_batch(request=request, customer_id=auth_context["customer_id"])
-        return api_ok("Batch job completed", data=batch_job)
+        if scheduler is None:
+            # Scheduler disabled (BATCH_SCHEDULER_ENABLED=false): drive the job within the request.
+            batch_job = await service.submit_batch(request=request, customer_id=auth_context["customer_id"])
+            return api_ok("Batch job completed", data=batch_job)
+        batch_job = await service.submit_batch_async(request=request, customer_id=auth_context["customer_id"])
     except ValidationError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     except ProviderError as exc:
         raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc)) from exc
 
+    scheduler.notify()
+    return api_ok("Batch job queued", data=batch_job)
+
 
 @router.get("/{job_id}", response_model=ApiResponse[BatchJobResponse])
 async def get_batch_status(
@@ -1,5 +1,12 @@
 """Batch service exports."""
 
+from .batch_scheduler import BatchScheduler, get_batch_scheduler, start_batch_scheduler, stop_batch_scheduler
 from .batch_service import BatchService
 
-__all__ = ["BatchService"]
+__all__ = [
+    "BatchScheduler",
+    "BatchService",
+    "get_batch_scheduler",
+    "start_batch_scheduler",
+    "stop_batch_scheduler",
+]
@@ -0,0 +1,476 @@
+"""Background scheduler that drives every in-flight provider batch.
+
+Instead of one sleeping coroutine per batch, a single loop owns all
+non-terminal :class:`BatchJob` rows.  At startup (and periodically) it reloads
+them from the database, so jobs survive process restarts.  Each tick it:
+
+* submits newly queued jobs to their provider (claimed atomically so several
+  workers never submit the same job twice);
+* leases the submitted jobs it tracks (``lease_owner``/``lease_expires_at``)
+  and renews the leases on every reload, so with several workers each job is
+  polled and its results persisted by exactly one of them; a worker that dies
+  hands its jobs over once the lease expires;
+* polls every due job with one request per provider where the provider offers
+  a list endpoint;
+* backs a job's polling interval off while its status is unchanged and resets
+  it as soon as the provider reports progress;
+* streams the result file of finished batches and persists the converted
+  responses in chunks, resuming from the last persisted position after a
+  restart.
+
+The loop, its back-off and the process-wide instance come from
+:mod:`core.utils.polling_loop`, shared with the video job poller.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from config.batch.defaults import (
+    BATCH_INITIAL_POLLING_DELAY_SECONDS,
+    BATCH_POLLING_INTERVAL_SECONDS,
+    BATCH_RESULT_PERSIST_CHUNK_SIZE,
+    BATCH_SCHEDULER_BACKOFF_FACTOR,
+    BATCH_SCHEDULER_MAX_ACTIVE_JOBS,
+    BATCH_SCHEDULER_MAX_POLLING_INTERVAL_SECONDS,
+    BATCH_SCHEDULER_REFRESH_INTERVAL_SECONDS,
+)
+from core.providers.resolvers import get_text_provider
+from core.pydantic_schemas import ProviderResponse
+from core.utils.polling_loop import JobPollingLoop, ProcessLoop, as_utc
+from features.batch.monitoring.batch_metrics import BatchMetrics
+from features.batch.repositories.batch_job_repository import BatchJobRepository
+from features.batch.services.provider_adapters import ADAPTERS, BatchProviderAdapter, ProviderBatchSnapshot
+from features.batch.status_handler import BatchStatusHandler
+from infrastructure.db.mysql import AsyncSessionFactory, session_scope
+
+logger = logging.getLogger(__name__)
+
+DISPATCH_SCHEDULER = "scheduler"
+"""``metadata["dispatch"]`` value marking jobs owned by the scheduler."""
+
+SUBMISSION_GRACE_SECONDS = 600
+"""Claimed jobs without provider references after this long are treated as orphaned."""
+
+AdapterFactory = Callable[[str, str], BatchProviderAdapter]
+
+
+def default_adapter_factory(provider_name: str, model: str) -> BatchProviderAdapter:
+    """Build the adapter for ``provider_name`` around a provider resolved for ``model``."""
+
+    adapter_cls = ADAPTERS.get(provider_name.lower())
+    if adapter_cls is None:
+        raise KeyError(f"No batch adapter registered for provider {provider_name}")
+    return adapter_cls(get_text_provider({"text": {"model": model}}))
+
+
+@dataclass
+class _TrackedJob:
+    job_id: str
+    provider: str
+    model: str
+    batch_id: str
+    interval: float
+    next_poll_at: float
+    signature: Optional[Tuple[Any, ...]] = None
+
+
+class BatchScheduler(JobPollingLoop[_TrackedJob]):
+    """Single polling loop for all scheduler-dispatched batch jobs."""
+
+    display_name = "Batch scheduler"
+    task_name = "batch-scheduler"
+
+    def __init__(
+        self,
+        session_factory: AsyncSessionFactory,
+        *,
+        adapter_factory: AdapterFactory = default_adapter_factory,
+        base_interval: float = BATCH_POLLING_INTERVAL_SECONDS,
+        max_interval: float = BATCH_SCHEDULER_MAX_POLLING_INTERVAL_SECONDS,
+        backoff_factor: float = BATCH_SCHEDULER_BACKOFF_FACTOR,
+        initial_delay: float = BATCH_INITIAL_POLLING_DELAY_SECONDS,
+        refresh_interval: float = BATCH_SCHEDULER_REFRESH_INTERVAL_SECONDS,
+        max_active_jobs: int = BATCH_SCHEDULER_MAX_ACTIVE_JOBS,
+        chunk_size: int = BATCH_RESULT_PERSIST_CHUNK_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+        owner: Optional[str] = None,
+        lease_seconds: Optional[float] = None,
+    ) -> None:
+        super().__init__(
+            base_interval=base_interval,
+            max_interval=max_interval,
+            backoff_factor=backoff_factor,
+            refresh_interval=refresh_interval,
+            clock=clock,
+            owner=owner,
+            lease_seconds=lease_seconds,
+        )
+        self._session_factory = session_factory
+        self._adapter_factory = adapter_factory
+        self._initial_delay = max(0.0, initial_delay)
+        self._max_active_jobs = max_active_jobs
+        self._chunk_size = max(1, chunk_size)
+
+        self._to_submit: List[str] = []
+        self._adapters: Dict[Tuple[str, str], BatchProviderAdapter] = {}
+
+    async def _on_stop(self) -> None:
+        try:
+            async with session_scope(self._session_factory) as session:
+                await BatchJobRepository(session).release_leases(list(self._tracked), owner=self._owner)
+        except Exception:  # pragma: no cover - leases expire on their own
+            logger.warning("Failed to release batch job leases", exc_info=True)
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    async def _tick(self) -> None:
+        while self._to_submit:
+            await self._submit(self._to_submit.pop(0))
+
+        now = self._clock()
+        due: Dict[str, List[_TrackedJob]] = {}
+        for tracked in self._due(now):
+            due.setdefault(tracked.provider, []).append(tracked)
+
+        for provider, jobs in due.items():
+            await self._poll_provider(provider, jobs, now)
+
+    async def _refresh(self, now: float) -> None:
+        async with session_scope(self._session_factory) as session:
+            repository = BatchJobRepository(session)
+            jobs = await repository.get_pending_jobs(limit=self._max_active_jobs)
+            submitted: Dict[str, Tuple[Any, str]] = {}
+            for job in jobs:
+                metadata = getattr(job, "metadata_payload", None) or {}
+                if metadata.get("dispatch") != DISPATCH_SCHEDULER:
+                    continue
+                refs = metadata.get("provider_batch") or {}
+                if refs.get("batch_id"):
+                    submitted[job.job_id] = (job, refs["batch_id"])
+                elif job.status == "queued":
+                    if job.job_id not in self._to_submit:
+                        self._to_submit.append(job.job_id)
+                else:
+                    await self._fail_orphaned_submission(repository, job)
+
+            leased = set(await repository.acquire_leases(submitted, owner=self._owner, **self._lease_window()))
+
+        for job_id, (job, batch_id) in submitted.items():
+            if job_id in leased and job_id not in self._tracked:
+                # Resume immediately: the job may have finished while unowned.
+                self._track(job_id, job.provider, job.model, batch_id, now)
+
+        for job_id in set(self._tracked) - leased:
+            # Cancelled through the API, finished, or leased by another worker.
+            self._tracked.pop(job_id, None)
+
+    def _track(self, job_id: str, provider: str, model: str, batch_id: str, next_poll_at: float) -> None:
+        self._tracked[job_id] = _TrackedJob(
+            job_id=job_id,
+            provider=provider,
+            model=model,
+            batch_id=batch_id,
+            interval=self._base_interval,
+            next_poll_at=next_poll_at,
+        )
+
+    async def _fail_orphaned_submission(self, repository: BatchJobRepository, job: Any) -> None:
+        started_at = as_utc(getattr(job, "started_at", None))
+        if started_at is None:
+            return
+        if datetime.now(timezone.utc) - started_at < timedelta(seconds=SUBMISSION_GRACE_SECONDS):
+            return
+        logger.error("Batch job lost during provider submission", extra={"job_id": job.job_id})
+        await repository.update_status(
+            job_id=job.job_id,
+            status="failed",
+            completed_at=datetime.now(timezone.utc),
+            error_message="Batch submission was interrupted before the provider batch id was recorded",
+        )
+
+    def _adapter(self, provider: str, model: str) -> BatchProviderAdapter:
+        key = (provider, model)
+        adapter = self._adapters.get(key)
+        if adapter is None:
+            adapter = self._adapters[key] = self._adapter_factory(provider, model)
+        return adapter
+
+    # ------------------------------------------------------------------
+    # Submission
+    # ------------------------------------------------------------------
+
+    async def _submit(self, job_id: str) -> None:
+        async with session_scope(self._session_factory) as session:
+            repository = BatchJobRepository(session)
+            job = await repository.get_by_job_id(job_id)
+            if job is None:
+                return
+            claimed = await repository.claim_for_submission(job_id, started_at=datetime.now(timezone.utc))
+            metadata = dict(getattr(job, "metadata_payload", None) or {})
+            provider, model = job.provider, job.model
+        if not claimed:
+            return
+
+        try:
+            refs = await self._adapter(provider, model).submit(
+                metadata.get("provider_requests") or [],
+                description=metadata.get("description"),
+            )
+        except Exception as exc:
+            logger.error(
+                "Batch provider submission failed",
+                extra={"job_id": job_id, "provider": provider, "error": str(exc)},
+                exc_info=True,
+            )
+            async with session_scope(self._session_factory) as session:
+                await BatchJobRepository(session).update_status(
+                    job_id=job_id,
+                    status="failed",
+                    completed_at=datetime.now(timezone.utc),
+                    error_message=str(exc),
+                )
+            BatchMetrics.track_error(provider=provider, model=model, error_type=exc.__class__.__name__)
+            return
+
+        metadata["provider_batch"] = refs
+        async with session_scope(self._session_factory) as session:
+            repository = BatchJobRepository(session)
+            await repository.update_metadata(job_id=job_id, metadata=metadata)
+            await repository.acquire_leases([job_id], owner=self._owner, **self._lease_window())
+
+        logger.info(
+            "Batch submitted to provider",
+            extra={"job_id": job_id, "provider": provider, "provider_batch_id": refs.get("batch_id")},
+        )
+        self._track(job_id, provider, model, refs["batch_id"], self._clock() + self._initial_delay)
+
+    # ------------------------------------------------------------------
+    # Polling
+    # ------------------------------------------------------------------
+
+    async def _poll_provider(self, provider: str, jobs: Sequence[_TrackedJob], now: float) -> None:
+        adapter = self._adapter(provider, jobs[0].model)
+        try:
+            snapshots = await adapter.poll([tracked.batch_id for tracked in jobs])
+        except Exception:
+            logger.warning(
+                "Batch status poll failed",
+                extra={"provider": provider, "job_count": len(jobs)},
+                exc_info=True,
+            )
+            for tracked in jobs:
+                self._back_off(tracked, now)
+            return
+
+        for tracked in jobs:
+            snapshot = snapshots.get(tracked.batch_id)
+            if snapshot is None:
+                self._back_off(tracked, now)
+                continue
+            try:
+                await self._apply(tracked, snapshot, now)
+            except Exception:
+                logger.exception("Failed to apply batch status", extra={"job_id": tracked.job_id})
+                self._back_off(tracked, now)
+
+    async def _apply(self, tracked: _TrackedJob, snapshot: ProviderBatchSnapshot, now: float) -> None:
+        if snapshot.is_terminal:
+            await self._finish(tracked, snapshot)
+            self._tracked.pop(tracked.job_id, None)
+            return
+
+        if snapshot.signature == tracked.signature:
+            self._back_off(tracked, now)
+            return
+
+        tracked.signature = snapshot.signature
+        self._reset_interval(tracked, now)
+        async with session_scope(self._session_factory) as session:
+            await BatchJobRepository(session).update_counts(
+                job_id=tracked.job_id,
+                succeeded=snapshot.succeeded,
+                failed=snapshot.failed,
+            )
+        logger.info(
+            "Provider reported batch progress",
+            extra={
+                "job_id": tracked.job_id,
+                "provider_status": snapshot.provider_status,
+                "succeeded": snapshot.succeeded,
+                "failed": snapshot.failed,
+            },
+        )
+
+    # ------------------------------------------------------------------
+    # Completion
+    # ------------------------------------------------------------------
+
+    async def _finish(self, tracked: _TrackedJob, snapshot: ProviderBatchSnapshot) -> None:
+        async with session_scope(self._session_factory) as session:
+            repository = BatchJobRepository(session)
+            if not await self._renew_lease(repository, tracked.job_id):
+                return
+            job = await repository.get_by_job_id(tracked.job_id)
+            if job is None or job.status not in {"queued", "processing"}:
+                return
+            metadata = dict(getattr(job, "metadata_payload", None) or {})
+            started_at = as_utc(job.started_at) or datetime.now(timezone.utc)
+
+        adapter = self._adapter(tracked.provider, tracked.model)
+        responses = await self._persist_results(tracked, adapter, snapshot, metadata)
+        metadata.pop("results_consumed", None)
+        record = SimpleNamespace(provider=tracked.provider, model=tracked.model, metadata_payload=metadata)
+
+        async with session_scope(self._session_factory) as session:
+            repository = BatchJobRepository(session)
+            if snapshot.status == "completed":
+                await BatchStatusHandler.update_batch_completion(
+                    repository, tracked.job_id, responses, record, started_at
+                )
+            else:
+                metadata["responses"] = [response.model_dump() for response in responses]
+                metadata.pop("provider_requests", None)
+                await repository.update_metadata(job_id=tracked.job_id, metadata=metadata)
+                await repository.update_status(
+                    job_id=tracked.job_id,
+                    status=snapshot.status,
+                    completed_at=datetime.now(timezone.utc),
+                    error_message=snapshot.error,
+                )
+                await repository.update_counts(
+                    job_id=tracked.job_id,
+                    succeeded=sum(1 for response in responses if not response.has_error),
+                    failed=sum(1 for response in responses if response.has_error),
+                )
+                BatchMetrics.track_error(
+                    provider=tracked.provider,
+                    model=tracked.model,
+                    error_type=f"batch_{snapshot.status}",
+                )
+
+        try:
+            await adapter.cleanup(metadata.get("provider_batch") or {})
+        except Exception:  # pragma: no cover - best-effort cleanup
+            logger.warning("Batch provider cleanup failed", extra={"job_id": tracked.job_id}, exc_info=True)
+
+    async def _persist_results(
+        self,
+        tracked: _TrackedJob,
+        adapter: BatchProviderAdapter,
+        snapshot: ProviderBatchSnapshot,
+        metadata: Dict[str, Any],
+    ) -> List[ProviderResponse]:
+        """Stream results into ``metadata["responses"]`` chunk by chunk.
+
+        ``metadata["results_consumed"]`` records how far into the provider's
+        result stream the stored responses reach, so a restart mid-download
+        skips entries that were already persisted.
+        """
+
+        requests: List[Dict[str, Any]] = metadata.get("provider_requests") or []
+        stored: List[Dict[str, Any]] = list(metadata.get("responses") or [])
+        consumed = int(metadata.get("results_consumed") or 0)
+        position = 0
+        chunk: List[Dict[str, Any]] = []
+
+        async def _flush() -> None:
+            nonlocal consumed, chunk
+            responses = await adapter.to_responses(requests, chunk, offset=consumed)
+            stored.extend(response.model_dump() for response in responses)
+            consumed += len(chunk)
+            chunk = []
+            metadata["responses"] = stored
+            metadata["results_consumed"] = consumed
+            failed = sum(1 for entry in stored if "error" in (entry.get("metadata") or {}))
+            async with session_scope(self._session_factory) as session:
+                repository = BatchJobRepository(session)
+                if not await self._renew_lease(repository, tracked.job_id):
+                    raise RuntimeError(f"Batch job {tracked.job_id} was leased by another worker")
+                await repository.update_metadata(job_id=tracked.job_id, metadata=metadata)
+                await repository.update_counts(job_id=tracked.job_id, succeeded=len(stored) - failed, failed=failed)
+
+        async for entry in adapter.iter_raw_results(snapshot):
+            position += 1
+            if position <= consumed:
+                continue
+            chunk.append(entry)
+            if len(chunk) >= self._chunk_size:
+                await _flush()
+        if chunk:
+            await _flush()
+
+        return _order_responses(requests, stored, tracked)
+
+    async def _renew_lease(self, repository: BatchJobRepository, job_id: str) -> bool:
+        held = await repository.acquire_leases([job_id], owner=self._owner, **self._lease_window())
+        if not held:
+            logger.info("Batch job lease lost; leaving it to its owner", extra={"job_id": job_id})
+        return bool(held)
+
+
+def _order_responses(
+    requests: Sequence[Dict[str, Any]],
+    stored: Sequence[Dict[str, Any]],
+    tracked: _TrackedJob,
+) -> List[ProviderResponse]:
+    by_id: Dict[Any, ProviderResponse] = {}
+    for entry in stored:
+        response = ProviderResponse(**entry)
+        by_id.setdefault(response.custom_id, response)
+
+    ordered: List[ProviderResponse] = []
+    for request in requests:
+        custom_id = request.get("custom_id")
+        response = by_id.get(custom_id)
+        if response is None:
+            response = ProviderResponse(
+                text="",
+                model=request.get("model") or tracked.model,
+                provider=tracked.provider,
+                metadata={
+                    "custom_id": custom_id,
+                    "error": "Result missing for batch request",
+                    "error_type": "MissingResult",
+                },
+            )
+        ordered.append(response)
+    return ordered
+
+
+_scheduler: ProcessLoop[BatchScheduler] = ProcessLoop(BatchScheduler)
+
+
+def get_batch_scheduler() -> Optional[BatchScheduler]:
+    """Return the process-wide scheduler, if one was started."""
+
+    return _scheduler.get()
+
+
+def start_batch_scheduler(session_factory: AsyncSessionFactory, **kwargs: Any) -> BatchScheduler:
+    """Create and start the process-wide scheduler."""
+
+    return _scheduler.start(session_factory, **kwargs)
+
+
+async def stop_batch_scheduler() -> None:
+    """Stop the process-wide scheduler if it is running."""
+
+    await _scheduler.stop()
+
+
+__all__ = [
+    "BatchScheduler",
+    "DISPATCH_SCHEDULER",
+    "default_adapter_factory",
+    "get_batch_scheduler",
+    "start_batch_scheduler",
+    "stop_batch_scheduler",
+]
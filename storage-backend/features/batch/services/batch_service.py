@@ -32,14 +32,25 @@ class BatchService:
     async def submit_batch(self, request: CreateBatchRequest, *, customer_id: int) -> BatchJobResponse:
         """Backward-compatible helper that submits and waits for completion."""
 
-        queued_job = await self.submit_batch_async(request, customer_id=customer_id)
+        queued_job = await self.submit_batch_async(request, customer_id=customer_id, dispatch="inline")
         return await self.poll_and_complete_batch(
             queued_job.job_id,
             customer_id=customer_id,
         )
 
-    async def submit_batch_async(self, request: CreateBatchRequest, *, customer_id: int) -> BatchJobResponse:
-        """Submit a new batch job without waiting for completion."""
+    async def submit_batch_async(
+        self,
+        request: CreateBatchRequest,
+        *,
+        customer_id: int,
+        dispatch: str = "scheduler",
+    ) -> BatchJobResponse:
+        """Submit a new batch job without waiting for completion.
+
+        Jobs with ``dispatch="scheduler"`` are picked up by the background
+        :class:`~features.batch.services.batch_scheduler.BatchScheduler`;
+        ``"inline"`` jobs are driven by :meth:`poll_and_complete_batch`.
+        """
 
         try:
             model_config = get_model_config(request.model)
@@ -77,6 +88,7 @@ class BatchService:
 
         metadata_payload = {
             "description": request.description,
+            "dispatch": dispatch,
             "provider_requests": provider_requests,
             "submitted_at": datetime.now(timezone.utc).isoformat(),
         }
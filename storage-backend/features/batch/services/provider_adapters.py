@@ -0,0 +1,308 @@
+"""Provider adapters used by the background batch scheduler.
+
+Each adapter splits a provider's batch workflow into the steps the scheduler
+drives independently: submit, poll many batches at once, stream the result
+entries, and convert them to :class:`ProviderResponse` objects.  Provider
+statuses are normalised to the ``BatchJob.status`` vocabulary.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, ClassVar, Dict, List, Optional, Sequence, Tuple
+
+from core.providers.base import BaseTextProvider
+from core.providers.batch import AnthropicBatchOperations, GeminiBatchOperations, OpenAIBatchOperations
+from core.providers.text.anthropic_batch import prepare_anthropic_batch_requests, process_anthropic_batch_response
+from core.providers.text.gemini.batch import process_gemini_batch_response, transform_to_gemini_format
+from core.providers.text.openai_batch import prepare_openai_batch_requests, process_openai_batch_response
+from core.pydantic_schemas import ProviderResponse
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled", "expired"})
+
+
+@dataclass(frozen=True, slots=True)
+class ProviderBatchSnapshot:
+    """Normalised view of a provider batch at one point in time."""
+
+    batch_id: str
+    status: str
+    provider_status: Optional[str] = None
+    succeeded: int = 0
+    failed: int = 0
+    result_sources: Tuple[Any, ...] = ()
+    error: Optional[str] = None
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.status in TERMINAL_STATUSES
+
+    @property
+    def signature(self) -> Tuple[Optional[str], int, int]:
+        """Value that changes whenever the batch makes visible progress."""
+
+        return (self.provider_status, self.succeeded, self.failed)
+
+
+def _attr(obj: Any, name: str, default: Any = None) -> Any:
+    if isinstance(obj, dict):
+        return obj.get(name, default)
+    return getattr(obj, name, default)
+
+
+def _select_requests(requests: Sequence[Dict[str, Any]], raw: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    wanted = {entry.get("custom_id") for entry in raw}
+    return [request for request in requests if request.get("custom_id") in wanted]
+
+
+class BatchProviderAdapter(ABC):
+    """Step-wise batch operations for one provider."""
+
+    provider_name: ClassVar[str]
+
+    def __init__(self, provider: BaseTextProvider) -> None:
+        self.provider = provider
+
+    @abstractmethod
+    async def submit(self, requests: List[Dict[str, Any]], *, description: Optional[str] = None) -> Dict[str, Any]:
+        """Create the provider batch and return the references to persist."""
+
+    @abstractmethod
+    async def poll(self, batch_ids: Sequence[str]) -> Dict[str, ProviderBatchSnapshot]:
+        """Return a snapshot for each of ``batch_ids``."""
+
+    @abstractmethod
+    def iter_raw_results(self, snapshot: ProviderBatchSnapshot) -> AsyncIterator[Dict[str, Any]]:
+        """Stream raw result entries for a completed batch."""
+
+    @abstractmethod
+    async def to_responses(
+        self,
+        requests: Sequence[Dict[str, Any]],
+        raw: Sequence[Dict[str, Any]],
+        *,
+        offset: int,
+    ) -> List[ProviderResponse]:
+        """Convert a chunk of raw results starting at stream position ``offset``."""
+
+    async def cleanup(self, refs: Dict[str, Any]) -> None:
+        """Release provider resources once the batch has ended."""
+
+
+class OpenAIBatchAdapter(BatchProviderAdapter):
+    provider_name = "openai"
+
+    _STATUS_MAP = {
+        "validating": "queued",
+        "in_progress": "processing",
+        "finalizing": "processing",
+        "cancelling": "processing",
+        "completed": "completed",
+        "failed": "failed",
+        "cancelled": "cancelled",
+        "expired": "expired",
+    }
+
+    def __init__(self, provider: BaseTextProvider) -> None:
+        super().__init__(provider)
+        self.ops = OpenAIBatchOperations(provider.client)
+
+    async def submit(self, requests: List[Dict[str, Any]], *, description: Optional[str] = None) -> Dict[str, Any]:
+        batch_requests, _ = prepare_openai_batch_requests(self.provider, requests)
+        return await self.ops.submit(batch_requests, description=description)
+
+    async def poll(self, batch_ids: Sequence[str]) -> Dict[str, ProviderBatchSnapshot]:
+        records = await self.ops.list_batches(batch_ids)
+        return {batch_id: self._snapshot(batch) for batch_id, batch in records.items()}
+
+    def _snapshot(self, batch: Any) -> ProviderBatchSnapshot:
+        provider_status = _attr(batch, "status")
+        status = self._STATUS_MAP.get(provider_status or "", "processing")
+        counts = _attr(batch, "request_counts")
+        sources: Tuple[Any, ...] = ()
+        if status in TERMINAL_STATUSES:
+            # Expired/cancelled batches keep the partial output of finished requests.
+            sources = tuple(
+                file_id for file_id in (_attr(batch, "output_file_id"), _attr(batch, "error_file_id")) if file_id
+            )
+        error = None
+        if status in {"failed", "cancelled", "expired"}:
+            errors = _attr(_attr(batch, "errors"), "data") or []
+            messages = [str(_attr(item, "message")) for item in errors if _attr(item, "message")]
+            error = "; ".join(messages) or f"Batch job {provider_status}"
+        return ProviderBatchSnapshot(
+            batch_id=_attr(batch, "id"),
+            status=status,
+            provider_status=provider_status,
+            succeeded=int(_attr(counts, "completed", 0) or 0),
+            failed=int(_attr(counts, "failed", 0) or 0),
+            result_sources=sources,
+            error=error,
+        )
+
+    async def iter_raw_results(self, snapshot: ProviderBatchSnapshot) -> AsyncIterator[Dict[str, Any]]:
+        for file_id in snapshot.result_sources:
+            async for entry in self.ops.iter_results(file_id):
+                yield entry
+
+    async def to_responses(
+        self,
+        requests: Sequence[Dict[str, Any]],
+        raw: Sequence[Dict[str, Any]],
+        *,
+        offset: int,
+    ) -> List[ProviderResponse]:
+        return await process_openai_batch_response(self.provider, _select_requests(requests, raw), list(raw))
+
+    async def cleanup(self, refs: Dict[str, Any]) -> None:
+        await self.ops.cleanup_file(refs.get("input_file_id"))
+
+
+class AnthropicBatchAdapter(BatchProviderAdapter):
+    provider_name = "anthropic"
+
+    def __init__(self, provider: BaseTextProvider) -> None:
+        super().__init__(provider)
+        self.ops = AnthropicBatchOperations(provider.client)
+
+    async def submit(self, requests: List[Dict[str, Any]], *, description: Optional[str] = None) -> Dict[str, Any]:
+        batch_requests, _ = prepare_anthropic_batch_requests(self.provider, requests)
+        return {"batch_id": await self.ops.submit_inline_batch(batch_requests)}
+
+    async def poll(self, batch_ids: Sequence[str]) -> Dict[str, ProviderBatchSnapshot]:
+        records = await self.ops.list_batches(batch_ids)
+        return {batch_id: self._snapshot(batch) for batch_id, batch in records.items()}
+
+    def _snapshot(self, batch: Any) -> ProviderBatchSnapshot:
+        provider_status = _attr(batch, "processing_status")
+        counts = _attr(batch, "request_counts")
+        ended = provider_status == "ended"
+        return ProviderBatchSnapshot(
+            batch_id=_attr(batch, "id"),
+            status="completed" if ended else "processing",
+            provider_status=provider_status,
+            succeeded=int(_attr(counts, "succeeded", 0) or 0),
+            failed=sum(int(_attr(counts, key, 0) or 0) for key in ("errored", "canceled", "expired")),
+            result_sources=(_attr(batch, "id"),) if ended else (),
+        )
+
+    async def iter_raw_results(self, snapshot: ProviderBatchSnapshot) -> AsyncIterator[Dict[str, Any]]:
+        for batch_id in snapshot.result_sources:
+            async for entry in self.ops.iter_results(batch_id):
+                yield entry
+
+    async def to_responses(
+        self,
+        requests: Sequence[Dict[str, Any]],
+        raw: Sequence[Dict[str, Any]],
+        *,
+        offset: int,
+    ) -> List[ProviderResponse]:
+        return await process_anthropic_batch_response(self.provider, _select_requests(requests, raw), list(raw))
+
+
+class GeminiBatchAdapter(BatchProviderAdapter):
+    """Gemini has no cheap multi-batch status call, so batches are fetched concurrently."""
+
+    provider_name = "google"
+
+    _STATUS_MAP = {
+        "JOB_STATE_PENDING": "queued",
+        "JOB_STATE_QUEUED": "queued",
+        "JOB_STATE_RUNNING": "processing",
+        "JOB_STATE_SUCCEEDED": "completed",
+        "JOB_STATE_FAILED": "failed",
+        "JOB_STATE_CANCELLED": "cancelled",
+        "JOB_STATE_EXPIRED": "expired",
+    }
+
+    def __init__(self, provider: BaseTextProvider) -> None:
+        super().__init__(provider)
+        self.ops = GeminiBatchOperations(provider.client)
+
+    @property
+    def _default_model(self) -> str:
+        model_config = getattr(self.provider, "_model_config", None)
+        return model_config.model_name if model_config else "gemini-2.5-flash"
+
+    async def submit(self, requests: List[Dict[str, Any]], *, description: Optional[str] = None) -> Dict[str, Any]:
+        model = self._default_model
+        gemini_requests, _ = transform_to_gemini_format(requests, model)
+        if len(gemini_requests) > 100:
+            file_path = await self.ops.create_jsonl_file(gemini_requests)
+            try:
+                batch_name = await self.ops.submit_file_batch(model=model, file_path=file_path, display_name=description)
+            finally:
+                file_path.unlink(missing_ok=True)
+        else:
+            batch_name = await self.ops.submit_inline_batch(
+                model=model, requests=gemini_requests, display_name=description
+            )
+        return {"batch_id": batch_name}
+
+    async def poll(self, batch_ids: Sequence[str]) -> Dict[str, ProviderBatchSnapshot]:
+        records = await asyncio.gather(
+            *(self.ops.get_batch(batch_id) for batch_id in batch_ids),
+            return_exceptions=True,
+        )
+        snapshots: Dict[str, ProviderBatchSnapshot] = {}
+        for batch_id, batch in zip(batch_ids, records):
+            if isinstance(batch, BaseException):
+                # Missing ids are backed off by the scheduler; the rest still advance.
+                logger.warning("Gemini batch status poll failed", extra={"batch_id": batch_id, "error": str(batch)})
+                continue
+            snapshots[batch_id] = self._snapshot(batch_id, batch)
+        return snapshots
+
+    def _snapshot(self, batch_id: str, batch: Any) -> ProviderBatchSnapshot:
+        provider_status = _attr(_attr(batch, "state"), "name")
+        status = self._STATUS_MAP.get(provider_status or "", "processing")
+        stats = _attr(batch, "completion_stats")
+        return ProviderBatchSnapshot(
+            batch_id=batch_id,
+            status=status,
+            provider_status=provider_status,
+            succeeded=int(_attr(stats, "successful_count", 0) or 0),
+            failed=int(_attr(stats, "failed_count", 0) or 0),
+            result_sources=(_attr(batch, "dest"),) if status == "completed" else (),
+            error=f"Gemini batch ended with state {provider_status}" if status in {"failed", "cancelled", "expired"} else None,
+        )
+
+    async def iter_raw_results(self, snapshot: ProviderBatchSnapshot) -> AsyncIterator[Dict[str, Any]]:
+        for destination in snapshot.result_sources:
+            async for entry in self.ops.iter_results(destination):
+                yield entry
+
+    async def to_responses(
+        self,
+        requests: Sequence[Dict[str, Any]],
+        raw: Sequence[Dict[str, Any]],
+        *,
+        offset: int,
+    ) -> List[ProviderResponse]:
+        # Gemini results carry no request ids; they are matched by position.
+        return await process_gemini_batch_response(self.provider, list(requests[offset : offset + len(raw)]), list(raw))
+
+
+ADAPTERS: Dict[str, type[BatchProviderAdapter]] = {
+    "openai": OpenAIBatchAdapter,
+    "anthropic": AnthropicBatchAdapter,
+    "google": GeminiBatchAdapter,
+    "gemini": GeminiBatchAdapter,
+}
+
+
+__all__ = [
+    "ADAPTERS",
+    "AnthropicBatchAdapter",
+    "BatchProviderAdapter",
+    "GeminiBatchAdapter",
+    "OpenAIBatchAdapter",
+    "ProviderBatchSnapshot",
+    "TERMINAL_STATUSES",
+]
@@ -53,6 +53,10 @@ class ChatGroup(Base):
     )
     leader_agent: Mapped[str] = mapped_column(String(50), default="sherlock")
     context_window_size: Mapped[int] = mapped_column(Integer, default=6)
+    # Sequential mode: run independent agents concurrently, emit in order
+    pipelined: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    # Agents whose reply does not depend on earlier replies in the same round
+    independent_agents: Mapped[list[str] | None] = mapped_column(JSON, nullable=True, default=list)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -236,6 +240,11 @@ class ChatMessage(Base):
     session: Mapped[ChatSession] = relationship("ChatSession", back_populates="messages")
     customer: Mapped["User"] = relationship("User", back_populates="messages")
 
+    __table_args__ = (
+        # Serves "messages of a session after <since>" (polling, long-poll, SSE).
+        Index("idx_chat_messages_session_created", "session_id", "created_at"),
+    )
+
 
 # Ensure group chat request models are registered with SQLAlchemy metadata.
 from features.chat.group_request_models import GroupChatRequest, GroupChatAgentRequest  # noqa: E402,F401
@@ -104,7 +104,7 @@ async def update_group(
     db: AsyncSession = Depends(get_chat_session),
     auth: AuthContext = Depends(require_auth_context),
 ):
-    """Update group settings (name, context_window_size only)."""
+    """Update group settings (name, context_window_size, pipelining)."""
     user_id = auth["customer_id"]
     service = GroupService(db)
     try:
@@ -113,6 +113,14 @@ async def update_group(
             raise HTTPException(status_code=404, detail="Group not found")
         if group.user_id != user_id:
             raise HTTPException(status_code=403, detail="Not authorized")
+        if data.independent_agents is not None:
+            members = {m.agent_name for m in group.members}
+            unknown = sorted(set(data.independent_agents) - members)
+            if unknown:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"independent_agents not in group: {unknown}",
+                )
 
         updated = await service.update_group(group_id, data)
         logger.info(f"Updated group {group_id}")
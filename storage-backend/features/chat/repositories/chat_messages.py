@@ -8,6 +8,7 @@ from uuid import uuid4
 
 from sqlalchemy import String, and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 from sqlalchemy.orm.attributes import InstrumentedAttribute
 
 from config.environment import IS_POSTGRESQL
@@ -141,6 +142,46 @@ class ChatMessageRepository:
         result = await self._session.execute(query)
         return result.scalars().all()
 
+    async def get_message_page(
+        self,
+        *,
+        session_id: str,
+        customer_id: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        limit: int,
+        newest_first: bool = False,
+    ) -> Sequence[ChatMessage]:
+        """Return a keyset page of ``session_id`` messages bounded by message IDs.
+
+        Only the columns needed to rebuild conversation turns are loaded, so
+        long sessions can be walked page by page from either end.
+        """
+
+        query = (
+            select(ChatMessage)
+            .options(
+                load_only(
+                    ChatMessage.message_id,
+                    ChatMessage.sender,
+                    ChatMessage.message,
+                    ChatMessage.image_locations,
+                    ChatMessage.file_locations,
+                )
+            )
+            .where(
+                ChatMessage.session_id == session_id,
+                ChatMessage.customer_id == customer_id,
+            )
+        )
+        if after_id is not None:
+            query = query.where(ChatMessage.message_id > after_id)
+        if before_id is not None:
+            query = query.where(ChatMessage.message_id < before_id)
+        order = ChatMessage.message_id.desc() if newest_first else ChatMessage.message_id.asc()
+        result = await self._session.execute(query.order_by(order).limit(limit))
+        return result.scalars().all()
+
     async def fetch_favorites(self, *, customer_id: int) -> dict[str, Any] | None:
         """Return a virtual session composed of the customer's favourite messages."""
 
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -129,6 +129,37 @@ class GroupChatRequestRepository:
         row = result.scalar_one_or_none()
         return row
 
+    async def get_latest_agent_sessions(
+        self, group_id: UUID, agent_names: List[str]
+    ) -> Dict[str, str]:
+        """Latest proactive session ID per agent, in a single query.
+
+        Batch form of :meth:`get_latest_agent_session` used when a group turn
+        builds its context snapshot; agents without a session are omitted.
+        """
+        if not agent_names:
+            return {}
+        ranked = (
+            select(
+                GroupChatAgentRequest.agent_name,
+                GroupChatAgentRequest.proactive_session_id,
+                func.row_number()
+                .over(
+                    partition_by=GroupChatAgentRequest.agent_name,
+                    order_by=GroupChatAgentRequest.created_at.desc(),
+                )
+                .label("rank"),
+            )
+            .join(GroupChatRequest, GroupChatAgentRequest.group_request_id == GroupChatRequest.id)
+            .where(GroupChatRequest.group_id == group_id)
+            .where(GroupChatAgentRequest.agent_name.in_(agent_names))
+            .subquery()
+        )
+        result = await self.db.execute(
+            select(ranked.c.agent_name, ranked.c.proactive_session_id).where(ranked.c.rank == 1)
+        )
+        return {agent_name: session_id for agent_name, session_id in result.all()}
+
     async def has_pending_agent_requests(self, request_id: UUID) -> bool:
         result = await self.db.execute(
             select(GroupChatAgentRequest)
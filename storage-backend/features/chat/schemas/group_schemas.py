@@ -1,6 +1,6 @@
 """Pydantic schemas for group chat operations."""
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from typing import Optional, List
 from uuid import UUID
 from datetime import datetime
@@ -23,11 +23,22 @@ class GroupCreate(BaseModel):
     mode: GroupMode
     agents: List[str]  # Agent names in order
     context_window_size: int = Field(default=6, ge=3, le=10)
+    pipelined: bool = False
+    independent_agents: List[str] = Field(default_factory=list)
+
+    @model_validator(mode="after")
+    def _independent_agents_are_members(self) -> "GroupCreate":
+        unknown = set(self.independent_agents) - set(self.agents)
+        if unknown:
+            raise ValueError(f"independent_agents not in agents: {sorted(unknown)}")
+        return self
 
 
 class GroupUpdate(BaseModel):
     name: Optional[str] = None
     context_window_size: Optional[int] = Field(default=None, ge=3, le=10)
+    pipelined: Optional[bool] = None
+    independent_agents: Optional[List[str]] = None
 
 
 class GroupMembersUpdate(BaseModel):
@@ -52,6 +63,8 @@ class GroupResponse(BaseModel):
     mode: GroupMode
     leader_agent: str
     context_window_size: int
+    pipelined: bool = False
+    independent_agents: Optional[List[str]] = None
     members: List[GroupMemberResponse]
     created_at: datetime
     updated_at: datetime
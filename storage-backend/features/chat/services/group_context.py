@@ -0,0 +1,128 @@
+"""Turn-level context snapshot for group chat.
+
+Building each agent's context separately cost two queries per agent (member
+row, then recent messages) plus one more for the agent's latest proactive
+session.  A :class:`GroupTurnSnapshot` loads the recent message window, every
+member's ``last_response_at`` and the latest sessions once per turn; each
+agent's view is then sliced from it in memory.
+
+The snapshot reflects the session as it was when the turn started.  Replies
+given earlier in the same turn reach later agents through
+``accumulated_context``, as before.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from features.chat.db_models import ChatGroupMember, ChatMessage
+from features.chat.repositories.group_request_repository import GroupChatRequestRepository
+
+logger = logging.getLogger(__name__)
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Naive timestamps are stored as UTC; make them comparable with aware ones."""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value
+
+
+def format_context_messages(messages: Sequence[ChatMessage]) -> List[Dict[str, Any]]:
+    """Format chronological messages as agent context entries."""
+    context = []
+    for msg in messages:
+        # Map sender to role: 'user' or 'assistant'
+        role = "user" if msg.sender.lower() == "user" else "assistant"
+        ctx = {
+            "role": role,
+            "content": msg.message or "",
+            "timestamp": msg.created_at.isoformat() if msg.created_at else None,
+        }
+        if msg.responding_agent:
+            ctx["agent"] = msg.responding_agent
+        context.append(ctx)
+    return context
+
+
+@dataclass(slots=True)
+class GroupTurnSnapshot:
+    """Everything a group turn needs to build per-agent payloads."""
+
+    messages: List[ChatMessage]  # newest window, chronological
+    last_response_at: Dict[str, Optional[datetime]] = field(default_factory=dict)
+    agent_sessions: Dict[str, str] = field(default_factory=dict)
+
+    def context_for_agent(self, agent_name: str, max_messages: int) -> List[Dict[str, Any]]:
+        """Messages since the agent's last response (at most ``max_messages``)."""
+        since = _as_utc(self.last_response_at.get(agent_name))
+        messages = self.messages
+        if since is not None:
+            messages = [
+                m for m in messages
+                if m.created_at is not None and _as_utc(m.created_at) > since
+            ]
+        return format_context_messages(messages[-max_messages:] if max_messages > 0 else [])
+
+    def agent_session(self, agent_name: str) -> Optional[str]:
+        """Latest proactive session of the agent in this group, if any."""
+        return self.agent_sessions.get(agent_name)
+
+
+async def load_group_turn_snapshot(
+    db: AsyncSession,
+    group_id: UUID,
+    session_id: str,
+    max_messages: int,
+    request_repo: GroupChatRequestRepository | None = None,
+) -> GroupTurnSnapshot:
+    """Load the context shared by every agent of one group turn.
+
+    The newest ``max_messages`` of the session cover every agent's view:
+    an agent's messages "since last response" are a suffix of the session,
+    so their newest ``max_messages`` are inside the overall newest window.
+    """
+    members_result = await db.execute(
+        select(ChatGroupMember.agent_name, ChatGroupMember.last_response_at)
+        .where(ChatGroupMember.group_id == group_id)
+    )
+    last_response_at = {name: last for name, last in members_result.all()}
+
+    # Served by idx_chat_messages_session_created (session_id, created_at)
+    messages_result = await db.execute(
+        select(ChatMessage)
+        .where(ChatMessage.session_id == session_id)
+        .order_by(ChatMessage.created_at.desc())
+        .limit(max_messages)
+    )
+    messages = list(messages_result.scalars().all())
+    messages.reverse()  # Chronological order
+
+    agent_sessions: Dict[str, str] = {}
+    if request_repo:
+        agent_sessions = await request_repo.get_latest_agent_sessions(
+            group_id, list(last_response_at)
+        )
+
+    logger.debug(
+        "Group %s turn snapshot: %d messages, %d members, %d sessions",
+        group_id,
+        len(messages),
+        len(last_response_at),
+        len(agent_sessions),
+    )
+    return GroupTurnSnapshot(
+        messages=messages,
+        last_response_at=last_response_at,
+        agent_sessions=agent_sessions,
+    )
+
+
+__all__ = ["GroupTurnSnapshot", "format_context_messages", "load_group_turn_snapshot"]
@@ -12,6 +12,11 @@ import asyncio
 from features.chat.db_models import ChatGroup, ChatGroupMember, ChatMessage
 from features.chat.group_request_models import GroupChatRequest
 from features.chat.repositories.group_request_repository import GroupChatRequestRepository
+from features.chat.services.group_context import (
+    GroupTurnSnapshot,
+    format_context_messages,
+    load_group_turn_snapshot,
+)
 from features.chat.services.group_service import GroupService
 
 logger = logging.getLogger(__name__)
@@ -225,21 +230,21 @@ class GroupChatRouter:
         messages = list(result.scalars().all())
         messages.reverse()  # Chronological order
         
-        # Format for agent
-        # Map sender to role: 'user' or 'assistant'
-        context = []
-        for msg in messages:
-            role = "user" if msg.sender.lower() == "user" else "assistant"
-            ctx = {
-                "role": role,
-                "content": msg.message or "",
-                "timestamp": msg.created_at.isoformat() if msg.created_at else None
-            }
-            if msg.responding_agent:
-                ctx["agent"] = msg.responding_agent
-            context.append(ctx)
-        
-        return context
+        return format_context_messages(messages)
+
+    async def get_turn_snapshot(
+        self,
+        group: ChatGroup,
+        session_id: str,
+        request_repo: GroupChatRequestRepository | None = None,
+    ) -> GroupTurnSnapshot:
+        """
+        Load context for every agent of a turn at once.
+        Per-agent views come from snapshot.context_for_agent().
+        """
+        return await load_group_turn_snapshot(
+            self.db, group.id, session_id, group.context_window_size, request_repo
+        )
     
     def format_context_for_forwarding(
         self,
@@ -323,6 +328,15 @@ def create_sequential_system_hint(position: int, total: int, previous_agents: Li
         )
 
 
+def create_independent_system_hint(position: int, total: int) -> str:
+    """Create a system hint for an agent answering in parallel (pipelined sequential mode)."""
+    return (
+        f"You are agent {position + 1} of {total} in a sequential response. "
+        f"The other agents are answering in parallel, so give your own perspective "
+        f"without relying on theirs."
+    )
+
+
 # ==============================================================================
 # Leader + Listeners Mode Functions
 # ==============================================================================
@@ -458,6 +472,7 @@ async def handle_leader_listeners_mode(
     mentioned_agents: List[str] = None,
     group_request: GroupChatRequest | None = None,
     request_repo: GroupChatRequestRepository | None = None,
+    persist_response_fn=None,
 ) -> List[Dict[str, Any]]:
     """
     Handle message flow in Leader+Listeners mode.
@@ -477,6 +492,8 @@ async def handle_leader_listeners_mode(
         router: GroupChatRouter instance
         route_to_agent_fn: Async function to route to agent
         mentioned_agents: List of @mentioned agents from user message
+        persist_response_fn: Optional async (agent_name, content) callback to
+            store each response
     
     Returns:
         List of response dicts [{agent, content}, ...]
@@ -496,10 +513,11 @@ async def handle_leader_listeners_mode(
         "role": "leader"
     })
     
+    # One snapshot for the whole turn (messages, member timestamps, sessions)
+    snapshot = await router.get_turn_snapshot(group, session_id, request_repo)
+
     # Get context for leader
-    leader_context = await router.get_context_for_agent(
-        group.id, group.leader_agent, session_id, group.context_window_size
-    )
+    leader_context = snapshot.context_for_agent(group.leader_agent, group.context_window_size)
     
     # Find leader member for position
     leader_member = next(m for m in members if m.agent_name == group.leader_agent)
@@ -514,9 +532,7 @@ async def handle_leader_listeners_mode(
 
     # Look up existing proactive session for Claude SDK session reuse
     if request_repo:
-        existing_session = await request_repo.get_latest_agent_session(
-            group.id, group.leader_agent
-        )
+        existing_session = snapshot.agent_session(group.leader_agent)
         if existing_session:
             leader_payload["group_metadata"]["proactive_session_id"] = existing_session
 
@@ -548,6 +564,9 @@ async def handle_leader_listeners_mode(
     leader_response = leader_result.response
 
     if leader_response:
+        if persist_response_fn:
+            await persist_response_fn(group.leader_agent, leader_response)
+
         # Update leader's last response time
         service = GroupService(db)
         await service.update_member_response_time(group.id, group.leader_agent)
@@ -610,9 +629,7 @@ async def handle_leader_listeners_mode(
         })
         
         # Get context for listener (DB history for session memory)
-        listener_context = await router.get_context_for_agent(
-            group.id, listener, session_id, group.context_window_size
-        )
+        listener_context = snapshot.context_for_agent(listener, group.context_window_size)
 
         # Find listener member
         listener_member = next(m for m in members if m.agent_name == listener)
@@ -640,9 +657,7 @@ async def handle_leader_listeners_mode(
 
         # Look up existing proactive session for Claude SDK session reuse
         if request_repo:
-            existing_session = await request_repo.get_latest_agent_session(
-                group.id, listener
-            )
+            existing_session = snapshot.agent_session(listener)
             if existing_session:
                 listener_payload["group_metadata"]["proactive_session_id"] = existing_session
 
@@ -674,6 +689,9 @@ async def handle_leader_listeners_mode(
         listener_response = listener_result.response
 
         if listener_response:
+            if persist_response_fn:
+                await persist_response_fn(listener, listener_response)
+
             # Update listener's last response time
             await service.update_member_response_time(group.id, listener)
             
@@ -708,10 +726,17 @@ async def handle_sequential_responses(
     route_to_agent_fn,
     group_request: GroupChatRequest | None = None,
     request_repo: GroupChatRequestRepository | None = None,
+    persist_response_fn=None,
 ):
     """
     Process all agents in sequence for sequential mode.
-    
+
+    Every agent's payload (DB context, hint, proactive session) is prepared
+    before the first request goes out. In pipelined groups, agents listed in
+    ``independent_agents`` are started concurrently at the beginning of the
+    round; the others still wait for all earlier responses. Responses are
+    always persisted and emitted in position order.
+
     Args:
         websocket: The WebSocket connection
         db: Database session
@@ -720,121 +745,153 @@ async def handle_sequential_responses(
         session_id: Current session ID
         router: GroupChatRouter instance
         route_to_agent_fn: Async function to route message to an agent
+        persist_response_fn: Optional async (agent_name, content) callback to
+            store a response, called in position order
     """
     members = sorted(group.members, key=lambda m: m.position)
     accumulated_context = []
-    
-    for member in members:
-        agent_name = member.agent_name
-        
-        if message_queue.is_cancelled(group.id):
-            await websocket.send_json({
-                "type": "sequence_interrupted",
-                "group_id": str(group.id),
-                "completed_agents": [m.agent_name for m in members[:member.position]]
-            })
-            break
-        
-        # Send typing indicator
-        await websocket.send_json({
-            "type": "agent_typing",
-            "group_id": str(group.id),
-            "agent_name": agent_name,
-            "position": member.position,
-            "total": len(members)
-        })
-        
-        # Build context (DB history for session memory, not sent in message)
-        context = await router.get_context_for_agent(
-            group.id, agent_name, session_id, group.context_window_size
-        )
 
-        # Format payload — DB context stays in payload["context"] for reference,
-        # but only accumulated_context (this round) goes into the message text.
+    # One snapshot for the whole turn (messages, member timestamps, sessions)
+    snapshot = await router.get_turn_snapshot(group, session_id, request_repo)
+
+    # Queued (SQS) agents resume one at a time from next_agent_index, so
+    # request-tracked rounds are never pipelined
+    independent = set()
+    if group.pipelined and request_repo is None:
+        independent = set(group.independent_agents or []) & {m.agent_name for m in members}
+
+    # Prepare every payload up front; only this round's responses are added later
+    payloads = {}
+    for member in members:
+        # DB context stays in payload["context"] for reference, but only
+        # accumulated_context (this round) goes into the message text.
+        context = snapshot.context_for_agent(member.agent_name, group.context_window_size)
         payload = router.format_context_for_forwarding(
             user_message, context, group, member.position
         )
-
-        # Delta-only: pass this-round responses separately for message formatting
-        payload["group_metadata"]["accumulated_context"] = list(accumulated_context)
-        payload["group_metadata"]["previous_responses_this_round"] = len(accumulated_context)
-        
-        # Get system hint for sequential positioning
-        previous_agents = [m.agent_name for m in members[:member.position]]
-        system_hint = create_sequential_system_hint(member.position, len(members), previous_agents)
+        if member.agent_name in independent:
+            system_hint = create_independent_system_hint(member.position, len(members))
+        else:
+            previous_agents = [m.agent_name for m in members[:member.position]]
+            system_hint = create_sequential_system_hint(member.position, len(members), previous_agents)
         payload["group_metadata"]["sequential_hint"] = system_hint
 
         # Look up existing proactive session for Claude SDK session reuse
         if request_repo:
-            existing_session = await request_repo.get_latest_agent_session(
-                group.id, agent_name
-            )
+            existing_session = snapshot.agent_session(member.agent_name)
             if existing_session:
                 payload["group_metadata"]["proactive_session_id"] = existing_session
+        payloads[member.agent_name] = payload
 
-        # Route to agent
-        try:
-            result = await route_to_agent_fn(agent_name, payload, session_id)
-        except Exception as e:
-            result = None
+    def route(agent_name: str, accumulated: List[Dict[str, Any]]):
+        payload = payloads[agent_name]
+        # Delta-only: pass this-round responses separately for message formatting
+        payload["group_metadata"]["accumulated_context"] = list(accumulated)
+        payload["group_metadata"]["previous_responses_this_round"] = len(accumulated)
+        return route_to_agent_fn(agent_name, payload, session_id)
+
+    in_flight: Dict[str, asyncio.Task] = {
+        m.agent_name: asyncio.create_task(route(m.agent_name, []))
+        for m in members
+        if m.agent_name in independent
+    }
+    if in_flight:
+        logger.info(f"Pipelined round for group {group.id}: {sorted(in_flight)} started concurrently")
+
+    try:
+        for member in members:
+            agent_name = member.agent_name
+
+            if message_queue.is_cancelled(group.id):
+                await websocket.send_json({
+                    "type": "sequence_interrupted",
+                    "group_id": str(group.id),
+                    "completed_agents": [m.agent_name for m in members[:member.position]]
+                })
+                break
+
+            # Send typing indicator
             await websocket.send_json({
-                "type": "agent_error",
+                "type": "agent_typing",
                 "group_id": str(group.id),
                 "agent_name": agent_name,
-                "error": str(e)
+                "position": member.position,
+                "total": len(members)
             })
 
-        if result and result.queued:
-            if request_repo and group_request and result.proactive_session_id:
-                await request_repo.create_agent_request(
-                    group_request_id=group_request.id,
-                    proactive_session_id=result.proactive_session_id,
-                    agent_name=agent_name,
-                )
-                await request_repo.update_request(
-                    group_request,
-                    next_agent_index=member.position + 1,
-                )
+            # Route to agent (or collect the already running request)
+            try:
+                pending = in_flight.pop(agent_name, None)
+                result = await (pending if pending is not None else route(agent_name, accumulated_context))
+            except Exception as e:
+                result = None
+                await websocket.send_json({
+                    "type": "agent_error",
+                    "group_id": str(group.id),
+                    "agent_name": agent_name,
+                    "error": str(e)
+                })
+
+            if result and result.queued:
+                if request_repo and group_request and result.proactive_session_id:
+                    await request_repo.create_agent_request(
+                        group_request_id=group_request.id,
+                        proactive_session_id=result.proactive_session_id,
+                        agent_name=agent_name,
+                    )
+                    await request_repo.update_request(
+                        group_request,
+                        next_agent_index=member.position + 1,
+                    )
+                else:
+                    logger.error("Queued sequential response missing request correlation data")
+                return
+
+            response = result.response if result else None
+
+            if response:
+                # Add to accumulated context for next agents
+                accumulated_context.append({
+                    "role": "assistant",
+                    "agent": agent_name,
+                    "content": response,
+                    "timestamp": datetime.utcnow().isoformat()
+                })
+
+                if persist_response_fn:
+                    await persist_response_fn(agent_name, response)
+
+                # Update last response time
+                service = GroupService(db)
+                await service.update_member_response_time(group.id, agent_name)
+
+                # Mark done
+                message_queue.mark_agent_done(group.id, agent_name)
+
+                # Send response
+                await websocket.send_json({
+                    "type": "agent_response",
+                    "group_id": str(group.id),
+                    "agent_name": agent_name,
+                    "content": response,
+                    "position": member.position,
+                    "is_last": member.position == len(members) - 1
+                })
             else:
-                logger.error("Queued sequential response missing request correlation data")
-            return
-
-        response = result.response if result else None
+                # Agent failed to respond
+                await websocket.send_json({
+                    "type": "agent_error",
+                    "group_id": str(group.id),
+                    "agent_name": agent_name,
+                    "error": "Failed to get response"
+                })
+    finally:
+        # Interrupted or stopped early: drop requests nobody will read
+        for task in in_flight.values():
+            task.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight.values(), return_exceptions=True)
 
-        if response:
-            # Add to accumulated context for next agents
-            accumulated_context.append({
-                "role": "assistant",
-                "agent": agent_name,
-                "content": response,
-                "timestamp": datetime.utcnow().isoformat()
-            })
-            
-            # Update last response time
-            service = GroupService(db)
-            await service.update_member_response_time(group.id, agent_name)
-            
-            # Mark done
-            message_queue.mark_agent_done(group.id, agent_name)
-            
-            # Send response
-            await websocket.send_json({
-                "type": "agent_response",
-                "group_id": str(group.id),
-                "agent_name": agent_name,
-                "content": response,
-                "position": member.position,
-                "is_last": member.position == len(members) - 1
-            })
-        else:
-            # Agent failed to respond
-            await websocket.send_json({
-                "type": "agent_error",
-                "group_id": str(group.id),
-                "agent_name": agent_name,
-                "error": "Failed to get response"
-            })
-    
     # Sequence complete
     await websocket.send_json({
         "type": "sequence_complete",
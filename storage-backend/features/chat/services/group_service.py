@@ -112,7 +112,9 @@ class GroupService:
             name=data.name,
             mode=data.mode.value,
             leader_agent=leader,
-            context_window_size=data.context_window_size
+            context_window_size=data.context_window_size,
+            pipelined=data.pipelined,
+            independent_agents=list(data.independent_agents),
         )
         self.db.add(group)
         await self.db.flush()
@@ -157,7 +159,7 @@ class GroupService:
         return list(result.scalars().all())
 
     async def update_group(self, group_id: UUID, data: GroupUpdate) -> Optional[ChatGroup]:
-        """Update group settings (name and context_window_size only)."""
+        """Update group settings (name, context_window_size and pipelining)."""
         group = await self.get_group(group_id)
         if not group:
             return None
@@ -166,6 +168,10 @@ class GroupService:
             group.name = data.name
         if data.context_window_size is not None:
             group.context_window_size = data.context_window_size
+        if data.pipelined is not None:
+            group.pipelined = data.pipelined
+        if data.independent_agents is not None:
+            group.independent_agents = list(data.independent_agents)
 
         await self.db.commit()
         await self.db.refresh(group)
@@ -0,0 +1,502 @@
+"""Token-budgeted chat history assembly.
+
+Clients send the whole conversation in ``user_input.chat_history`` on every
+turn, so long sessions eventually overflow the model context and pay for every
+earlier message again.  :class:`HistoryCompactor` rebuilds the history
+server-side instead:
+
+* messages are read newest-first from the database with a keyset cursor, so
+  only the tail of a long session is ever loaded;
+* per-message token counts are cached by content hash;
+* the history is fitted to a budget derived from the model's
+  ``ModelConfig.context_window`` and capped at ``HISTORY_MAX_TOKENS``;
+* once a session overflows, the window is cut back to
+  ``HISTORY_COMPACT_TARGET_RATIO`` of the budget and everything before it is
+  folded into a rolling summary generated in the background.
+
+The start of the verbatim window only moves when the budget overflows again,
+which keeps the prompt prefix byte-stable (and cacheable) between compactions.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import posixpath
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Protocol
+
+from config.text.defaults import (
+    HISTORY_COMPACT_TARGET_RATIO,
+    HISTORY_COMPACTION_ENABLED,
+    HISTORY_CONTEXT_FRACTION,
+    HISTORY_DEFAULT_CONTEXT_WINDOW,
+    HISTORY_MAX_SESSIONS,
+    HISTORY_MAX_TOKENS,
+    HISTORY_MIN_TOKENS,
+    HISTORY_PAGE_SIZE,
+    HISTORY_SUMMARY_BATCH_TOKENS,
+    HISTORY_SUMMARY_MAX_TOKENS,
+    HISTORY_SUMMARY_MODEL,
+)
+from core.observability.metrics import track_metric
+from core.providers.registry.model_config import ModelConfig
+from features.semantic_search.utils.token_counter import TokenCounter
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_HEADER = "Summary of the earlier part of this conversation:"
+# Per-message framing overhead (role markers) added by every chat format.
+_MESSAGE_OVERHEAD_TOKENS = 4
+# Flat estimate for an image or file block in client-supplied history.
+_ATTACHMENT_TOKENS = 800
+
+_SUMMARY_SYSTEM_PROMPT = (
+    "You maintain a running summary of a conversation between a user and an AI assistant. "
+    "Merge the new messages into the existing summary. Keep facts about the user, decisions, "
+    "open questions, commitments and any names, numbers or code the assistant may need later. "
+    "Write plain prose in the conversation's language, no preamble."
+)
+
+
+@dataclass(slots=True)
+class HistoryTurn:
+    """One stored message reduced to what the provider needs."""
+
+    message_id: int
+    role: str
+    content: str
+    tokens: int = 0
+
+
+@dataclass(slots=True)
+class RollingSummary:
+    """Summary of every message up to and including ``upto_message_id``."""
+
+    upto_message_id: int
+    text: str
+    tokens: int
+
+
+@dataclass(slots=True)
+class AssembledHistory:
+    """History ready to be placed before the current prompt."""
+
+    messages: List[Dict[str, Any]]
+    tokens: int
+    budget: int
+    compacted: bool = False
+    summarized: bool = False
+
+
+@dataclass(slots=True)
+class _SessionState:
+    boundary_id: int  # oldest message kept verbatim
+    summary: Optional[RollingSummary] = None
+
+
+class MessageLoader(Protocol):
+    async def load(
+        self,
+        *,
+        session_id: str,
+        customer_id: int,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None,
+        limit: int,
+        newest_first: bool = False,
+    ) -> List[HistoryTurn]: ...
+
+
+Summarizer = Callable[[Optional[str], List[HistoryTurn]], Awaitable[str]]
+
+
+def _turn_from_message(message: Any) -> Optional[HistoryTurn]:
+    text = (message.message or "").strip()
+    attachments = [*(message.image_locations or []), *(message.file_locations or [])]
+    if attachments:
+        names = ", ".join(posixpath.basename(str(location)) for location in attachments)
+        text = f"{text}\n[Attachments: {names}]".strip()
+    if not text:
+        return None
+    role = "user" if (message.sender or "").lower() == "user" else "assistant"
+    return HistoryTurn(message_id=message.message_id, role=role, content=text)
+
+
+class DatabaseMessageLoader:
+    """Load turns from the main database, one short transaction per page."""
+
+    async def load(
+        self,
+        *,
+        session_id: str,
+        customer_id: int,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None,
+        limit: int,
+        newest_first: bool = False,
+    ) -> List[HistoryTurn]:
+        from features.chat.repositories.chat_messages import ChatMessageRepository
+        from infrastructure.db.mysql import require_main_session_factory, session_scope
+
+        async with session_scope(require_main_session_factory()) as db_session:
+            rows = await ChatMessageRepository(db_session).get_message_page(
+                session_id=session_id,
+                customer_id=customer_id,
+                after_id=after_id,
+                before_id=before_id,
+                limit=limit,
+                newest_first=newest_first,
+            )
+        return [turn for row in rows if (turn := _turn_from_message(row)) is not None]
+
+
+async def summarize_with_provider(previous: Optional[str], turns: List[HistoryTurn]) -> str:
+    """Fold ``turns`` into ``previous`` using ``HISTORY_SUMMARY_MODEL``."""
+
+    from core.providers.factory import get_text_provider
+
+    provider = get_text_provider({"text": {"model": HISTORY_SUMMARY_MODEL}})
+    transcript = "\n\n".join(f"{turn.role.upper()}: {turn.content}" for turn in turns)
+    prompt = f"Existing summary:\n{previous or '(none)'}\n\nNew messages:\n{transcript}\n\nUpdated summary:"
+    response = await provider.generate(
+        prompt=prompt,
+        system_prompt=_SUMMARY_SYSTEM_PROMPT,
+        max_tokens=HISTORY_SUMMARY_MAX_TOKENS,
+        temperature=0.2,
+        disable_native_tools=True,
+    )
+    return (response.text or "").strip()
+
+
+class MessageTokenCache:
+    """Token counts keyed by a hash of the message text."""
+
+    def __init__(self, counter: Optional[TokenCounter] = None, *, max_entries: int = 20_000) -> None:
+        self._counter = counter or TokenCounter()
+        self._max_entries = max_entries
+        self._counts: "OrderedDict[bytes, int]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def count(self, text: str) -> int:
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        tokens = self._counts.get(key)
+        if tokens is not None:
+            self._counts.move_to_end(key)
+            return tokens
+        tokens = self._counter.count_tokens(text) + _MESSAGE_OVERHEAD_TOKENS
+        self._counts[key] = tokens
+        if len(self._counts) > self._max_entries:
+            self._counts.popitem(last=False)
+        return tokens
+
+    def count_content(self, content: Any) -> int:
+        """Count a provider message ``content`` (string or block list)."""
+
+        if isinstance(content, str):
+            return self.count(content)
+        if not isinstance(content, list):
+            return self.count(str(content or ""))
+        tokens = _MESSAGE_OVERHEAD_TOKENS
+        for block in content:
+            text = block.get("text") if isinstance(block, dict) else None
+            tokens += self.count(text) if isinstance(text, str) else _ATTACHMENT_TOKENS
+        return tokens
+
+
+def history_token_budget(model_config: Optional[ModelConfig], max_tokens: int) -> int:
+    """Return the history budget for a model, leaving room for the reply."""
+
+    window = (model_config.context_window if model_config else None) or HISTORY_DEFAULT_CONTEXT_WINDOW
+    budget = min(HISTORY_MAX_TOKENS, int(window * HISTORY_CONTEXT_FRACTION) - max(0, max_tokens))
+    return max(HISTORY_MIN_TOKENS, budget)
+
+
+def _starts_with_user(turns: List[Any]) -> List[Any]:
+    """Drop leading assistant turns; providers expect history to open with the user."""
+
+    for index, turn in enumerate(turns):
+        role = turn.role if isinstance(turn, HistoryTurn) else turn.get("role")
+        if role == "user":
+            return turns[index:]
+    return []
+
+
+class HistoryCompactor:
+    """Assemble per-session history within a token budget."""
+
+    def __init__(
+        self,
+        *,
+        loader: Optional[MessageLoader] = None,
+        summarizer: Optional[Summarizer] = None,
+        token_cache: Optional[MessageTokenCache] = None,
+        page_size: int = HISTORY_PAGE_SIZE,
+        target_ratio: float = HISTORY_COMPACT_TARGET_RATIO,
+        max_sessions: int = HISTORY_MAX_SESSIONS,
+    ) -> None:
+        self._loader = loader or DatabaseMessageLoader()
+        self._summarizer = summarizer or summarize_with_provider
+        self.tokens = token_cache or MessageTokenCache()
+        self.page_size = page_size
+        self.target_ratio = target_ratio
+        self.max_sessions = max_sessions
+        self._states: "OrderedDict[str, _SessionState]" = OrderedDict()
+        self._refreshing: Dict[str, asyncio.Task[None]] = {}
+
+    def summary_for(self, session_id: str) -> Optional[RollingSummary]:
+        state = self._states.get(session_id)
+        return state.summary if state else None
+
+    async def assemble(self, *, session_id: str, customer_id: int, budget: int) -> AssembledHistory:
+        """Return the verbatim tail of ``session_id`` plus its rolling summary."""
+
+        state = self._states.get(session_id)
+        if state is not None:
+            self._states.move_to_end(session_id)
+        summary = state.summary if state else None
+        available = budget - (summary.tokens if summary else 0)
+
+        # Walk backwards from the newest message until the window start or the budget.
+        turns: List[HistoryTurn] = []
+        total = 0
+        overflow = False
+        before_id: Optional[int] = None
+        while not overflow:
+            page = await self._loader.load(
+                session_id=session_id,
+                customer_id=customer_id,
+                after_id=state.boundary_id - 1 if state else None,
+                before_id=before_id,
+                limit=self.page_size,
+                newest_first=True,
+            )
+            for turn in page:
+                turn.tokens = self.tokens.count(turn.content)
+                turns.append(turn)
+                total += turn.tokens
+                if total > available:
+                    overflow = True
+                    break
+            if len(page) < self.page_size:
+                break
+            before_id = page[-1].message_id
+
+        compacted = False
+        if overflow:
+            target = max(1, int(budget * self.target_ratio) - (summary.tokens if summary else 0))
+            kept: List[HistoryTurn] = []
+            kept_tokens = 0
+            for turn in turns:
+                if kept and kept_tokens + turn.tokens > target:
+                    break
+                kept.append(turn)
+                kept_tokens += turn.tokens
+            kept.reverse()
+            turns = _starts_with_user(kept) or kept[-1:]
+            total = sum(turn.tokens for turn in turns)
+            state = self._remember(session_id, turns[0].message_id)
+            self._schedule_summary(session_id, customer_id)
+            compacted = True
+        else:
+            turns.reverse()
+
+        messages: List[Dict[str, Any]] = []
+        if summary is not None:
+            messages.append({"role": "user", "content": f"{SUMMARY_HEADER}\n{summary.text}"})
+            total += summary.tokens
+        messages.extend({"role": turn.role, "content": turn.content} for turn in turns)
+        return AssembledHistory(
+            messages=messages,
+            tokens=total,
+            budget=budget,
+            compacted=compacted,
+            summarized=summary is not None,
+        )
+
+    def fit_client_history(self, history: List[Dict[str, Any]], budget: int) -> List[Dict[str, Any]]:
+        """Trim client-supplied history to the newest turns that fit ``budget``."""
+
+        kept: List[Dict[str, Any]] = []
+        total = 0
+        for item in reversed(history):
+            tokens = self.tokens.count_content(item.get("content"))
+            if kept and total + tokens > budget:
+                break
+            kept.append(item)
+            total += tokens
+        if len(kept) == len(history):
+            return history
+        kept.reverse()
+        return _starts_with_user(kept) or kept[-1:]
+
+    async def drain(self) -> None:
+        """Wait for in-flight summary refreshes (used on shutdown and in tests)."""
+
+        while self._refreshing:
+            await asyncio.gather(*list(self._refreshing.values()), return_exceptions=True)
+
+    def reset(self) -> None:
+        for task in self._refreshing.values():
+            task.cancel()
+        self._refreshing.clear()
+        self._states.clear()
+
+    def _remember(self, session_id: str, boundary_id: int) -> _SessionState:
+        state = self._states.get(session_id)
+        if state is None:
+            state = self._states[session_id] = _SessionState(boundary_id=boundary_id)
+        else:
+            state.boundary_id = boundary_id
+        self._states.move_to_end(session_id)
+        while len(self._states) > self.max_sessions:
+            self._states.popitem(last=False)
+        return state
+
+    def _schedule_summary(self, session_id: str, customer_id: int) -> None:
+        if session_id in self._refreshing:
+            return
+        task = asyncio.create_task(self._refresh_summary(session_id, customer_id))
+        self._refreshing[session_id] = task
+        task.add_done_callback(lambda _task: self._refreshing.pop(session_id, None))
+
+    async def _refresh_summary(self, session_id: str, customer_id: int) -> None:
+        """Fold every message before the window start into the rolling summary."""
+
+        try:
+            while True:
+                state = self._states.get(session_id)
+                if state is None:
+                    return
+                summary = state.summary
+                page = await self._loader.load(
+                    session_id=session_id,
+                    customer_id=customer_id,
+                    after_id=summary.upto_message_id if summary else None,
+                    before_id=state.boundary_id,
+                    limit=self.page_size,
+                )
+                if not page:
+                    return
+
+                batch: List[HistoryTurn] = []
+                batch_tokens = 0
+                for turn in page:
+                    tokens = self.tokens.count(turn.content)
+                    if batch and batch_tokens + tokens > HISTORY_SUMMARY_BATCH_TOKENS:
+                        break
+                    batch.append(turn)
+                    batch_tokens += tokens
+
+                text = await self._summarizer(summary.text if summary else None, batch)
+                if not text:
+                    logger.warning("History summary for session %s came back empty", session_id)
+                    return
+                state.summary = RollingSummary(
+                    upto_message_id=batch[-1].message_id,
+                    text=text,
+                    tokens=self.tokens.count(text),
+                )
+                track_metric("chat.history_summary_folded", len(batch))
+                logger.info(
+                    "History summary for session %s now covers messages up to %s (%d tokens)",
+                    session_id,
+                    state.summary.upto_message_id,
+                    state.summary.tokens,
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # pragma: no cover - summaries are best effort
+            logger.warning("History summary refresh failed for session %s: %s", session_id, exc)
+
+
+def _has_attachments(history: Any) -> bool:
+    return isinstance(history, list) and any(
+        isinstance(item, dict) and isinstance(item.get("content"), list) for item in history
+    )
+
+
+_compactor: Optional[HistoryCompactor] = None
+
+
+def get_history_compactor() -> HistoryCompactor:
+    """Return the process-wide history compactor."""
+
+    global _compactor
+    if _compactor is None:
+        _compactor = HistoryCompactor()
+    return _compactor
+
+
+async def compact_history_payload(
+    history_payload: Dict[str, Any],
+    *,
+    customer_id: int,
+    provider: Any,
+    max_tokens: int,
+) -> Dict[str, Any]:
+    """Replace ``chat_history`` in ``history_payload`` with a budgeted history.
+
+    Sessions are assembled from the database.  Edited messages and histories
+    carrying image or file blocks keep the client's history (which reflects
+    the edit or the attachments) trimmed to the same budget; so does any
+    request whose session cannot be read.
+    """
+
+    if not HISTORY_COMPACTION_ENABLED:
+        return history_payload
+
+    model_config = provider.get_model_config() if hasattr(provider, "get_model_config") else None
+    compactor = get_history_compactor()
+    budget = history_token_budget(model_config, max_tokens)
+    client_history = history_payload.get("chat_history")
+    session_id = history_payload.get("session_id")
+
+    if (
+        isinstance(session_id, str)
+        and session_id
+        and not history_payload.get("is_edited_message")
+        and not _has_attachments(client_history)
+    ):
+        try:
+            assembled = await compactor.assemble(session_id=session_id, customer_id=customer_id, budget=budget)
+        except Exception as exc:
+            logger.warning("Server-side history unavailable for session %s, using client history: %s", session_id, exc)
+        else:
+            if assembled.messages or not client_history:
+                history_payload["chat_history"] = assembled.messages
+                track_metric(
+                    "chat.history_tokens",
+                    assembled.tokens,
+                    tags={"source": "server", "compacted": assembled.compacted, "summarized": assembled.summarized},
+                )
+                return history_payload
+
+    if isinstance(client_history, list) and client_history:
+        fitted = compactor.fit_client_history(client_history, budget)
+        if fitted is not client_history:
+            logger.info(
+                "Trimmed client chat history for customer %s from %d to %d messages",
+                customer_id,
+                len(client_history),
+                len(fitted),
+            )
+            history_payload["chat_history"] = fitted
+    return history_payload
+
+
+__all__ = [
+    "AssembledHistory",
+    "DatabaseMessageLoader",
+    "HistoryCompactor",
+    "HistoryTurn",
+    "MessageTokenCache",
+    "RollingSummary",
+    "compact_history_payload",
+    "get_history_compactor",
+    "history_token_budget",
+]
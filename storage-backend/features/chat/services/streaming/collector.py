@@ -57,17 +57,29 @@ async def collect_streaming_chunks(
             "Deep research enabled for customer %s", customer_id if customer_id is not None else "unknown"
         )
         from .deep_research import DeepResearchOutcome, stream_deep_research_response
+        from .deep_research_persistence import build_findings_persister
 
         resolved_session_id = session_id
         if resolved_session_id is None and isinstance(user_input, dict):
             resolved_session_id = user_input.get("session_id")
 
+        # Findings are saved while the analysis streams; the history layer
+        # then only appends the analysis message.
+        persist_findings = None
+        if customer_id is not None:
+            persist_findings = build_findings_persister(
+                session_id=resolved_session_id,
+                customer_id=customer_id,
+                settings=settings,
+            )
+
         response = stream_deep_research_response(
             prompt=messages or [],
             settings=settings,
             customer_id=customer_id or 0,
             manager=manager,
             session_id=resolved_session_id,
+            persist_findings=persist_findings,
         )
 
         streamed_chunks: List[str] = []
@@ -18,6 +18,7 @@ from core.exceptions import ProviderError, ValidationError
 from core.streaming.manager import StreamingManager
 
 from features.chat.repositories.chat_sessions import ChatSessionRepository
+from features.chat.services.history.compaction import compact_history_payload
 from features.chat.utils.prompt_utils import PromptInput, prompt_preview
 from features.chat.utils.chat_history_formatter import (
     extract_and_format_chat_history,
@@ -129,6 +130,13 @@ async def stream_response(
         # instead of the original prompt from user_input
         history_payload["prompt"] = prompt
 
+        history_payload = await compact_history_payload(
+            history_payload,
+            customer_id=customer_id,
+            provider=provider,
+            max_tokens=max_tokens,
+        )
+
         messages = extract_and_format_chat_history(
             user_input=history_payload,
             system_prompt=system_prompt if provider_name != "anthropic" else None,
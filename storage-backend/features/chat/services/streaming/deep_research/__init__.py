@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
-from .outcome import DeepResearchOutcome
+from .outcome import DeepResearchFindings, DeepResearchOutcome
+from .pipeline import StagePipeline
 from .workflow import stream_deep_research_response
 
-__all__ = ["DeepResearchOutcome", "stream_deep_research_response"]
+__all__ = [
+    "DeepResearchFindings",
+    "DeepResearchOutcome",
+    "StagePipeline",
+    "stream_deep_research_response",
+]
@@ -6,6 +6,16 @@ from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 
+@dataclass(slots=True)
+class DeepResearchFindings:
+    """Artefacts available once the research stage has finished."""
+
+    original_query: str
+    optimized_prompt: str
+    research_response: str
+    citations: List[Dict[str, Any]]
+
+
 @dataclass(slots=True)
 class DeepResearchOutcome:
     """Container describing artefacts produced during deep research."""
@@ -20,4 +30,4 @@ class DeepResearchOutcome:
     analysis_chunks: List[str]
 
 
-__all__ = ["DeepResearchOutcome"]
+__all__ = ["DeepResearchFindings", "DeepResearchOutcome"]
@@ -0,0 +1,104 @@
+"""Small stage pipeline used by the deep research workflow.
+
+Stages used to run strictly one after another.  ``StagePipeline`` keeps the
+per-stage timings the workflow already reported and adds two ways to overlap
+work:
+
+- :meth:`StagePipeline.run_parallel` runs independent calls of one stage
+  concurrently and reports each result as soon as it is ready;
+- :meth:`StagePipeline.start_background` starts a side stage (such as
+  persistence) that runs while the following stages continue, and
+  :meth:`StagePipeline.join` collects it later.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+class StagePipeline:
+    """Times workflow stages and manages their concurrent parts."""
+
+    def __init__(self) -> None:
+        self.timings: Dict[str, float] = {}
+        self._background: Dict[str, asyncio.Task[Any]] = {}
+
+    @asynccontextmanager
+    async def stage(self, name: str) -> AsyncIterator[None]:
+        """Time the enclosed block as stage ``name`` (only when it succeeds)."""
+
+        start_time = time.time()
+        yield
+        self.timings[name] = time.time() - start_time
+
+    async def run_parallel(
+        self,
+        name: str,
+        calls: Sequence[Callable[[], Awaitable[T]]],
+        on_result: Optional[Callable[[int, T], Awaitable[None]]] = None,
+    ) -> List[T | BaseException]:
+        """Run ``calls`` concurrently as stage ``name``.
+
+        ``on_result(index, value)`` is awaited for each successful call in
+        completion order.  Results are returned in call order, with the
+        exception in place of the value for calls that failed.
+        """
+
+        async def _indexed(index: int, call: Callable[[], Awaitable[T]]):
+            try:
+                return index, await call()
+            except Exception as exc:
+                return index, exc
+
+        results: List[T | BaseException] = [None] * len(calls)  # type: ignore[list-item]
+        async with self.stage(name):
+            tasks = [asyncio.ensure_future(_indexed(i, call)) for i, call in enumerate(calls)]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    index, value = await next_done
+                    results[index] = value
+                    if on_result is not None and not isinstance(value, BaseException):
+                        await on_result(index, value)
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+        return results
+
+    def start_background(self, name: str, awaitable: Awaitable[T]) -> None:
+        """Start side stage ``name`` without waiting for it."""
+
+        async def _timed() -> T:
+            start_time = time.time()
+            result = await awaitable
+            self.timings[name] = time.time() - start_time
+            return result
+
+        self._background[name] = asyncio.ensure_future(_timed())
+
+    def has_background(self, name: str) -> bool:
+        """Return True if side stage ``name`` was started."""
+
+        return name in self._background
+
+    async def join(self, name: str) -> Any:
+        """Wait for side stage ``name`` and return its result (re-raising errors)."""
+
+        return await self._background.pop(name)
+
+    async def cancel_background(self) -> None:
+        """Cancel side stages that were never joined."""
+
+        tasks = list(self._background.values())
+        self._background.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+__all__ = ["StagePipeline"]
@@ -11,6 +11,7 @@ from core.streaming.manager import StreamingManager
 from ..events import (
     emit_deep_research_analyzing,
     emit_deep_research_optimizing,
+    emit_deep_research_partial_findings,
     emit_deep_research_searching,
 )
 from ..deep_research_config import DEEP_RESEARCH_DEFAULTS, get_deep_research_config
@@ -21,6 +22,8 @@ from ..deep_research_helpers import (
 )
 from features.chat.utils.model_swap import get_provider_for_model
 
+from .pipeline import StagePipeline
+
 
 logger = logging.getLogger("features.chat.services.streaming.deep_research")
 
@@ -32,8 +35,13 @@ async def optimize_research_prompt(
     settings: Dict[str, Any],
     customer_id: int,
     manager: StreamingManager,
+    max_sub_queries: int = 1,
 ) -> str:
-    """Stage 1: Optimize user query into research prompt."""
+    """Stage 1: Optimize user query into research prompt.
+
+    With ``max_sub_queries > 1`` the model may return several independent
+    prompts separated by ``SUB_QUERY_SEPARATOR`` lines.
+    """
 
     logger.info("Stage 1: Optimizing research prompt (customer=%s)", customer_id)
     await emit_deep_research_optimizing(manager)
@@ -43,6 +51,7 @@ async def optimize_research_prompt(
         user_query=user_query,
         chat_history=chat_history,
         today=today,
+        max_sub_queries=max_sub_queries,
     )
 
     provider, _ = resolve_primary_provider(settings, customer_id, logger=logger)
@@ -114,6 +123,93 @@ async def execute_deep_research(
 
     logger.info("Stage 2: Executing deep research (customer=%s)", customer_id)
     await emit_deep_research_searching(manager, optimized_prompt=optimized_prompt)
+    return await _run_research_query(
+        query=optimized_prompt, settings=settings, customer_id=customer_id
+    )
+
+
+async def execute_parallel_research(
+    *,
+    sub_queries: List[str],
+    optimized_prompt: str,
+    settings: Dict[str, Any],
+    customer_id: int,
+    manager: StreamingManager,
+    pipeline: StagePipeline,
+) -> Tuple[str, List[Dict[str, Any]]]:
+    """Stage 2 (split): research independent sub-queries concurrently.
+
+    Each sub-query's findings are emitted as soon as it finishes.  The
+    merged report keeps the sub-query order; failed sub-queries are left out
+    unless all of them fail, in which case the first error is raised.
+    """
+
+    total = len(sub_queries)
+    logger.info(
+        "Stage 2: Executing deep research as %s parallel queries (customer=%s)",
+        total,
+        customer_id,
+    )
+    await emit_deep_research_searching(manager, optimized_prompt=optimized_prompt)
+
+    async def _on_findings(index: int, result: Tuple[str, List[Dict[str, Any]]]) -> None:
+        text, citations = result
+        await emit_deep_research_partial_findings(
+            manager,
+            index=index,
+            total=total,
+            findings=text,
+            citations_count=len(citations),
+        )
+
+    results = await pipeline.run_parallel(
+        "research",
+        [
+            lambda query=query: _run_research_query(
+                query=query, settings=settings, customer_id=customer_id
+            )
+            for query in sub_queries
+        ],
+        on_result=_on_findings,
+    )
+
+    sections: List[str] = []
+    citations: List[Dict[str, Any]] = []
+    seen_citations: set[str] = set()
+    errors: List[BaseException] = []
+    for index, result in enumerate(results):
+        if isinstance(result, BaseException):
+            logger.warning(
+                "Research sub-query %s/%s failed (customer=%s): %s",
+                index + 1,
+                total,
+                customer_id,
+                result,
+            )
+            errors.append(result)
+            continue
+        text, query_citations = result
+        if text:
+            sections.append(text)
+        for citation in query_citations:
+            key = str(citation.get("url") or citation) if isinstance(citation, dict) else str(citation)
+            if key not in seen_citations:
+                seen_citations.add(key)
+                citations.append(citation)
+
+    if len(errors) == total:
+        raise errors[0]
+
+    return "\n\n".join(sections), citations
+
+
+async def _run_research_query(
+    *,
+    query: str,
+    settings: Dict[str, Any],
+    customer_id: int,
+) -> Tuple[str, List[Dict[str, Any]]]:
+    """Send one research prompt to Perplexity and return text and citations."""
 
     research_model = str(
         get_deep_research_config("deep_research_model", settings)
@@ -147,7 +243,7 @@ async def execute_deep_research(
     )
 
     response = await provider.generate(
-        prompt=optimized_prompt,
+        prompt=query,
         temperature=float(research_temperature or 0.2),
         max_tokens=int(research_max_tokens or 2048),
         model=target_model_name,
@@ -208,5 +304,6 @@ async def analyze_research_findings(
 __all__ = [
     "optimize_research_prompt",
     "execute_deep_research",
+    "execute_parallel_research",
     "analyze_research_findings",
 ]
@@ -1,11 +1,15 @@
-"""Orchestration logic for the deep research streaming workflow."""
+"""Orchestration logic for the deep research streaming workflow.
+
+Stages run through a :class:`StagePipeline`: research fans out over the
+optimizer's sub-queries, and findings persistence (when the caller supplies
+``persist_findings``) runs in the background while the analysis streams.
+"""
 
 from __future__ import annotations
 
 import logging
-import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from fastapi import HTTPException
 
@@ -13,19 +17,24 @@ from core.exceptions import ProviderError
 from core.streaming.manager import StreamingManager
 from ..events import emit_deep_research_completed, emit_deep_research_started
 from .context import deep_research_context
-from ..deep_research_config import validate_deep_research_settings
+from ..deep_research_config import get_deep_research_config, validate_deep_research_settings
 from ..deep_research_helpers import (
     emit_deep_research_error,
     extract_chat_history,
     extract_user_query,
+    split_research_queries,
 )
-from .outcome import DeepResearchOutcome
+from .outcome import DeepResearchFindings, DeepResearchOutcome
+from .pipeline import StagePipeline
 from .stages import (
     analyze_research_findings,
     execute_deep_research,
+    execute_parallel_research,
     optimize_research_prompt,
 )
 
+FindingsPersister = Callable[[DeepResearchFindings], Awaitable[Tuple[str, Dict[str, int]]]]
+
 
 logger = logging.getLogger("features.chat.services.streaming.deep_research")
 
@@ -36,8 +45,14 @@ async def stream_deep_research_response(
     customer_id: int,
     manager: StreamingManager,
     session_id: Optional[str] = None,
+    persist_findings: Optional[FindingsPersister] = None,
 ) -> DeepResearchOutcome:
-    """Orchestrate the deep research workflow and return outcome object."""
+    """Orchestrate the deep research workflow and return outcome object.
+
+    ``persist_findings`` is started as soon as the research report is ready
+    and overlaps the analysis stage; it returns the session id and message
+    ids of the stored findings.  Its failure is logged, not raised.
+    """
 
     try:
         validated_settings = validate_deep_research_settings(settings)
@@ -66,25 +81,27 @@ async def stream_deep_research_response(
     citations: List[Dict[str, Any]] = []
     message_ids: Optional[Dict[str, int]] = None
     resolved_session_id = session_id
-    stage_timings: Dict[str, float] = {}
+    pipeline = StagePipeline()
+    stage_timings = pipeline.timings
     collected_chunks: List[str] = []
     chunk_count = 0
+    max_sub_queries = int(get_deep_research_config("deep_research_max_sub_queries", settings_local) or 1)
 
     try:
         async with deep_research_context():
             user_query = extract_user_query(prompt)
             chat_history = extract_chat_history(settings_local)
 
-            start_time = time.time()
             try:
-                optimized_prompt = await optimize_research_prompt(
-                    user_query=user_query,
-                    chat_history=chat_history,
-                    settings=settings_local,
-                    customer_id=customer_id,
-                    manager=manager,
-                )
-                stage_timings["optimization"] = time.time() - start_time
+                async with pipeline.stage("optimization"):
+                    optimized_prompt = await optimize_research_prompt(
+                        user_query=user_query,
+                        chat_history=chat_history,
+                        settings=settings_local,
+                        customer_id=customer_id,
+                        manager=manager,
+                        max_sub_queries=max_sub_queries,
+                    )
                 logger.info("Stage 1: Optimization succeeded", extra={"customer_id": customer_id})
             except Exception as exc:
                 logger.error(
@@ -101,31 +118,53 @@ async def stream_deep_research_response(
                     original_error=exc,
                 ) from exc
 
-            start_time = time.time()
-            research_response, citations = await execute_deep_research(
-                optimized_prompt=optimized_prompt,
-                settings=settings_local,
-                customer_id=customer_id,
-                manager=manager,
-            )
-            stage_timings["research"] = time.time() - start_time
-
-            start_time = time.time()
-            try:
-                async for chunk in analyze_research_findings(
-                    research_response=research_response,
-                    original_query=user_query,
-                    chat_history=chat_history,
+            sub_queries = split_research_queries(optimized_prompt, max_sub_queries)
+            if len(sub_queries) > 1:
+                research_response, citations = await execute_parallel_research(
+                    sub_queries=sub_queries,
                     optimized_prompt=optimized_prompt,
                     settings=settings_local,
                     customer_id=customer_id,
                     manager=manager,
-                ):
-                    chunk_count += 1
-                    collected_chunks.append(chunk)
-                    await manager.send_to_queues({"type": "text_chunk", "content": chunk})
-                    manager.collect_chunk(chunk, "text")
-                stage_timings["analysis"] = time.time() - start_time
+                    pipeline=pipeline,
+                )
+            else:
+                async with pipeline.stage("research"):
+                    research_response, citations = await execute_deep_research(
+                        optimized_prompt=optimized_prompt,
+                        settings=settings_local,
+                        customer_id=customer_id,
+                        manager=manager,
+                    )
+
+            if persist_findings is not None:
+                pipeline.start_background(
+                    "persistence",
+                    persist_findings(
+                        DeepResearchFindings(
+                            original_query=user_query,
+                            optimized_prompt=optimized_prompt,
+                            research_response=research_response,
+                            citations=citations,
+                        )
+                    ),
+                )
+
+            try:
+                async with pipeline.stage("analysis"):
+                    async for chunk in analyze_research_findings(
+                        research_response=research_response,
+                        original_query=user_query,
+                        chat_history=chat_history,
+                        optimized_prompt=optimized_prompt,
+                        settings=settings_local,
+                        customer_id=customer_id,
+                        manager=manager,
+                    ):
+                        chunk_count += 1
+                        collected_chunks.append(chunk)
+                        await manager.send_to_queues({"type": "text_chunk", "content": chunk})
+                        manager.collect_chunk(chunk, "text")
                 logger.info("Stage 3: Analysis succeeded", extra={"customer_id": customer_id})
             except Exception as exc:
                 logger.error(
@@ -142,6 +181,16 @@ async def stream_deep_research_response(
                     original_error=exc,
                 ) from exc
 
+            if pipeline.has_background("persistence"):
+                try:
+                    resolved_session_id, message_ids = await pipeline.join("persistence")
+                except Exception as exc:
+                    logger.error(
+                        "Deep research findings persistence failed",
+                        extra={"customer_id": customer_id, "error": str(exc)},
+                        exc_info=True,
+                    )
+
             await emit_deep_research_completed(
                 manager,
                 citations_count=len(citations),
@@ -183,6 +232,8 @@ async def stream_deep_research_response(
         )
         await emit_deep_research_error(manager, f"Deep research failed: {exc}")
         raise
+    finally:
+        await pipeline.cancel_background()
 
 
 __all__ = ["stream_deep_research_response"]
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import logging
 
 from features.chat.repositories.chat_messages import ChatMessageRepository
 from features.chat.repositories.chat_sessions import ChatSessionRepository
 
+from .deep_research_sessions import ensure_session_exists
+
+if TYPE_CHECKING:
+    from .deep_research import DeepResearchFindings
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +37,47 @@ async def save_deep_research_complete_to_db(
         extra={"session_id": session_id, "customer_id": customer_id},
     )
 
+    findings_ids = await save_deep_research_findings_to_db(
+        session_id=session_id,
+        customer_id=customer_id,
+        original_query=original_query,
+        optimized_prompt=optimized_prompt,
+        research_response=research_response,
+        citations=citations,
+        ai_character_name=ai_character_name,
+        primary_model_name=primary_model_name,
+        db_session=db_session,
+    )
+    analysis_ids = await save_deep_research_analysis_to_db(
+        session_id=session_id,
+        customer_id=customer_id,
+        analysis_response=analysis_response,
+        research_message_id=findings_ids["research_message_id"],
+        ai_character_name=ai_character_name,
+        primary_model_name=primary_model_name,
+        db_session=db_session,
+    )
+    return {**findings_ids, **analysis_ids}
+
+
+async def save_deep_research_findings_to_db(
+    *,
+    session_id: str,
+    customer_id: int,
+    original_query: str,
+    optimized_prompt: str,
+    research_response: str,
+    citations: List[Dict[str, Any]],
+    ai_character_name: str,
+    primary_model_name: str,
+    db_session: Any,
+) -> Dict[str, int]:
+    """Persist the request, optimized prompt and research report (3 messages).
+
+    Runs while the analysis is still streaming; the session is tagged here
+    so the analysis message only has to be appended.
+    """
+
     message_repo = ChatMessageRepository(db_session)
     session_repo = ChatSessionRepository(db_session)
 
@@ -103,6 +149,44 @@ async def save_deep_research_complete_to_db(
             metadata_updates={"claude_code_data": citation_metadata},
         )
 
+    await session_repo.add_notification_tag(
+        session_id=session_id,
+        customer_id=customer_id,
+    )
+
+    logger.info(
+        "Deep research findings saved (3 messages)",
+        extra={
+            "session_id": session_id,
+            "customer_id": customer_id,
+            "user_message_id": user_message.message_id,
+            "optimized_prompt_id": optimized_message.message_id,
+            "research_message_id": research_message.message_id,
+            "citations_count": len(citations),
+        },
+    )
+
+    return {
+        "user_message_id": user_message.message_id,
+        "optimized_prompt_id": optimized_message.message_id,
+        "research_message_id": research_message.message_id,
+    }
+
+
+async def save_deep_research_analysis_to_db(
+    *,
+    session_id: str,
+    customer_id: int,
+    analysis_response: str,
+    research_message_id: int,
+    ai_character_name: str,
+    primary_model_name: str,
+    db_session: Any,
+) -> Dict[str, int]:
+    """Persist the conversational analysis after its findings messages."""
+
+    message_repo = ChatMessageRepository(db_session)
+
     analysis_payload = {
         "sender": "AI",
         "message": analysis_response,
@@ -122,35 +206,72 @@ async def save_deep_research_complete_to_db(
         is_ai_message=True,
         claude_code_data={
             "deep_research_stage": "analysis",
-            "based_on_research_message_id": research_message.message_id,
+            "based_on_research_message_id": research_message_id,
             "message_type": "deep_research_analysis",
         },
     )
 
-    await session_repo.add_notification_tag(
-        session_id=session_id,
-        customer_id=customer_id,
-    )
-
     logger.info(
-        "Complete deep research workflow saved (4 messages)",
+        "Deep research analysis saved",
         extra={
             "session_id": session_id,
             "customer_id": customer_id,
-            "user_message_id": user_message.message_id,
-            "optimized_prompt_id": optimized_message.message_id,
-            "research_message_id": research_message.message_id,
+            "research_message_id": research_message_id,
             "analysis_message_id": analysis_message.message_id,
-            "citations_count": len(citations),
         },
     )
 
-    return {
-        "user_message_id": user_message.message_id,
-        "optimized_prompt_id": optimized_message.message_id,
-        "research_message_id": research_message.message_id,
-        "analysis_message_id": analysis_message.message_id,
-    }
+    return {"analysis_message_id": analysis_message.message_id}
+
+
+def build_findings_persister(
+    *,
+    session_id: Optional[str],
+    customer_id: int,
+    settings: Dict[str, Any],
+) -> Callable[["DeepResearchFindings"], Awaitable[Tuple[str, Dict[str, int]]]]:
+    """Return a callback that saves research findings into the main database.
+
+    The workflow runs it in the background while the analysis streams.  It
+    returns the (possibly newly created) session id and the message ids, which
+    the history layer uses to append only the analysis message afterwards.
+    """
+
+    text_settings = settings.get("text", {}) if isinstance(settings, dict) else {}
+    ai_character_name = str(text_settings.get("ai_character", "assistant"))
+    primary_model_name = str(text_settings.get("model", "gpt-4o-mini"))
+
+    async def _persist(findings: "DeepResearchFindings") -> Tuple[str, Dict[str, int]]:
+        from infrastructure.db.mysql import require_main_session_factory, session_scope
+
+        session_factory = require_main_session_factory()
+        async with session_scope(session_factory) as db_session:
+            resolved_session_id = await ensure_session_exists(
+                session_id=session_id,
+                customer_id=customer_id,
+                session_name=f"Deep Research: {findings.original_query[:50]}...",
+                ai_character_name=ai_character_name,
+                db_session=db_session,
+            )
+            message_ids = await save_deep_research_findings_to_db(
+                session_id=resolved_session_id,
+                customer_id=customer_id,
+                original_query=findings.original_query,
+                optimized_prompt=findings.optimized_prompt,
+                research_response=findings.research_response,
+                citations=findings.citations,
+                ai_character_name=ai_character_name,
+                primary_model_name=primary_model_name,
+                db_session=db_session,
+            )
+        return resolved_session_id, message_ids
+
+    return _persist
 
 
-__all__ = ["save_deep_research_complete_to_db"]
+__all__ = [
+    "build_findings_persister",
+    "save_deep_research_complete_to_db",
+    "save_deep_research_findings_to_db",
+    "save_deep_research_analysis_to_db",
+]
@@ -17,6 +17,9 @@ DEEP_RESEARCH_DEFAULTS: Dict[str, Any] = {
     "optimization_max_tokens": 800,
     "research_temperature": 0.2,
     "research_max_tokens": 2048,
+    # Upper bound on independent research prompts run in parallel; the
+    # optimizer decides how many (if any) separate aspects the request has.
+    "deep_research_max_sub_queries": 3,
     "enable_prompt_optimization": True,
     "enable_citation_storage": True,
     "session_name_prefix": "Deep Research",
@@ -40,21 +40,69 @@ ANALYSIS_PROMPT_HEADER = (
 )
 
 
+SUB_QUERY_SEPARATOR = "---"
+
+
 def build_optimization_prompt_text(
-    *, user_query: str, chat_history: str, today: str | None = None
+    *,
+    user_query: str,
+    chat_history: str,
+    today: str | None = None,
+    max_sub_queries: int = 1,
 ) -> str:
     """Compose optimization prompt text with consistent formatting."""
 
     current_day = today or datetime.now().strftime("%Y-%m-%d")
+    split_instruction = ""
+    if max_sub_queries > 1:
+        split_instruction = (
+            "If the request covers clearly independent aspects that can be "
+            f"researched separately, you may instead return up to {max_sub_queries} "
+            "self-contained prompts, one per aspect, separated by a line "
+            f"containing only {SUB_QUERY_SEPARATOR}. Otherwise return a single prompt.\n\n"
+        )
     return (
         f"Today is {current_day}\n\n"
         f"{OPTIMIZATION_PROMPT_HEADER}\n\n"
         "Return only the prompt for the final tool, without any extra text\n\n"
+        f"{split_instruction}"
         f"User request: {user_query}\n\n"
         f"Chat history: {chat_history}"
     )
 
 
+def split_research_queries(optimized_prompt: str, max_queries: int) -> List[str]:
+    """Split an optimized prompt into its independent research prompts.
+
+    Prompts are separated by ``SUB_QUERY_SEPARATOR`` lines.  A leading
+    ``Today is ...`` line is repeated on every prompt; anything past
+    ``max_queries`` prompts is folded into the last one.
+    """
+
+    date_line = ""
+    body = optimized_prompt
+    first_line, newline, rest = optimized_prompt.partition("\n")
+    if newline and first_line.startswith("Today is "):
+        date_line, body = first_line, rest
+
+    parts: List[List[str]] = [[]]
+    for line in body.splitlines():
+        if line.strip() == SUB_QUERY_SEPARATOR:
+            parts.append([])
+        else:
+            parts[-1].append(line)
+    queries = ["\n".join(part).strip() for part in parts]
+    queries = [query for query in queries if query]
+
+    if len(queries) <= 1:
+        return [optimized_prompt]
+    if max_queries > 0 and len(queries) > max_queries:
+        queries[max_queries - 1:] = ["\n\n".join(queries[max_queries - 1:])]
+    if date_line:
+        queries = [f"{date_line}\n{query}" for query in queries]
+    return queries
+
+
 def build_analysis_prompt_text(
     *,
     original_query: str,
@@ -197,11 +245,13 @@ async def emit_deep_research_error(manager: StreamingManager, message: str) -> N
 
 
 __all__ = [
+    "SUB_QUERY_SEPARATOR",
     "build_optimization_prompt_text",
     "build_analysis_prompt_text",
     "extract_chat_history",
     "extract_user_query",
     "extract_text_from_content",
     "resolve_primary_provider",
+    "split_research_queries",
     "emit_deep_research_error",
 ]
@@ -3,11 +3,19 @@
 from __future__ import annotations
 
 from .deep_research_artifacts import save_deep_research_to_db
-from .deep_research_complete import save_deep_research_complete_to_db
+from .deep_research_complete import (
+    build_findings_persister,
+    save_deep_research_analysis_to_db,
+    save_deep_research_complete_to_db,
+    save_deep_research_findings_to_db,
+)
 from .deep_research_sessions import ensure_session_exists
 
 __all__ = [
+    "build_findings_persister",
     "save_deep_research_to_db",
     "save_deep_research_complete_to_db",
+    "save_deep_research_findings_to_db",
+    "save_deep_research_analysis_to_db",
     "ensure_session_exists",
 ]
@@ -12,6 +12,7 @@ from .deep_research import (
     emit_deep_research_completed,
     emit_deep_research_event,
     emit_deep_research_optimizing,
+    emit_deep_research_partial_findings,
     emit_deep_research_searching,
     emit_deep_research_started,
 )
@@ -32,6 +33,7 @@ __all__ = [
     "emit_deep_research_started",
     "emit_deep_research_optimizing",
     "emit_deep_research_searching",
+    "emit_deep_research_partial_findings",
     "emit_deep_research_analyzing",
     "emit_deep_research_completed",
     "_generate_tool_display_text",
@@ -79,6 +79,30 @@ async def emit_deep_research_searching(
     )
 
 
+async def emit_deep_research_partial_findings(
+    manager: StreamingManager,
+    *,
+    index: int,
+    total: int,
+    findings: str,
+    citations_count: int = 0,
+) -> None:
+    """Emit findings of one research sub-query as soon as it finishes."""
+
+    await emit_deep_research_event(
+        manager=manager,
+        event_type="deepResearchPartialFindings",
+        stage="research",
+        message=f"Research thread {index + 1} of {total} finished",
+        metadata={
+            "index": index,
+            "total": total,
+            "findings": findings,
+            "citationsCount": citations_count,
+        },
+    )
+
+
 async def emit_deep_research_analyzing(manager: StreamingManager) -> None:
     """Emit event when analysis stage begins."""
 
@@ -115,6 +139,7 @@ __all__ = [
     "emit_deep_research_started",
     "emit_deep_research_optimizing",
     "emit_deep_research_searching",
+    "emit_deep_research_partial_findings",
     "emit_deep_research_analyzing",
     "emit_deep_research_completed",
 ]
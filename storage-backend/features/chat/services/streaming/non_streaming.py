@@ -8,6 +8,7 @@ from typing import Any, Dict, Optional
 from core.exceptions import ProviderError, ValidationError
 from core.pydantic_schemas import ProviderResponse
 
+from features.chat.services.history.compaction import compact_history_payload
 from features.chat.utils.prompt_utils import PromptInput, prompt_preview
 from features.chat.utils.chat_history_formatter import (
     extract_and_format_chat_history,
@@ -74,6 +75,13 @@ async def generate_response(
     else:
         history_payload["prompt"] = context.text_prompt
 
+    history_payload = await compact_history_payload(
+        history_payload,
+        customer_id=customer_id,
+        provider=provider,
+        max_tokens=max_tokens,
+    )
+
     messages = extract_and_format_chat_history(
         user_input=history_payload,
         system_prompt=system_prompt if provider_name != "anthropic" else None,
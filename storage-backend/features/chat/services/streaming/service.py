@@ -14,6 +14,7 @@ from .core import generate_response as generate_response_impl
 from .core import stream_response as stream_response_impl
 from .core import stream_response_chunks as stream_response_chunks_impl
 from .helpers import get_helper
+from .tts_orchestrator import prewarm_tts_stream
 
 
 class ChatService:
@@ -26,6 +27,11 @@ class ChatService:
             tts_factory: Callable[[], TTSService] = get_helper("TTSService", TTSService)
             self._tts_service = tts_factory()
 
+    def prewarm_tts(self, settings: Dict[str, Any]) -> bool:
+        """Start the streaming TTS connection early when ``settings`` enable it."""
+
+        return prewarm_tts_stream(self._tts_service, settings)
+
     async def stream_response(
         self,
         *,
@@ -14,6 +14,50 @@ from pydantic import ValidationError as PydanticValidationError
 logger = logging.getLogger(__name__)
 
 
+def prewarm_tts_stream(tts_service: TTSService, settings: Dict[str, Any]) -> bool:
+    """Open the TTS provider connection as soon as a TTS-enabled request arrives.
+
+    The handshake then overlaps STT, context resolution and the LLM's
+    time-to-first-token instead of adding to time-to-first-audio.
+    """
+
+    if not _tts_requested(settings):
+        return False
+    user_settings = _parse_user_settings(settings)
+    if user_settings is None:
+        return False
+    try:
+        return tts_service.prewarm_stream(user_settings)
+    except Exception as exc:  # pragma: no cover - pre-warming is best effort
+        logger.debug("TTS pre-warm skipped: %s", exc)
+        return False
+
+
+def _tts_requested(settings: Dict[str, Any]) -> bool:
+    if not isinstance(settings, dict):
+        return False
+
+    tts_settings = settings.get("tts")
+    if not isinstance(tts_settings, dict):
+        return False
+
+    auto_execute = bool(tts_settings.get("tts_auto_execute"))
+    streaming_enabled = tts_settings.get("streaming")
+
+    return auto_execute and streaming_enabled is not False
+
+
+def _parse_user_settings(settings: Dict[str, Any]) -> Optional[TTSUserSettings]:
+    payload = {
+        "general": settings.get("general", {}),
+        "tts": settings.get("tts", {}),
+    }
+    try:
+        return TTSUserSettings.model_validate(payload)
+    except PydanticValidationError:
+        return None
+
+
 class TTSOrchestrator:
     """Manage lifecycle of queue-based TTS streaming alongside text generation."""
 
@@ -40,17 +84,7 @@ class TTSOrchestrator:
     def should_enable_tts(self) -> bool:
         """Return True when settings indicate auto-executed streaming TTS."""
 
-        if not isinstance(self.settings, dict):
-            return False
-
-        tts_settings = self.settings.get("tts")
-        if not isinstance(tts_settings, dict):
-            return False
-
-        auto_execute = bool(tts_settings.get("tts_auto_execute"))
-        streaming_enabled = tts_settings.get("streaming")
-
-        return auto_execute and streaming_enabled is not False
+        return _tts_requested(self.settings)
 
     async def start_tts_streaming(self) -> bool:
         """Initialise queue duplication and background TTS streaming."""
@@ -188,4 +222,4 @@ class TTSOrchestrator:
         return self._tts_enabled
 
 
-__all__ = ["TTSOrchestrator"]
+__all__ = ["TTSOrchestrator", "prewarm_tts_stream"]
@@ -8,6 +8,7 @@ from typing import Any, Dict, Optional, Tuple
 from core.exceptions import ValidationError
 from core.providers.base import BaseTextProvider
 from core.providers.factory import get_text_provider
+from core.providers.text_routing import route_text_provider
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +28,7 @@ def resolve_generation_context(
         raise ValidationError("Invalid customer_id", field="customer_id")
 
     settings = settings or {}
-    provider = get_text_provider(settings)
+    provider = route_text_provider(get_text_provider(settings), settings)
     model_config = provider.get_model_config()
 
     resolved_model = model or settings.get("text", {}).get("model", "gpt-4o-mini")
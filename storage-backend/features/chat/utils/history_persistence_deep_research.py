@@ -11,6 +11,7 @@ from fastapi import WebSocket
 from core.streaming.manager import StreamingManager
 from features.chat.services.streaming.deep_research_persistence import (
     ensure_session_exists,
+    save_deep_research_analysis_to_db,
     save_deep_research_complete_to_db,
     save_deep_research_to_db,
 )
@@ -33,7 +34,12 @@ async def persist_complete_deep_research_workflow(
     workflow: StandardWorkflowOutcome,
     manager: StreamingManager,
 ) -> None:
-    """Persist complete deep research workflow as 4 separate messages."""
+    """Persist complete deep research workflow as 4 separate messages.
+
+    When the workflow already stored the findings while the analysis was
+    streaming (``research_metadata["message_ids"]``), only the analysis
+    message is added here.
+    """
 
     research_metadata = workflow.result.get("research_metadata") or {}
 
@@ -70,28 +76,42 @@ async def persist_complete_deep_research_workflow(
     ai_character_name = text_settings.get("ai_character", "assistant")
     primary_model_name = text_settings.get("model", "gpt-4o-mini")
 
+    findings_ids = research_metadata.get("message_ids") or {}
     session_factory = require_main_session_factory()
-    async with session_scope(session_factory) as db_session:
-        session_id = await ensure_session_exists(
-            session_id=session_id,
-            customer_id=customer_id,
-            session_name=f"Deep Research: {original_query[:50]}...",
-            ai_character_name=ai_character_name,
-            db_session=db_session,
-        )
-
-        message_ids = await save_deep_research_complete_to_db(
-            session_id=session_id,
-            customer_id=customer_id,
-            original_query=str(original_query),
-            optimized_prompt=str(optimized_prompt),
-            research_response=str(research_response),
-            analysis_response=str(analysis_response),
-            citations=citations,
-            ai_character_name=str(ai_character_name),
-            primary_model_name=str(primary_model_name),
-            db_session=db_session,
-        )
+    if findings_ids.get("research_message_id"):
+        async with session_scope(session_factory) as db_session:
+            analysis_ids = await save_deep_research_analysis_to_db(
+                session_id=session_id,
+                customer_id=customer_id,
+                analysis_response=str(analysis_response),
+                research_message_id=findings_ids["research_message_id"],
+                ai_character_name=str(ai_character_name),
+                primary_model_name=str(primary_model_name),
+                db_session=db_session,
+            )
+        message_ids = {**findings_ids, **analysis_ids}
+    else:
+        async with session_scope(session_factory) as db_session:
+            session_id = await ensure_session_exists(
+                session_id=session_id,
+                customer_id=customer_id,
+                session_name=f"Deep Research: {original_query[:50]}...",
+                ai_character_name=ai_character_name,
+                db_session=db_session,
+            )
+
+            message_ids = await save_deep_research_complete_to_db(
+                session_id=session_id,
+                customer_id=customer_id,
+                original_query=str(original_query),
+                optimized_prompt=str(optimized_prompt),
+                research_response=str(research_response),
+                analysis_response=str(analysis_response),
+                citations=citations,
+                ai_character_name=str(ai_character_name),
+                primary_model_name=str(primary_model_name),
+                db_session=db_session,
+            )
 
     if not message_ids:
         return
@@ -241,30 +241,32 @@ async def _route_to_group(
             }
             
             async def route_to_agent(agent_name: str, payload: dict, sess_id: str):
-                """Wrapper to route to individual agents and save response."""
+                """Wrapper to route to individual agents.
+
+                Does not touch ``db``: pipelined groups run several of these
+                concurrently, so responses are saved by save_agent_response.
+                """
                 logger.info("Group routing to agent: %s", agent_name)
-                result = await real_route_to_agent(
+                return await real_route_to_agent(
                     agent_name=agent_name,
                     payload=payload,
                     session_id=sess_id,
                     user_id=user_id,
                 )
-                
-                # Save agent response to database
-                if result.response:
-                    agent_msg = ChatMessage(
-                        session_id=effective_session_id,
-                        customer_id=user_id,
-                        sender="AI",
-                        message=result.response,
-                        ai_character_name=agent_name,
-                        responding_agent=agent_name,
-                    )
-                    db.add(agent_msg)
-                    await db.flush()
-                    logger.info("Saved group agent response from %s: msg_id=%s", agent_name, agent_msg.message_id)
-                
-                return result
+
+            async def save_agent_response(agent_name: str, content: str) -> None:
+                """Save agent response to database (called in display order)."""
+                agent_msg = ChatMessage(
+                    session_id=effective_session_id,
+                    customer_id=user_id,
+                    sender="AI",
+                    message=content,
+                    ai_character_name=agent_name,
+                    responding_agent=agent_name,
+                )
+                db.add(agent_msg)
+                await db.flush()
+                logger.info("Saved group agent response from %s: msg_id=%s", agent_name, agent_msg.message_id)
             
             handled = await route_group_message(
                 data=data,
@@ -273,6 +275,7 @@ async def _route_to_group(
                 session_id=effective_session_id,
                 user_message_id=user_message_id,
                 route_to_agent_fn=route_to_agent,
+                persist_response_fn=save_agent_response,
             )
             
             await db.commit()
@@ -86,6 +86,12 @@ async def run_standard_workflow(
         logger_args["history_size"],
     )
 
+    if request_type != "tts":
+        # Overlap the TTS provider handshake with STT and the LLM's first token.
+        prewarm_tts = getattr(service, "prewarm_tts", None)
+        if prewarm_tts is not None:
+            prewarm_tts(settings)
+
     cancelled = False
 
     try:
@@ -30,7 +30,11 @@ async def dispatch_workflow(
     """Route an inbound payload to the appropriate workflow handler."""
     session.customer_id = int(data.get("customer_id") or session.customer_id or 0)
     if runtime is None:
-        runtime = await create_workflow_runtime(session_id=session.session_id, websocket=websocket)
+        runtime = await create_workflow_runtime(
+            session_id=session.session_id,
+            websocket=websocket,
+            audio_frames=session.audio_frames,
+        )
     
     # Check for group chat message first
     if is_group_message(data):
@@ -46,6 +46,7 @@ async def route_group_message(
     session_id: str,
     user_message_id: int | None = None,
     route_to_agent_fn,
+    persist_response_fn=None,
 ) -> bool:
     """
     Route a message through the group chat system.
@@ -56,6 +57,8 @@ async def route_group_message(
         db: Database session
         session_id: Current session ID
         route_to_agent_fn: Async function to route to individual agents
+        persist_response_fn: Optional async (agent_name, content) callback that
+            stores each agent response, called in the order responses are shown
         
     Returns:
         True if handled successfully, False if not a group message
@@ -124,6 +127,7 @@ async def route_group_message(
                 route_to_agent_fn=route_to_agent_fn,
                 group_request=group_request,
                 request_repo=request_repo,
+                persist_response_fn=persist_response_fn,
             )
         
         elif group.mode == "leader_listeners":
@@ -138,6 +142,7 @@ async def route_group_message(
                 mentioned_agents=mentioned_agents,
                 group_request=group_request,
                 request_repo=request_repo,
+                persist_response_fn=persist_response_fn,
             )
         
         elif group.mode == "explicit":
@@ -207,6 +212,9 @@ async def route_group_message(
                     continue
 
                 if result.response:
+                    if persist_response_fn:
+                        await persist_response_fn(agent_name, result.response)
+
                     # Update last response time
                     await service.update_member_response_time(group_id, agent_name)
 
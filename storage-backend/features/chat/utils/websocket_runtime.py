@@ -14,6 +14,7 @@ from typing import Any, List, Optional
 
 from fastapi import WebSocket
 
+from core.streaming.audio_frames import AudioFrameEncoder
 from core.streaming.manager import StreamingManager
 
 from .websocket_streaming import send_to_frontend
@@ -121,7 +122,10 @@ class WorkflowRuntime:
 
 
 async def create_workflow_runtime(
-    *, session_id: str, websocket: WebSocket
+    *,
+    session_id: str,
+    websocket: WebSocket,
+    audio_frames: Optional[AudioFrameEncoder] = None,
 ) -> WorkflowRuntime:
     """Prepare streaming infrastructure for a workflow execution."""
 
@@ -129,6 +133,11 @@ async def create_workflow_runtime(
     frontend_queue: asyncio.Queue[Any] = asyncio.Queue()
     manager.add_queue(frontend_queue)
     frontend_task = asyncio.create_task(
-        send_to_frontend(frontend_queue, websocket, session_id=session_id)
+        send_to_frontend(
+            frontend_queue,
+            websocket,
+            session_id=session_id,
+            audio_frames=audio_frames,
+        )
     )
     return WorkflowRuntime(manager=manager, tasks=[frontend_task], frontend_queue=frontend_queue)
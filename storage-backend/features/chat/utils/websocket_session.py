@@ -11,6 +11,8 @@ from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 from uuid import uuid4
 
+from core.streaming.audio_frames import AudioFrameEncoder
+
 
 def utcnow() -> datetime:
     """Return a timezone-aware timestamp for session bookkeeping."""
@@ -28,6 +30,8 @@ class WorkflowSession:
     last_activity: datetime = field(default_factory=utcnow)
     context: Dict[str, Any] = field(default_factory=dict)
     active_workflow: Optional[str] = None
+    # Set when the client negotiated binary audio frames for this connection.
+    audio_frames: Optional[AudioFrameEncoder] = field(default=None, repr=False)
 
     def touch(self) -> None:
         """Record activity on the session."""
@@ -12,11 +12,14 @@ from typing import Any, Dict, Optional
 
 from fastapi import WebSocket
 
+from core.streaming.audio_frames import AudioFrameEncoder, audio_bytes
 from core.utils.json_serialization import sanitize_for_json
 from .websocket_session import WorkflowSession
 from .websocket_stream_buffer import get_stream_buffer_manager
 
 logger = logging.getLogger(__name__)
+# Per-chunk records are sampled (see core.logging.DEFAULT_LOG_SAMPLING).
+chunk_logger = logging.getLogger(f"{__name__}.chunks")
 
 _MIN_IDLE_CHECK_SECONDS = 15
 _MAX_IDLE_CHECK_SECONDS = 60
@@ -27,8 +30,13 @@ async def send_to_frontend(
     websocket: WebSocket,
     *,
     session_id: Optional[str] = None,
+    audio_frames: Optional[AudioFrameEncoder] = None,
 ) -> None:
-    """Stream queued data to the frontend WebSocket."""
+    """Stream queued data to the frontend WebSocket.
+
+    When ``audio_frames`` is provided the client negotiated binary audio, so
+    ``audio_chunk`` events go out as binary frames instead of base64 JSON.
+    """
 
     buffer_manager = get_stream_buffer_manager()
     chunk_counter = 0  # Per-stream sequence number for resumption
@@ -62,6 +70,17 @@ async def send_to_frontend(
 
             message_type = payload.get("type")
 
+            if audio_frames is not None:
+                if message_type == "tts_started":
+                    audio_frames.new_stream()
+                elif message_type == "audio_chunk":
+                    audio = audio_bytes(payload.get("content"))
+                    if audio:
+                        await websocket.send_bytes(
+                            audio_frames.encode(audio, audio_format=payload.get("format"))
+                        )
+                        continue
+
             # Add chunk_index and buffer for streamable types (text_chunk, thinking_chunk)
             if message_type in ("text_chunk", "thinking_chunk"):
                 chunk_counter += 1
@@ -73,21 +92,19 @@ async def send_to_frontend(
                 # Buffer for potential replay after reconnect
                 if session_id:
                     await buffer_manager.add_chunk(session_id, payload)
-                    # Log every 10th chunk to avoid spam
-                    if chunk_counter % 10 == 1:
-                        logger.info(
-                            "📦 Buffering chunk %d (type=%s, session=%s)",
-                            chunk_counter,
-                            message_type,
-                            session_id[:8] if session_id else "none",
-                        )
+                    chunk_logger.info(
+                        "📦 Buffering chunk %d (type=%s, session=%s)",
+                        chunk_counter,
+                        message_type,
+                        session_id[:8],
+                    )
                 else:
-                    logger.warning(
+                    chunk_logger.warning(
                         "⚠️ Cannot buffer chunk %d - no session_id!",
                         chunk_counter,
                     )
 
-                logger.debug(
+                chunk_logger.debug(
                     "Streaming chunk %d (type=%s, session=%s)",
                     chunk_counter,
                     message_type,
@@ -133,7 +150,7 @@ async def send_to_frontend(
                     message_type,
                 )
             elif message_type == "thinking_chunk":
-                logger.debug(
+                chunk_logger.debug(
                     "Forwarding reasoning chunk to frontend (session=%s)",
                     session_id,
                 )
@@ -146,7 +163,7 @@ async def send_to_frontend(
             text_preview = str(chunk)
             if len(text_preview) > 120:
                 text_preview = f"{text_preview[:117]}…"
-            logger.debug(
+            chunk_logger.debug(
                 "Streaming text chunk %d to frontend (session=%s, preview=%s)",
                 chunk_counter,
                 session_id[:8] if session_id else "none",
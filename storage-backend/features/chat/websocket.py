@@ -19,6 +19,11 @@ from core.observability.websocket_logging import (
     log_websocket_accepted,
     log_websocket_message_received,
 )
+from core.streaming.audio_frames import (
+    AUDIO_TRANSPORT_BINARY,
+    AudioFrameEncoder,
+    requested_audio_transport,
+)
 from features.audio.service import STTService
 from features.chat.service import ChatService
 
@@ -146,7 +151,13 @@ async def websocket_chat_endpoint(
     try:
         auth_context = await authenticate_websocket(websocket)
         customer_id = int(auth_context.get("customer_id", 0))
-        session = WorkflowSession(customer_id=customer_id)
+        audio_transport = requested_audio_transport(websocket)
+        session = WorkflowSession(
+            customer_id=customer_id,
+            audio_frames=AudioFrameEncoder()
+            if audio_transport == AUDIO_TRANSPORT_BINARY
+            else None,
+        )
 
         logger.info(
             "WebSocket authenticated for customer %s (session=%s)",
@@ -164,6 +175,7 @@ async def websocket_chat_endpoint(
                     "type": "websocket_ready",
                     "content": "Backend ready",
                     "session_id": session.session_id,
+                    "audio_transport": audio_transport,
                 }
             )
         logger.debug(
@@ -326,6 +338,7 @@ async def websocket_chat_endpoint(
             runtime = await create_workflow_runtime(
                 session_id=session.session_id,
                 websocket=websocket,
+                audio_frames=session.audio_frames,
             )
 
             # Start new workflow (inline to allow test patching of dispatch_workflow)
@@ -4,6 +4,7 @@ from .activities import ActivityData, ActivityGPSData
 from .lifestyle import DailyHealthEvents
 from .sleep import SleepData
 from .summary import BodyComposition, HRVData, UserSummary
+from .sync import SyncWatermark
 from .training import EnduranceScore, FitnessAge, TrainingReadiness, TrainingStatus
 
 __all__ = [
@@ -18,4 +19,5 @@ __all__ = [
     "ActivityData",
     "ActivityGPSData",
     "DailyHealthEvents",
+    "SyncWatermark",
 ]
@@ -0,0 +1,28 @@
+"""Bookkeeping ORM models for incremental Garmin/Withings synchronisation."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from sqlalchemy import Date, DateTime, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infrastructure.db.base import Base
+
+
+class SyncWatermark(Base):
+    """Last calendar date successfully synced for a (customer, dataset) pair."""
+
+    __tablename__ = "garmin_sync_watermarks"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    customer_id: Mapped[int] = mapped_column(Integer, index=True)
+    dataset: Mapped[str] = mapped_column(String(64))
+    last_synced_date: Mapped[date] = mapped_column(Date)
+    last_run_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    rows_written: Mapped[int] = mapped_column(Integer, default=0)
+
+    __table_args__ = (UniqueConstraint("customer_id", "dataset", name="unique_customer_dataset"),)
+
+
+__all__ = ["SyncWatermark"]
@@ -7,11 +7,28 @@ so that :mod:`service` can focus on wiring dependencies together.
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Sequence
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.exceptions import DatabaseError
+from core.pydantic_schemas import DataSource
+from features.db.garmin.db_models import (
+    ActivityData,
+    ActivityGPSData,
+    BodyComposition,
+    DailyHealthEvents,
+    EnduranceScore,
+    FitnessAge,
+    HRVData,
+    SleepData,
+    TrainingReadiness,
+    TrainingStatus,
+    UserSummary,
+)
 from features.garmin.results import IngestResult
+from infrastructure.db.fetchers.cache import invalidate_after_commit
 if TYPE_CHECKING:
     from features.garmin.schemas.requests import (
         ActivityGpsRequest,
@@ -26,10 +43,93 @@ if TYPE_CHECKING:
         TrainingStatusRequest,
         UserSummaryRequest,
     )
+    from features.garmin.schemas.requests import GarminRequest
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class BulkIngestSpec:
+    """Describe how an ingest method maps onto a multi-row upsert."""
+
+    record_type: str
+    repo_attr: str
+    model: type
+    conflict_columns: tuple[str, ...]
+    metadata: Callable[[Mapping[str, Any]], dict[str, Any]]
+
+
+_DAILY_KEY = ("customer_id", "calendar_date")
+_ACTIVITY_KEY = ("activity_id",)
+
+BULK_INGEST_SPECS: dict[str, BulkIngestSpec] = {
+    "ingest_sleep": BulkIngestSpec(
+        "sleep",
+        "_sleep_repo",
+        SleepData,
+        _DAILY_KEY,
+        lambda row: {
+            "nap_segments": len(row.get("nap_data") or []),
+            "heart_rate_points": len(row.get("sleep_heart_rate_data") or []),
+        },
+    ),
+    "ingest_user_summary": BulkIngestSpec(
+        "user_summary", "_summary_repo", UserSummary, _DAILY_KEY, lambda row: {"total_steps": row.get("total_steps")}
+    ),
+    "ingest_body_composition": BulkIngestSpec(
+        "body_composition", "_summary_repo", BodyComposition, _DAILY_KEY, lambda row: {"weight": row.get("weight")}
+    ),
+    "ingest_hrv": BulkIngestSpec(
+        "hrv", "_summary_repo", HRVData, _DAILY_KEY, lambda row: {"weekly_avg": row.get("hrv_weekly_avg")}
+    ),
+    "ingest_training_readiness": BulkIngestSpec(
+        "training_readiness",
+        "_training_repo",
+        TrainingReadiness,
+        _DAILY_KEY,
+        lambda row: {"score": row.get("training_readiness_score")},
+    ),
+    "ingest_endurance_score": BulkIngestSpec(
+        "endurance_score",
+        "_training_repo",
+        EnduranceScore,
+        _DAILY_KEY,
+        lambda row: {"score": row.get("endurance_score")},
+    ),
+    "ingest_training_status": BulkIngestSpec(
+        "training_status",
+        "_training_repo",
+        TrainingStatus,
+        _DAILY_KEY,
+        lambda row: {"acute_load": row.get("daily_training_load_acute")},
+    ),
+    "ingest_fitness_age": BulkIngestSpec(
+        "fitness_age", "_training_repo", FitnessAge, _DAILY_KEY, lambda row: {"fitness_age": row.get("fitness_age")}
+    ),
+    "ingest_activity": BulkIngestSpec(
+        "activity",
+        "_activity_repo",
+        ActivityData,
+        _ACTIVITY_KEY,
+        lambda row: {"distance": row.get("activity_distance")},
+    ),
+    "ingest_activity_gps": BulkIngestSpec(
+        "activity_gps",
+        "_activity_repo",
+        ActivityGPSData,
+        _ACTIVITY_KEY,
+        lambda row: {"points": len(row.get("gps_data") or [])},
+    ),
+    "ingest_daily_health_events": BulkIngestSpec(
+        "daily_health",
+        "_activity_repo",
+        DailyHealthEvents,
+        _DAILY_KEY,
+        lambda row: {"last_meal_time": row.get("last_meal_time")},
+    ),
+}
+
+
 class GarminIngestionMixin:
     """Provide Garmin ingestion flows for services with repository attributes."""
 
@@ -188,5 +288,61 @@ class GarminIngestionMixin:
         metadata = {"last_meal_time": internal.get("last_meal_time")}
         return IngestResult.from_repository("daily_health", record, metadata=metadata)
 
+    async def ingest_many(
+        self,
+        session: AsyncSession,
+        ingest_method: str,
+        payloads: Sequence["GarminRequest"],
+        customer_id: int,
+    ) -> list[IngestResult]:
+        """Persist ``payloads`` through multi-row upserts instead of per-row statements.
+
+        Ingest methods without a :data:`BULK_INGEST_SPECS` entry fall back to
+        calling the single-record handler for each payload.  Cached Garmin
+        charts are dropped once ``session`` commits.
+        """
+
+        if not payloads:
+            return []
+
+        invalidate_after_commit(session, DataSource.GARMIN)
+
+        spec = BULK_INGEST_SPECS.get(ingest_method)
+        if spec is None:
+            handler = getattr(self, ingest_method)
+            return [await handler(session, payload, customer_id) for payload in payloads]
+
+        rows: list[dict[str, Any]] = []
+        for payload in payloads:
+            internal = payload.to_internal()
+            row = {**internal, "customer_id": customer_id}
+            if any(row.get(column) is None for column in spec.conflict_columns):
+                raise DatabaseError(
+                    f"{', '.join(spec.conflict_columns)} required for {spec.record_type} upsert",
+                    operation=f"garmin.bulk.{spec.record_type}",
+                )
+            rows.append(row)
+
+        repository = getattr(self, spec.repo_attr)
+        await repository.bulk_upsert(
+            session,
+            spec.model,
+            rows,
+            spec.conflict_columns,
+            operation=f"garmin.bulk.{spec.record_type}",
+        )
+        logger.debug(
+            "Bulk ingested Garmin rows",
+            extra={"customer_id": customer_id, "record_type": spec.record_type, "rows": len(rows)},
+        )
+        return [
+            IngestResult(
+                record_type=spec.record_type,
+                calendar_date=row.get("calendar_date"),
+                metadata=spec.metadata(row),
+            )
+            for row in rows
+        ]
+
 
-__all__ = ["GarminIngestionMixin"]
+__all__ = ["BULK_INGEST_SPECS", "BulkIngestSpec", "GarminIngestionMixin"]
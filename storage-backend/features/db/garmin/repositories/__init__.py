@@ -5,6 +5,7 @@ from __future__ import annotations
 from .activity import GarminActivityRepository
 from .sleep import GarminSleepRepository
 from .summary import GarminSummaryRepository
+from .sync import GarminSyncRepository
 from .training import GarminTrainingRepository
 
 __all__ = [
@@ -12,6 +13,7 @@ __all__ = [
     "GarminSummaryRepository",
     "GarminTrainingRepository",
     "GarminActivityRepository",
+    "GarminSyncRepository",
     "build_repositories",
 ]
 
@@ -24,4 +26,5 @@ def build_repositories() -> dict[str, object]:
         "summary": GarminSummaryRepository(),
         "training": GarminTrainingRepository(),
         "activity": GarminActivityRepository(),
+        "sync": GarminSyncRepository(),
     }
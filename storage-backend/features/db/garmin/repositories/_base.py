@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import Any, Sequence, TypeVar
+from typing import Any, Mapping, Sequence, TypeVar
 
 from sqlalchemy import Select, asc, desc, select
 from sqlalchemy.exc import SQLAlchemyError
@@ -18,9 +18,14 @@ logger = logging.getLogger(__name__)
 
 ModelType = TypeVar("ModelType", bound=DeclarativeMeta)
 
+DEFAULT_BULK_BATCH_SIZE = 500
+
 
 def _get_upsert_statement(
-    model: type, values: dict[str, Any], is_postgresql: bool, conflict_columns: list[str]
+    model: type,
+    values: dict[str, Any] | Sequence[dict[str, Any]],
+    is_postgresql: bool,
+    conflict_columns: list[str],
 ):
     """Build database-specific upsert statement.
 
@@ -28,18 +33,27 @@ def _get_upsert_statement(
     PostgreSQL: INSERT ... ON CONFLICT DO UPDATE (requires explicit constraint specification)
 
     For PostgreSQL, conflict_columns specifies the unique constraint to use (e.g., customer_id, calendar_date).
+    ``values`` may be a list of rows sharing the same keys to emit a single
+    multi-row ``INSERT``.
     """
+    if isinstance(values, Mapping):
+        rows: list[dict[str, Any]] = [dict(values)]
+    else:
+        rows = [dict(row) for row in values]
+    # Columns referenced by the UPDATE clause; multi-row callers guarantee identical keys.
+    provided = set(rows[0])
+
     if is_postgresql:
         from sqlalchemy.dialects.postgresql import insert as pg_insert
 
-        statement = pg_insert(model).values(**values)
+        statement = pg_insert(model).values(rows)
 
         # Build update dict using excluded (PostgreSQL syntax)
         # Exclude conflict columns and id from updates
         update_columns = {
             column.name: statement.excluded[column.name]
             for column in model.__table__.columns
-            if column.name not in conflict_columns and column.name != "id" and column.name in values
+            if column.name not in conflict_columns and column.name != "id" and column.name in provided
         }
 
         # If no columns to update (only key columns provided), use DO NOTHING
@@ -53,13 +67,13 @@ def _get_upsert_statement(
     else:
         from sqlalchemy.dialects.mysql import insert as mysql_insert
 
-        statement = mysql_insert(model).values(**values)
+        statement = mysql_insert(model).values(rows)
 
         # Build update dict using inserted (MySQL syntax)
         update_columns = {
             column.name: statement.inserted[column.name]
             for column in model.__table__.columns
-            if column.name != "id" and column.name in values
+            if column.name != "id" and column.name in provided
         }
 
         return statement.on_duplicate_key_update(**update_columns)
@@ -114,6 +128,50 @@ class GarminRepository:
 
         return instance
 
+    async def bulk_upsert(
+        self,
+        session: AsyncSession,
+        model: ModelType,
+        rows: Sequence[Mapping[str, Any]],
+        conflict_columns: Sequence[str],
+        *,
+        operation: str,
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+    ) -> int:
+        """Upsert ``rows`` using one multi-row statement per batch.
+
+        Rows sharing a natural key are merged (later values win) because
+        PostgreSQL rejects statements that touch the same conflict target
+        twice.  Rows are then grouped by their column set so every statement
+        has a uniform ``VALUES`` shape.  Unlike :meth:`_upsert`, no rows are
+        read back.  Returns the number of distinct rows written.
+        """
+
+        merged: dict[tuple[Any, ...], dict[str, Any]] = {}
+        for row in rows:
+            key = tuple(row.get(column) for column in conflict_columns)
+            if key in merged:
+                merged[key].update(row)
+            else:
+                merged[key] = dict(row)
+
+        groups: dict[frozenset[str], list[dict[str, Any]]] = {}
+        for row in merged.values():
+            groups.setdefault(frozenset(row), []).append(row)
+
+        try:
+            for group in groups.values():
+                for offset in range(0, len(group), max(1, batch_size)):
+                    batch = group[offset : offset + batch_size]
+                    statement = _get_upsert_statement(model, batch, IS_POSTGRESQL, list(conflict_columns))
+                    await session.execute(statement)
+            await session.flush()
+        except SQLAlchemyError as exc:  # pragma: no cover - defensive logging
+            self._logger.exception("Database bulk operation failed", extra={"operation": operation})
+            raise DatabaseError("Database operation failed", operation=operation) from exc
+
+        return len(merged)
+
     async def _fetch(
         self,
         session: AsyncSession,
@@ -156,4 +214,4 @@ class GarminRepository:
         return records
 
 
-__all__ = ["GarminRepository"]
+__all__ = ["DEFAULT_BULK_BATCH_SIZE", "GarminRepository"]
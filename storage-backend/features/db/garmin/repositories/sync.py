@@ -0,0 +1,117 @@
+"""Repository for incremental sync watermarks and stored-date lookups."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Iterable, Sequence
+
+from sqlalchemy import Select, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.exceptions import DatabaseError
+from features.db.garmin.db_models import SyncWatermark
+
+from ._base import GarminRepository, ModelType
+
+
+class GarminSyncRepository(GarminRepository):
+    """Track per-dataset sync progress so nightly runs only fetch new data."""
+
+    async def fetch_watermarks(
+        self,
+        session: AsyncSession,
+        customer_id: int,
+        datasets: Iterable[str],
+    ) -> dict[str, date]:
+        """Return ``{dataset: last_synced_date}`` for the known ``datasets``."""
+
+        names = list(datasets)
+        if not names:
+            return {}
+
+        statement: Select[Any] = select(SyncWatermark).where(
+            SyncWatermark.customer_id == customer_id,
+            SyncWatermark.dataset.in_(names),
+        )
+        try:
+            result = await session.execute(statement)
+        except SQLAlchemyError as exc:  # pragma: no cover - defensive logging
+            self._logger.exception("Database select failed", extra={"operation": "garmin.sync.watermarks"})
+            raise DatabaseError("Database operation failed", operation="garmin.sync.watermarks") from exc
+
+        return {row.dataset: row.last_synced_date for row in result.scalars().all()}
+
+    async def upsert_watermark(
+        self,
+        session: AsyncSession,
+        customer_id: int,
+        dataset: str,
+        last_synced_date: date,
+        *,
+        rows_written: int = 0,
+    ) -> SyncWatermark:
+        """Record ``last_synced_date`` as the sync frontier for ``dataset``."""
+
+        values = {
+            "customer_id": customer_id,
+            "dataset": dataset,
+            "last_synced_date": last_synced_date,
+            "last_run_at": datetime.now(timezone.utc),
+            "rows_written": rows_written,
+        }
+        return await self._upsert(
+            session,
+            SyncWatermark,
+            values,
+            [SyncWatermark.customer_id == customer_id, SyncWatermark.dataset == dataset],
+            operation="garmin.sync.watermark",
+        )
+
+    async def fetch_stored_dates(
+        self,
+        session: AsyncSession,
+        model: ModelType,
+        customer_id: int,
+        *,
+        start: date,
+        end: date,
+    ) -> set[date]:
+        """Return the distinct ``calendar_date`` values stored for ``model`` in range."""
+
+        statement: Select[Any] = (
+            select(model.calendar_date)
+            .where(
+                model.customer_id == customer_id,
+                model.calendar_date >= start,
+                model.calendar_date <= end,
+            )
+            .distinct()
+        )
+        try:
+            result = await session.execute(statement)
+        except SQLAlchemyError as exc:  # pragma: no cover - defensive logging
+            self._logger.exception("Database select failed", extra={"operation": "garmin.sync.dates"})
+            raise DatabaseError("Database operation failed", operation="garmin.sync.dates") from exc
+
+        return {_as_date(value) for value in result.scalars().all() if value is not None}
+
+
+def _as_date(value: date | datetime) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+def missing_dates(stored: Iterable[date], start: date, end: date) -> Sequence[date]:
+    """Return the calendar days between ``start`` and ``end`` absent from ``stored``."""
+
+    present = set(stored)
+    days: list[date] = []
+    current = start
+    while current <= end:
+        if current not in present:
+            days.append(current)
+        current += timedelta(days=1)
+    return days
+
+
+__all__ = ["GarminSyncRepository", "missing_dates"]
@@ -16,6 +16,7 @@ from .repositories import (
     GarminActivityRepository,
     GarminSleepRepository,
     GarminSummaryRepository,
+    GarminSyncRepository,
     GarminTrainingRepository,
 )
 from .retrieval import GarminRetrievalMixin
@@ -38,12 +39,14 @@ class GarminService(GarminIngestionMixin, GarminRetrievalMixin):
         summary_repo: GarminSummaryRepository | None = None,
         training_repo: GarminTrainingRepository | None = None,
         activity_repo: GarminActivityRepository | None = None,
+        sync_repo: GarminSyncRepository | None = None,
         datasets: GarminDatasetRegistry | None = None,
     ) -> None:
         self._sleep_repo = sleep_repo or GarminSleepRepository()
         self._summary_repo = summary_repo or GarminSummaryRepository()
         self._training_repo = training_repo or GarminTrainingRepository()
         self._activity_repo = activity_repo or GarminActivityRepository()
+        self._sync_repo = sync_repo or GarminSyncRepository()
         self._datasets = datasets or build_default_dataset_registry()
 
     async def with_session(
@@ -56,6 +59,12 @@ class GarminService(GarminIngestionMixin, GarminRetrievalMixin):
         async with session_scope(session_factory) as session:
             return await handler(session)
 
+    @property
+    def sync_repository(self) -> GarminSyncRepository:
+        """Repository tracking incremental sync watermarks."""
+
+        return self._sync_repo
+
     def validate(self, schema: type["GarminRequest"], payload: Mapping[str, Any]) -> "GarminRequest":
         """Validate ``payload`` against ``schema`` raising :class:`ValidationError` on failure."""
 
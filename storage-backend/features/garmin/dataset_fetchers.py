@@ -1,10 +1,16 @@
-"""Garmin dataset fetcher implementations shared by the provider service."""
+"""Garmin dataset fetcher implementations shared by the provider service.
+
+Fetchers are coroutines: every blocking client call goes through the
+:class:`~features.garmin.fetch_engine.GarminFetchEngine` attached to the
+dataset context, and per-day endpoints fan out concurrently via
+:meth:`GarminFetchEngine.map_days`.
+"""
 
 from __future__ import annotations
 
+import functools
 import logging
-from datetime import date, timedelta
-from typing import Any, Iterable, Mapping, TYPE_CHECKING
+from typing import Any, Mapping, TYPE_CHECKING
 
 from core.exceptions import ProviderError
 from features.garmin.schemas.queries import GarminDataQuery
@@ -23,91 +29,93 @@ def _is_not_found_error(exc: ProviderError) -> bool:
     return "404" in message or "not found" in message
 
 
-def fetch_sleep(context: "GarminDatasetContext", window: "FetchWindow", query: GarminDataQuery) -> Any:
+async def fetch_sleep(context: "GarminDatasetContext", window: "FetchWindow", query: GarminDataQuery) -> Any:
     display_name = window.display_name or ""
-    return context.client.fetch_sleep(display_name=display_name, start=window.start, end=window.end)
+    fetch = functools.partial(context.client.fetch_sleep, display_name=display_name)
+    days = await context.engine.map_days(lambda day: fetch(start=day, end=day), window.start, window.end)
+    return _flatten(days)
 
 
-def fetch_summary(context: "GarminDatasetContext", window: "FetchWindow", query: GarminDataQuery) -> Any:
+async def fetch_summary(context: "GarminDatasetContext", window: "FetchWindow", query: GarminDataQuery) -> Any:
     display_name = window.display_name or ""
-    return context.client.fetch_user_summary(display_name=display_name, start=window.start, end=window.end)
+    fetch = functools.partial(context.client.fetch_user_summary, display_name=display_name)
+    days = await context.engine.map_days(lambda day: fetch(start=day, end=day), window.start, window.end)
+    return _flatten(days)
 
 
-def fetch_body_composition(
+async def fetch_body_composition(
     context: "GarminDatasetContext", window: "FetchWindow", query: GarminDataQuery
 ) -> Mapping[str, Any]:
-    garmin_payload = context.client.fetch_body_composition(start=window.start, end=window.end)
-    withings_payload: list[dict[str, Any]] | None = None
-    if context.withings:
+    async def _fetch_withings() -> list[dict[str, Any]] | None:
+        if not context.withings:
+            return None
         try:
-            withings_payload = context.withings.fetch_body_composition(start=window.start, end=window.end)
+            return await context.engine.call(
+                context.withings.fetch_body_composition, start=window.start, end=window.end
+            )
         except Exception as exc:  # pragma: no cover - logged for observability
             logger.warning(
                 "Withings body composition fetch failed",
                 extra={"start": window.start.isoformat(), "end": window.end.isoformat()},
                 exc_info=exc,
             )
+            return None
+
+    async def _fetch_garmin() -> Any:
+        return await context.engine.call(
+            context.client.fetch_body_composition, start=window.start, end=window.end
+        )
+
+    garmin_payload, withings_payload = await context.engine.gather([_fetch_garmin, _fetch_withings])
     return {"garmin": garmin_payload, "withings": withings_payload}
 
 
-def fetch_hrv(context: "GarminDatasetContext", window: "FetchWindow", query: GarminDataQuery) -> list[Mapping[str, Any]]:
-    results: list[Mapping[str, Any]] = []
-    for day in _date_range(window.start, window.end):
-        payload = context.client.fetch_hrv(target_date=day)
-        if payload:
-            results.append(payload)
-    return results
+async def fetch_hrv(
+    context: "GarminDatasetContext", window: "FetchWindow", query: GarminDataQuery
+) -> list[Mapping[str, Any]]:
+    fetch = context.client.fetch_hrv
+    days = await context.engine.map_days(lambda day: fetch(target_date=day), window.start, window.end)
+    return _flatten(days)
 
 
-def fetch_training_readiness(
+async def fetch_training_readiness(
     context: "GarminDatasetContext", window: "FetchWindow", query: GarminDataQuery
 ) -> list[Mapping[str, Any]]:
-    results: list[Mapping[str, Any]] = []
-    for day in _date_range(window.start, window.end):
-        payload = context.client.fetch_training_readiness(target_date=day)
-        if payload:
-            if isinstance(payload, list):
-                results.extend(payload)
-            else:
-                results.append(payload)
-    return results
+    fetch = context.client.fetch_training_readiness
+    days = await context.engine.map_days(lambda day: fetch(target_date=day), window.start, window.end)
+    return _flatten(days)
 
 
-def fetch_endurance_score(context: "GarminDatasetContext", window: "FetchWindow", query: GarminDataQuery) -> Any:
-    return context.client.fetch_endurance_score(start=window.start, end=window.end)
+async def fetch_endurance_score(
+    context: "GarminDatasetContext", window: "FetchWindow", query: GarminDataQuery
+) -> Any:
+    return await context.engine.call(context.client.fetch_endurance_score, start=window.start, end=window.end)
 
 
-def fetch_training_status(
+async def fetch_training_status(
     context: "GarminDatasetContext", window: "FetchWindow", query: GarminDataQuery
 ) -> list[Mapping[str, Any]]:
-    results: list[Mapping[str, Any]] = []
-    for day in _date_range(window.start, window.end):
-        payload = context.client.fetch_training_status(target_date=day)
-        if payload:
-            results.append(payload)
-    return results
+    fetch = context.client.fetch_training_status
+    days = await context.engine.map_days(lambda day: fetch(target_date=day), window.start, window.end)
+    return _flatten(days)
 
 
-def fetch_training_load_balance(
+async def fetch_training_load_balance(
     context: "GarminDatasetContext", window: "FetchWindow", query: GarminDataQuery
 ) -> list[Mapping[str, Any]]:
     """Fetch training load balance metrics for each day in the window."""
 
-    results: list[Mapping[str, Any]] = []
-    for day in _date_range(window.start, window.end):
-        payload = context.client.fetch_training_load_balance(target_date=day)
-        if payload:
-            results.append(payload)
-    return results
+    fetch = context.client.fetch_training_load_balance
+    days = await context.engine.map_days(lambda day: fetch(target_date=day), window.start, window.end)
+    return _flatten(days)
 
 
-def fetch_fitness_age(context: "GarminDatasetContext", window: "FetchWindow", query: GarminDataQuery) -> list[Mapping[str, Any]]:
-    results: list[Mapping[str, Any]] = []
-    for day in _date_range(window.start, window.end):
-        payload = context.client.fetch_fitness_age(target_date=day)
-        if payload:
-            results.append(payload)
-    return results
+async def fetch_fitness_age(
+    context: "GarminDatasetContext", window: "FetchWindow", query: GarminDataQuery
+) -> list[Mapping[str, Any]]:
+    fetch = context.client.fetch_fitness_age
+    days = await context.engine.map_days(lambda day: fetch(target_date=day), window.start, window.end)
+    return _flatten(days)
 
 
 def _merge_activity_payloads(
@@ -158,40 +166,45 @@ def _merge_activity_payloads(
     return merged
 
 
-def fetch_activity(context: "GarminDatasetContext", window: "FetchWindow", query: GarminDataQuery) -> Any:
+async def fetch_activity(context: "GarminDatasetContext", window: "FetchWindow", query: GarminDataQuery) -> Any:
+    engine = context.engine
     if query.activity_id is not None:
-        payload = context.client.fetch_activity_detail(query.activity_id)
+        payload = await engine.call(context.client.fetch_activity_detail, query.activity_id)
         return [] if payload is None else [payload]
 
-    summaries = context.client.fetch_activities(
+    summaries = await engine.call(
+        context.client.fetch_activities,
         start=window.start,
         end=window.end,
         limit=query.limit,
         offset=query.offset,
     )
+    summaries = [summary for summary in summaries if isinstance(summary, Mapping)]
 
-    enriched: list[Mapping[str, Any]] = []
-    for summary in summaries:
-        if not isinstance(summary, Mapping):
-            continue
+    async def _no_detail() -> None:
+        return None
 
+    detail_factories = []
+    for summary in summaries:
         activity_id = summary.get("activityId") or summary.get("activity_id")
-        detail_payload = None
         activity_id_int = None
         if isinstance(activity_id, int):
             activity_id_int = activity_id
         elif isinstance(activity_id, str) and activity_id.isdigit():
             activity_id_int = int(activity_id)
 
-        if activity_id_int is not None:
-            detail_payload = context.client.fetch_activity_detail(activity_id_int)
-
-        enriched.append(_merge_activity_payloads(summary, detail_payload))
+        if activity_id_int is None:
+            detail_factories.append(_no_detail)
+        else:
+            detail_factories.append(
+                functools.partial(engine.call, context.client.fetch_activity_detail, activity_id_int)
+            )
 
-    return enriched
+    details = await engine.gather(detail_factories)
+    return [_merge_activity_payloads(summary, detail) for summary, detail in zip(summaries, details)]
 
 
-def fetch_activity_gps(context: "GarminDatasetContext", window: "FetchWindow", query: GarminDataQuery) -> Any:
+async def fetch_activity_gps(context: "GarminDatasetContext", window: "FetchWindow", query: GarminDataQuery) -> Any:
     if query.activity_id is None:
         raise ProviderError(
             "activity_id is required for activity GPS dataset",
@@ -200,7 +213,7 @@ def fetch_activity_gps(context: "GarminDatasetContext", window: "FetchWindow", q
 
     payload: Mapping[str, Any] | None = None
     try:
-        payload = context.client.fetch_activity_gps(query.activity_id)
+        payload = await context.engine.call(context.client.fetch_activity_gps, query.activity_id)
     except ProviderError as exc:
         if _is_not_found_error(exc):
             logger.info(
@@ -210,7 +223,7 @@ def fetch_activity_gps(context: "GarminDatasetContext", window: "FetchWindow", q
         else:
             raise
 
-    detail_payload = context.client.fetch_activity_detail(query.activity_id)
+    detail_payload = await context.engine.call(context.client.fetch_activity_detail, query.activity_id)
 
     if not payload and not detail_payload:
         logger.info(
@@ -225,7 +238,7 @@ def fetch_activity_gps(context: "GarminDatasetContext", window: "FetchWindow", q
     return [merged_payload]
 
 
-def fetch_daily_health_events(
+async def fetch_daily_health_events(
     context: "GarminDatasetContext", window: "FetchWindow", query: GarminDataQuery
 ) -> list[Mapping[str, Any]]:
     if not window.display_name:
@@ -233,24 +246,20 @@ def fetch_daily_health_events(
             "Garmin display name required for daily health events",
             provider="garmin",
         )
-    results: list[Mapping[str, Any]] = []
-    for day in _date_range(window.start, window.end):
-        payload = context.client.fetch_daily_health_events(target_date=day, display_name=window.display_name)
-        if payload:
-            if isinstance(payload, list):
-                results.extend(payload)
-            else:
-                results.append(payload)
-    return results
+    fetch = functools.partial(context.client.fetch_daily_health_events, display_name=window.display_name)
+    days = await context.engine.map_days(lambda day: fetch(target_date=day), window.start, window.end)
+    return _flatten(days)
 
 
-def fetch_max_metrics(context: "GarminDatasetContext", window: "FetchWindow", query: GarminDataQuery) -> list[Mapping[str, Any]]:
+async def fetch_max_metrics(
+    context: "GarminDatasetContext", window: "FetchWindow", query: GarminDataQuery
+) -> list[Mapping[str, Any]]:
     """Fetch VO2 max metrics with monthly granularity for the window period.
 
     This method returns monthly VO2 max values from Garmin. These values are typically merged
     with training_status records to enrich daily training load data with VO2 max feedback.
     """
-    payload = context.client.fetch_max_metrics(start=window.start, end=window.end)
+    payload = await context.engine.call(context.client.fetch_max_metrics, start=window.start, end=window.end)
     if isinstance(payload, list):
         return payload
     if isinstance(payload, Mapping):
@@ -258,11 +267,18 @@ def fetch_max_metrics(context: "GarminDatasetContext", window: "FetchWindow", qu
     return []
 
 
-def _date_range(start: date, end: date) -> Iterable[date]:
-    current = start
-    while current <= end:
-        yield current
-        current += timedelta(days=1)
+def _flatten(payloads: list[Any]) -> list[Any]:
+    """Flatten per-day payloads, dropping empty responses and expanding lists."""
+
+    results: list[Any] = []
+    for payload in payloads:
+        if not payload:
+            continue
+        if isinstance(payload, list):
+            results.extend(payload)
+        else:
+            results.append(payload)
+    return results
 
 
 __all__ = [
@@ -4,12 +4,13 @@ from __future__ import annotations
 
 import inspect
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
 from typing import Any, Awaitable, Callable, Iterable, Mapping
 
 from core.providers.garmin import GarminConnectClient
 from core.providers.withings import WithingsClient
+from features.garmin.fetch_engine import GarminFetchEngine
 from features.garmin.schemas.queries import GarminDataQuery
 from features.garmin.schemas.requests import (
     ActivityGpsRequest,
@@ -64,6 +65,7 @@ class GarminDatasetContext:
 
     client: GarminConnectClient
     withings: WithingsClient | None = None
+    engine: GarminFetchEngine = field(default_factory=GarminFetchEngine)
 
 
 @dataclass(slots=True)
@@ -196,6 +198,7 @@ def _build_fetch_window(
 
 __all__ = [
     "DatasetConfig",
+    "FetchWindow",
     "GarminDatasetContext",
     "build_dataset_configs",
     "fetch_dataset_raw",
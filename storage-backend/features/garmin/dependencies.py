@@ -22,6 +22,7 @@ from infrastructure.db.mysql import (
 from features.db.garmin.repositories import build_repositories
 from features.db.garmin.service import GarminService
 
+from .fetch_engine import GarminFetchEngine
 from .service import GarminProviderService
 from .settings import get_garmin_provider_settings, get_withings_provider_settings
 
@@ -90,6 +91,7 @@ def _build_service() -> GarminService:
         summary_repo=repositories["summary"],
         training_repo=repositories["training"],
         activity_repo=repositories["activity"],
+        sync_repo=repositories["sync"],
     )
 
 
@@ -138,6 +140,7 @@ def get_garmin_provider_service() -> GarminProviderService:
             garmin_service=garmin_service,
             save_to_db_default=settings.save_to_db_default,
             withings_client=withings_client,
+            fetch_engine=GarminFetchEngine(settings.fetch_engine),
         )
 
     return _provider_service
@@ -0,0 +1,187 @@
+"""Non-blocking execution engine for Garmin Connect dataset fetches.
+
+:class:`GarminConnectClient` is built on :mod:`garth`, which performs blocking
+HTTP calls.  The engine runs those calls on a dedicated thread pool so async
+routes never block the event loop, and fans per-day requests out with bounded
+concurrency, a shared request rate limit, and coordinated backoff whenever
+Garmin answers with HTTP 429.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Awaitable, Callable, Iterable, Sequence, TypeVar
+
+from core.exceptions import ProviderError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class FetchEngineSettings:
+    """Tuning knobs for :class:`GarminFetchEngine`."""
+
+    max_workers: int = 8
+    concurrency: int = 4
+    rate_limit_per_second: float = 8.0
+    max_rate_limit_retries: int = 4
+    rate_limit_backoff_seconds: float = 2.0
+    max_backoff_seconds: float = 60.0
+
+
+def is_rate_limited_error(exc: BaseException) -> bool:
+    """Return ``True`` when ``exc`` represents an HTTP 429 from Garmin."""
+
+    original = getattr(exc, "original_error", None)
+    response = getattr(original, "response", None) or getattr(exc, "response", None)
+    status_code = getattr(response, "status_code", None)
+    if status_code == 429:
+        return True
+    message = str(exc).lower()
+    return "429" in message or "too many requests" in message
+
+
+@dataclass
+class GarminFetchEngine:
+    """Run blocking Garmin client calls off the event loop with rate limiting."""
+
+    settings: FetchEngineSettings = field(default_factory=FetchEngineSettings)
+    _executor: ThreadPoolExecutor | None = field(default=None, init=False, repr=False)
+    _rate_lock: asyncio.Lock | None = field(default=None, init=False, repr=False)
+    _lock_loop: asyncio.AbstractEventLoop | None = field(default=None, init=False, repr=False)
+    _next_slot: float = field(default=0.0, init=False, repr=False)
+    _paused_until: float = field(default=0.0, init=False, repr=False)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def call(self, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """Execute ``func`` on the engine thread pool honouring rate limits.
+
+        HTTP 429 responses pause every in-flight request on the engine and the
+        call is retried with exponential backoff up to
+        ``settings.max_rate_limit_retries`` times before the error propagates.
+        """
+
+        loop = asyncio.get_running_loop()
+        bound = functools.partial(func, *args, **kwargs)
+        attempt = 0
+        while True:
+            await self._acquire_slot()
+            try:
+                return await loop.run_in_executor(self._get_executor(), bound)
+            except ProviderError as exc:
+                if not is_rate_limited_error(exc) or attempt >= self.settings.max_rate_limit_retries:
+                    raise
+                delay = min(
+                    self.settings.rate_limit_backoff_seconds * (2**attempt),
+                    self.settings.max_backoff_seconds,
+                )
+                attempt += 1
+                self._paused_until = max(self._paused_until, time.monotonic() + delay)
+                logger.warning(
+                    "Garmin rate limit hit; backing off",
+                    extra={
+                        "function": getattr(func, "__name__", repr(func)),
+                        "attempt": attempt,
+                        "delay_seconds": delay,
+                    },
+                )
+
+    async def map_days(
+        self,
+        func: Callable[[date], T],
+        start: date,
+        end: date,
+    ) -> list[T]:
+        """Invoke ``func`` for every day between ``start`` and ``end`` inclusive.
+
+        Calls are fanned out with at most ``settings.concurrency`` requests in
+        flight; results are returned in calendar order.
+        """
+
+        return await self.gather([functools.partial(self.call, func, day) for day in iter_days(start, end)])
+
+    async def gather(self, factories: Sequence[Callable[[], Awaitable[T]]]) -> list[T]:
+        """Await coroutine ``factories`` with bounded concurrency, preserving order."""
+
+        if not factories:
+            return []
+
+        semaphore = asyncio.Semaphore(max(1, self.settings.concurrency))
+
+        async def _run(factory: Callable[[], Awaitable[T]]) -> T:
+            async with semaphore:
+                return await factory()
+
+        tasks = [asyncio.ensure_future(_run(factory)) for factory in factories]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    def shutdown(self, *, wait: bool = False) -> None:
+        """Release the worker threads owned by the engine."""
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(1, self.settings.max_workers),
+                thread_name_prefix="garmin-fetch",
+            )
+        return self._executor
+
+    def _get_rate_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._rate_lock is None or self._lock_loop is not loop:
+            self._rate_lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._rate_lock
+
+    async def _acquire_slot(self) -> None:
+        rate = self.settings.rate_limit_per_second
+        interval = 1.0 / rate if rate > 0 else 0.0
+        async with self._get_rate_lock():
+            now = time.monotonic()
+            ready_at = max(now, self._next_slot, self._paused_until)
+            self._next_slot = ready_at + interval
+        delay = ready_at - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def iter_days(start: date, end: date) -> Iterable[date]:
+    """Yield each date between ``start`` and ``end`` inclusive."""
+
+    current = start
+    while current <= end:
+        yield current
+        current += timedelta(days=1)
+
+
+__all__ = [
+    "FetchEngineSettings",
+    "GarminFetchEngine",
+    "is_rate_limited_error",
+    "iter_days",
+]
@@ -141,8 +141,8 @@ async def get_activity_detail(
     """
 
     try:
-        # Call client directly - no dataset translation needed
-        data = service._context.client.fetch_activity_detail(activity_id)
+        # Call client directly (off the event loop) - no dataset translation needed
+        data = await service.run_client("fetch_activity_detail", activity_id)
 
         if data is None:
             return handle_errors(
@@ -179,7 +179,7 @@ async def get_activity_weather(
     """
 
     try:
-        data = service._context.client.fetch_activity_weather(activity_id)
+        data = await service.run_client("fetch_activity_weather", activity_id)
 
         if data is None:
             return handle_errors(
@@ -216,7 +216,7 @@ async def get_activity_hr_zones(
     """
 
     try:
-        data = service._context.client.fetch_activity_hr_zones(activity_id)
+        data = await service.run_client("fetch_activity_hr_zones", activity_id)
 
         if data is None:
             return handle_errors(
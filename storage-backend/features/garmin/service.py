@@ -10,6 +10,7 @@ payload munging.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
 from typing import Any, Iterable, Mapping, Sequence
@@ -20,6 +21,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from core.exceptions import ConfigurationError, ProviderError, ValidationError
 from core.providers.garmin import GarminConnectClient
 from core.providers.withings import WithingsClient
+from features.db.garmin.repositories import GarminSyncRepository
 from features.db.garmin.service import GarminService
 from features.garmin.dataset_registry import (
     DatasetConfig,
@@ -27,6 +29,7 @@ from features.garmin.dataset_registry import (
     build_dataset_configs,
     fetch_dataset_raw,
 )
+from features.garmin.fetch_engine import GarminFetchEngine
 from features.garmin.results import IngestResult
 from features.garmin.schemas.queries import DataSource, GarminDataQuery
 from features.garmin.schemas.requests import GarminRequest
@@ -72,11 +75,16 @@ class GarminProviderService:
         garmin_service: GarminService,
         save_to_db_default: bool = True,
         withings_client: WithingsClient | None = None,
+        fetch_engine: GarminFetchEngine | None = None,
     ) -> None:
         object.__setattr__(
             self,
             "_context",
-            GarminDatasetContext(client=client, withings=withings_client),
+            GarminDatasetContext(
+                client=client,
+                withings=withings_client,
+                engine=fetch_engine or GarminFetchEngine(),
+            ),
         )
         object.__setattr__(self, "_garmin_service", garmin_service)
         object.__setattr__(self, "_save_to_db_default", save_to_db_default)
@@ -86,6 +94,12 @@ class GarminProviderService:
     # Public API
     # ------------------------------------------------------------------
 
+    @property
+    def sync_repository(self) -> GarminSyncRepository:
+        """Watermark repository used by incremental syncs."""
+
+        return self._garmin_service.sync_repository
+
     def status(self) -> Mapping[str, Any]:
         """Return provider metadata for diagnostics."""
 
@@ -123,8 +137,101 @@ class GarminProviderService:
             )
 
         # Standard flow: fetch from Garmin API
+        raw_payloads = await self._fetch_raw(dataset, config, query, customer_id)
+        return await self._build_result(
+            dataset,
+            config,
+            query,
+            raw_payloads,
+            customer_id=customer_id,
+            save_flag=save_flag,
+            session=session,
+        )
+
+    async def fetch_datasets(
+        self,
+        datasets: Sequence[str],
+        query: GarminDataQuery,
+        *,
+        customer_id: int,
+        save_to_db: bool | None = None,
+        session: AsyncSession | None = None,
+    ) -> dict[str, DatasetResult | Exception]:
+        """Fetch several datasets concurrently and persist them in request order.
+
+        Garmin API calls for every dataset run in parallel on the fetch engine;
+        translation and ingestion then run sequentially because they share the
+        single ``session``.  Failures are returned per dataset instead of
+        aborting the whole batch.
+        """
+
+        if query.source == DataSource.DATABASE:
+            results: dict[str, DatasetResult | Exception] = {}
+            for dataset in datasets:
+                try:
+                    results[dataset] = await self.fetch_dataset(
+                        dataset, query, customer_id=customer_id, save_to_db=save_to_db, session=session
+                    )
+                except Exception as exc:  # noqa: BLE001 - surfaced per dataset
+                    results[dataset] = exc
+            return results
+
+        save_flag = self._resolve_save_flag(save_to_db)
+        configs: dict[str, DatasetConfig | Exception] = {}
+        for dataset in datasets:
+            try:
+                configs[dataset] = self._require_dataset(dataset)
+            except ProviderError as exc:
+                configs[dataset] = exc
+
+        async def _fetch(dataset: str) -> Any:
+            config = configs[dataset]
+            if isinstance(config, Exception):
+                raise config
+            return await self._fetch_raw(dataset, config, query, customer_id)
+
+        raw_results = await asyncio.gather(*(_fetch(dataset) for dataset in datasets), return_exceptions=True)
+
+        results = {}
+        for dataset, raw_payloads in zip(datasets, raw_results):
+            if isinstance(raw_payloads, BaseException):
+                if not isinstance(raw_payloads, Exception):
+                    raise raw_payloads
+                results[dataset] = raw_payloads
+                continue
+            try:
+                results[dataset] = await self._build_result(
+                    dataset,
+                    configs[dataset],  # type: ignore[arg-type] - failed lookups raised above
+                    query,
+                    raw_payloads,
+                    customer_id=customer_id,
+                    save_flag=save_flag,
+                    session=session,
+                )
+            except Exception as exc:  # noqa: BLE001 - surfaced per dataset
+                results[dataset] = exc
+        return results
+
+    async def run_client(self, method: str, /, *args: Any, **kwargs: Any) -> Any:
+        """Invoke a :class:`GarminConnectClient` method without blocking the loop."""
+
+        func = getattr(self._context.client, method)
+        return await self._context.engine.call(func, *args, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    async def _fetch_raw(
+        self,
+        dataset: str,
+        config: DatasetConfig,
+        query: GarminDataQuery,
+        customer_id: int,
+    ) -> Any:
         try:
-            raw_payloads = await fetch_dataset_raw(dataset, config, self._context, query)
+            return await fetch_dataset_raw(dataset, config, self._context, query)
         except Exception as exc:
             logger.error(
                 "Failed to fetch Garmin dataset from API",
@@ -138,6 +245,17 @@ class GarminProviderService:
             )
             raise
 
+    async def _build_result(
+        self,
+        dataset: str,
+        config: DatasetConfig,
+        query: GarminDataQuery,
+        raw_payloads: Any,
+        *,
+        customer_id: int,
+        save_flag: bool,
+        session: AsyncSession | None,
+    ) -> DatasetResult:
         try:
             translated = list(config.translator(raw_payloads, query))
         except Exception as exc:
@@ -153,10 +271,9 @@ class GarminProviderService:
                 "Garmin dataset returned no rows",
                 extra={"dataset": dataset, "customer_id": customer_id},
             )
-            items = []
             return DatasetResult(
                 dataset=dataset,
-                items=items,
+                items=[],
                 raw=self._prepare_raw(raw_payloads),
                 ingested=[],
                 saved=False,
@@ -183,10 +300,6 @@ class GarminProviderService:
             saved=saved,
         )
 
-    # ------------------------------------------------------------------
-    # Internal helpers
-    # ------------------------------------------------------------------
-
     async def _ingest(
         self,
         dataset: str,
@@ -198,12 +311,7 @@ class GarminProviderService:
         if ingest_method is None:
             return []
 
-        handler = getattr(self._garmin_service, ingest_method)
-        results: list[IngestResult] = []
-        for payload in requests:
-            result = await handler(session, payload, customer_id)  # type: ignore[arg-type]
-            results.append(result)
-        return results
+        return await self._garmin_service.ingest_many(session, ingest_method, requests, customer_id)
 
     def _validate_payloads(
         self,
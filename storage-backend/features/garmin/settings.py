@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from core.exceptions import ConfigurationError
+from features.garmin.fetch_engine import FetchEngineSettings
 
 
 @dataclass(frozen=True)
@@ -21,6 +22,7 @@ class GarminProviderSettings:
     request_timeout: float
     backoff_factor: float
     max_retry_attempts: int
+    fetch_engine: FetchEngineSettings = FetchEngineSettings()
 
 
 def get_garmin_provider_settings() -> GarminProviderSettings:
@@ -36,6 +38,13 @@ def get_garmin_provider_settings() -> GarminProviderSettings:
     timeout = _float_env("GARMIN_REQUEST_TIMEOUT", default=30.0)
     backoff = _float_env("GARMIN_BACKOFF_FACTOR", default=0.5)
     retries = _int_env("GARMIN_MAX_RETRY_ATTEMPTS", default=3)
+    fetch_engine = FetchEngineSettings(
+        max_workers=_int_env("GARMIN_FETCH_MAX_WORKERS", default=8),
+        concurrency=_int_env("GARMIN_FETCH_CONCURRENCY", default=4),
+        rate_limit_per_second=_float_env("GARMIN_FETCH_RATE_LIMIT_PER_SECOND", default=8.0),
+        max_rate_limit_retries=_int_env("GARMIN_FETCH_MAX_RATE_LIMIT_RETRIES", default=4),
+        rate_limit_backoff_seconds=_float_env("GARMIN_FETCH_RATE_LIMIT_BACKOFF", default=2.0),
+    )
 
     return GarminProviderSettings(
         session_path=session_path,
@@ -46,6 +55,28 @@ def get_garmin_provider_settings() -> GarminProviderSettings:
         request_timeout=timeout,
         backoff_factor=backoff,
         max_retry_attempts=retries,
+        fetch_engine=fetch_engine,
+    )
+
+
+@dataclass(frozen=True)
+class GarminSyncSettings:
+    """Tuning for incremental, watermark-driven Garmin/Withings syncs."""
+
+    initial_backfill_days: int = 7
+    overlap_days: int = 1
+    gap_lookback_days: int = 14
+    max_window_days: int = 31
+
+
+def get_garmin_sync_settings() -> GarminSyncSettings:
+    """Return environment configuration for incremental Garmin syncs."""
+
+    return GarminSyncSettings(
+        initial_backfill_days=_int_env("GARMIN_SYNC_INITIAL_BACKFILL_DAYS", default=7),
+        overlap_days=_int_env("GARMIN_SYNC_OVERLAP_DAYS", default=1),
+        gap_lookback_days=_int_env("GARMIN_SYNC_GAP_LOOKBACK_DAYS", default=14),
+        max_window_days=_int_env("GARMIN_SYNC_MAX_WINDOW_DAYS", default=31),
     )
 
 
@@ -100,8 +131,10 @@ def get_withings_provider_settings() -> WithingsProviderSettings:
 
 __all__ = [
     "GarminProviderSettings",
+    "GarminSyncSettings",
     "WithingsProviderSettings",
     "get_garmin_provider_settings",
+    "get_garmin_sync_settings",
     "get_withings_provider_settings",
 ]
 
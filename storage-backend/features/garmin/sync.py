@@ -0,0 +1,244 @@
+"""Incremental Garmin/Withings sync driven by per-dataset watermarks.
+
+Each (customer, dataset) pair stores the last calendar date that was synced
+successfully.  A run only asks Garmin for the days after that watermark (plus
+a small overlap so partially recorded "today" data is completed), and scans a
+short lookback window of the dataset's table for missed nights so gaps are
+backfilled without re-fetching everything in between.  Large ranges are split
+into bounded windows that commit independently, which keeps historical
+imports resumable.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Mapping, Sequence
+
+from features.db.garmin.db_models import HRVData, SleepData, TrainingReadiness, UserSummary
+from features.db.garmin.repositories import GarminSyncRepository
+from features.db.garmin.repositories.sync import missing_dates
+from infrastructure.db.mysql import AsyncSessionFactory, session_scope
+
+from .schemas.queries import GarminDataQuery
+from .service import GarminProviderService
+from .settings import GarminSyncSettings, get_garmin_sync_settings
+
+logger = logging.getLogger(__name__)
+
+# Datasets expected to produce one row per night; only these take part in gap detection.
+GAP_DETECTION_MODELS: Mapping[str, type] = {
+    "sleep": SleepData,
+    "summary": UserSummary,
+    "hrv": HRVData,
+    "training_readiness": TrainingReadiness,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class SyncWindow:
+    """Inclusive date range scheduled for a dataset sync."""
+
+    start: date
+    end: date
+    reason: str
+
+    def split(self, max_days: int) -> list["SyncWindow"]:
+        """Return consecutive windows no longer than ``max_days`` each."""
+
+        span = max(1, max_days)
+        windows: list[SyncWindow] = []
+        cursor = self.start
+        while cursor <= self.end:
+            chunk_end = min(self.end, cursor + timedelta(days=span - 1))
+            windows.append(SyncWindow(cursor, chunk_end, self.reason))
+            cursor = chunk_end + timedelta(days=1)
+        return windows
+
+
+def plan_incremental_window(
+    watermark: date | None,
+    today: date,
+    settings: GarminSyncSettings,
+) -> SyncWindow:
+    """Return the window following ``watermark`` up to ``today``."""
+
+    if watermark is None:
+        start = today - timedelta(days=max(1, settings.initial_backfill_days) - 1)
+        return SyncWindow(start, today, "initial")
+
+    start = watermark + timedelta(days=1) - timedelta(days=max(0, settings.overlap_days))
+    return SyncWindow(min(start, today), today, "incremental")
+
+
+def group_gap_windows(days: Sequence[date]) -> list[SyncWindow]:
+    """Collapse sorted missing ``days`` into contiguous gap windows."""
+
+    windows: list[SyncWindow] = []
+    for day in sorted(days):
+        if windows and windows[-1].end + timedelta(days=1) == day:
+            windows[-1] = SyncWindow(windows[-1].start, day, "gap")
+        else:
+            windows.append(SyncWindow(day, day, "gap"))
+    return windows
+
+
+class GarminSyncEngine:
+    """Fetch only missing Garmin data and advance per-dataset watermarks."""
+
+    def __init__(
+        self,
+        provider_service: GarminProviderService,
+        session_factory: AsyncSessionFactory,
+        *,
+        sync_repository: GarminSyncRepository | None = None,
+        settings: GarminSyncSettings | None = None,
+    ) -> None:
+        self._provider = provider_service
+        self._session_factory = session_factory
+        self._repository = sync_repository or provider_service.sync_repository
+        self._settings = settings or get_garmin_sync_settings()
+
+    async def plan(
+        self,
+        customer_id: int,
+        datasets: Sequence[str],
+        *,
+        today: date | None = None,
+    ) -> dict[str, list[SyncWindow]]:
+        """Return the windows each dataset needs, oldest first."""
+
+        run_date = today or date.today()
+        async with session_scope(self._session_factory) as session:
+            watermarks = await self._repository.fetch_watermarks(session, customer_id, datasets)
+            plans: dict[str, list[SyncWindow]] = {}
+            for dataset in datasets:
+                watermark = watermarks.get(dataset)
+                incremental = plan_incremental_window(watermark, run_date, self._settings)
+                windows = [
+                    window
+                    for window in await self._detect_gaps(session, dataset, customer_id, watermark, run_date)
+                    if window.end < incremental.start
+                ]
+                windows.append(incremental)
+                plans[dataset] = windows
+        return plans
+
+    async def sync(
+        self,
+        customer_id: int,
+        datasets: Sequence[str],
+        *,
+        today: date | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Sync ``datasets`` for ``customer_id`` and return a per-dataset summary."""
+
+        plans = await self.plan(customer_id, datasets, today=today)
+        summary: dict[str, dict[str, Any]] = {
+            dataset: {"status": "ok", "items": 0, "saved": False, "windows": []} for dataset in datasets
+        }
+
+        # Datasets sharing a window (the common case) are fetched together.
+        by_window: dict[tuple[date, date, str], list[str]] = {}
+        for dataset, windows in plans.items():
+            for window in windows:
+                for chunk in window.split(self._settings.max_window_days):
+                    by_window.setdefault((chunk.start, chunk.end, chunk.reason), []).append(dataset)
+
+        failed: set[str] = set()
+        for (start, end, reason), members in sorted(by_window.items()):
+            active = [dataset for dataset in members if dataset not in failed]
+            if not active:
+                continue
+            await self._sync_window(customer_id, SyncWindow(start, end, reason), active, summary, failed)
+
+        return summary
+
+    async def _sync_window(
+        self,
+        customer_id: int,
+        window: SyncWindow,
+        datasets: list[str],
+        summary: dict[str, dict[str, Any]],
+        failed: set[str],
+    ) -> None:
+        query = GarminDataQuery(start_date=window.start, end_date=window.end)
+        async with session_scope(self._session_factory) as session:
+            results = await self._provider.fetch_datasets(
+                datasets,
+                query,
+                customer_id=customer_id,
+                save_to_db=True,
+                session=session,
+            )
+            for dataset in datasets:
+                entry = summary[dataset]
+                result = results[dataset]
+                entry["windows"].append(
+                    {"start": window.start.isoformat(), "end": window.end.isoformat(), "reason": window.reason}
+                )
+                if isinstance(result, Exception):
+                    # Stop advancing this dataset so its watermark never skips a failed window.
+                    if window.reason != "gap":
+                        failed.add(dataset)
+                    logger.error(
+                        "Garmin incremental sync failed",
+                        extra={
+                            "dataset": dataset,
+                            "customer_id": customer_id,
+                            "start": window.start.isoformat(),
+                            "end": window.end.isoformat(),
+                        },
+                        exc_info=result,
+                    )
+                    entry["status"] = "error"
+                    entry["message"] = str(result)
+                    continue
+
+                entry["items"] += len(result.items)
+                entry["saved"] = entry["saved"] or result.saved
+                if window.reason != "gap":
+                    record = await self._repository.upsert_watermark(
+                        session,
+                        customer_id,
+                        dataset,
+                        window.end,
+                        rows_written=len(result.ingested),
+                    )
+                    entry["watermark"] = record.last_synced_date.isoformat()
+
+    async def _detect_gaps(
+        self,
+        session: Any,
+        dataset: str,
+        customer_id: int,
+        watermark: date | None,
+        today: date,
+    ) -> list[SyncWindow]:
+        model = GAP_DETECTION_MODELS.get(dataset)
+        if model is None or watermark is None or self._settings.gap_lookback_days <= 0:
+            return []
+
+        end = min(watermark, today)
+        start = today - timedelta(days=self._settings.gap_lookback_days - 1)
+        if start > end:
+            return []
+
+        stored = await self._repository.fetch_stored_dates(session, model, customer_id, start=start, end=end)
+        gaps = group_gap_windows(missing_dates(stored, start, end))
+        if gaps:
+            logger.info(
+                "Detected missing Garmin nights",
+                extra={"dataset": dataset, "customer_id": customer_id, "gaps": len(gaps)},
+            )
+        return gaps
+
+
+__all__ = [
+    "GAP_DETECTION_MODELS",
+    "GarminSyncEngine",
+    "SyncWindow",
+    "group_gap_windows",
+    "plan_incremental_window",
+]
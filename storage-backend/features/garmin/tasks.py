@@ -10,6 +10,7 @@ from infrastructure.db.mysql import AsyncSessionFactory, session_scope
 
 from .schemas.queries import GarminDataQuery
 from .service import GarminProviderService
+from .sync import GarminSyncEngine
 
 logger = logging.getLogger(__name__)
 
@@ -29,38 +30,48 @@ async def run_nightly_sync(
     The helper is designed so it can be scheduled via APScheduler, Celery, or any
     other orchestration framework that can await an async callable. Results are
     returned as a dictionary keyed by dataset name, enabling metrics/alerts to
-    consume the summary without scraping logs.
+    consume the summary without scraping logs. Datasets are fetched from Garmin
+    concurrently and persisted in order.
+
+    Without ``target_date`` the run is incremental: :class:`GarminSyncEngine`
+    fetches only the days after each dataset's watermark plus any missed
+    nights. Passing ``target_date`` forces a single-day re-sync of that date.
     """
 
-    run_date = target_date or date.today()
     dataset_list = tuple(datasets) if datasets else DEFAULT_SYNC_DATASETS
+    if target_date is None:
+        engine = GarminSyncEngine(provider_service, session_factory)
+        return await engine.sync(customer_id, dataset_list)
+
+    run_date = target_date
     summary: dict[str, Mapping[str, object]] = {}
     query = GarminDataQuery(start_date=run_date, end_date=run_date)
 
     async with session_scope(session_factory) as session:
-        for dataset in dataset_list:
-            try:
-                result = await provider_service.fetch_dataset(
-                    dataset,
-                    query,
-                    customer_id=customer_id,
-                    save_to_db=True,
-                    session=session,
-                )
-            except Exception as exc:  # pragma: no cover - scheduler logging
-                logger.error(
-                    "Garmin nightly sync failed",
-                    extra={"dataset": dataset, "customer_id": customer_id},
-                    exc_info=exc,
-                )
-                summary[dataset] = {"status": "error", "message": str(exc)}
-                continue
-
-            summary[dataset] = {
-                "status": "ok",
-                "items": len(result.items),
-                "saved": result.saved,
-            }
+        results = await provider_service.fetch_datasets(
+            dataset_list,
+            query,
+            customer_id=customer_id,
+            save_to_db=True,
+            session=session,
+        )
+
+    for dataset in dataset_list:
+        result = results[dataset]
+        if isinstance(result, Exception):
+            logger.error(
+                "Garmin nightly sync failed",
+                extra={"dataset": dataset, "customer_id": customer_id},
+                exc_info=result,
+            )
+            summary[dataset] = {"status": "error", "message": str(result)}
+            continue
+
+        summary[dataset] = {
+            "status": "ok",
+            "items": len(result.items),
+            "saved": result.saved,
+        }
 
     return summary
 
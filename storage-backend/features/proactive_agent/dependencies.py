@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import logging
-from contextlib import asynccontextmanager
-from typing import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import AsyncIterator, Callable
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -84,8 +84,22 @@ async def get_db_session_direct() -> AsyncIterator[AsyncSession]:
             raise
 
 
+@asynccontextmanager
+async def open_proactive_agent_repository() -> AsyncIterator[ProactiveAgentRepository]:
+    """Repository on a short-lived session (one per query in long-lived streams)."""
+    async with get_db_session_direct() as db:
+        yield ProactiveAgentRepository(db)
+
+
+def get_repository_opener() -> Callable[[], AbstractAsyncContextManager[ProactiveAgentRepository]]:
+    """Provide the repository opener used by the SSE message stream."""
+    return open_proactive_agent_repository
+
+
 __all__ = [
     "get_proactive_agent_repository",
     "get_proactive_agent_session",
     "get_db_session_direct",
+    "get_repository_opener",
+    "open_proactive_agent_repository",
 ]
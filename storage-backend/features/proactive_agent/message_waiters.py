@@ -0,0 +1,139 @@
+"""Process-wide waiters for long-poll and SSE message delivery.
+
+Clients park on a per-session :class:`asyncio.Event` instead of re-querying
+the database in a loop.  ``ProactiveAgentRepository.create_message`` calls
+:func:`notify_after_commit`, which wakes the session's waiters once the
+transaction that inserted the message commits, so a woken waiter always
+finds the new row.
+
+Waiters are per process.  The commit also broadcasts a
+:data:`WAKEUP_SIGNAL` on the proactive push bus (Redis or ``pg_notify``, see
+``core/connections/push_bus.py``), which wakes the session's waiters on the
+other workers; local waiters are woken directly without the round trip.
+Without a bus, a message persisted on another worker is picked up when the
+waiting request times out and re-queries.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from core.connections.proactive_registry import get_proactive_registry
+from core.connections.push_bus import on_signal
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "proactive_agent_pending_notifications"
+_LISTENING_KEY = "proactive_agent_notify_listener"
+
+WAKEUP_SIGNAL = "proactive_agent_message"
+
+
+class SessionMessageWaiters:
+    """Per-session sets of events, set whenever a new agent message is stored."""
+
+    def __init__(self) -> None:
+        self._waiters: Dict[str, Set[asyncio.Event]] = {}
+
+    @contextmanager
+    def subscribe(self, session_id: str) -> Iterator[asyncio.Event]:
+        """Register a waiter for ``session_id`` for the duration of the block.
+
+        Subscribe *before* querying, so a message stored between the query and
+        the wait still sets the event.
+        """
+        waiter = asyncio.Event()
+        self._waiters.setdefault(session_id, set()).add(waiter)
+        try:
+            yield waiter
+        finally:
+            waiters = self._waiters.get(session_id)
+            if waiters is not None:
+                waiters.discard(waiter)
+                if not waiters:
+                    del self._waiters[session_id]
+
+    def notify(self, session_id: str) -> int:
+        """Wake every waiter of ``session_id``; returns how many were woken."""
+        waiters = self._waiters.get(session_id)
+        if not waiters:
+            return 0
+        for waiter in waiters:
+            waiter.set()
+        return len(waiters)
+
+    def waiting(self, session_id: str | None = None) -> int:
+        """Number of parked requests (for one session, or overall)."""
+        if session_id is not None:
+            return len(self._waiters.get(session_id, ()))
+        return sum(len(waiters) for waiters in self._waiters.values())
+
+
+# Module-level registry - survives across request instances
+message_waiters = SessionMessageWaiters()
+
+
+def get_message_waiters() -> SessionMessageWaiters:
+    """Return the process-wide waiter registry."""
+    return message_waiters
+
+
+def _on_wakeup(session_id: str) -> None:
+    message_waiters.notify(session_id)
+
+
+on_signal(WAKEUP_SIGNAL, _on_wakeup)
+
+
+def _notify_everywhere(session_id: str) -> None:
+    message_waiters.notify(session_id)
+    bus = get_proactive_registry().bus
+    if bus is None:
+        return
+    try:
+        bus.signal_nowait(WAKEUP_SIGNAL, session_id)
+    except RuntimeError:  # no running event loop (sync callers)
+        logger.debug("No event loop; wakeup for session %s stays local", session_id)
+
+
+def _on_commit(session: Session) -> None:
+    for session_id in session.info.pop(_PENDING_KEY, ()):
+        _notify_everywhere(session_id)
+
+
+def _on_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def notify_after_commit(db_session: Any, session_id: str) -> None:
+    """Wake waiters of ``session_id`` when ``db_session`` commits.
+
+    Waiters on other workers are woken through the push bus, if one is
+    attached.  Sessions that are not SQLAlchemy sessions (test doubles)
+    notify at once.
+    """
+    sync_session = getattr(db_session, "sync_session", db_session)
+    if not isinstance(sync_session, Session):
+        _notify_everywhere(session_id)
+        return
+
+    sync_session.info.setdefault(_PENDING_KEY, set()).add(session_id)
+    if not sync_session.info.get(_LISTENING_KEY):
+        event.listen(sync_session, "after_commit", _on_commit)
+        event.listen(sync_session, "after_rollback", _on_rollback)
+        sync_session.info[_LISTENING_KEY] = True
+
+
+__all__ = [
+    "WAKEUP_SIGNAL",
+    "SessionMessageWaiters",
+    "get_message_waiters",
+    "message_waiters",
+    "notify_after_commit",
+]
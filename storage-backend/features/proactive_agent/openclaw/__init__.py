@@ -9,6 +9,8 @@ Components:
 - auth.py: Device authentication and signature generation
 - adapter.py: Chat message adapter
 - config.py: Configuration loading
+- connection_pool.py: Pool of gateway connections with run ownership
+- stream_registry.py: Active stream registry with session/activity indexes
 - session.py: Shared connection management
 - router.py: Message routing
 """
@@ -16,7 +18,9 @@ Components:
 from .adapter import OpenClawAdapter
 from .stream_types import StreamContext
 from .auth import DeviceAuth
-from .client import OpenClawClient
+from .client import ConnectionMetrics, OpenClawClient
+from .connection_pool import OpenClawConnectionPool
+from .stream_registry import StreamRegistry
 from .exceptions import (
     OpenClawError,
     ProtocolError,
@@ -39,8 +43,11 @@ __all__ = [
     # Adapter
     "OpenClawAdapter",
     "StreamContext",
+    "StreamRegistry",
     # Client
+    "ConnectionMetrics",
     "OpenClawClient",
+    "OpenClawConnectionPool",
     "OpenClawError",
     "ProtocolError",
     "RequestError",
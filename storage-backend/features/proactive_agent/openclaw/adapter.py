@@ -9,7 +9,9 @@ Event Mapping:
 - Final -> stream_end
 - Error/Aborted -> stream_error
 
-Design: Single shared OpenClaw connection serving multiple sessions concurrently.
+Design: A small pool of gateway connections serving multiple sessions
+concurrently. Each run is pinned to the connection it was sent on; indexes
+keep run, session and activity lookups independent of the number of streams.
 """
 
 import base64
@@ -31,7 +33,9 @@ STALE_CLEANUP_IDLE_SECONDS = STREAM_TIMEOUT_SECONDS
 
 from .adapter_handlers import handle_aborted, handle_delta, handle_error, handle_final
 from .client import OpenClawClient
+from .connection_pool import OpenClawConnectionPool
 from .exceptions import RequestError
+from .stream_registry import StreamRegistry
 from .stream_types import StreamContext
 
 logger = logging.getLogger(__name__)
@@ -46,28 +50,47 @@ class OpenClawAdapter:
     Handles:
     - Sending chat.send requests
     - Mapping streaming events to mobile format
-    - Per-run callback routing (shared connection)
+    - Per-run callback routing (pooled connections)
     - Text accumulation for final message
     """
 
-    def __init__(self, client: OpenClawClient):
+    def __init__(self, client: OpenClawClient | OpenClawConnectionPool):
         """Initialize the adapter.
 
         Args:
-            client: Connected OpenClawClient instance
+            client: Connected OpenClawClient instance, or a connection pool
         """
-        self._client = client
-        self._active_streams: dict[str, StreamContext] = {}
+        if isinstance(client, OpenClawConnectionPool):
+            self._pool = client
+        else:
+            self._pool = OpenClawConnectionPool([client])
+        self._active_streams = StreamRegistry()
         self._last_stale_cleanup_monotonic = 0.0
 
+    @property
+    def _client(self) -> OpenClawClient | None:
+        """Return the client in the first pool slot."""
+        return self._pool.client(0)
+
+    @property
+    def pool(self) -> OpenClawConnectionPool:
+        """Return the connection pool."""
+        return self._pool
+
     @property
     def active_stream_count(self) -> int:
         """Return count of active streams."""
         return len(self._active_streams)
 
-    def get_active_run_ids(self) -> list[str]:
-        """Return list of active run IDs."""
-        return list(self._active_streams.keys())
+    def get_active_run_ids(self, connection: int | None = None) -> list[str]:
+        """Return list of active run IDs, optionally only those on one connection."""
+        if connection is None:
+            return list(self._active_streams.keys())
+        return [run_id for run_id in self._pool.run_ids(connection) if run_id in self._active_streams]
+
+    def connection_stats(self) -> list[dict[str, Any]]:
+        """Return per-connection load and flow-control metrics."""
+        return self._pool.stats()
 
     def get_run_id_for_session(self, session_id: str) -> str | None:
         """Find the active run ID for a given session ID.
@@ -78,10 +101,7 @@ class OpenClawAdapter:
         Returns:
             run_id if found, None otherwise
         """
-        for run_id, context in self._active_streams.items():
-            if context.session_id == session_id:
-                return run_id
-        return None
+        return self._active_streams.first_run_for_session(session_id)
 
     async def send_message(
         self,
@@ -137,12 +157,12 @@ class OpenClawAdapter:
             on_tool_result=on_tool_result,
             on_thinking_chunk=on_thinking_chunk,
         )
+        client = self._pool.acquire(run_id)
         self._active_streams[run_id] = context
 
-        params = await self._build_send_params(session_key, message, run_id, attachments)
-
         try:
-            response = await self._client.request("chat.send", params)
+            params = await self._build_send_params(session_key, message, run_id, attachments)
+            response = await client.request("chat.send", params)
 
             # Check if OpenClaw returns a different runId than our idempotencyKey
             response_run_id = response.get("runId")
@@ -154,6 +174,7 @@ class OpenClawAdapter:
                     response_run_id[:8],
                 )
                 self._active_streams.pop(run_id, None)
+                self._pool.rebind(run_id, response_run_id)
                 context.run_id = response_run_id
                 self._active_streams[response_run_id] = context
                 run_id = response_run_id
@@ -161,7 +182,7 @@ class OpenClawAdapter:
             logger.info(f"chat.send accepted: run_id={run_id[:8]}..., status={response.get('status')}")
             return run_id
         except Exception as e:
-            self._active_streams.pop(run_id, None)
+            self._remove_stream(run_id)
             logger.error(f"chat.send failed: run_id={run_id[:8]}..., error={e}")
             raise
 
@@ -252,23 +273,42 @@ class OpenClawAdapter:
         logger.debug(f"chat.send params keys: {list(params.keys())}")
         return params
 
-    async def handle_event(self, event: dict[str, Any]) -> None:
+    async def handle_event(self, event: dict[str, Any], connection: int | None = None) -> None:
         """Process incoming events from OpenClaw (chat + agent).
 
         Routes events to appropriate handlers based on type.
         Args:
             event: Event frame from OpenClawClient
+            connection: Pool slot the event arrived on. The gateway broadcasts
+                to every connection, so only the run's own connection is used.
         """
         await self._maybe_cleanup_stale_streams()
         event_type = event.get("event")
 
         if event_type == "chat":
-            await self._handle_chat_event(event)
+            await self._handle_chat_event(event, connection)
         elif event_type == "agent":
-            await self._handle_agent_event(event)
+            await self._handle_agent_event(event, connection)
         # else: ignore other event types
 
-    async def _handle_chat_event(self, event: dict[str, Any]) -> None:
+    def _route(self, run_id: str, connection: int | None) -> StreamContext | None:
+        """Return the run's context if this connection should handle its events."""
+        context = self._active_streams.get(run_id)
+        if context is None:
+            return None
+        if connection is not None:
+            owner = self._pool.owner(run_id)
+            if owner is not None and owner != connection:
+                return None
+        self._active_streams.touch(run_id)
+        return context
+
+    def _remove_stream(self, run_id: str) -> StreamContext | None:
+        """Drop a run from the stream registry and its connection."""
+        self._pool.release(run_id)
+        return self._active_streams.pop(run_id, None)
+
+    async def _handle_chat_event(self, event: dict[str, Any], connection: int | None = None) -> None:
         """Handle chat events (text streaming)."""
         payload = event.get("payload", {})
         run_id = payload.get("runId")
@@ -277,10 +317,11 @@ class OpenClawAdapter:
             logger.warning(f"Chat event missing runId: {event}")
             return
 
-        context = self._active_streams.get(run_id)
+        context = self._route(run_id, connection)
         if not context:
             # Expected noise: OpenClaw broadcasts events to ALL connected
-            # clients, including cron jobs the backend didn't initiate.
+            # clients, including cron jobs the backend didn't initiate and
+            # runs owned by another connection of the pool.
             state = payload.get("state")
             session_key = payload.get("sessionKey", "?")
             logger.debug(
@@ -296,18 +337,18 @@ class OpenClawAdapter:
             await handle_delta(context, payload)
         elif state == "final":
             await handle_final(context, payload)
-            self._active_streams.pop(run_id, None)
+            self._remove_stream(run_id)
             logger.debug(f"Stream completed: run_id={run_id[:8]}...")
         elif state == "error":
             await handle_error(context, payload)
-            self._active_streams.pop(run_id, None)
+            self._remove_stream(run_id)
         elif state == "aborted":
             await handle_aborted(context)
-            self._active_streams.pop(run_id, None)
+            self._remove_stream(run_id)
         else:
             logger.warning(f"Unknown chat state: {state}")
 
-    async def _handle_agent_event(self, event: dict[str, Any]) -> None:
+    async def _handle_agent_event(self, event: dict[str, Any], connection: int | None = None) -> None:
         """Handle agent events (tool execution, thinking).
 
         Event format from OpenClaw:
@@ -328,7 +369,7 @@ class OpenClawAdapter:
             logger.debug("Agent event missing runId, ignoring")
             return
 
-        context = self._active_streams.get(run_id)
+        context = self._route(run_id, connection)
         if not context:
             # Expected noise: OpenClaw broadcasts agent events to ALL connected
             # clients, including cron jobs the backend didn't initiate.
@@ -340,9 +381,7 @@ class OpenClawAdapter:
             #)
             return
 
-        # Update activity timestamp - agent events count as activity
-        context.touch()
-
+        # Activity timestamp was updated by _route - agent events count as activity
         stream = payload.get("stream")
         data = payload.get("data", {})
 
@@ -386,13 +425,12 @@ class OpenClawAdapter:
 
         orphan_ids = [
             candidate_run_id
-            for candidate_run_id, candidate_context in self._active_streams.items()
+            for candidate_run_id in self._active_streams.run_ids_for_session(context.session_id)
             if candidate_run_id != run_id
-            and candidate_context.session_id == context.session_id
-            and not candidate_context.started
+            and not self._active_streams[candidate_run_id].started
         ]
         for orphan_run_id in orphan_ids:
-            self._active_streams.pop(orphan_run_id, None)
+            self._remove_stream(orphan_run_id)
 
         if orphan_ids:
             logger.info(
@@ -525,8 +563,13 @@ class OpenClawAdapter:
             logger.debug(f"Abort requested for unknown run_id: {run_id[:8]}...")
             return False
 
+        client = self._pool.client_for(run_id) or self._client
+        if client is None:
+            logger.warning(f"Abort failed: run_id={run_id[:8]}..., no gateway connection")
+            return False
+
         try:
-            await self._client.request("chat.abort", {"sessionKey": context.session_key, "runId": run_id})
+            await client.request("chat.abort", {"sessionKey": context.session_key, "runId": run_id})
             logger.info(f"Abort sent: run_id={run_id[:8]}...")
             return True
         except RequestError as e:
@@ -538,14 +581,14 @@ class OpenClawAdapter:
 
     def cleanup_stream(self, run_id: str) -> None:
         """Remove stream context without sending events."""
-        if run_id in self._active_streams:
-            self._active_streams.pop(run_id)
+        if self._remove_stream(run_id) is not None:
             logger.debug(f"Stream cleaned up: run_id={run_id[:8]}...")
 
     def cleanup_all_streams(self) -> list[str]:
         """Remove all stream contexts without sending events."""
         run_ids = list(self._active_streams.keys())
         self._active_streams.clear()
+        self._pool.release_all()
         logger.info(f"Cleaned up {len(run_ids)} streams")
         return run_ids
 
@@ -558,11 +601,7 @@ class OpenClawAdapter:
         Returns:
             List of stale run_ids
         """
-        stale = []
-        for run_id, context in self._active_streams.items():
-            if context.idle_seconds() > timeout_seconds:
-                stale.append(run_id)
-        return stale
+        return self._active_streams.stale_run_ids(timeout_seconds)
 
     async def force_complete_stream(self, run_id: str, reason: str = "timeout") -> bool:
         """Force a stream to complete, saving accumulated content.
@@ -577,7 +616,7 @@ class OpenClawAdapter:
         Returns:
             True if stream was completed, False if not found
         """
-        context = self._active_streams.pop(run_id, None)
+        context = self._remove_stream(run_id)
         if not context:
             return False
         
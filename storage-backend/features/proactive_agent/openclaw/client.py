@@ -10,7 +10,9 @@ Protocol version: 3
 import asyncio
 import json
 import logging
+import time
 import uuid
+from dataclasses import dataclass
 from typing import Any, Awaitable, Callable, Optional
 
 import websockets
@@ -22,7 +24,37 @@ from .frame_handler import FrameHandler
 logger = logging.getLogger(__name__)
 
 # Re-export exceptions for backwards compatibility
-__all__ = ["OpenClawClient", "OpenClawError", "ProtocolError", "RequestError"]
+__all__ = ["ConnectionMetrics", "OpenClawClient", "OpenClawError", "ProtocolError", "RequestError"]
+
+
+@dataclass(slots=True)
+class ConnectionMetrics:
+    """Flow-control counters for one gateway connection.
+
+    ``send_wait_seconds`` is the time spent inside ``websocket.send``, which
+    only blocks while the socket's write buffer is above its high-water mark;
+    a growing value means the gateway is not draining this connection.
+    """
+
+    requests_sent: int = 0
+    bytes_sent: int = 0
+    send_wait_seconds: float = 0.0
+    max_send_wait_seconds: float = 0.0
+    frames_received: int = 0
+    bytes_received: int = 0
+
+    def record_send(self, size: int, waited: float) -> None:
+        """Count one sent frame of ``size`` bytes that took ``waited`` seconds."""
+        self.requests_sent += 1
+        self.bytes_sent += size
+        self.send_wait_seconds += waited
+        if waited > self.max_send_wait_seconds:
+            self.max_send_wait_seconds = waited
+
+    def record_receive(self, size: int) -> None:
+        """Count one received frame of ``size`` bytes."""
+        self.frames_received += 1
+        self.bytes_received += size
 
 
 class OpenClawClient:
@@ -62,12 +94,18 @@ class OpenClawClient:
         self._receive_task: Optional[asyncio.Task[None]] = None
         self._connected = False
         self._frame_handler = FrameHandler(self._pending_requests, on_event)
+        self.metrics = ConnectionMetrics()
 
     @property
     def connected(self) -> bool:
         """Return True if client is connected and handshake completed."""
         return self._connected
 
+    @property
+    def pending_request_count(self) -> int:
+        """Return number of requests still waiting for a response."""
+        return len(self._pending_requests)
+
     @property
     def challenge_nonce(self) -> Optional[str]:
         """Return the challenge nonce received from gateway."""
@@ -217,7 +255,10 @@ class OpenClawClient:
 
         try:
             logger.debug(f"Sending request: method={method} id={request_id[:8]}...")
-            await self._ws.send(json.dumps(frame))
+            data = json.dumps(frame)
+            send_started = time.monotonic()
+            await self._ws.send(data)
+            self.metrics.record_send(len(data), time.monotonic() - send_started)
 
             response = await asyncio.wait_for(future, timeout=timeout)
 
@@ -243,6 +284,7 @@ class OpenClawClient:
                 return
 
             async for message in self._ws:
+                self.metrics.record_receive(len(message))
                 try:
                     frame = json.loads(message)
                     await self._frame_handler.handle_frame(frame)
@@ -9,6 +9,7 @@ Environment Variables:
 - OPENCLAW_PLATFORM: Platform identifier (default: backend)
 - OPENCLAW_KEYPAIR_PATH: Path to device keypair JSON
 - OPENCLAW_TOKEN_CACHE_PATH: Path to token cache JSON
+- OPENCLAW_POOL_SIZE: Gateway connections shared by all sessions (default: 1)
 """
 
 import logging
@@ -19,6 +20,18 @@ from typing import Optional
 logger = logging.getLogger(__name__)
 
 
+def _int_env(name: str, default: int) -> int:
+    """Read an integer environment variable, falling back on bad values."""
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        logger.warning("Invalid %s=%r, using %d", name, raw, default)
+        return default
+
+
 @dataclass
 class OpenClawConfig:
     """OpenClaw Gateway configuration."""
@@ -31,6 +44,9 @@ class OpenClawConfig:
     keypair_path: str
     token_cache_path: str
     enabled: bool
+    # The gateway broadcasts every event to every connection, so each extra
+    # connection multiplies inbound traffic; keep the pool small.
+    pool_size: int = 1
 
     @classmethod
     def from_env(cls) -> "OpenClawConfig":
@@ -52,6 +68,7 @@ class OpenClawConfig:
                 "config/openclaw/device_tokens.json",
             ),
             enabled=os.getenv("OPENCLAW_ENABLED", "true").lower() == "true",
+            pool_size=_int_env("OPENCLAW_POOL_SIZE", 1),
         )
 
     def validate(self) -> list[str]:
@@ -62,6 +79,8 @@ class OpenClawConfig:
                 errors.append("OPENCLAW_GATEWAY_TOKEN is required when enabled")
             if not self.gateway_url:
                 errors.append("OPENCLAW_GATEWAY_URL is required")
+            if self.pool_size < 1:
+                errors.append("OPENCLAW_POOL_SIZE must be at least 1")
         return errors
 
 
@@ -79,9 +98,10 @@ def get_openclaw_config() -> OpenClawConfig:
                 logger.error("OpenClaw config validation failed: %s", errors)
             else:
                 logger.info(
-                    "OpenClaw enabled: url=%s, client=%s",
+                    "OpenClaw enabled: url=%s, client=%s, pool_size=%d",
                     _config.gateway_url,
                     _config.client_id,
+                    _config.pool_size,
                 )
         else:
             logger.debug("OpenClaw disabled")
@@ -0,0 +1,129 @@
+"""Pool of OpenClaw Gateway connections.
+
+Every event frame is handled inline by the receiving client's loop, so one
+shared WebSocket serialises all sessions: a slow callback (TTS, mobile push)
+or a large ``chat.send`` with attachments holds up every other stream.
+The pool spreads runs over a few connections, assigning each new run to the
+least-loaded live connection and remembering the owner so that requests for
+the run (``chat.abort``) and its events stay on that connection.
+
+The gateway broadcasts events to every connected client, so each connection
+also sees events for runs it does not own; the adapter drops those after a
+single dict lookup.
+"""
+
+import logging
+from dataclasses import asdict
+from typing import Any, Optional, Sequence
+
+from .client import OpenClawClient
+from .exceptions import OpenClawError
+
+logger = logging.getLogger(__name__)
+
+
+class OpenClawConnectionPool:
+    """Fixed set of connection slots with run ownership tracking.
+
+    Slots may be empty or disconnected while the session manager reconnects
+    them; they are skipped when new runs are assigned.
+    """
+
+    def __init__(self, clients: Sequence[Optional[OpenClawClient]]):
+        """Initialize the pool.
+
+        Args:
+            clients: One entry per slot (``None`` for a slot not yet connected)
+        """
+        if not clients:
+            raise ValueError("Connection pool needs at least one slot")
+        self._clients: list[Optional[OpenClawClient]] = list(clients)
+        self._runs: list[set[str]] = [set() for _ in self._clients]
+        self._owners: dict[str, int] = {}
+
+    @property
+    def size(self) -> int:
+        """Return number of connection slots."""
+        return len(self._clients)
+
+    def client(self, slot: int) -> Optional[OpenClawClient]:
+        """Return the client in ``slot`` (may be None)."""
+        return self._clients[slot]
+
+    def attach(self, slot: int, client: Optional[OpenClawClient]) -> None:
+        """Place ``client`` in ``slot``, replacing any previous one."""
+        self._clients[slot] = client
+
+    def load(self, slot: int) -> int:
+        """Return number of runs assigned to ``slot``."""
+        return len(self._runs[slot])
+
+    def acquire(self, run_id: str) -> OpenClawClient:
+        """Assign ``run_id`` to the least-loaded connected slot.
+
+        Raises:
+            OpenClawError: If no slot has a connected client
+        """
+        live = [
+            slot
+            for slot, client in enumerate(self._clients)
+            if client is not None and client.connected
+        ]
+        if not live:
+            raise OpenClawError("No connected OpenClaw gateway connection")
+        slot = min(live, key=lambda index: (len(self._runs[index]), index))
+        self._runs[slot].add(run_id)
+        self._owners[run_id] = slot
+        return self._clients[slot]  # type: ignore[return-value]
+
+    def rebind(self, old_run_id: str, new_run_id: str) -> None:
+        """Move ownership when the gateway assigns its own run id."""
+        slot = self._owners.pop(old_run_id, None)
+        if slot is None:
+            return
+        self._runs[slot].discard(old_run_id)
+        self._runs[slot].add(new_run_id)
+        self._owners[new_run_id] = slot
+
+    def release(self, run_id: str) -> None:
+        """Forget ``run_id`` (no-op for unknown runs)."""
+        slot = self._owners.pop(run_id, None)
+        if slot is not None:
+            self._runs[slot].discard(run_id)
+
+    def release_all(self) -> None:
+        """Forget every run."""
+        self._owners.clear()
+        for runs in self._runs:
+            runs.clear()
+
+    def owner(self, run_id: str) -> Optional[int]:
+        """Return the slot that owns ``run_id``, if assigned through the pool."""
+        return self._owners.get(run_id)
+
+    def client_for(self, run_id: str) -> Optional[OpenClawClient]:
+        """Return the client owning ``run_id``, if assigned through the pool."""
+        slot = self._owners.get(run_id)
+        return None if slot is None else self._clients[slot]
+
+    def run_ids(self, slot: int) -> list[str]:
+        """Return run ids assigned to ``slot``."""
+        return list(self._runs[slot])
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Return per-connection load and flow-control metrics."""
+        stats = []
+        for slot, client in enumerate(self._clients):
+            entry: dict[str, Any] = {
+                "slot": slot,
+                "connected": bool(client is not None and client.connected),
+                "active_runs": len(self._runs[slot]),
+            }
+            if client is not None:
+                entry["pending_requests"] = client.pending_request_count
+                entry.update(asdict(client.metrics))
+            stats.append(entry)
+        return stats
+
+
+__all__ = ["OpenClawConnectionPool"]
@@ -1,8 +1,8 @@
 """OpenClaw shared connection manager.
 
-Manages a single shared WebSocket connection to OpenClaw Gateway that serves
-all sessions and users. Handles connection lifecycle, reconnection, and
-event dispatching.
+Manages a small pool of WebSocket connections to OpenClaw Gateway
+(``OPENCLAW_POOL_SIZE``) shared by all sessions and users. Handles connection
+lifecycle, per-connection reconnection, and event dispatching.
 
 Usage:
     manager = get_openclaw_session_manager()
@@ -12,23 +12,25 @@ Usage:
 
 import asyncio
 import logging
+from functools import partial
 from typing import Any, Optional
 
 from .adapter import OpenClawAdapter
 from .auth import DeviceAuth
 from .client import OpenClawClient, OpenClawError, ProtocolError
 from .config import OpenClawConfig, get_openclaw_config
+from .connection_pool import OpenClawConnectionPool
 
 logger = logging.getLogger(__name__)
 
 
 class OpenClawSessionManager:
-    """Manages a single shared OpenClaw WebSocket connection.
+    """Manages the shared pool of OpenClaw WebSocket connections.
 
     Features:
     - Lazy connection on first use
-    - Automatic reconnection on disconnect
-    - Event dispatching to adapter
+    - Automatic reconnection of dropped connections
+    - Event dispatching to adapter (tagged with the receiving connection)
     - Thread-safe connection management
     """
 
@@ -42,7 +44,7 @@ class OpenClawSessionManager:
             config: OpenClaw configuration
         """
         self._config = config
-        self._client: Optional[OpenClawClient] = None
+        self._pool = OpenClawConnectionPool([None] * max(1, config.pool_size))
         self._adapter: Optional[OpenClawAdapter] = None
         self._auth: Optional[DeviceAuth] = None
         self._connect_lock = asyncio.Lock()
@@ -51,10 +53,30 @@ class OpenClawSessionManager:
         self._reconnect_task: Optional[asyncio.Task[None]] = None
         self._device_token: Optional[str] = None
 
+    @property
+    def _client(self) -> Optional[OpenClawClient]:
+        """Return the client in the first pool slot."""
+        return self._pool.client(0)
+
+    @_client.setter
+    def _client(self, client: Optional[OpenClawClient]) -> None:
+        self._pool.attach(0, client)
+
     @property
     def connected(self) -> bool:
-        """Return True if connected and handshake completed."""
-        return self._connected and self._client is not None and self._client.connected
+        """Return True if at least one connection has completed its handshake."""
+        return self._connected and any(
+            self._slot_connected(slot) for slot in range(self._pool.size)
+        )
+
+    def _slot_connected(self, slot: int) -> bool:
+        """Return True if the client in ``slot`` has completed its handshake."""
+        client = self._pool.client(slot)
+        return client is not None and client.connected
+
+    def connection_stats(self) -> list[dict[str, Any]]:
+        """Return per-connection load and flow-control metrics."""
+        return self._pool.stats()
 
     async def get_adapter(self) -> OpenClawAdapter:
         """Get the OpenClaw adapter, connecting if necessary.
@@ -90,8 +112,44 @@ class OpenClawSessionManager:
                 self._connecting = False
 
     async def _connect(self) -> None:
-        """Establish connection to OpenClaw Gateway."""
-        logger.info("Connecting to OpenClaw Gateway: %s", self._config.gateway_url)
+        """Connect every pool slot that is not connected.
+
+        Slots that fail are retried by the reconnect loop as long as at least
+        one connection is up; if none is, the last error is raised.
+        """
+        last_error: Optional[Exception] = None
+        failed = 0
+        for slot in range(self._pool.size):
+            if self._slot_connected(slot):
+                continue
+            try:
+                await self._connect_slot(slot)
+            except Exception as e:
+                logger.error("OpenClaw connection %d failed: %s", slot, e)
+                last_error = e
+                failed += 1
+
+        if last_error is not None and not any(
+            self._slot_connected(slot) for slot in range(self._pool.size)
+        ):
+            raise last_error
+
+        # Adapter survives slot reconnects: runs on other connections stay live
+        if self._adapter is None:
+            self._adapter = OpenClawAdapter(self._pool)
+        self._connected = True
+
+        if failed:
+            self._schedule_reconnect()
+
+    async def _connect_slot(self, slot: int) -> None:
+        """Establish one pool connection to OpenClaw Gateway."""
+        logger.info(
+            "Connecting to OpenClaw Gateway: %s (connection %d/%d)",
+            self._config.gateway_url,
+            slot + 1,
+            self._pool.size,
+        )
 
         # Initialize auth if needed
         if self._auth is None:
@@ -106,15 +164,19 @@ class OpenClawSessionManager:
         self._device_token = self._auth.get_cached_token()
 
         # Create client
-        self._client = OpenClawClient(
+        client = OpenClawClient(
             url=self._config.gateway_url,
-            on_event=self._handle_event,
+            on_event=partial(self._handle_event, connection=slot),
             on_connected=self._handle_connected,
-            on_disconnected=self._handle_disconnected,
+            on_disconnected=partial(self._handle_disconnected, connection=slot),
         )
+        previous = self._pool.client(slot)
+        if previous is not None:
+            await previous.close()
+        self._pool.attach(slot, client)
 
         # Connect and get challenge nonce
-        nonce = await self._client.connect()
+        nonce = await client.connect()
 
         # Build connect params with signature
         connect_params = self._auth.build_connect_params(
@@ -127,7 +189,7 @@ class OpenClawSessionManager:
         )
 
         # Complete handshake
-        hello_response = await self._client.handshake(connect_params)
+        hello_response = await client.handshake(connect_params)
 
         # Cache device token for future connections
         new_token = hello_response.get("deviceToken")
@@ -136,33 +198,42 @@ class OpenClawSessionManager:
             self._device_token = new_token
             logger.info("Cached new device token")
 
-        # Create adapter
-        self._adapter = OpenClawAdapter(self._client)
-        self._connected = True
-
         logger.info(
-            "OpenClaw connected: server=%s, device=%s",
+            "OpenClaw connected (connection %d): server=%s, device=%s",
+            slot,
             hello_response.get("server", {}).get("displayName", "unknown"),
             self._auth.device_id[:16] + "...",
         )
 
-    async def _handle_event(self, event: dict[str, Any]) -> None:
+    async def _handle_event(self, event: dict[str, Any], connection: Optional[int] = None) -> None:
         """Handle events from OpenClaw Gateway."""
         if self._adapter is not None:
-            await self._adapter.handle_event(event)
+            await self._adapter.handle_event(event, connection=connection)
 
     async def _handle_connected(self, payload: dict[str, Any]) -> None:
         """Handle successful connection."""
         logger.debug("OpenClaw connected callback: %s", payload.get("server", {}))
 
-    async def _handle_disconnected(self, error: Optional[Exception]) -> None:
-        """Handle disconnection - force-complete active streams and reconnect."""
-        self._connected = False
-        logger.warning("OpenClaw disconnected: %s", error)
+    async def _handle_disconnected(
+        self,
+        error: Optional[Exception],
+        connection: Optional[int] = None,
+    ) -> None:
+        """Handle disconnection - force-complete the connection's streams and reconnect.
+
+        Args:
+            error: Error that closed the connection, if any
+            connection: Pool slot that dropped (None: treat every stream as lost)
+        """
+        if connection is None or not any(
+            self._slot_connected(slot) for slot in range(self._pool.size) if slot != connection
+        ):
+            self._connected = False
+        logger.warning("OpenClaw disconnected (connection %s): %s", connection, error)
 
         # Force-complete active streams to save accumulated content
         if self._adapter is not None:
-            active_run_ids = self._adapter.get_active_run_ids()
+            active_run_ids = self._adapter.get_active_run_ids(connection)
             if active_run_ids:
                 logger.warning(
                     "Force-completing %d active streams due to disconnect",
@@ -179,7 +250,10 @@ class OpenClawSessionManager:
                         # Still try to clean up
                         self._adapter.cleanup_stream(run_id)
 
-        # Schedule reconnect
+        self._schedule_reconnect()
+
+    def _schedule_reconnect(self) -> None:
+        """Start the reconnect loop unless it is already running."""
         if self._reconnect_task is None or self._reconnect_task.done():
             self._reconnect_task = asyncio.create_task(self._reconnect_loop())
 
@@ -200,12 +274,15 @@ class OpenClawSessionManager:
             await asyncio.sleep(delay)
 
             try:
-                await self._connect()
-                logger.info("OpenClaw reconnected successfully")
-                return
+                async with self._connect_lock:
+                    await self._connect()
             except Exception as e:
                 logger.error("OpenClaw reconnect failed: %s", e)
-                delay = min(delay * 2, 60.0)
+            else:
+                if all(self._slot_connected(slot) for slot in range(self._pool.size)):
+                    logger.info("OpenClaw reconnected successfully")
+                    return
+            delay = min(delay * 2, 60.0)
 
         logger.error(
             "OpenClaw reconnect failed after %d attempts", self.MAX_RECONNECT_ATTEMPTS
@@ -221,9 +298,12 @@ class OpenClawSessionManager:
                 # RuntimeError can occur if event loop is closed
                 pass
 
-        if self._client is not None:
-            await self._client.close()
-            self._client = None
+        for slot in range(self._pool.size):
+            client = self._pool.client(slot)
+            if client is not None:
+                await client.close()
+                self._pool.attach(slot, None)
+        self._pool.release_all()
 
         self._adapter = None
         self._connected = False
@@ -0,0 +1,88 @@
+"""Indexed registry of active OpenClaw streams.
+
+The adapter used to keep a plain ``run_id -> StreamContext`` dict and scan it
+to find a session's run, the orphans of a steered run, or stale streams.
+``StreamRegistry`` is still a mapping keyed by run id, but it also keeps:
+
+- a ``session_id -> run ids`` index (oldest run first), and
+- the runs ordered by last activity, so stale streams are found by walking
+  the idle end of the order and stopping at the first live one.
+"""
+
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Iterator
+
+from .stream_types import StreamContext
+
+
+class StreamRegistry(MutableMapping[str, StreamContext]):
+    """``run_id -> StreamContext`` mapping with session and activity indexes."""
+
+    def __init__(self) -> None:
+        # Least recently active first; see touch()
+        self._streams: OrderedDict[str, StreamContext] = OrderedDict()
+        self._by_session: dict[str, dict[str, None]] = {}
+
+    def __getitem__(self, run_id: str) -> StreamContext:
+        return self._streams[run_id]
+
+    def __setitem__(self, run_id: str, context: StreamContext) -> None:
+        if run_id in self._streams:
+            self._unindex(run_id)
+        self._streams[run_id] = context
+        self._streams.move_to_end(run_id)
+        self._by_session.setdefault(context.session_id, {})[run_id] = None
+
+    def __delitem__(self, run_id: str) -> None:
+        self._unindex(run_id)
+        del self._streams[run_id]
+
+    def __contains__(self, run_id: object) -> bool:
+        return run_id in self._streams
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._streams)
+
+    def __len__(self) -> int:
+        return len(self._streams)
+
+    def clear(self) -> None:
+        self._streams.clear()
+        self._by_session.clear()
+
+    def _unindex(self, run_id: str) -> None:
+        session_id = self._streams[run_id].session_id
+        runs = self._by_session.get(session_id)
+        if runs is not None:
+            runs.pop(run_id, None)
+            if not runs:
+                del self._by_session[session_id]
+
+    def run_ids_for_session(self, session_id: str) -> list[str]:
+        """Return the session's active run ids, oldest first."""
+        return list(self._by_session.get(session_id, ()))
+
+    def first_run_for_session(self, session_id: str) -> str | None:
+        """Return the session's oldest active run id, if any."""
+        return next(iter(self._by_session.get(session_id, ())), None)
+
+    def touch(self, run_id: str) -> None:
+        """Record activity on a run and move it to the fresh end of the order."""
+        self._streams[run_id].touch()
+        self._streams.move_to_end(run_id)
+
+    def stale_run_ids(self, timeout_seconds: float) -> list[str]:
+        """Return runs idle for longer than ``timeout_seconds``.
+
+        Only the idle prefix of the activity order is visited.
+        """
+        stale = []
+        for run_id, context in self._streams.items():
+            if context.idle_seconds() <= timeout_seconds:
+                break
+            stale.append(run_id)
+        return stale
+
+
+__all__ = ["StreamRegistry"]
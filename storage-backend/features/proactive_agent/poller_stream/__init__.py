@@ -4,7 +4,7 @@ from .error_mapper import ERROR_MESSAGES, get_user_friendly_error
 from .event_emitter import EventEmitter, StreamSession
 from .heartbeat_emitter import HeartbeatEmitter
 from .marker_detector import DetectedMarker, MarkerDetector, MarkerResult, MarkerType
-from .ndjson_parser import EventType, NDJSONLineParser, ParsedEvent
+from .ndjson_parser import EventType, NDJSONLineParser, ParsedEvent, coalesce_events
 from .schemas import CompleteMessage, ErrorMessage, InitMessage
 from .special_event_handlers import (
     handle_chart_event,
@@ -13,6 +13,7 @@ from .special_event_handlers import (
     handle_scene_event,
 )
 from .stream_session import PollerStreamSession
+from .tag_scanner import TagScanner
 from .thinking_parser import ChunkType, ParsedChunk, ThinkingParser
 from .tool_tracker import ToolInfo, ToolTracker
 from .websocket_handler import router as poller_stream_router
@@ -40,9 +41,11 @@ __all__ = [
     "NDJSONLineParser",
     "ParsedChunk",
     "ParsedEvent",
+    "TagScanner",
     "ThinkingParser",
     "ToolInfo",
     "ToolTracker",
+    "coalesce_events",
     # Schemas
     "CompleteMessage",
     "ErrorMessage",
@@ -80,6 +80,19 @@ class EventEmitter:
         self._stream_started = False
         self._error_emitted = False
 
+        # Dispatch table built once per stream rather than per event
+        self._handlers = {
+            EventType.TEXT_CHUNK: self._emit_text_chunk,
+            EventType.THINKING_CHUNK: self._emit_thinking_chunk,
+            EventType.TOOL_START: self._emit_tool_start,
+            EventType.TOOL_RESULT: self._emit_tool_result,
+            EventType.CHART_DETECTED: self._handle_chart,
+            EventType.RESEARCH_DETECTED: self._handle_research,
+            EventType.SCENE_DETECTED: self._handle_scene,
+            EventType.COMPONENT_UPDATE_DETECTED: self._handle_component_update,
+            EventType.SESSION_ID: self._update_session_id,
+        }
+
     async def emit(self, event: ParsedEvent) -> None:
         """Emit a parsed event to frontends via existing handlers."""
         # Log parse errors (don't silently drop them)
@@ -99,17 +112,7 @@ class EventEmitter:
             self._stream_started = True
 
         # Route event to appropriate handler
-        handler = {
-            EventType.TEXT_CHUNK: self._emit_text_chunk,
-            EventType.THINKING_CHUNK: self._emit_thinking_chunk,
-            EventType.TOOL_START: self._emit_tool_start,
-            EventType.TOOL_RESULT: self._emit_tool_result,
-            EventType.CHART_DETECTED: self._handle_chart,
-            EventType.RESEARCH_DETECTED: self._handle_research,
-            EventType.SCENE_DETECTED: self._handle_scene,
-            EventType.COMPONENT_UPDATE_DETECTED: self._handle_component_update,
-            EventType.SESSION_ID: self._update_session_id,
-        }.get(event.type)
+        handler = self._handlers.get(event.type)
 
         if handler:
             await handler(event.data)
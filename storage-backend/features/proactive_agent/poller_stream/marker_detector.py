@@ -1,10 +1,13 @@
 """Detector for extracting special markers from tool result content."""
 
 import json
+from bisect import bisect_left
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
+from .tag_scanner import TagScanner
+
 
 class MarkerType(Enum):
     CHART = "chart"
@@ -27,7 +30,12 @@ class MarkerResult:
 
 
 class MarkerDetector:
-    """Detects and extracts special markers from tool result content."""
+    """Detects and extracts special markers from tool result content.
+
+    All start and end tags are located in one pass with a shared
+    :class:`TagScanner`; the cleaned content is assembled once from the
+    spans between markers.
+    """
 
     CHART_START, CHART_END = "[SHERLOCK_CHART:v1]", "[/SHERLOCK_CHART]"
     RESEARCH_START, RESEARCH_END = "[SHERLOCK_RESEARCH:v1]", "[/SHERLOCK_RESEARCH]"
@@ -35,58 +43,61 @@ class MarkerDetector:
     COMPONENT_UPDATE_START = "[SHERLOCK_COMPONENT_UPDATE:v1]"
     COMPONENT_UPDATE_END = "[/SHERLOCK_COMPONENT_UPDATE]"
 
+    _MARKER_PREFIX = "[SHERLOCK_"
+
+    # start tag -> (end tag, type); insertion order is the order markers are reported in
+    _PAIRS = {
+        CHART_START: (CHART_END, MarkerType.CHART),
+        RESEARCH_START: (RESEARCH_END, MarkerType.RESEARCH),
+        SCENE_START: (SCENE_END, MarkerType.SCENE),
+        COMPONENT_UPDATE_START: (COMPONENT_UPDATE_END, MarkerType.COMPONENT_UPDATE),
+    }
+    _TYPE_ORDER = {mtype: rank for rank, (_, mtype) in enumerate(_PAIRS.values())}
+    _SCANNER = TagScanner([*_PAIRS, *(end for end, _ in _PAIRS.values())])
+    _START_SCANNER = TagScanner(_PAIRS)
+
     def detect(self, content: str) -> MarkerResult:
         """Detect all markers in content and return cleaned content."""
         if not content:
             return MarkerResult(markers=[], cleaned_content="")
-        markers: list[DetectedMarker] = []
-        cleaned = content
-        for start, end, mtype in [
-            (self.CHART_START, self.CHART_END, MarkerType.CHART),
-            (self.RESEARCH_START, self.RESEARCH_END, MarkerType.RESEARCH),
-            (self.SCENE_START, self.SCENE_END, MarkerType.SCENE),
-            (self.COMPONENT_UPDATE_START, self.COMPONENT_UPDATE_END, MarkerType.COMPONENT_UPDATE),
-        ]:
-            markers.extend(self._extract_markers(cleaned, start, end, mtype))
-            cleaned = self._remove_markers(cleaned, start, end)
-        return MarkerResult(markers=markers, cleaned_content=cleaned)
+        tags = [(m.start(), m.end(), m.group()) for m in self._SCANNER.finditer(content)]
+        if not tags:
+            return MarkerResult(markers=[], cleaned_content=content)
 
-    def has_markers(self, content: str) -> bool:
-        """Quick check if content might contain markers."""
-        return (
-            self.CHART_START in content
-            or self.RESEARCH_START in content
-            or self.SCENE_START in content
-            or self.COMPONENT_UPDATE_START in content
-        )
-
-    def _extract_markers(
-        self, content: str, start_tag: str, end_tag: str, marker_type: MarkerType
-    ) -> list[DetectedMarker]:
-        markers, pos = [], 0
-        while True:
-            start = content.find(start_tag, pos)
-            if start == -1:
-                break
-            end = content.find(end_tag, start + len(start_tag))
-            if end == -1:
-                break
-            raw_json = content[start + len(start_tag):end].strip()
+        end_positions: dict[str, list[int]] = {}
+        for start, _, tag in tags:
+            if tag not in self._PAIRS:
+                end_positions.setdefault(tag, []).append(start)
+
+        markers: list[DetectedMarker] = []
+        pieces: list[str] = []
+        cursor = 0
+        for start, body_start, tag in tags:
+            pair = self._PAIRS.get(tag)
+            if pair is None or start < cursor:
+                continue
+            end_tag, marker_type = pair
+            ends = end_positions.get(end_tag, [])
+            index = bisect_left(ends, body_start)
+            if index == len(ends):
+                continue  # unclosed - left in the content as-is
+            body_end = ends[index]
+            raw_json = content[body_start:body_end].strip()
             try:
                 markers.append(DetectedMarker(marker_type, json.loads(raw_json), raw_json))
             except json.JSONDecodeError:
                 pass
-            pos = end + len(end_tag)
-        return markers
-
-    def _remove_markers(self, content: str, start_tag: str, end_tag: str) -> str:
-        result = content
-        while True:
-            start = result.find(start_tag)
-            if start == -1:
-                break
-            end = result.find(end_tag, start)
-            if end == -1:
-                break
-            result = result[:start] + result[end + len(end_tag):]
-        return result
+            pieces.append(content[cursor:start])
+            cursor = body_end + len(end_tag)
+        pieces.append(content[cursor:])
+
+        # Report grouped by type (charts, research, scenes, updates) as before
+        markers.sort(key=lambda marker: self._TYPE_ORDER[marker.type])
+        return MarkerResult(markers=markers, cleaned_content="".join(pieces))
+
+    def has_markers(self, content: str) -> bool:
+        """Quick check if content might contain markers."""
+        # One scan for the shared prefix rejects ordinary tool output
+        if self._MARKER_PREFIX not in content:
+            return False
+        return next(self._START_SCANNER.finditer(content), None) is not None
@@ -3,7 +3,16 @@
 import json
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from typing import Any, Callable, Iterable
+
+try:  # pragma: no cover - optional dependency guard
+    import orjson
+
+    _loads: Callable[[str], Any] = orjson.loads
+    _DECODE_ERRORS: tuple[type[Exception], ...] = (orjson.JSONDecodeError, json.JSONDecodeError)
+except ImportError:  # pragma: no cover - dependency guard
+    _loads = json.loads
+    _DECODE_ERRORS = (json.JSONDecodeError,)
 
 from .marker_detector import MarkerDetector, MarkerType
 from .thinking_parser import ChunkType, ThinkingParser
@@ -32,6 +41,27 @@ class ParsedEvent:
     data: dict[str, Any]
 
 
+_COALESCIBLE = frozenset({EventType.TEXT_CHUNK, EventType.THINKING_CHUNK})
+
+
+def coalesce_events(events: Iterable[ParsedEvent]) -> list[ParsedEvent]:
+    """Merge adjacent text (or thinking) chunks into one event, preserving order.
+
+    A burst of deltas then costs one push and one StreamingManager hop
+    instead of one per delta.
+    """
+    merged: list[ParsedEvent] = []
+    for event in events:
+        if merged and event.type in _COALESCIBLE and merged[-1].type is event.type:
+            previous = merged[-1]
+            merged[-1] = ParsedEvent(
+                event.type, {"content": previous.data["content"] + event.data["content"]}
+            )
+        else:
+            merged.append(event)
+    return merged
+
+
 class NDJSONLineParser:
     """Parses Claude NDJSON stream lines into structured events."""
 
@@ -40,19 +70,26 @@ class NDJSONLineParser:
         self._tools = ToolTracker()
         self._markers = MarkerDetector()
         self._session_id: str | None = None
+        self._handlers: dict[str, Callable[[dict], list[ParsedEvent]]] = {
+            "system": self._system,
+            "stream_event": self._stream_event,
+            "assistant": self._assistant,
+            "user": self._user,
+            "result": self._result,
+        }
 
     def process_line(self, line: str) -> list[ParsedEvent]:
         """Process a single NDJSON line and return events."""
         if not line or not line.strip():
             return []
         try:
-            parsed = json.loads(line)
-        except json.JSONDecodeError:
+            parsed = _loads(line)
+        except _DECODE_ERRORS:
+            return [ParsedEvent(EventType.PARSE_ERROR, {"line": line})]
+        if not isinstance(parsed, dict):
             return [ParsedEvent(EventType.PARSE_ERROR, {"line": line})]
-        msg_type = parsed.get("type", "")
-        handlers = {"system": self._system, "stream_event": self._stream_event,
-                    "assistant": self._assistant, "user": self._user, "result": self._result}
-        return handlers.get(msg_type, lambda _: [])(parsed)
+        handler = self._handlers.get(parsed.get("type", ""))
+        return handler(parsed) if handler else []
 
     def _system(self, p: dict) -> list[ParsedEvent]:
         sid = p.get("session_id")
@@ -2,22 +2,29 @@
 
 Handles the producer/consumer pattern for processing NDJSON lines from
 the Claude CLI poller.
+
+Batching: a WebSocket frame may carry several NDJSON lines separated by
+``\n`` (one line per frame still works).  The consumer also drains frames
+that queued up while it was busy, parses the whole burst in one pass and
+merges adjacent text/thinking deltas before emitting, so tool-heavy runs are
+not bound by per-line push overhead.
 """
 
 import asyncio
 import logging
 import time
-from typing import Optional, Protocol
+from typing import Iterable, Optional, Protocol
 
 from fastapi import WebSocket, WebSocketDisconnect
 
 from config.proactive_agent import (
+    POLLER_STREAM_MAX_BATCH_FRAMES,
     POLLER_STREAM_QUEUE_SIZE,
     POLLER_STREAM_QUEUE_TIMEOUT,
 )
 
 from .error_mapper import get_user_friendly_error
-from .ndjson_parser import EventType, NDJSONLineParser
+from .ndjson_parser import EventType, NDJSONLineParser, ParsedEvent, coalesce_events
 from .schemas import CompleteMessage, ErrorMessage, InitMessage
 
 logger = logging.getLogger(__name__)
@@ -116,14 +123,24 @@ class PollerStreamSession:
                 self.queue.put_nowait(None)
 
     async def consumer(self) -> None:
-        """Process lines from queue."""
+        """Process frames from queue, draining any backlog into one batch."""
         try:
             while True:
-                line = await self.queue.get()
-                if line is None:
+                frame = await self.queue.get()
+                if frame is None:
                     break
-                await self._process_line(line)
-                if self._completed or self._error_emitted:
+                frames = [frame]
+                producer_done = False
+                while len(frames) < POLLER_STREAM_MAX_BATCH_FRAMES and not self.queue.empty():
+                    queued = self.queue.get_nowait()
+                    if queued is None:
+                        producer_done = True
+                        break
+                    frames.append(queued)
+                await self._process_lines(
+                    line for queued in frames for line in queued.split("\n")
+                )
+                if self._completed or self._error_emitted or producer_done:
                     break
         except Exception:
             logger.exception(f"Consumer error: session={self.session_id}")
@@ -131,9 +148,36 @@ class PollerStreamSession:
 
     async def _process_line(self, line: str) -> None:
         """Process a single line (ndjson, error, complete)."""
-        stripped = line.strip()
-        if not stripped:
+        await self._process_lines((line,))
+
+    async def _process_lines(self, lines: Iterable[str]) -> None:
+        """Process a batch of lines; parsed events are coalesced per batch.
+
+        Control messages (error/complete) flush the events parsed before them
+        and end the batch, exactly as they end the stream.
+        """
+        pending: list[ParsedEvent] = []
+        for line in lines:
+            stripped = line.strip()
+            if not stripped:
+                continue
+            if await self._process_stripped(stripped, pending):
+                return
+        await self._emit_events(pending)
+
+    async def _emit_events(self, events: list[ParsedEvent]) -> None:
+        if not events:
             return
+        # M6.7: Track first content and chunk count (per parsed event)
+        if self._first_content_time is None:
+            self._first_content_time = time.time()
+        self._chunk_count += len(events)
+        for event in coalesce_events(events):
+            await self.emitter.emit(event)
+        events.clear()
+
+    async def _process_stripped(self, stripped: str, pending: list[ParsedEvent]) -> bool:
+        """Handle one non-empty line; returns True when the stream ended."""
         self._last_line_time = time.time()
         self._last_line_preview = stripped[:200]
 
@@ -147,12 +191,13 @@ class PollerStreamSession:
                 try:
                     self._last_control_type = "error"
                     msg = ErrorMessage.model_validate_json(stripped)
+                    await self._emit_events(pending)
                     self._log_stream_error(msg.code, msg.message)
                     user_message = get_user_friendly_error(msg.code, msg.message)
                     await self.emitter.emit_error(msg.code, user_message)
                     self._error_emitted = True
                     self._closed = True
-                    return
+                    return True
                 except Exception:
                     pass  # Not a valid error message, treat as NDJSON
             elif '"type": "complete"' in stripped or '"type":"complete"' in stripped:
@@ -164,27 +209,22 @@ class PollerStreamSession:
                         self._last_line_preview,
                     )
                     msg = CompleteMessage.model_validate_json(stripped)
+                    await self._emit_events(pending)
                     await self._finalize(msg.exit_code)
-                    return
+                    return True
                 except Exception:
                     pass  # Not a valid complete message, treat as NDJSON
 
-        # Parse NDJSON line and emit events
+        # Parse NDJSON line; events are emitted when the batch is flushed
         events = self.parser.process_line(stripped)
-        stream_complete_seen = False
-        for event in events:
-            # M6.7: Track first content and chunk count
-            if self._first_content_time is None:
-                self._first_content_time = time.time()
-            self._chunk_count += 1
-            await self.emitter.emit(event)
-            if event.type == EventType.STREAM_COMPLETE:
-                stream_complete_seen = True
+        pending.extend(events)
 
-        if stream_complete_seen and not self._completed:
+        if not self._completed and any(e.type == EventType.STREAM_COMPLETE for e in events):
+            await self._emit_events(pending)
             self._last_control_type = "stream_complete"
             await self._finalize(0)
-            return
+            return True
+        return False
 
     async def _finalize(self, exit_code: int) -> None:
         """Finalize the stream."""
@@ -0,0 +1,43 @@
+"""Single-pass scanner for a fixed set of literal tags.
+
+Marker and thinking-tag detection used to search the content once per tag
+(and rebuild it after each removal).  ``TagScanner`` compiles every tag into
+one alternation, so a single left-to-right pass over the text finds all of
+them, and :meth:`TagScanner.partial_suffix` reports how much of a streamed
+delta must be carried over because it may be the start of a tag split
+across chunks.
+"""
+
+import re
+from typing import Iterable, Iterator
+
+
+class TagScanner:
+    """Finds occurrences of several literal tags in one pass."""
+
+    def __init__(self, tags: Iterable[str]) -> None:
+        self.tags = tuple(dict.fromkeys(tags))
+        if not self.tags or not all(self.tags):
+            raise ValueError("TagScanner needs at least one non-empty tag")
+        # Longest first, so a tag that prefixes another never shadows it
+        ordered = sorted(self.tags, key=len, reverse=True)
+        self._pattern = re.compile("|".join(re.escape(tag) for tag in ordered))
+        self._prefixes = {tag: frozenset(tag[:n] for n in range(1, len(tag))) for tag in self.tags}
+        self._any_prefix = frozenset().union(*self._prefixes.values())
+        self._max_partial = max(len(tag) for tag in self.tags) - 1
+
+    def finditer(self, text: str, pos: int = 0) -> Iterator[re.Match[str]]:
+        """Yield non-overlapping tag matches in ``text`` from ``pos``."""
+        return self._pattern.finditer(text, pos)
+
+    def partial_suffix(self, text: str, pos: int = 0, tag: str | None = None) -> int:
+        """Length of the longest suffix of ``text[pos:]`` that starts a tag.
+
+        Restricted to ``tag`` when given.  Callers hold that many characters
+        back until the next delta shows whether the tag completes.
+        """
+        prefixes = self._prefixes[tag] if tag is not None else self._any_prefix
+        for length in range(min(self._max_partial, len(text) - pos), 0, -1):
+            if text[-length:] in prefixes:
+                return length
+        return 0
@@ -3,6 +3,8 @@
 from dataclasses import dataclass
 from enum import Enum
 
+from .tag_scanner import TagScanner
+
 
 class ChunkType(Enum):
     TEXT = "text"
@@ -18,6 +20,8 @@ class ParsedChunk:
 OPENING_TAG = "<thinking>"
 CLOSING_TAG = "</thinking>"
 
+_TAGS = TagScanner((OPENING_TAG, CLOSING_TAG))
+
 
 class ThinkingParser:
     """
@@ -35,76 +39,60 @@ class ThinkingParser:
 
         final_chunks = parser.flush()
         clean_text = parser.get_clean_text()
+
+    Each delta is scanned once from left to right; only a possible partial
+    tag at its end is carried over to the next call.  Accumulated text is
+    kept as lists of pieces and joined on demand.
     """
 
     def __init__(self) -> None:
         """Initialize parser state."""
         self._in_thinking = False
         self._buffer = ""
-        self._accumulated_text = ""
-        self._accumulated_thinking = ""
-        self._accumulated_clean = ""
-        self._had_partial_tag = False
+        self._accumulated_text: list[str] = []
+        self._accumulated_thinking: list[str] = []
+        self._accumulated_clean: list[str] = []
 
     def process(self, text: str) -> list[ParsedChunk]:
         """Process incoming text chunk and return parsed chunks."""
         if not text:
             return []
 
-        self._accumulated_text += text
-        # Check if we have a partial tag before appending
-        tag = CLOSING_TAG if self._in_thinking else OPENING_TAG
-        self._had_partial_tag = self._partial_tag_length(tag) > 0
+        self._accumulated_text.append(text)
         self._buffer += text
         return self._parse_buffer()
 
+    def _awaited_tag(self) -> str:
+        return CLOSING_TAG if self._in_thinking else OPENING_TAG
+
     def _parse_buffer(self) -> list[ParsedChunk]:
         """Parse buffered content and emit complete chunks."""
         chunks = []
-        completed_partial = False
-        while True:
-            tag = CLOSING_TAG if self._in_thinking else OPENING_TAG
-            tag_pos = self._buffer.find(tag)
-
-            if tag_pos != -1:
-                # Found complete tag
-                before = self._buffer[:tag_pos]
-                if before:
-                    chunks.append(self._make_chunk(before))
-                self._in_thinking = not self._in_thinking
-                self._buffer = self._buffer[tag_pos + len(tag) :]
-                completed_partial = self._had_partial_tag
-                self._had_partial_tag = False
-            else:
-                # Check for partial tag at end
-                partial_len = self._partial_tag_length(tag)
-                if partial_len > 0:
-                    # Emit content before partial tag, keep partial buffered
-                    before = self._buffer[:-partial_len]
-                    if before:
-                        chunks.append(self._make_chunk(before))
-                    self._buffer = self._buffer[-partial_len:]
-                elif self._buffer:
-                    # Emit immediately regardless of mode (real-time streaming)
-                    chunks.append(self._make_chunk(self._buffer))
-                    self._buffer = ""
-                break
+        buffer, pos = self._buffer, 0
+        for match in _TAGS.finditer(buffer):
+            # The tag of the other mode is plain text (e.g. a stray closing tag)
+            if match.group() != self._awaited_tag():
+                continue
+            if match.start() > pos:
+                chunks.append(self._make_chunk(buffer[pos:match.start()]))
+            self._in_thinking = not self._in_thinking
+            pos = match.end()
+
+        # Emit immediately regardless of mode (real-time streaming), keeping
+        # only a partial tag at the end buffered
+        end = len(buffer) - _TAGS.partial_suffix(buffer, pos, self._awaited_tag())
+        if end > pos:
+            chunks.append(self._make_chunk(buffer[pos:end]))
+        self._buffer = buffer[end:]
         return chunks
 
-    def _partial_tag_length(self, tag: str) -> int:
-        """Return length of partial tag match at end of buffer."""
-        for length in range(min(len(tag) - 1, len(self._buffer)), 0, -1):
-            if tag.startswith(self._buffer[-length:]):
-                return length
-        return 0
-
     def _make_chunk(self, content: str) -> ParsedChunk:
         """Create chunk and update accumulators."""
         chunk_type = ChunkType.THINKING if self._in_thinking else ChunkType.TEXT
         if self._in_thinking:
-            self._accumulated_thinking += content
+            self._accumulated_thinking.append(content)
         else:
-            self._accumulated_clean += content
+            self._accumulated_clean.append(content)
         return ParsedChunk(chunk_type, content)
 
     def flush(self) -> list[ParsedChunk]:
@@ -117,21 +105,20 @@ class ThinkingParser:
 
     def get_accumulated_text(self) -> str:
         """Get full accumulated text INCLUDING <thinking> tags."""
-        return self._accumulated_text
+        return "".join(self._accumulated_text)
 
     def get_clean_text(self) -> str:
         """Get accumulated text with thinking content removed."""
-        return self._accumulated_clean
+        return "".join(self._accumulated_clean)
 
     def get_accumulated_thinking(self) -> str:
         """Get just the thinking content (without tags)."""
-        return self._accumulated_thinking
+        return "".join(self._accumulated_thinking)
 
     def reset(self) -> None:
         """Reset parser state for reuse."""
         self._in_thinking = False
         self._buffer = ""
-        self._accumulated_text = ""
-        self._accumulated_thinking = ""
-        self._accumulated_clean = ""
-        self._had_partial_tag = False
+        self._accumulated_text.clear()
+        self._accumulated_thinking.clear()
+        self._accumulated_clean.clear()
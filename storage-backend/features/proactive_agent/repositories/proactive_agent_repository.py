@@ -12,6 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from features.chat.db_models import ChatMessage, ChatSession
 from features.chat.repositories.chat_messages import ChatMessageRepository
 from features.chat.repositories.chat_sessions import ChatSessionRepository
+from features.proactive_agent.message_waiters import notify_after_commit
 
 from .converters import message_to_dict, session_to_dict
 
@@ -164,6 +165,10 @@ class ProactiveAgentRepository:
             update_last_mod_time=True,
         )
 
+        if sender == "AI":
+            # Long-poll and SSE clients wake up once this transaction commits.
+            notify_after_commit(self._session, session_id)
+
         logger.debug(
             "Created proactive agent message",
             extra={
@@ -228,6 +233,14 @@ class ProactiveAgentRepository:
             payload={"file_locations": file_locations},
         )
 
+    async def release_connection(self) -> None:
+        """End the current read transaction so the pooled connection is returned.
+
+        Long-poll requests call this before parking, so idle waiters do not
+        hold database connections.
+        """
+        await self._session.commit()
+
     async def get_new_agent_messages(
         self,
         session_id: str,
@@ -16,16 +16,21 @@ import logging
 from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 
 from config.proactive_agent import (
     API_VERSION,
     DEFAULT_CHARACTER_NAME,
     INTERNAL_API_KEY,
+    LONG_POLL_MAX_WAIT_SECONDS,
 )
 from core.exceptions import NotFoundError
 from core.pydantic_schemas import ApiResponse, ok as api_ok
-from features.proactive_agent.dependencies import get_proactive_agent_repository
+from features.proactive_agent.dependencies import (
+    get_proactive_agent_repository,
+    get_repository_opener,
+)
 from features.proactive_agent.poller_stream import poller_stream_router
 from features.proactive_agent.repositories import ProactiveAgentRepository
 from features.proactive_agent.schemas import (
@@ -34,6 +39,7 @@ from features.proactive_agent.schemas import (
 )
 from features.proactive_agent.schemas.response import SessionResponse
 from features.proactive_agent.service import ProactiveAgentService
+from features.proactive_agent.services.message_stream import stream_session_messages
 
 logger = logging.getLogger(__name__)
 
@@ -97,12 +103,20 @@ async def poll_new_messages(
     session_id: str,
     user_id: int = Query(..., description="User ID"),
     since: Optional[datetime] = Query(None, description="Get messages after this timestamp"),
+    wait: int = Query(
+        default=0,
+        ge=0,
+        le=LONG_POLL_MAX_WAIT_SECONDS,
+        description="Long-poll: seconds to wait for a new message when none is pending",
+    ),
     repository: ProactiveAgentRepository = Depends(get_proactive_agent_repository),
 ) -> dict:
     """
     Poll for new agent messages (lightweight endpoint for mobile polling).
 
-    Returns only new messages from the agent since the given timestamp.
+    Returns only new messages from the agent since the given timestamp. With
+    ``wait`` > 0 the request is held until a message arrives or ``wait``
+    seconds pass, so idle clients stop hammering the database.
     """
     service = _get_service(repository)
     try:
@@ -110,12 +124,54 @@ async def poll_new_messages(
             session_id=session_id,
             user_id=user_id,
             since=since,
+            wait=wait,
         )
         return api_ok("New messages retrieved", data=messages)
     except NotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
 
 
+@router.get("/messages/{session_id}/events")
+async def stream_new_messages(
+    session_id: str,
+    request: Request,
+    user_id: int = Query(..., description="User ID"),
+    since: Optional[datetime] = Query(None, description="Get messages after this timestamp"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    open_repository=Depends(get_repository_opener),
+) -> StreamingResponse:
+    """Server-sent events stream of new agent messages (push variant of /poll).
+
+    Ownership is checked on a short-lived session: a request-scoped one would
+    stay checked out for the whole stream.
+    """
+    try:
+        async with open_repository() as repository:
+            await _get_service(repository).ensure_session_owner(session_id, user_id)
+    except NotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+
+    if since is None and last_event_id:
+        try:
+            since = datetime.fromisoformat(last_event_id)
+        except ValueError:
+            logger.debug("Ignoring unparseable Last-Event-ID %r", last_event_id)
+
+    return StreamingResponse(
+        stream_session_messages(
+            session_id,
+            since,
+            open_repository,
+            is_disconnected=request.is_disconnected,
+        ),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @router.get("/session", response_model=ApiResponse[SessionResponse])
 async def get_or_create_session(
     user_id: int = Query(..., description="User ID"),
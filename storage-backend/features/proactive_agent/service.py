@@ -86,9 +86,19 @@ class ProactiveAgentService:
         session_id: str,
         user_id: int,
         since: Optional[datetime] = None,
+        wait: float = 0,
     ) -> list[dict[str, Any]]:
-        """Get new agent messages since a timestamp (for polling)."""
-        return await self._session_handler.get_new_messages(session_id, user_id, since)
+        """Get new agent messages since a timestamp (for polling).
+
+        ``wait`` > 0 long-polls for up to that many seconds.
+        """
+        return await self._session_handler.get_new_messages(
+            session_id, user_id, since, wait
+        )
+
+    async def ensure_session_owner(self, session_id: str, user_id: int) -> None:
+        """Raise NotFoundError unless the session belongs to the user."""
+        await self._session_handler.ensure_session_owner(session_id, user_id)
 
     async def get_session(
         self,
@@ -144,7 +144,7 @@ class ChartHandler:
             # Fetch data from database
             data_source = request.data_query.source
             fetcher = get_data_fetcher(data_source)
-            chart_data = await fetcher.fetch(request.data_query)
+            chart_data = await fetcher.fetch_cached(request.data_query, customer_id=request.user_id)
         elif request.data:
             # Use provided data directly
             data_source = DataSource.GENERATED
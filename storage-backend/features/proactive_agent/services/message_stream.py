@@ -0,0 +1,97 @@
+"""Server-sent event stream of new agent messages for one session.
+
+Push alternative to ``GET /messages/{session_id}/poll``: the stream queries
+once, then parks on the session's waiter and only touches the database again
+when a message has been committed (or a keepalive interval has passed).
+Each query uses its own short-lived session, so an open stream does not hold
+a pooled connection.
+
+Events:
+    ``event: message`` with the message dict as ``data``; the ``id`` is the
+    message's ``created_at`` so reconnecting clients can send it back as
+    ``Last-Event-ID`` (or ``since``) and resume without gaps.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+from config.proactive_agent import SSE_KEEPALIVE_SECONDS, SSE_MAX_DURATION_SECONDS
+from features.proactive_agent.message_waiters import message_waiters
+from features.proactive_agent.repositories import ProactiveAgentRepository
+
+logger = logging.getLogger(__name__)
+
+RepositoryOpener = Callable[[], AbstractAsyncContextManager[ProactiveAgentRepository]]
+
+
+def format_sse(data: Any, *, event: Optional[str] = None, event_id: Optional[str] = None) -> str:
+    """Encode one SSE frame."""
+    lines = []
+    if event_id:
+        lines.append(f"id: {event_id}")
+    if event:
+        lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+async def stream_session_messages(
+    session_id: str,
+    since: Optional[datetime],
+    open_repository: RepositoryOpener,
+    *,
+    is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+    keepalive: float = SSE_KEEPALIVE_SECONDS,
+    max_duration: float = SSE_MAX_DURATION_SECONDS,
+) -> AsyncIterator[str]:
+    """Yield SSE frames for agent messages newer than ``since``.
+
+    Session ownership must be checked by the caller before streaming starts.
+    """
+    cursor = since
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max_duration
+
+    with message_waiters.subscribe(session_id) as waiter:
+        fetch = True
+        while True:
+            if fetch:
+                async with open_repository() as repository:
+                    messages = await repository.get_new_agent_messages(
+                        session_id=session_id,
+                        since=cursor,
+                    )
+                    payloads = [repository.message_to_dict(m) for m in messages]
+                for message, payload in zip(messages, payloads):
+                    cursor = message.created_at or cursor
+                    yield format_sse(
+                        payload,
+                        event="message",
+                        event_id=cursor.isoformat() if cursor else None,
+                    )
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            if is_disconnected is not None and await is_disconnected():
+                logger.debug("SSE client for session %s disconnected", session_id)
+                return
+            try:
+                await asyncio.wait_for(waiter.wait(), timeout=min(keepalive, remaining))
+            except asyncio.TimeoutError:
+                fetch = False
+                yield ": keepalive\n\n"
+                continue
+            waiter.clear()
+            fetch = True
+
+    yield format_sse({"reason": "max_duration"}, event="close")
+
+
+__all__ = ["format_sse", "stream_session_messages"]
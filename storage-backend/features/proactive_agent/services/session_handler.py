@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 from typing import Any, Optional
 
 from core.exceptions import NotFoundError
+from features.proactive_agent.message_waiters import message_waiters
 from features.proactive_agent.repositories import ProactiveAgentRepository
 
 
@@ -50,8 +52,44 @@ class SessionHandler:
         session_id: str,
         user_id: int,
         since: Optional[datetime] = None,
+        wait: float = 0,
     ) -> list[dict[str, Any]]:
-        """Get new agent messages since a timestamp (for polling)."""
+        """Get new agent messages since a timestamp (for polling).
+
+        With ``wait`` > 0 this is a long poll: when nothing is new, the request
+        parks (without a DB connection) until a message for the session is
+        committed or ``wait`` seconds pass.
+        """
+        await self.ensure_session_owner(session_id, user_id)
+
+        with message_waiters.subscribe(session_id) as waiter:
+            messages = await self._repository.get_new_agent_messages(
+                session_id=session_id,
+                since=since,
+            )
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + wait
+            while not messages:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                await self._repository.release_connection()
+                try:
+                    await asyncio.wait_for(waiter.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    # Re-query once: the message may have been stored where no
+                    # wakeup reaches this worker.
+                    pass
+                waiter.clear()
+                messages = await self._repository.get_new_agent_messages(
+                    session_id=session_id,
+                    since=since,
+                )
+
+        return [self._repository.message_to_dict(m) for m in messages]
+
+    async def ensure_session_owner(self, session_id: str, user_id: int) -> None:
+        """Raise NotFoundError unless ``session_id`` exists and belongs to ``user_id``."""
         session = await self._repository.get_session_by_id(session_id)
         if not session:
             raise NotFoundError(f"Session {session_id} not found")
@@ -59,13 +97,6 @@ class SessionHandler:
         if session.customer_id != user_id:
             raise NotFoundError(f"Session {session_id} not found")
 
-        messages = await self._repository.get_new_agent_messages(
-            session_id=session_id,
-            since=since,
-        )
-
-        return [self._repository.message_to_dict(m) for m in messages]
-
     async def get_session(
         self,
         user_id: int,
@@ -12,6 +12,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 from core.connections import get_proactive_registry
+from core.streaming.audio_frames import audio_event_as_json
 
 if TYPE_CHECKING:
     from core.streaming.manager import StreamingManager
@@ -131,6 +132,9 @@ async def create_forwarder_task(
                 # Only forward TTS-related events
                 if event_type in TTS_EVENT_TYPES:
                     try:
+                        if event_type == "audio_chunk":
+                            # The proactive channel is JSON-only.
+                            event = audio_event_as_json(event)
                         if "session_id" not in event:
                             event = {**event, "session_id": session_id}
                         await registry.push_to_user(user_id, event)
@@ -2,15 +2,14 @@
 
 from __future__ import annotations
 
-import io
 import logging
-import wave
 from dataclasses import dataclass
 from typing import Callable
 
 from fastapi import WebSocket
 
 from core.exceptions import ServiceError
+from core.streaming.audio_buffer import AudioAccumulator
 from core.streaming.manager import StreamingManager
 from features.audio.schemas import (
     AudioAction,
@@ -34,7 +33,8 @@ from .validation import AudioValidationError, validate_audio_format
 
 logger = logging.getLogger(__name__)
 
-_PCM16_MIN_BYTES = 24_000 * 2  # One second of mono PCM16 audio
+_PCM16_SAMPLE_RATE = 24_000
+_PCM16_MIN_BYTES = _PCM16_SAMPLE_RATE * 2  # One second of mono PCM16 audio
 
 
 @dataclass(slots=True)
@@ -54,25 +54,6 @@ class RealtimeAudioFinaliser:
     streaming_manager: StreamingManager
     event_factory: RealtimeEventFactory
 
-    def _convert_pcm_to_wav(self, pcm_bytes: bytes, sample_rate: int = 24000) -> bytes:
-        """Convert raw PCM16 audio to WAV format.
-
-        Args:
-            pcm_bytes: Raw PCM16 audio data
-            sample_rate: Sample rate in Hz (default 24000 for OpenAI realtime)
-
-        Returns:
-            WAV formatted audio bytes
-        """
-        wav_buffer = io.BytesIO()
-        with wave.open(wav_buffer, "wb") as wav_file:
-            wav_file.setnchannels(1)  # Mono
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(pcm_bytes)
-        wav_buffer.seek(0)
-        return wav_buffer.read()
-
     async def process_audio(
         self,
         *,
@@ -84,19 +65,21 @@ class RealtimeAudioFinaliser:
     ) -> AudioProcessingResult:
         """Validate, upload, and optionally translate the turn audio."""
 
-        audio_bytes = turn_context.audio_bytes()
-        if not audio_bytes:
+        audio = turn_context.audio
+        if not audio:
             return AudioProcessingResult()
 
-        if not await self._validate_audio(
-            audio_bytes=audio_bytes,
-            websocket=websocket,
-            session_id=session_id,
-        ):
+        with audio.getbuffer() as audio_view:
+            is_valid = await self._validate_audio(
+                audio_bytes=audio_view,
+                websocket=websocket,
+                session_id=session_id,
+            )
+        if not is_valid:
             return AudioProcessingResult()
 
         audio_url = await self._upload_audio(
-            audio_bytes=audio_bytes,
+            audio=audio,
             customer_id=customer_id,
             websocket=websocket,
             session_id=session_id,
@@ -105,7 +88,7 @@ class RealtimeAudioFinaliser:
         translation_text: str | None = None
         if audio_url and self._should_translate(settings):
             translation_text = await self._translate_audio(
-                audio_bytes=audio_bytes,
+                audio_bytes=audio.to_bytes(),
                 customer_id=customer_id,
                 settings=settings,
                 websocket=websocket,
@@ -130,7 +113,7 @@ class RealtimeAudioFinaliser:
     async def _validate_audio(
         self,
         *,
-        audio_bytes: bytes,
+        audio_bytes: bytes | memoryview,
         websocket: WebSocket,
         session_id: str,
     ) -> bool:
@@ -157,22 +140,22 @@ class RealtimeAudioFinaliser:
     async def _upload_audio(
         self,
         *,
-        audio_bytes: bytes,
+        audio: AudioAccumulator,
         customer_id: int,
         websocket: WebSocket,
         session_id: str,
     ) -> str | None:
         try:
-            # Convert PCM to WAV format before uploading
-            wav_bytes = self._convert_pcm_to_wav(audio_bytes)
             storage = self.storage_service_factory()
-            return await storage.upload_audio(
-                audio_bytes=wav_bytes,
-                customer_id=customer_id,
-                file_extension="wav",
-                folder="assets/realtime",
-                content_type="audio/wav",
-            )
+            # Stream a WAV header followed by the PCM buffer; no WAV copy is built.
+            with audio.open_wav(sample_rate=_PCM16_SAMPLE_RATE) as wav_stream:
+                return await storage.upload_audio(
+                    audio_bytes=wav_stream,
+                    customer_id=customer_id,
+                    file_extension="wav",
+                    folder="assets/realtime",
+                    content_type="audio/wav",
+                )
         except Exception as exc:  # pragma: no cover - surfaced via websocket message
             error = audio_upload_failed_error(str(exc))
             logger.error(error.to_log_message())
@@ -7,6 +7,8 @@ import re
 from pathlib import Path
 from typing import Mapping
 
+from core.streaming.audio_buffer import AudioAccumulator
+
 
 @dataclass(slots=True)
 class RealtimeTurnContext:
@@ -16,7 +18,7 @@ class RealtimeTurnContext:
     user_transcript_parts: list[str] = field(default_factory=list)
     assistant_text_parts: list[str] = field(default_factory=list)
     assistant_transcript_parts: list[str] = field(default_factory=list)
-    audio_chunks: list[bytes] = field(default_factory=list)
+    audio: AudioAccumulator = field(default_factory=AudioAccumulator, repr=False)
     live_translation_text: str | None = None
     live_translation_parts: list[str] = field(default_factory=list, repr=False)
 
@@ -33,7 +35,7 @@ class RealtimeTurnContext:
         self.user_transcript_parts.clear()
         self.assistant_text_parts.clear()
         self.assistant_transcript_parts.clear()
-        self.audio_chunks.clear()
+        self.audio.clear()
         self.live_translation_text = None
         self.live_translation_parts.clear()
         self.ai_response_started = False
@@ -80,9 +82,12 @@ class RealtimeTurnContext:
         return " ".join(part for part in self.assistant_transcript_parts if part)
 
     def audio_bytes(self) -> bytes:
-        """Return the raw PCM audio generated for the current turn."""
+        """Return a copy of the raw PCM audio generated for the current turn.
+
+        Prefer ``audio.getbuffer()`` where a read-only view is enough.
+        """
 
-        return b"".join(self.audio_chunks)
+        return self.audio.to_bytes()
 
     def set_base_audio_filename(self, filename: str) -> None:
         """Persist the client supplied base filename for generated audio."""
@@ -5,6 +5,7 @@ import logging
 from fastapi import WebSocket
 
 from core.providers.realtime.base import RealtimeEvent, RealtimeEventType
+from core.streaming.audio_frames import AudioFrameEncoder, audio_bytes
 from core.streaming.manager import StreamingManager
 
 from .context import RealtimeTurnContext
@@ -40,6 +41,7 @@ async def handle_provider_event(
     event_factory: RealtimeEventFactory,
     metrics: RealtimeMetricsCollector | None = None,
     force_close: bool = False,
+    audio_frames: AudioFrameEncoder | None = None,
 ) -> bool:
     """Relay a provider event to the websocket client and update turn state."""
 
@@ -78,7 +80,8 @@ async def handle_provider_event(
         await websocket.send_json(ai_response_payload)
         turn_context.ai_response_started = True
 
-    await websocket.send_json(payload)
+    if not await _send_audio_frame(websocket, event, payload, audio_frames):
+        await websocket.send_json(payload)
 
     update_turn_state_from_event(
         event=event,
@@ -113,6 +116,29 @@ async def handle_provider_event(
     return should_close_session
 
 
+async def _send_audio_frame(
+    websocket: WebSocket,
+    event: RealtimeEvent,
+    payload: dict[str, object],
+    audio_frames: AudioFrameEncoder | None,
+) -> bool:
+    """Send an audio chunk as a binary frame when the client negotiated it."""
+
+    if audio_frames is None or payload.get("type") != "audio_chunk":
+        return False
+    audio = audio_bytes(payload.get("content"))
+    if not audio:
+        return False
+    await websocket.send_bytes(
+        audio_frames.encode(
+            audio,
+            audio_format=str(event.payload.get("format") or "pcm"),
+            stream_key=payload.get("response_id"),
+        )
+    )
+    return True
+
+
 async def _finalise_turn(
     *,
     websocket: WebSocket,
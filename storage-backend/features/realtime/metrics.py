@@ -1,9 +1,22 @@
-"""Prometheus metrics helpers for realtime websocket sessions."""
+"""Prometheus metrics helpers for realtime websocket sessions.
+
+Series are labelled by provider, model and outcome only, so the number of
+time series stays bounded no matter how many sessions run.  Per-session
+detail goes into histograms (duration, turns, audio volume) and into a
+bounded in-memory ring buffer of recently finished sessions, served by
+``GET /admin/realtime/sessions/recent``.
+"""
 
 from __future__ import annotations
 
+import threading
 import time
-from typing import Optional
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from typing import Any, Deque, Dict, List, Optional
+
+from config.realtime.defaults import METRICS_MAX_MODEL_LABELS, RECENT_SESSIONS_LIMIT
 
 try:  # pragma: no cover - optional dependency guard
     from prometheus_client import Counter, Gauge, Histogram  # type: ignore
@@ -12,11 +25,20 @@ except Exception:  # pragma: no cover - dependency guard
     Gauge = None  # type: ignore
     Histogram = None  # type: ignore
 
+OTHER_LABEL = "other"
+UNKNOWN_LABEL = "unknown"
+
+_SESSION_LABELS = ("provider", "model")
+_OUTCOME_LABELS = ("provider", "model", "outcome")
 
 _sessions_active: Optional["Gauge"]
 _sessions_total: Optional["Counter"]
+_sessions_finished: Optional["Counter"]
 _turns_total: Optional["Counter"]
 _turn_duration: Optional["Histogram"]
+_session_duration: Optional["Histogram"]
+_session_turns: Optional["Histogram"]
+_session_audio_bytes: Optional["Histogram"]
 _audio_received: Optional["Counter"]
 _audio_sent: Optional["Counter"]
 _errors_total: Optional["Counter"]
@@ -32,6 +54,7 @@ else:  # pragma: no cover - metrics registration
 
 if Counter is None:  # pragma: no cover - dependency guard
     _sessions_total = None
+    _sessions_finished = None
     _turns_total = None
     _audio_received = None
     _audio_sent = None
@@ -41,27 +64,32 @@ else:  # pragma: no cover - metrics registration
     _sessions_total = Counter(  # type: ignore[operator]
         "realtime_sessions_total",
         "Total number of realtime sessions started",
-        labelnames=("customer_id",),
+        labelnames=_SESSION_LABELS,
+    )
+    _sessions_finished = Counter(  # type: ignore[operator]
+        "realtime_sessions_finished_total",
+        "Total number of realtime sessions finished, by outcome",
+        labelnames=_OUTCOME_LABELS,
     )
     _turns_total = Counter(  # type: ignore[operator]
         "realtime_turns_total",
         "Total number of realtime turns completed",
-        labelnames=("session_id", "customer_id"),
+        labelnames=_SESSION_LABELS,
     )
     _audio_received = Counter(  # type: ignore[operator]
         "realtime_audio_bytes_received",
         "Total audio bytes received from clients",
-        labelnames=("session_id",),
+        labelnames=_SESSION_LABELS,
     )
     _audio_sent = Counter(  # type: ignore[operator]
         "realtime_audio_bytes_sent",
         "Total audio bytes sent to clients",
-        labelnames=("session_id",),
+        labelnames=_SESSION_LABELS,
     )
     _errors_total = Counter(  # type: ignore[operator]
         "realtime_errors_total",
         "Total number of realtime errors emitted",
-        labelnames=("error_code", "session_id"),
+        labelnames=("error_code", "provider"),
     )
     _provider_events = Counter(  # type: ignore[operator]
         "realtime_provider_events",
@@ -71,12 +99,34 @@ else:  # pragma: no cover - metrics registration
 
 if Histogram is None:  # pragma: no cover - dependency guard
     _turn_duration = None
+    _session_duration = None
+    _session_turns = None
+    _session_audio_bytes = None
 else:  # pragma: no cover - metrics registration
     _turn_duration = Histogram(  # type: ignore[operator]
         "realtime_turn_duration_seconds",
         "Duration of realtime turns",
+        labelnames=_SESSION_LABELS,
         buckets=(0.5, 1, 2, 5, 10, 30, 60),
     )
+    _session_duration = Histogram(  # type: ignore[operator]
+        "realtime_session_duration_seconds",
+        "Wall-clock duration of realtime sessions",
+        labelnames=_OUTCOME_LABELS,
+        buckets=(5, 15, 30, 60, 120, 300, 600, 1800, 3600),
+    )
+    _session_turns = Histogram(  # type: ignore[operator]
+        "realtime_session_turns",
+        "Completed turns per realtime session",
+        labelnames=_SESSION_LABELS,
+        buckets=(0, 1, 2, 5, 10, 20, 50, 100),
+    )
+    _session_audio_bytes = Histogram(  # type: ignore[operator]
+        "realtime_session_audio_bytes",
+        "Audio bytes exchanged per realtime session",
+        labelnames=("provider", "direction"),
+        buckets=(1e4, 1e5, 5e5, 1e6, 5e6, 1e7, 5e7),
+    )
 
 
 def _inc(counter: Optional["Counter"], *, value: float = 1.0, **labels) -> None:
@@ -90,23 +140,139 @@ def _inc(counter: Optional["Counter"], *, value: float = 1.0, **labels) -> None:
         counter.inc(value)
 
 
-def _observe(histogram: Optional["Histogram"], value: float) -> None:
+def _observe(histogram: Optional["Histogram"], value: float, **labels) -> None:
     """Observe histogram value when metric is enabled."""
 
     if histogram is None:  # pragma: no cover - optional dependency
         return
-    histogram.observe(value)
+    if labels:
+        histogram.labels(**labels).observe(value)
+    else:
+        histogram.observe(value)
+
+
+class BoundedLabelValues:
+    """Admit at most ``limit`` distinct values for a label; map the rest to ``other``.
+
+    Model names come from client settings, so they cannot be used as label
+    values verbatim without letting callers mint new time series.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self._limit = max(1, limit)
+        self._seen: set[str] = set()
+        self._lock = threading.Lock()
+
+    def __call__(self, value: Optional[str]) -> str:
+        normalised = (value or "").strip().lower() or UNKNOWN_LABEL
+        if normalised in self._seen:
+            return normalised
+        with self._lock:
+            if normalised in self._seen:
+                return normalised
+            if len(self._seen) >= self._limit:
+                return OTHER_LABEL
+            self._seen.add(normalised)
+            return normalised
+
+
+_model_label = BoundedLabelValues(METRICS_MAX_MODEL_LABELS)
+_provider_label = BoundedLabelValues(METRICS_MAX_MODEL_LABELS)
+
+
+@dataclass(slots=True)
+class RealtimeSessionSummary:
+    """Per-session record kept in the recent-sessions ring buffer."""
+
+    session_id: str
+    customer_id: int
+    provider: str
+    model: str
+    started_at: str
+    duration_seconds: float = 0.0
+    turns: int = 0
+    audio_bytes_received: int = 0
+    audio_bytes_sent: int = 0
+    errors: Dict[str, int] = field(default_factory=dict)
+    outcome: str = "active"
+    ended_at: Optional[str] = None
+
+
+class RecentRealtimeSessions:
+    """Thread-safe ring buffer of the most recently finished sessions."""
+
+    def __init__(self, limit: int = RECENT_SESSIONS_LIMIT) -> None:
+        self._sessions: Deque[RealtimeSessionSummary] = deque(maxlen=max(1, limit))
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        return self._sessions.maxlen or 0
+
+    def add(self, summary: RealtimeSessionSummary) -> None:
+        with self._lock:
+            self._sessions.append(summary)
+
+    def snapshot(
+        self,
+        *,
+        limit: Optional[int] = None,
+        customer_id: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return finished sessions, newest first."""
+
+        with self._lock:
+            sessions = list(self._sessions)
+        sessions.reverse()
+        if customer_id is not None:
+            sessions = [item for item in sessions if item.customer_id == customer_id]
+        if limit is not None:
+            sessions = sessions[: max(0, limit)]
+        return [asdict(item) for item in sessions]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sessions.clear()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+recent_sessions = RecentRealtimeSessions()
+
+
+def get_recent_sessions() -> RecentRealtimeSessions:
+    """Return the process-wide recent-sessions buffer."""
+
+    return recent_sessions
 
 
 class RealtimeMetricsCollector:
     """Collect realtime metrics for a websocket session."""
 
-    def __init__(self, *, session_id: str, customer_id: int) -> None:
+    def __init__(
+        self,
+        *,
+        session_id: str,
+        customer_id: int,
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> None:
         self.session_id = session_id
         self.customer_id = customer_id
         self.turn_start_time: float | None = None
+        self._started = time.perf_counter()
+        self._closed = False
+        self._labels = {"provider": _provider_label(provider), "model": _model_label(model)}
+        self.summary = RealtimeSessionSummary(
+            session_id=session_id,
+            customer_id=customer_id,
+            provider=provider or UNKNOWN_LABEL,
+            model=model or UNKNOWN_LABEL,
+            started_at=datetime.now(UTC).isoformat(),
+        )
 
-        _inc(_sessions_total, customer_id=str(customer_id))
+        _inc(_sessions_total, **self._labels)
         self._update_active_sessions(1)
 
     def start_turn(self) -> None:
@@ -119,52 +285,70 @@ class RealtimeMetricsCollector:
 
         if self.turn_start_time is not None:
             elapsed = max(time.perf_counter() - self.turn_start_time, 0.0)
-            _observe(_turn_duration, elapsed)
+            _observe(_turn_duration, elapsed, **self._labels)
             self.turn_start_time = None
 
-        _inc(
-            _turns_total,
-            session_id=self.session_id,
-            customer_id=str(self.customer_id),
-        )
+        self.summary.turns += 1
+        _inc(_turns_total, **self._labels)
 
     def record_audio_received(self, num_bytes: int) -> None:
         """Record audio bytes received from the client."""
 
         if num_bytes <= 0:
             return
-        _inc(
-            _audio_received,
-            value=float(num_bytes),
-            session_id=self.session_id,
-        )
+        self.summary.audio_bytes_received += num_bytes
+        _inc(_audio_received, value=float(num_bytes), **self._labels)
 
     def record_audio_sent(self, num_bytes: int) -> None:
         """Record audio bytes streamed to the client."""
 
         if num_bytes <= 0:
             return
-        _inc(
-            _audio_sent,
-            value=float(num_bytes),
-            session_id=self.session_id,
-        )
+        self.summary.audio_bytes_sent += num_bytes
+        _inc(_audio_sent, value=float(num_bytes), **self._labels)
 
     def record_error(self, error_code: str) -> None:
         """Record realtime error occurrence."""
 
-        _inc(_errors_total, error_code=error_code, session_id=self.session_id)
+        self.summary.errors[error_code] = self.summary.errors.get(error_code, 0) + 1
+        _inc(_errors_total, error_code=error_code, provider=self._labels["provider"])
 
     def record_provider_event(self, event_type: str, provider: str) -> None:
         """Record provider event metrics."""
 
-        _inc(_provider_events, event_type=event_type, provider=provider)
+        _inc(_provider_events, event_type=event_type, provider=_provider_label(provider))
+
+    @property
+    def outcome(self) -> str:
+        if self.summary.errors:
+            return "error"
+        return "completed" if self.summary.turns else "no_turns"
 
     def cleanup(self) -> None:
-        """Decrement active session gauge when websocket closes."""
+        """Finish the session: record per-session histograms and release the gauge.
 
+        Several shutdown paths call this; only the first call counts.
+        """
+
+        if self._closed:
+            return
+        self._closed = True
         self._update_active_sessions(-1)
 
+        summary = self.summary
+        summary.duration_seconds = round(max(time.perf_counter() - self._started, 0.0), 3)
+        summary.outcome = self.outcome
+        summary.ended_at = datetime.now(UTC).isoformat()
+
+        outcome_labels = {**self._labels, "outcome": summary.outcome}
+        _inc(_sessions_finished, **outcome_labels)
+        _observe(_session_duration, summary.duration_seconds, **outcome_labels)
+        _observe(_session_turns, summary.turns, **self._labels)
+        provider = self._labels["provider"]
+        _observe(_session_audio_bytes, summary.audio_bytes_received, provider=provider, direction="received")
+        _observe(_session_audio_bytes, summary.audio_bytes_sent, provider=provider, direction="sent")
+        recent_sessions.add(summary)
+
     @staticmethod
     def _update_active_sessions(delta: int) -> None:
         if _sessions_active is None:  # pragma: no cover - optional dependency
@@ -175,5 +359,9 @@ class RealtimeMetricsCollector:
             _sessions_active.dec(-delta)
 
 
-__all__ = ["RealtimeMetricsCollector"]
-
+__all__ = [
+    "RealtimeMetricsCollector",
+    "RealtimeSessionSummary",
+    "RecentRealtimeSessions",
+    "get_recent_sessions",
+]
@@ -262,6 +262,11 @@ class RealtimeHandshakeMessage(BaseModel):
     message_type: Literal["websocket_ready"] = Field(default="websocket_ready", alias="type")
     session: RealtimeSessionSnapshot
     settings: RealtimeSessionSettings
+    audio_transport: Literal["json", "binary"] = Field(
+        default="json",
+        alias="audioTransport",
+        description="How assistant audio is delivered: base64 JSON events or binary frames",
+    )
 
     model_config = {
         "populate_by_name": True,
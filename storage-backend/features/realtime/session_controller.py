@@ -10,6 +10,11 @@ from typing import Callable, Mapping
 from fastapi import WebSocket
 
 from core.providers.realtime.base import BaseRealtimeProvider, RealtimeEvent
+from core.streaming.audio_frames import (
+    AUDIO_TRANSPORT_BINARY,
+    AudioFrameEncoder,
+    requested_audio_transport,
+)
 from core.streaming.manager import StreamingManager
 from features.audio.service import STTService
 from features.chat.service import ChatHistoryService
@@ -63,11 +68,22 @@ class RealtimeSessionController:
     ) -> None:
         """Execute the realtime session lifecycle until completion or error."""
 
+        requested_transport = (
+            initial_message.get("audio_transport")
+            if isinstance(initial_message, Mapping)
+            else None
+        )
+        audio_transport = requested_audio_transport(websocket, requested_transport)
+        audio_frames = (
+            AudioFrameEncoder() if audio_transport == AUDIO_TRANSPORT_BINARY else None
+        )
+
         startup = initialise_session(
             session_id=session_id,
             customer_id=customer_id,
             session_defaults=self._session_defaults,
             initial_message=initial_message,
+            audio_transport=audio_transport,
         )
 
         self._closure.prepare(
@@ -111,6 +127,7 @@ class RealtimeSessionController:
                 event_factory=event_factory,
                 metrics=metrics,
                 force_close=False,
+                audio_frames=audio_frames,
             )
 
             close_signalled = False
@@ -151,7 +168,12 @@ class RealtimeSessionController:
         if provider is None:
             return
 
-        metrics = RealtimeMetricsCollector(session_id=session_id, customer_id=customer_id)
+        metrics = RealtimeMetricsCollector(
+            session_id=session_id,
+            customer_id=customer_id,
+            provider=getattr(provider, "name", None),
+            model=startup.handshake.settings.model,
+        )
         input_audio_queue: asyncio.Queue[bytes | None] = asyncio.Queue()
         await provider.set_input_audio_queue(input_audio_queue)
 
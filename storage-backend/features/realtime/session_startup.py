@@ -36,6 +36,7 @@ def initialise_session(
     customer_id: int,
     session_defaults: RealtimeSessionSettings,
     initial_message: Mapping[str, object] | None,
+    audio_transport: str = "json",
 ) -> SessionStartup:
     """Prepare handshake, turn state, and context for a websocket session."""
 
@@ -115,7 +116,10 @@ def initialise_session(
         )
 
     handshake = build_handshake(
-        session_id=session_id, customer_id=customer_id, settings=session_settings
+        session_id=session_id,
+        customer_id=customer_id,
+        settings=session_settings,
+        audio_transport=audio_transport,
     )
 
     return SessionStartup(
@@ -172,8 +172,7 @@ def _handle_audio_chunk_event(
     if isinstance(audio_chunk, str):
         decoded = _safe_base64_decode(audio_chunk)
         if decoded:
-            turn_context.audio_chunks.append(decoded)
-            streaming_manager.collect_chunk(audio_chunk, "audio")
+            turn_context.audio.append(decoded)
             if metrics:
                 metrics.record_audio_sent(len(decoded))
         turn_state.start_ai_response(payload.get("response_id"))
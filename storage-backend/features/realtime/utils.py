@@ -20,7 +20,11 @@ logger = logging.getLogger(__name__)
 
 
 def build_handshake(
-    *, session_id: str, customer_id: int, settings: RealtimeSessionSettings
+    *,
+    session_id: str,
+    customer_id: int,
+    settings: RealtimeSessionSettings,
+    audio_transport: str = "json",
 ) -> RealtimeHandshakeMessage:
     """Return the handshake message sent to clients when a session starts."""
 
@@ -29,7 +33,11 @@ def build_handshake(
         customer_id=customer_id,
         turn_id=None,
     )
-    return RealtimeHandshakeMessage(session=snapshot, settings=settings)
+    return RealtimeHandshakeMessage(
+        session=snapshot,
+        settings=settings,
+        audio_transport=audio_transport,
+    )
 
 
 def extract_customer_id(websocket: WebSocket) -> int:
@@ -0,0 +1,222 @@
+"""Content-addressed cache for synthesised speech.
+
+Replaying a message, canned proactive-agent phrases and the legacy flows ask
+for the same text with the same voice over and over.  Results are keyed by a
+hash of the tuned text plus everything that changes the audio (provider,
+model, voice, format and acoustic settings), map to the stored audio URL and,
+for short clips, keep the raw audio in memory so streaming requests can replay
+it without contacting the provider.
+
+Uploads for cacheable results use a deterministic S3 key derived from the
+cache key, so a regeneration after eviction or restart overwrites the same
+object instead of creating another one.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Mapping, Optional
+
+from config.tts.defaults import (
+    CACHE_ENABLED,
+    CACHE_MAX_AUDIO_BYTES,
+    CACHE_MAX_CLIP_BYTES,
+    CACHE_MAX_ENTRIES,
+)
+
+from features.tts.schemas.requests import TTSUserSettings
+
+logger = logging.getLogger(__name__)
+
+# Settings that steer delivery rather than the synthesised audio itself.
+_NON_ACOUSTIC_SETTINGS = frozenset(
+    {"provider", "model", "voice", "format", "streaming", "tts_auto_execute", "chunk_schedule"}
+)
+
+
+@dataclass(slots=True)
+class CachedTTSResult:
+    """A previously synthesised result."""
+
+    key: str
+    provider: str
+    model: Optional[str]
+    voice: Optional[str]
+    audio_format: str
+    chunk_count: int
+    url: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    audio: Optional[bytes] = field(default=None, repr=False)
+
+
+def tts_cache_key(
+    *,
+    text: str,
+    customer_id: int,
+    provider: str,
+    model: Optional[str],
+    voice: Optional[str],
+    audio_format: str,
+    settings: Mapping[str, Any],
+) -> str:
+    """Return the SHA-256 cache key for already tuned ``text`` and its settings.
+
+    ``customer_id`` is part of the key so cached URLs never cross accounts.
+    """
+
+    acoustic = {name: value for name, value in settings.items() if name not in _NON_ACOUSTIC_SETTINGS}
+    payload = json.dumps(
+        {
+            "text": text,
+            "customer_id": customer_id,
+            "provider": provider,
+            "model": model,
+            "voice": voice,
+            "format": audio_format.lower(),
+            "settings": acoustic,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def cache_key_for(
+    *,
+    text: str,
+    customer_id: int,
+    user_settings: TTSUserSettings,
+    provider: Any,
+    audio_format: str,
+    model: Optional[str] = None,
+) -> str:
+    """Return :func:`tts_cache_key` for a resolved provider and user settings."""
+
+    if model is None:
+        model = user_settings.tts.model
+        if hasattr(provider, "resolve_model"):
+            model = provider.resolve_model(model)
+    return tts_cache_key(
+        text=text,
+        customer_id=customer_id,
+        provider=getattr(provider, "name", type(provider).__name__),
+        model=model,
+        voice=user_settings.tts.voice,
+        audio_format=audio_format,
+        settings=user_settings.tts.as_provider_settings(),
+    )
+
+
+def cache_storage_key(*, customer_id: int, key: str, extension: str) -> str:
+    """Return the deterministic S3 key for a cached result."""
+
+    return f"{customer_id}/assets/tts/cache/{key}.{extension}"
+
+
+class TTSResultCache:
+    """In-memory LRU of cached results; audio is kept only for short clips."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        max_clip_bytes: int = CACHE_MAX_CLIP_BYTES,
+        max_audio_bytes: int = CACHE_MAX_AUDIO_BYTES,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_clip_bytes = max_clip_bytes
+        self.max_audio_bytes = max_audio_bytes
+        self._entries: "OrderedDict[str, CachedTTSResult]" = OrderedDict()
+        self._audio_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def audio_bytes(self) -> int:
+        return self._audio_bytes
+
+    def keeps_audio(self, size: int) -> bool:
+        """Return True when a clip of ``size`` bytes would be kept in memory."""
+
+        return 0 < size <= min(self.max_clip_bytes, self.max_audio_bytes)
+
+    def get(self, key: str, *, need_url: bool = False, need_audio: bool = False) -> Optional[CachedTTSResult]:
+        """Return the entry for ``key`` when it carries what the caller needs."""
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if (need_url and not entry.url) or (need_audio and entry.audio is None):
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, entry: CachedTTSResult) -> None:
+        """Store ``entry``, merging with any URL or audio already cached."""
+
+        if entry.audio is not None and not self.keeps_audio(len(entry.audio)):
+            entry.audio = None
+
+        previous = self._entries.pop(entry.key, None)
+        if previous is not None:
+            if previous.audio is not None:
+                self._audio_bytes -= len(previous.audio)
+                if entry.audio is None:
+                    entry.audio = previous.audio
+            if entry.url is None and previous.url is not None:
+                entry.url = previous.url
+                entry.metadata = entry.metadata or previous.metadata
+
+        self._entries[entry.key] = entry
+        if entry.audio is not None:
+            self._audio_bytes += len(entry.audio)
+        self._evict()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._audio_bytes = 0
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries:
+            _, evicted = self._entries.popitem(last=False)
+            if evicted.audio is not None:
+                self._audio_bytes -= len(evicted.audio)
+        if self._audio_bytes <= self.max_audio_bytes:
+            return
+        # Over the audio budget: drop clips (oldest first) but keep their URLs.
+        for entry in self._entries.values():
+            if entry.audio is not None:
+                self._audio_bytes -= len(entry.audio)
+                entry.audio = None
+                if self._audio_bytes <= self.max_audio_bytes:
+                    break
+
+
+_cache: Optional[TTSResultCache] = None
+
+
+def get_tts_cache() -> Optional[TTSResultCache]:
+    """Return the process-wide cache, or ``None`` when ``TTS_CACHE_ENABLED`` is off."""
+
+    global _cache
+    if not CACHE_ENABLED:
+        return None
+    if _cache is None:
+        _cache = TTSResultCache()
+    return _cache
+
+
+__all__ = [
+    "CachedTTSResult",
+    "TTSResultCache",
+    "cache_key_for",
+    "cache_storage_key",
+    "get_tts_cache",
+    "tts_cache_key",
+]
@@ -25,6 +25,8 @@ class TTSRequestBatch:
     model: str | None
     format: str | None
     voice: str | None
+    text: str = ""
+    """Tuned text the requests were split from (used for cache keys)."""
 
 
 def build_tts_requests(
@@ -78,6 +80,7 @@ def build_tts_requests(
         model=resolved_model,
         format=resolved_format,
         voice=resolved_voice,
+        text=tuned_text,
     )
 
 
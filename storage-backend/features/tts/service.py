@@ -12,6 +12,7 @@ from infrastructure.aws.storage import StorageService
 
 from features.tts.schemas.requests import TTSGenerateRequest, TTSUserSettings
 
+from .cache import TTSResultCache, get_tts_cache
 from .service_generate import generate_audio
 from .service_models import TTSBillingResult, TTSGenerationResult, TTSStreamingMetadata
 from .service_stream_http import prepare_http_stream
@@ -29,15 +30,18 @@ class TTSService:
         *,
         provider_resolver: Callable[[Dict[str, Any]], Any] = get_tts_provider,
         storage_service_factory: Callable[[], StorageService] | None = None,
+        cache: TTSResultCache | None = None,
     ) -> None:
         self._provider_resolver = provider_resolver
         self._storage_service_factory = storage_service_factory or StorageService
+        self._cache = cache if cache is not None else get_tts_cache()
 
     async def generate(self, request: TTSGenerateRequest) -> TTSGenerationResult:
         return await generate_audio(
             request=request,
             provider_resolver=self._provider_resolver,
             storage_service_factory=self._storage_service_factory,
+            cache=self._cache,
         )
 
     async def get_billing(self, settings: TTSUserSettings) -> TTSBillingResult:
@@ -65,8 +69,29 @@ class TTSService:
             storage_service_factory=self._storage_service_factory,
             timings=timings,
             runtime=runtime,
+            cache=self._cache,
         )
 
+    def prewarm_stream(self, user_settings: TTSUserSettings) -> bool:
+        """Start the provider's input-streaming connection ahead of the text.
+
+        Returns ``True`` when the provider supports pre-warming; the handshake
+        itself runs in the background.
+        """
+
+        if user_settings.general.return_test_data:
+            return False
+        provider = self._provider_resolver(user_settings.to_provider_payload())
+        prewarm = getattr(provider, "prewarm_stream", None)
+        if prewarm is None or not getattr(provider, "supports_input_stream", False):
+            return False
+        prewarm(
+            voice=user_settings.tts.voice,
+            model=user_settings.tts.model,
+            audio_format=provider.get_websocket_format(),
+        )
+        return True
+
     async def stream_from_text_queue(
         self,
         *,
@@ -86,6 +111,7 @@ class TTSService:
             provider_resolver=self._provider_resolver,
             storage_service_factory=self._storage_service_factory,
             timings=timings,
+            cache=self._cache,
         )
 
     async def stream_http(
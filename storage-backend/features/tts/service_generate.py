@@ -12,6 +12,7 @@ from infrastructure.aws.storage import StorageService
 from features.tts.schemas.requests import TTSAction, TTSGenerateRequest
 from features.tts.utils import merge_audio_chunks
 
+from .cache import CachedTTSResult, TTSResultCache, cache_key_for
 from .request_builder import build_tts_requests
 from .service_models import TTSGenerationResult
 from .service_persistence import persist_audio_and_metadata
@@ -26,8 +27,13 @@ async def generate_audio(
     request: TTSGenerateRequest,
     provider_resolver: Callable[[Dict[str, Any]], Any],
     storage_service_factory: Callable[[], StorageService],
+    cache: TTSResultCache | None = None,
 ) -> TTSGenerationResult:
-    """Generate audio for the supplied request in a single response."""
+    """Generate audio for the supplied request in a single response.
+
+    With a ``cache`` an identical earlier request is answered from its stored
+    URL (or cached clip) without calling the provider.
+    """
 
     if request.action not in {TTSAction.TTS_NO_STREAM, TTSAction.BILLING}:
         raise ValidationError(f"Unsupported TTS action: {request.action}", field="action")
@@ -53,12 +59,34 @@ async def generate_audio(
     if not batch.requests:
         raise ServiceError("No TTS chunks to process")
 
-    audio_chunks = []
-    last_result: Dict[str, Any] = {}
-
     resolved_model = batch.model
     resolved_format = batch.format or "mp3"
     resolved_voice = batch.voice
+    save_to_s3 = user_settings.general.save_to_s3
+
+    cache_key: str | None = None
+    if cache is not None:
+        cache_key = cache_key_for(
+            text=batch.text,
+            customer_id=request.customer_id,
+            user_settings=user_settings,
+            provider=batch.provider,
+            audio_format=resolved_format,
+            model=resolved_model,
+        )
+        cached = cache.get(cache_key, need_url=save_to_s3, need_audio=not save_to_s3)
+        if cached is not None:
+            cached_result = await _cached_generation_result(
+                cached,
+                storage_service_factory=storage_service_factory,
+                request=request,
+            )
+            if cached_result is not None:
+                logger.info("Serving TTS from cache (customer_id=%s key=%s)", request.customer_id, cache_key[:12])
+                return cached_result
+
+    audio_chunks = []
+    last_result: Dict[str, Any] = {}
 
     for tts_request in batch.requests:
         result = await batch.provider.generate(tts_request)
@@ -84,8 +112,24 @@ async def generate_audio(
         resolved_format=resolved_format,
         chunk_count=len(batch.requests),
         extra_metadata=last_result,
+        cache_key=cache_key,
     )
 
+    if cache is not None and cache_key is not None:
+        cache.put(
+            CachedTTSResult(
+                key=cache_key,
+                provider=metadata_provider,
+                model=resolved_model,
+                voice=resolved_voice,
+                audio_format=resolved_format,
+                chunk_count=len(batch.requests),
+                url=result_url if save_to_s3 else None,
+                metadata=dict(metadata) if save_to_s3 else {},
+                audio=merged_audio if cache.keeps_audio(len(merged_audio)) else None,
+            )
+        )
+
     stored_format = metadata.get("format", resolved_format)
 
     return TTSGenerationResult(
@@ -100,4 +144,45 @@ async def generate_audio(
     )
 
 
+async def _cached_generation_result(
+    cached: CachedTTSResult,
+    *,
+    storage_service_factory: Callable[[], StorageService],
+    request: TTSGenerateRequest,
+) -> TTSGenerationResult | None:
+    """Build the result from a cache entry; ``None`` when it lacks what is needed."""
+
+    if request.user_settings.general.save_to_s3:
+        if not cached.url:
+            return None
+        result_url, metadata = cached.url, dict(cached.metadata)
+    else:
+        if cached.audio is None:
+            return None
+        result_url, metadata = await persist_audio_and_metadata(
+            storage_service_factory=storage_service_factory,
+            audio_bytes=cached.audio,
+            user_settings=request.user_settings,
+            customer_id=request.customer_id,
+            provider_name=cached.provider,
+            resolved_model=cached.model,
+            resolved_voice=cached.voice,
+            resolved_format=cached.audio_format,
+            chunk_count=cached.chunk_count,
+            extra_metadata={},
+        )
+    metadata["cache_hit"] = True
+
+    return TTSGenerationResult(
+        status="completed",
+        result=result_url,
+        provider=metadata.get("provider", cached.provider),
+        model=cached.model,
+        voice=cached.voice,
+        format=metadata.get("format", cached.audio_format),
+        chunk_count=cached.chunk_count,
+        metadata=metadata,
+    )
+
+
 __all__ = ["generate_audio"]
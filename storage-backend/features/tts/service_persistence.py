@@ -5,16 +5,20 @@ from __future__ import annotations
 import base64
 from typing import Any, Callable, Dict, Tuple
 
+from core.streaming.manager import StreamingManager
 from infrastructure.aws.storage import StorageService
 
+from features.tts.cache import CachedTTSResult, TTSResultCache, cache_storage_key
 from features.tts.schemas.requests import TTSUserSettings
 from features.tts.utils import prepare_audio_payload
 
+from .service_models import TTSStreamingMetadata
+
 
 async def persist_audio_and_metadata(
     *,
     storage_service_factory: "Callable[[], StorageService]",
-    audio_bytes: bytes,
+    audio_bytes: bytes | memoryview,
     user_settings: TTSUserSettings,
     customer_id: int,
     provider_name: str,
@@ -23,8 +27,13 @@ async def persist_audio_and_metadata(
     resolved_format: str,
     chunk_count: int,
     extra_metadata: Dict[str, Any],
+    cache_key: str | None = None,
 ) -> Tuple[str, Dict[str, Any]]:
-    """Store audio if required and assemble the metadata payload."""
+    """Store audio if required and assemble the metadata payload.
+
+    With ``cache_key`` the upload goes to the content-addressed cache key, so
+    regenerating identical audio overwrites one object.
+    """
 
     (
         prepared_audio,
@@ -49,12 +58,18 @@ async def persist_audio_and_metadata(
         metadata["original_format"] = resolved_format
 
     if user_settings.general.save_to_s3:
+        upload_kwargs: Dict[str, Any] = {}
+        if cache_key:
+            upload_kwargs["key"] = cache_storage_key(
+                customer_id=customer_id, key=cache_key, extension=storage_format
+            )
         storage_service = storage_service_factory()
         s3_url = await storage_service.upload_audio(
             audio_bytes=prepared_audio,
             customer_id=customer_id,
             file_extension=storage_format,
             content_type=content_type,
+            **upload_kwargs,
         )
         metadata["s3_url"] = s3_url
         metadata["extra"] = extra or None
@@ -67,4 +82,66 @@ async def persist_audio_and_metadata(
     return inline_url, metadata
 
 
-__all__ = ["persist_audio_and_metadata"]
+async def persist_streamed_audio(
+    *,
+    manager: StreamingManager,
+    metadata: TTSStreamingMetadata,
+    audio_bytes: bytes | memoryview,
+    storage_service_factory: "Callable[[], StorageService]",
+    user_settings: TTSUserSettings,
+    customer_id: int,
+    cache_key: str | None = None,
+) -> None:
+    """Persist streamed audio, update ``metadata`` and announce the file URL."""
+
+    result_url, storage_metadata = await persist_audio_and_metadata(
+        storage_service_factory=storage_service_factory,
+        audio_bytes=audio_bytes,
+        user_settings=user_settings,
+        customer_id=customer_id,
+        provider_name=metadata.provider,
+        resolved_model=metadata.model,
+        resolved_voice=metadata.voice,
+        resolved_format=metadata.format,
+        chunk_count=metadata.audio_chunk_count,
+        extra_metadata={"text_chunk_count": metadata.text_chunk_count},
+        cache_key=cache_key,
+    )
+    metadata.audio_file_url = result_url
+    metadata.storage_metadata = storage_metadata
+    metadata.format = storage_metadata.get("format", metadata.format)
+
+    # Send simple tts_file_uploaded - consistent with standard flow
+    await manager.send_to_queues({
+        "type": "tts_file_uploaded",
+        "content": {"audio_url": result_url}
+    })
+
+
+def remember_streamed_audio(
+    cache: TTSResultCache,
+    *,
+    key: str,
+    metadata: TTSStreamingMetadata,
+    audio_format: str,
+    audio_bytes: bytes | memoryview,
+    save_to_s3: bool,
+) -> None:
+    """Cache a persisted streaming result (``audio_format`` is the provider format)."""
+
+    cache.put(
+        CachedTTSResult(
+            key=key,
+            provider=metadata.provider,
+            model=metadata.model,
+            voice=metadata.voice,
+            audio_format=audio_format,
+            chunk_count=metadata.audio_chunk_count,
+            url=metadata.audio_file_url if save_to_s3 else None,
+            metadata=dict(metadata.storage_metadata or {}) if save_to_s3 else {},
+            audio=bytes(audio_bytes) if cache.keeps_audio(len(audio_bytes)) else None,
+        )
+    )
+
+
+__all__ = ["persist_audio_and_metadata", "persist_streamed_audio", "remember_streamed_audio"]
@@ -10,8 +10,10 @@ from core.streaming.manager import StreamingManager
 from infrastructure.aws.storage import StorageService
 
 from features.tts.schemas.requests import TTSUserSettings
+from features.tts.utils import tune_text
+from .cache import TTSResultCache, cache_key_for
 from .service_models import TTSStreamingMetadata
-from .service_persistence import persist_audio_and_metadata
+from .service_persistence import persist_streamed_audio, remember_streamed_audio
 from .service_stream_queue_helpers import (
     perform_fallback_buffered_stream,
     stream_audio_from_queue,
@@ -22,6 +24,23 @@ from .test_mode import emit_test_stream
 logger = logging.getLogger(__name__)
 
 
+class _RecordingTextQueue:
+    """Queue proxy remembering the text a provider consumed (for cache keys)."""
+
+    def __init__(self, queue: asyncio.Queue[str | None]) -> None:
+        self._queue = queue
+        self.chunks: List[str] = []
+
+    async def get(self) -> str | None:
+        item = await self._queue.get()
+        if item is not None:
+            self.chunks.append(item)
+        return item
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._queue, name)
+
+
 async def stream_text_queue_audio(
     *,
     text_queue: asyncio.Queue[str | None],
@@ -31,8 +50,14 @@ async def stream_text_queue_audio(
     provider_resolver: Callable[[Dict[str, Any]], Any],
     storage_service_factory: Callable[[], StorageService],
     timings: Dict[str, float] | None = None,
+    cache: TTSResultCache | None = None,
 ) -> TTSStreamingMetadata:
-    """Stream audio while consuming text chunks from a queue."""
+    """Stream audio while consuming text chunks from a queue.
+
+    The text is not known up front, so ``cache`` cannot short-circuit this
+    path; the finished result is cached under the full text instead, which
+    lets a later replay of the same message skip the provider.
+    """
 
     if user_settings.general.return_test_data:
         return await emit_test_stream(manager, user_settings, customer_id=customer_id)
@@ -54,6 +79,7 @@ async def stream_text_queue_audio(
             provider=provider,
             storage_service_factory=storage_service_factory,
             timings=timings,
+            cache=cache,
         )
 
     provider_name = getattr(provider, "name", "tts")
@@ -84,10 +110,11 @@ async def stream_text_queue_audio(
         }
     )
 
-    metadata, audio_bytes = await stream_audio_from_queue(
+    recorded_queue = _RecordingTextQueue(text_queue) if cache is not None else None
+    metadata, audio = await stream_audio_from_queue(
         provider=provider,
         provider_name=provider_name,
-        text_queue=text_queue,
+        text_queue=recorded_queue or text_queue,  # type: ignore[arg-type]
         manager=manager,
         user_settings=user_settings,
         audio_format=audio_format,
@@ -95,31 +122,42 @@ async def stream_text_queue_audio(
         timings=timings,
     )
 
-    if audio_bytes:
+    cache_key: str | None = None
+    if recorded_queue is not None and recorded_queue.chunks:
+        cache_key = cache_key_for(
+            text=tune_text("".join(recorded_queue.chunks)),
+            customer_id=customer_id,
+            user_settings=user_settings,
+            provider=provider,
+            audio_format=audio_format,
+        )
+
+    if audio:
+        audio_format = metadata.format
         try:
-            result_url, storage_metadata = await persist_audio_and_metadata(
-                storage_service_factory=storage_service_factory,
-                audio_bytes=audio_bytes,
-                user_settings=user_settings,
-                customer_id=customer_id,
-                provider_name=metadata.provider,
-                resolved_model=metadata.model,
-                resolved_voice=metadata.voice,
-                resolved_format=metadata.format,
-                chunk_count=metadata.audio_chunk_count,
-                extra_metadata={"text_chunk_count": metadata.text_chunk_count},
-            )
-            metadata.audio_file_url = result_url
-            metadata.storage_metadata = storage_metadata
-            metadata.format = storage_metadata.get("format", metadata.format)
-
-            # Send simple tts_file_uploaded - consistent with standard flow
-            await manager.send_to_queues({
-                "type": "tts_file_uploaded",
-                "content": {"audio_url": result_url}
-            })
+            with audio.getbuffer() as audio_view:
+                await persist_streamed_audio(
+                    manager=manager,
+                    metadata=metadata,
+                    audio_bytes=audio_view,
+                    storage_service_factory=storage_service_factory,
+                    user_settings=user_settings,
+                    customer_id=customer_id,
+                    cache_key=cache_key,
+                )
+                if cache is not None and cache_key is not None:
+                    remember_streamed_audio(
+                        cache,
+                        key=cache_key,
+                        metadata=metadata,
+                        audio_format=audio_format,
+                        audio_bytes=audio_view,
+                        save_to_s3=user_settings.general.save_to_s3,
+                    )
         except Exception as exc:  # pragma: no cover - defensive logging
             logger.error("Failed to persist streamed TTS audio: %s", exc, exc_info=True)
+        finally:
+            audio.clear()
 
     return metadata
 
@@ -6,17 +6,19 @@ import asyncio
 import base64
 import logging
 import time
-from io import BytesIO
 from typing import Any, Callable, Dict, List
 
 from core.exceptions import ValidationError
+from core.streaming.audio_buffer import AudioAccumulator
 from core.streaming.manager import StreamingManager
 from infrastructure.aws.storage import StorageService
 
 from features.tts.schemas.requests import TTSUserSettings
 
+from .cache import TTSResultCache
 from .service_models import TTSStreamingMetadata
 from .service_stream_text import stream_text_audio
+from .service_streaming import record_first_audio
 
 
 logger = logging.getLogger(__name__)
@@ -32,7 +34,7 @@ async def stream_audio_from_queue(
     audio_format: str,
     chunk_length_schedule: List[int] | None,
     timings: Dict[str, float],
-) -> tuple[TTSStreamingMetadata, bytes]:
+) -> tuple[TTSStreamingMetadata, AudioAccumulator]:
     """Consume the text queue via provider streaming API."""
 
     if not hasattr(provider, "stream_from_text_queue"):
@@ -42,7 +44,7 @@ async def stream_audio_from_queue(
         )
 
     text_chunk_count = manager.get_tts_chunks_sent() if manager.is_tts_enabled() else 0
-    audio_buffer = BytesIO()
+    audio_buffer = AudioAccumulator()
     audio_chunk_count = 0
 
     try:
@@ -60,26 +62,27 @@ async def stream_audio_from_queue(
                 continue
 
             if audio_chunk_count == 0 and "tts_first_response_time" not in timings:
-                timings["tts_first_response_time"] = time.time()
+                ttfa_ms = record_first_audio(timings, provider=provider_name, mode="queue")
                 first_chunk_latency = (
                     timings["tts_first_response_time"]
                     - timings.get("tts_request_sent_time", 0.0)
                 )
                 logger.info(
-                    "First TTS audio chunk received (latency: %.2fms)",
+                    "First TTS audio chunk received (latency: %.2fms, ttfa: %sms)",
                     first_chunk_latency * 1000,
+                    f"{ttfa_ms:.0f}" if ttfa_ms is not None else "n/a",
                 )
 
-            manager.collect_chunk(audio_chunk_b64, "audio")
-            await manager.send_to_queues({"type": "audio_chunk", "content": audio_chunk_b64})
-
             try:
                 audio_bytes = base64.b64decode(audio_chunk_b64)
             except Exception as exc:  # pragma: no cover - defensive logging
                 logger.warning("Failed to decode audio chunk: %s", exc)
                 continue
 
-            audio_buffer.write(audio_bytes)
+            await manager.send_to_queues(
+                {"type": "audio_chunk", "content": audio_bytes, "format": audio_format}
+            )
+            audio_buffer.append(audio_bytes)
             audio_chunk_count += 1
 
         if audio_chunk_count == 0:
@@ -137,9 +140,9 @@ async def stream_audio_from_queue(
         )
         # Send tts_completed so client doesn't hang waiting for completion signal
         await manager.send_to_queues({"type": "tts_completed", "content": ""})
+        audio_buffer.clear()
         raise
 
-    audio_buffer.seek(0)
     metadata = TTSStreamingMetadata(
         provider=provider_name,
         model=user_settings.tts.model,
@@ -149,7 +152,7 @@ async def stream_audio_from_queue(
         audio_chunk_count=audio_chunk_count,
     )
 
-    return metadata, audio_buffer.getvalue()
+    return metadata, audio_buffer
 
 
 async def perform_fallback_buffered_stream(
@@ -161,6 +164,7 @@ async def perform_fallback_buffered_stream(
     provider: Any,
     storage_service_factory: Callable[[], StorageService],
     timings: Dict[str, float] | None,
+    cache: TTSResultCache | None = None,
 ) -> TTSStreamingMetadata:
     """Collect all queued text and reuse buffered streaming logic."""
 
@@ -196,6 +200,7 @@ async def perform_fallback_buffered_stream(
         provider_resolver=lambda _: provider,
         storage_service_factory=storage_service_factory,
         timings=timings,
+        cache=cache,
     )
 
 
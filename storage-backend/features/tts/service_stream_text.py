@@ -12,10 +12,11 @@ from infrastructure.aws.storage import StorageService
 
 from features.tts.schemas.requests import TTSUserSettings
 
+from .cache import CachedTTSResult, TTSResultCache, cache_key_for
 from .request_builder import build_tts_requests
 from .service_models import TTSStreamingMetadata
-from .service_persistence import persist_audio_and_metadata
-from .service_streaming import stream_requests
+from .service_persistence import persist_streamed_audio, remember_streamed_audio
+from .service_streaming import replay_cached_audio, stream_requests
 from .test_mode import emit_test_stream
 
 
@@ -32,8 +33,13 @@ async def stream_text_audio(
     storage_service_factory: Callable[[], StorageService],
     timings: Dict[str, float] | None = None,
     runtime=None,
+    cache: TTSResultCache | None = None,
 ) -> TTSStreamingMetadata:
-    """Stream audio chunks through the supplied streaming manager."""
+    """Stream audio chunks through the supplied streaming manager.
+
+    A short clip already in ``cache`` is replayed at once instead of being
+    synthesised again.
+    """
 
     if not text.strip():
         raise ValidationError("Text input is required for streaming", field="text")
@@ -61,12 +67,37 @@ async def stream_text_audio(
     if timings is None:
         timings = {}
 
+    cache_key: str | None = None
+    if cache is not None:
+        cache_key = cache_key_for(
+            text=batch.text,
+            customer_id=customer_id,
+            user_settings=user_settings,
+            provider=batch.provider,
+            audio_format=websocket_format,
+            model=batch.model,
+        )
+        cached = cache.get(cache_key, need_audio=True)
+        if cached is not None and cached.audio is not None:
+            logger.info("Replaying cached TTS audio (customer=%s key=%s)", customer_id, cache_key[:12])
+            return await _replay_cached(
+                cached,
+                audio=cached.audio,
+                manager=manager,
+                text_chunk_total=len(batch.requests),
+                timings=timings,
+                user_settings=user_settings,
+                customer_id=customer_id,
+                storage_service_factory=storage_service_factory,
+                cache_key=cache_key,
+            )
+
     chunk_length_schedule: List[int] | None = None
     if getattr(user_settings.tts, "chunk_schedule", None):
         chunk_length_schedule = user_settings.tts.chunk_schedule
         logger.debug("Using chunk_length_schedule from settings: %s", chunk_length_schedule)
 
-    metadata, audio_bytes = await stream_requests(
+    metadata, audio = await stream_requests(
         manager=manager,
         provider=batch.provider,
         requests=batch.requests,
@@ -79,32 +110,74 @@ async def stream_text_audio(
         runtime=runtime,
     )
 
-    if audio_bytes:
+    if audio:
+        audio_format = metadata.format
         try:
-            result_url, storage_metadata = await persist_audio_and_metadata(
-                storage_service_factory=storage_service_factory,
-                audio_bytes=audio_bytes,
-                user_settings=user_settings,
-                customer_id=customer_id,
-                provider_name=metadata.provider,
-                resolved_model=metadata.model,
-                resolved_voice=metadata.voice,
-                resolved_format=metadata.format,
-                chunk_count=metadata.audio_chunk_count,
-                extra_metadata={"text_chunk_count": metadata.text_chunk_count},
-            )
-            metadata.audio_file_url = result_url
-            metadata.storage_metadata = storage_metadata
-            metadata.format = storage_metadata.get("format", metadata.format)
-
-            # Send simple tts_file_uploaded - consistent with standard flow
-            await manager.send_to_queues({
-                "type": "tts_file_uploaded",
-                "content": {"audio_url": result_url}
-            })
+            with audio.getbuffer() as audio_view:
+                await persist_streamed_audio(
+                    manager=manager,
+                    metadata=metadata,
+                    audio_bytes=audio_view,
+                    storage_service_factory=storage_service_factory,
+                    user_settings=user_settings,
+                    customer_id=customer_id,
+                    cache_key=cache_key,
+                )
+                if cache is not None and cache_key is not None:
+                    remember_streamed_audio(
+                        cache,
+                        key=cache_key,
+                        metadata=metadata,
+                        audio_format=audio_format,
+                        audio_bytes=audio_view,
+                        save_to_s3=user_settings.general.save_to_s3,
+                    )
         except Exception as exc:  # pragma: no cover - defensive logging
             logger.error("Failed to persist streamed TTS audio: %s", exc, exc_info=True)
+        finally:
+            audio.clear()
+
+    return metadata
+
+
+async def _replay_cached(
+    cached: CachedTTSResult,
+    *,
+    audio: bytes,
+    manager: StreamingManager,
+    text_chunk_total: int,
+    timings: Dict[str, float],
+    user_settings: TTSUserSettings,
+    customer_id: int,
+    storage_service_factory: Callable[[], StorageService],
+    cache_key: str,
+) -> TTSStreamingMetadata:
+    metadata = await replay_cached_audio(
+        manager=manager,
+        cached=cached,
+        text_chunk_total=text_chunk_total,
+        timings=timings,
+    )
 
+    if user_settings.general.save_to_s3 and cached.url:
+        metadata.audio_file_url = cached.url
+        metadata.storage_metadata = dict(cached.metadata)
+        metadata.format = cached.metadata.get("format", metadata.format)
+        await manager.send_to_queues({"type": "tts_file_uploaded", "content": {"audio_url": cached.url}})
+        return metadata
+
+    try:
+        await persist_streamed_audio(
+            manager=manager,
+            metadata=metadata,
+            audio_bytes=audio,
+            storage_service_factory=storage_service_factory,
+            user_settings=user_settings,
+            customer_id=customer_id,
+            cache_key=cache_key,
+        )
+    except Exception as exc:  # pragma: no cover - defensive logging
+        logger.error("Failed to persist cached TTS audio: %s", exc, exc_info=True)
     return metadata
 
 
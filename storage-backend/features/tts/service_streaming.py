@@ -8,20 +8,44 @@ independently.
 
 from __future__ import annotations
 
-import base64
 import logging
 import time
 from typing import Any, Dict, Iterable, Tuple
 
 from core.exceptions import ProviderError, ServiceError
+from core.observability.metrics import track_metric
+from core.streaming.audio_buffer import AudioAccumulator
 from core.streaming.manager import StreamingManager
 
+from .cache import CachedTTSResult
 from .service_models import TTSStreamingMetadata
 
 
 logger = logging.getLogger(__name__)
 
 
+def record_first_audio(timings: Dict[str, float], *, provider: str, mode: str) -> float | None:
+    """Stamp the first audio chunk and emit the time-to-first-audio metric.
+
+    TTFA is measured from request acceptance (``start_time``) when the caller
+    recorded it, otherwise from when the TTS request was sent.  Returns the
+    latency in milliseconds, or ``None`` when no reference point exists.
+    """
+
+    now = time.time()
+    timings["tts_first_response_time"] = now
+    reference = timings.get("start_time") or timings.get("tts_request_sent_time")
+    if not reference:
+        return None
+    ttfa_ms = (now - reference) * 1000
+    track_metric(
+        "tts.time_to_first_audio_ms",
+        ttfa_ms,
+        tags={"provider": provider, "mode": mode},
+    )
+    return ttfa_ms
+
+
 def _is_elevenlabs_provider(provider: Any) -> bool:
     """Check if provider is ElevenLabs that supports WebSocket streaming."""
 
@@ -40,7 +64,7 @@ async def _stream_audio_chunks(
     audio_format: str,
     text_chunk_total: int,
     timings: Dict[str, float],
-    audio_accumulator: bytearray,
+    audio_accumulator: AudioAccumulator,
     chunk_length_schedule: list[int] | None = None,
     runtime=None,
 ) -> int:
@@ -69,13 +93,17 @@ async def _stream_audio_chunks(
             if not audio_chunk:
                 continue
             if not first_chunk_recorded:
-                timings["tts_first_response_time"] = time.time()
+                record_first_audio(
+                    timings,
+                    provider=getattr(provider, "name", "tts"),
+                    mode="websocket" if use_websocket else "rest",
+                )
                 first_chunk_recorded = True
             audio_chunk_count += 1
-            encoded = base64.b64encode(audio_chunk).decode()
-            audio_accumulator.extend(audio_chunk)
-            manager.collect_chunk(encoded, "audio")
-            await manager.send_to_queues({"type": "audio_chunk", "content": encoded})
+            audio_accumulator.append(audio_chunk)
+            await manager.send_to_queues(
+                {"type": "audio_chunk", "content": audio_chunk, "format": audio_format}
+            )
 
     return audio_chunk_count
 
@@ -92,8 +120,12 @@ async def stream_requests(
     timings: Dict[str, float],
     chunk_length_schedule: list[int] | None = None,
     runtime=None,
-) -> Tuple[TTSStreamingMetadata, bytes]:
-    """Handle the full streaming lifecycle and return session metadata."""
+) -> Tuple[TTSStreamingMetadata, AudioAccumulator]:
+    """Handle the full streaming lifecycle and return metadata plus the audio.
+
+    The caller owns the returned accumulator and should ``clear()`` it once
+    the audio has been persisted.
+    """
 
     requests = list(requests)
 
@@ -101,6 +133,7 @@ async def stream_requests(
         raise ServiceError("No TTS chunks to process")
 
     text_chunk_total = len(requests)
+    timings.setdefault("tts_request_sent_time", time.time())
 
     start_content = {
         "provider": metadata_provider,
@@ -118,7 +151,7 @@ async def stream_requests(
     )
 
     try:
-        audio_accumulator = bytearray()
+        audio_accumulator = AudioAccumulator()
         audio_chunk_count = await _stream_audio_chunks(
             manager=manager,
             provider=provider,
@@ -195,7 +228,81 @@ async def stream_requests(
         audio_chunk_count=audio_chunk_count,
     )
     timings["tts_response_time"] = time.time()
-    return metadata, bytes(audio_accumulator)
+    return metadata, audio_accumulator
+
+
+_REPLAY_CHUNK_BYTES = 32 * 1024
+
+
+async def replay_cached_audio(
+    *,
+    manager: StreamingManager,
+    cached: CachedTTSResult,
+    text_chunk_total: int,
+    timings: Dict[str, float],
+) -> TTSStreamingMetadata:
+    """Emit a cached clip with the same event sequence as :func:`stream_requests`.
+
+    The audio is sent at once (in frame-sized slices) instead of at provider
+    pace; persistence stays with the caller.
+    """
+
+    if cached.audio is None:
+        raise ServiceError("Cached TTS entry has no audio to replay")
+    timings.setdefault("tts_request_sent_time", time.time())
+    await manager.send_to_queues(
+        {
+            "type": "tts_started",
+            "content": {
+                "provider": cached.provider,
+                "model": cached.model,
+                "voice": cached.voice,
+                "format": cached.audio_format,
+                "text_chunk_count": text_chunk_total,
+                "cached": True,
+            },
+        }
+    )
+
+    audio = memoryview(cached.audio)
+    audio_chunk_count = 0
+    for offset in range(0, len(audio), _REPLAY_CHUNK_BYTES):
+        if not audio_chunk_count:
+            record_first_audio(timings, provider=cached.provider, mode="cache")
+        await manager.send_to_queues(
+            {
+                "type": "audio_chunk",
+                "content": bytes(audio[offset : offset + _REPLAY_CHUNK_BYTES]),
+                "format": cached.audio_format,
+            }
+        )
+        audio_chunk_count += 1
+
+    await manager.send_to_queues(
+        {
+            "type": "tts_generation_completed",
+            "content": {
+                "provider": cached.provider,
+                "model": cached.model,
+                "voice": cached.voice,
+                "format": cached.audio_format,
+                "audio_chunk_count": audio_chunk_count,
+                "text_chunk_count": text_chunk_total,
+                "cached": True,
+            },
+        }
+    )
+    await manager.send_to_queues({"type": "tts_completed", "content": ""})
+    timings["tts_response_time"] = time.time()
+
+    return TTSStreamingMetadata(
+        provider=cached.provider,
+        model=cached.model,
+        voice=cached.voice,
+        format=cached.audio_format,
+        text_chunk_count=text_chunk_total,
+        audio_chunk_count=audio_chunk_count,
+    )
 
 
-__all__ = ["stream_requests"]
+__all__ = ["record_first_audio", "replay_cached_audio", "stream_requests"]
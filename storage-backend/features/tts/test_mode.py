@@ -65,7 +65,6 @@ async def emit_test_stream(
     """Send a canned streaming payload over the provided manager."""
 
     fake_bytes = base64.b64decode(b"dGVzdC1hdWRpbw==")
-    encoded = base64.b64encode(fake_bytes).decode()
     metadata = build_test_metadata(user_settings)
     audio_url = build_test_audio_url(customer_id)
 
@@ -82,8 +81,10 @@ async def emit_test_stream(
                 },
             }
         )
-        manager.collect_chunk(encoded, "audio")
-        await manager.send_to_queues({"type": "audio_chunk", "content": encoded})
+        manager.collect_chunk(fake_bytes, "audio")
+        await manager.send_to_queues(
+            {"type": "audio_chunk", "content": fake_bytes, "format": metadata["format"]}
+        )
         await manager.send_to_queues({"type": "tts_completed", "content": ""})
         # Send simple tts_file_uploaded event - standardized format for all clients
         await manager.send_to_queues({
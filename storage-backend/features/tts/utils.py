@@ -5,10 +5,11 @@ from __future__ import annotations
 import io
 import logging
 import re
-import wave
 from datetime import UTC, datetime
 from typing import Iterable, List, Tuple
 
+from core.streaming.audio_buffer import wav_header
+
 logger = logging.getLogger(__name__)
 
 _ACTION_PATTERNS = [
@@ -109,23 +110,24 @@ def _parse_pcm_sample_rate(audio_format: str) -> int:
         return 24000
 
 
-def prepare_audio_payload(audio_bytes: bytes, audio_format: str | None) -> Tuple[bytes, str, str, dict[str, int | str]]:
-    """Normalise raw provider audio into a storable/uploadable payload."""
+def prepare_audio_payload(
+    audio_bytes: bytes | memoryview, audio_format: str | None
+) -> Tuple[bytes | memoryview, str, str, dict[str, int | str]]:
+    """Normalise raw provider audio into a storable/uploadable payload.
+
+    Non-PCM audio is returned as given, so a ``memoryview`` over an
+    :class:`~core.streaming.audio_buffer.AudioAccumulator` reaches the upload
+    without being copied.
+    """
 
     resolved_format = (audio_format or "mp3").lower()
     metadata: dict[str, int | str] = {}
 
     if resolved_format.startswith("pcm"):
         sample_rate = _parse_pcm_sample_rate(resolved_format)
-        wav_buffer = io.BytesIO()
-        with wave.open(wav_buffer, "wb") as wav_file:
-            wav_file.setnchannels(1)
-            wav_file.setsampwidth(2)
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_bytes)
-        wav_buffer.seek(0)
+        header = wav_header(len(audio_bytes), sample_rate=sample_rate)
         metadata = {"original_format": resolved_format, "sample_rate": sample_rate}
-        return wav_buffer.read(), "wav", "audio/wav", metadata
+        return header + audio_bytes, "wav", "audio/wav", metadata
 
     return (
         audio_bytes,
@@ -13,6 +13,11 @@ from fastapi.websockets import WebSocketDisconnect, WebSocketState
 from pydantic import ValidationError as PydanticValidationError
 
 from core.observability import log_websocket_request, render_payload_preview
+from core.streaming.audio_frames import (
+    AUDIO_TRANSPORT_BINARY,
+    AudioFrameEncoder,
+    requested_audio_transport,
+)
 from features.tts.dependencies import get_current_user
 from features.tts.schemas.requests import TTSUserSettings
 
@@ -73,6 +78,7 @@ async def tts_websocket_endpoint(
         return
 
     realtime_settings = resolve_realtime_settings(user_settings)
+    audio_transport = requested_audio_transport(websocket, payload.get("audio_transport"))
 
     await websocket.send_json(
         {
@@ -84,6 +90,7 @@ async def tts_websocket_endpoint(
             "format": realtime_settings.audio_format,
             "session_id": session_id,
             "customer_id": customer_id,
+            "audio_transport": audio_transport,
         }
     )
 
@@ -105,6 +112,9 @@ async def tts_websocket_endpoint(
             model=realtime_settings.model,
             voice=realtime_settings.voice,
             audio_format=realtime_settings.audio_format,
+            audio_frames=AudioFrameEncoder()
+            if audio_transport == AUDIO_TRANSPORT_BINARY
+            else None,
         )
     )
     client_task = asyncio.create_task(
@@ -7,6 +7,8 @@ from typing import Any, Dict
 
 from fastapi import WebSocket
 
+from core.streaming.audio_frames import AudioFrameEncoder, audio_bytes
+
 
 async def send_error(websocket: WebSocket, message: str, *, details: Any | None = None) -> None:
     """Send a structured error payload to the websocket client."""
@@ -25,8 +27,13 @@ async def forward_audio_events(
     model: str,
     voice: str,
     audio_format: str,
+    audio_frames: AudioFrameEncoder | None = None,
 ) -> None:
-    """Relay audio events produced by the ElevenLabs client to the browser."""
+    """Relay audio events produced by the ElevenLabs client to the browser.
+
+    With ``audio_frames`` set, audio goes out as binary frames and only status
+    and error events are sent as JSON.
+    """
 
     sequence = 0
     while True:
@@ -39,6 +46,11 @@ async def forward_audio_events(
             chunk = payload.get("chunk")
             if not chunk:
                 continue
+            if audio_frames is not None:
+                audio = audio_bytes(chunk)
+                if audio:
+                    await websocket.send_bytes(audio_frames.encode(audio, audio_format=audio_format))
+                continue
             sequence += 1
             await websocket.send_json(
                 {
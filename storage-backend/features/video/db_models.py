@@ -0,0 +1,78 @@
+"""Database models for background video generation jobs."""
+
+from __future__ import annotations
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    JSON,
+    String,
+    Text,
+)
+from sqlalchemy.sql import func
+
+from infrastructure.db.base import Base
+
+
+class VideoJob(Base):
+    """A video generation driven by the background job poller."""
+
+    __tablename__ = "video_jobs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    job_id = Column(String(64), unique=True, nullable=False, index=True)
+    customer_id = Column(
+        Integer,
+        ForeignKey("Users.customer_id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    provider = Column(String(50), nullable=False)
+    model = Column(String(100), nullable=False)
+    mode = Column(String(32), nullable=False, default="text_to_video")
+    status = Column(
+        Enum(
+            "queued",
+            "processing",
+            "completed",
+            "failed",
+            name="video_job_status",
+        ),
+        nullable=False,
+        default="queued",
+        index=True,
+    )
+
+    prompt = Column(Text, nullable=False)
+    input_image_url = Column(Text, nullable=True)
+    settings = Column(JSON, nullable=True)
+    provider_handle = Column(JSON, nullable=True)
+
+    video_url = Column(String(1000), nullable=True)
+    error_message = Column(Text, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Worker currently polling/finishing the job (see VideoJobPoller)
+    lease_owner = Column(String(64), nullable=True)
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("idx_video_jobs_status_created", "status", "created_at"),
+        Index("idx_video_jobs_customer_created", "customer_id", "created_at"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<VideoJob(job_id='{self.job_id}', status='{self.status}', "
+            f"provider='{self.provider}')>"
+        )
+
+
+__all__ = ["VideoJob"]
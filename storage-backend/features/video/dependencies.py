@@ -0,0 +1,20 @@
+"""FastAPI dependencies for the video feature."""
+
+from __future__ import annotations
+
+from typing import AsyncGenerator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.db.mysql import require_main_session_factory, session_scope
+
+
+async def get_video_job_session() -> AsyncGenerator[AsyncSession, None]:
+    """Yield a database session for video job persistence."""
+
+    session_factory = require_main_session_factory()
+    async with session_scope(session_factory) as session:
+        yield session
+
+
+__all__ = ["get_video_job_session"]
@@ -0,0 +1,454 @@
+"""Background video jobs driven by a single shared poller.
+
+``POST /video/jobs`` only records a :class:`VideoJob` row and returns its id.
+One :class:`VideoJobPoller` per process then owns every non-terminal job:
+
+* queued jobs are claimed atomically and started with the provider's
+  ``start_generation`` step, whose handle is persisted so jobs survive
+  restarts;
+* started jobs are leased to one worker (``lease_owner``/``lease_expires_at``,
+  renewed on every reload, including while an upload runs), so with several
+  workers each job is polled, downloaded and uploaded exactly once; a worker
+  that dies hands its jobs over once the lease expires;
+* due jobs are polled with ``check_generation``; the interval backs off while
+  the provider reports no change and resets on progress;
+* finished videos are streamed from the provider straight into a multipart S3
+  upload, so no full MP4 is ever held in memory; uploads run as hand-offs
+  outside the polling pass, so a large upload never delays other jobs' polls;
+* every state change is pushed to the user's proactive WebSocket connections.
+
+Provider requests issued by the poller, and concurrent uploads, are capped
+by ``VIDEO_JOB_MAX_CONCURRENCY``, so memory and connection usage stay flat
+however many generations are queued.  The loop itself is the shared
+:class:`~core.utils.polling_loop.JobPollingLoop`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config.video.defaults import (
+    VIDEO_JOB_BACKOFF_FACTOR,
+    VIDEO_JOB_MAX_ACTIVE_JOBS,
+    VIDEO_JOB_MAX_CONCURRENCY,
+    VIDEO_JOB_MAX_POLL_INTERVAL_SECONDS,
+    VIDEO_JOB_POLL_INTERVAL_SECONDS,
+    VIDEO_JOB_REFRESH_INTERVAL_SECONDS,
+    VIDEO_JOB_TIMEOUT_SECONDS,
+)
+from core.connections import get_proactive_registry
+from core.exceptions import ConfigurationError
+from core.providers.base import BaseVideoProvider, VideoOperationStatus
+from core.providers.factory import get_video_provider
+from core.utils.polling_loop import JobPollingLoop, ProcessLoop, as_utc
+from infrastructure.aws.storage import StorageService
+from infrastructure.db.mysql import AsyncSessionFactory, session_scope
+
+from .db_models import VideoJob
+from .helpers import build_metadata, build_provider_kwargs, extract_video_settings, validate_generation_params
+from .repository import VideoJobRepository
+
+logger = logging.getLogger(__name__)
+
+SUBMISSION_GRACE_SECONDS = 300
+"""Claimed jobs without a provider handle after this long are treated as orphaned."""
+
+ProviderFactory = Callable[[Dict[str, Any]], BaseVideoProvider]
+Notifier = Callable[[int, Dict[str, Any]], Awaitable[None]]
+
+
+def supports_background_generation(provider: BaseVideoProvider) -> bool:
+    """Return whether ``provider`` implements the step-wise generation API."""
+
+    return type(provider).start_generation is not BaseVideoProvider.start_generation
+
+
+def serialize_video_job(job: VideoJob) -> Dict[str, Any]:
+    """Return the client-facing representation of ``job``."""
+
+    settings = job.settings or {}
+    return {
+        "job_id": job.job_id,
+        "status": job.status,
+        "provider": job.provider,
+        "model": job.model,
+        "mode": job.mode,
+        "video_url": job.video_url,
+        "error": job.error_message,
+        "settings": settings.get("metadata") or {},
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+    }
+
+
+async def create_video_job(
+    session: AsyncSession,
+    *,
+    prompt: str,
+    settings: Dict[str, Any],
+    customer_id: int,
+    input_image_url: Optional[str] = None,
+    session_id: Optional[str] = None,
+    provider_factory: ProviderFactory = get_video_provider,
+) -> VideoJob:
+    """Validate a generation request and queue it for the poller."""
+
+    validate_generation_params(prompt, customer_id)
+    settings = settings or {}
+
+    try:
+        provider = provider_factory(settings)
+    except ConfigurationError:
+        raise
+    except Exception as exc:
+        raise ConfigurationError(f"Unable to resolve video provider: {exc}", key="video.model") from exc
+    if not supports_background_generation(provider):
+        raise NotImplementedError(f"{provider.__class__.__name__} doesn't support background generation")
+
+    provider_name = getattr(provider, "provider_name", "video")
+    video_settings = extract_video_settings(settings)
+    mode = "image_to_video" if input_image_url else "text_to_video"
+    job = await VideoJobRepository(session).create(
+        job_id=f"vid_{uuid.uuid4().hex}",
+        customer_id=customer_id,
+        provider=provider_name,
+        model=video_settings["model"],
+        mode=mode,
+        prompt=prompt,
+        input_image_url=input_image_url,
+        settings={
+            "request": settings,
+            "provider_kwargs": build_provider_kwargs(video_settings, provider_name),
+            "metadata": build_metadata(video_settings, provider_name, mode),
+            "file_extension": video_settings["file_extension"],
+            "session_id": session_id,
+        },
+    )
+    logger.info(
+        "Video job queued",
+        extra={"job_id": job.job_id, "customer_id": customer_id, "provider": provider_name, "mode": mode},
+    )
+    return job
+
+
+async def push_video_job_event(customer_id: int, event: Dict[str, Any]) -> None:
+    """Push a job event to the user's proactive WebSocket connections."""
+
+    registry = get_proactive_registry()
+    session_scoped = bool(event.get("data", {}).get("session_id"))
+    await registry.push_to_user(user_id=customer_id, message=event, session_scoped=session_scoped)
+
+
+@dataclass
+class _TrackedVideoJob:
+    job_id: str
+    customer_id: int
+    settings: Dict[str, Any]
+    handle: Dict[str, Any]
+    interval: float
+    next_poll_at: float
+    deadline: float
+    signature: Optional[Tuple[Any, ...]] = None
+
+
+class VideoJobPoller(JobPollingLoop[_TrackedVideoJob]):
+    """Single loop advancing every in-flight video job."""
+
+    display_name = "Video job poller"
+    task_name = "video-job-poller"
+
+    def __init__(
+        self,
+        session_factory: AsyncSessionFactory,
+        *,
+        provider_factory: ProviderFactory = get_video_provider,
+        storage_factory: Callable[[], StorageService] = StorageService,
+        notifier: Notifier = push_video_job_event,
+        base_interval: float = VIDEO_JOB_POLL_INTERVAL_SECONDS,
+        max_interval: float = VIDEO_JOB_MAX_POLL_INTERVAL_SECONDS,
+        backoff_factor: float = VIDEO_JOB_BACKOFF_FACTOR,
+        refresh_interval: float = VIDEO_JOB_REFRESH_INTERVAL_SECONDS,
+        timeout: float = VIDEO_JOB_TIMEOUT_SECONDS,
+        max_active_jobs: int = VIDEO_JOB_MAX_ACTIVE_JOBS,
+        max_concurrency: int = VIDEO_JOB_MAX_CONCURRENCY,
+        clock: Callable[[], float] = time.monotonic,
+        owner: Optional[str] = None,
+        lease_seconds: Optional[float] = None,
+    ) -> None:
+        super().__init__(
+            base_interval=base_interval,
+            max_interval=max_interval,
+            backoff_factor=backoff_factor,
+            refresh_interval=refresh_interval,
+            clock=clock,
+            owner=owner,
+            lease_seconds=lease_seconds,
+        )
+        self._session_factory = session_factory
+        self._provider_factory = provider_factory
+        self._storage_factory = storage_factory
+        self._notifier = notifier
+        self._timeout = timeout
+        self._max_active_jobs = max_active_jobs
+        self._max_concurrency = max(1, max_concurrency)
+
+        self._to_submit: List[str] = []
+        self._providers: Dict[str, BaseVideoProvider] = {}
+        self._storage: Optional[StorageService] = None
+        self._upload_slots = asyncio.Semaphore(self._max_concurrency)
+
+    async def _on_stop(self) -> None:
+        try:
+            async with session_scope(self._session_factory) as session:
+                await VideoJobRepository(session).release_leases(list(self._tracked), owner=self._owner)
+        except Exception:  # pragma: no cover - leases expire on their own
+            logger.warning("Failed to release video job leases", exc_info=True)
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    async def _tick(self) -> None:
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def _bounded(step: Awaitable[None]) -> None:
+            async with semaphore:
+                await step
+
+        to_submit, self._to_submit = self._to_submit, []
+        now = self._clock()
+        await asyncio.gather(
+            *(_bounded(self._submit(job_id)) for job_id in to_submit),
+            *(_bounded(self._advance(tracked, now)) for tracked in self._due(now)),
+        )
+
+    async def _refresh(self, now: float) -> None:
+        async with session_scope(self._session_factory) as session:
+            repository = VideoJobRepository(session)
+            jobs = await repository.get_active_jobs(limit=self._max_active_jobs)
+            started: Dict[str, VideoJob] = {}
+            orphaned = []
+            for job in jobs:
+                if job.provider_handle:
+                    # Handed-off jobs stay in the lease, so an upload keeps its claim.
+                    started[job.job_id] = job
+                elif job.status == "queued":
+                    if job.job_id not in self._to_submit:
+                        self._to_submit.append(job.job_id)
+                elif self._age(job) > timedelta(seconds=SUBMISSION_GRACE_SECONDS):
+                    orphaned.append(job)
+
+            leased = set(await repository.acquire_leases(started, owner=self._owner, **self._lease_window()))
+
+        for job_id, job in started.items():
+            if job_id in leased and job_id not in self._tracked and not self._is_handed_off(job_id):
+                # Resume immediately: the video may have finished while unowned.
+                self._track(job, job.provider_handle, now)
+
+        for job in orphaned:
+            await self._fail(
+                job.job_id,
+                job.customer_id,
+                job.settings or {},
+                "Video submission was interrupted before the provider operation was recorded",
+            )
+        for job_id in set(self._tracked) - leased:
+            # Finished, or leased by another worker.
+            self._tracked.pop(job_id, None)
+
+    @staticmethod
+    def _age(job: VideoJob) -> timedelta:
+        started_at = as_utc(job.started_at) or as_utc(job.created_at) or datetime.now(timezone.utc)
+        return datetime.now(timezone.utc) - started_at
+
+    def _track(self, job: VideoJob, handle: Dict[str, Any], now: float, *, delay: float = 0.0) -> None:
+        remaining = self._timeout - self._age(job).total_seconds()
+        self._tracked[job.job_id] = _TrackedVideoJob(
+            job_id=job.job_id,
+            customer_id=job.customer_id,
+            settings=job.settings or {},
+            handle=handle,
+            interval=self._base_interval,
+            next_poll_at=now + delay,
+            deadline=now + remaining,
+        )
+
+    def _provider(self, settings: Dict[str, Any]) -> BaseVideoProvider:
+        request = settings.get("request") or {}
+        model = str((request.get("video") or {}).get("model", "")).lower()
+        provider = self._providers.get(model)
+        if provider is None:
+            provider = self._providers[model] = self._provider_factory(request)
+        return provider
+
+    # ------------------------------------------------------------------
+    # Steps
+    # ------------------------------------------------------------------
+
+    async def _submit(self, job_id: str) -> None:
+        async with session_scope(self._session_factory) as session:
+            repository = VideoJobRepository(session)
+            job = await repository.get_by_job_id(job_id)
+            if job is None:
+                return
+            claimed = await repository.claim_for_submission(job_id, started_at=datetime.now(timezone.utc))
+            if claimed:
+                await repository.acquire_leases([job_id], owner=self._owner, **self._lease_window())
+        if not claimed:
+            return
+
+        settings = job.settings or {}
+        try:
+            handle = await self._provider(settings).start_generation(
+                job.prompt,
+                image_url=job.input_image_url,
+                model=job.model,
+                **(settings.get("provider_kwargs") or {}),
+            )
+        except Exception as exc:
+            logger.error(
+                "Video provider submission failed",
+                extra={"job_id": job_id, "provider": job.provider, "error": str(exc)},
+                exc_info=True,
+            )
+            await self._fail(job_id, job.customer_id, settings, str(exc))
+            return
+
+        async with session_scope(self._session_factory) as session:
+            await VideoJobRepository(session).set_provider_handle(job_id, handle)
+        logger.info("Video job started", extra={"job_id": job_id, "provider": job.provider})
+
+        self._track(job, handle, self._clock(), delay=self._base_interval)
+        await self._notify(job.customer_id, job_id, settings, "processing")
+
+    async def _advance(self, tracked: _TrackedVideoJob, now: float) -> None:
+        if now >= tracked.deadline:
+            self._tracked.pop(tracked.job_id, None)
+            await self._fail(tracked.job_id, tracked.customer_id, tracked.settings, "Video generation timed out")
+            return
+
+        try:
+            status = await self._provider(tracked.settings).check_generation(tracked.handle)
+        except Exception:
+            logger.warning("Video status poll failed", extra={"job_id": tracked.job_id}, exc_info=True)
+            self._back_off(tracked, now)
+            return
+
+        if status.state == "completed":
+            self._tracked.pop(tracked.job_id, None)
+            self._hand_off(tracked.job_id, self._finish(tracked, status))
+        elif status.state == "failed":
+            self._tracked.pop(tracked.job_id, None)
+            await self._fail(
+                tracked.job_id, tracked.customer_id, tracked.settings, status.error or "Video generation failed"
+            )
+        elif (status.provider_status, status.progress) == tracked.signature:
+            self._back_off(tracked, now)
+        else:
+            tracked.signature = (status.provider_status, status.progress)
+            self._reset_interval(tracked, now)
+            await self._notify(
+                tracked.customer_id, tracked.job_id, tracked.settings, "processing", progress=status.progress
+            )
+
+    async def _finish(self, tracked: _TrackedVideoJob, status: VideoOperationStatus) -> None:
+        settings = tracked.settings
+        async with session_scope(self._session_factory) as session:
+            held = await VideoJobRepository(session).acquire_leases(
+                [tracked.job_id], owner=self._owner, **self._lease_window()
+            )
+        if not held:
+            logger.info("Video job lease lost; leaving it to its owner", extra={"job_id": tracked.job_id})
+            return
+
+        try:
+            if self._storage is None:
+                self._storage = self._storage_factory()
+            async with self._upload_slots:
+                video_url = await self._storage.upload_video_stream(
+                    chunks=self._provider(settings).stream_generation(status),
+                    customer_id=tracked.customer_id,
+                    file_extension=settings.get("file_extension") or "mp4",
+                )
+        except Exception as exc:
+            logger.error("Video upload failed", extra={"job_id": tracked.job_id, "error": str(exc)}, exc_info=True)
+            await self._fail(tracked.job_id, tracked.customer_id, settings, f"Failed to store video: {exc}")
+            return
+
+        async with session_scope(self._session_factory) as session:
+            updated = await VideoJobRepository(session).mark_completed(
+                tracked.job_id, video_url=video_url, completed_at=datetime.now(timezone.utc), owner=self._owner
+            )
+        if not updated:
+            return
+        logger.info("Video job completed", extra={"job_id": tracked.job_id, "video_url": video_url})
+        await self._notify(tracked.customer_id, tracked.job_id, settings, "completed", video_url=video_url)
+
+    async def _fail(self, job_id: str, customer_id: int, settings: Dict[str, Any], error: str) -> None:
+        async with session_scope(self._session_factory) as session:
+            updated = await VideoJobRepository(session).mark_failed(
+                job_id, error_message=error, completed_at=datetime.now(timezone.utc)
+            )
+        if not updated:
+            return
+        logger.warning("Video job failed", extra={"job_id": job_id, "error": error})
+        await self._notify(customer_id, job_id, settings, "failed", error=error)
+
+    async def _notify(
+        self,
+        customer_id: int,
+        job_id: str,
+        settings: Dict[str, Any],
+        status: str,
+        **fields: Any,
+    ) -> None:
+        data: Dict[str, Any] = {"job_id": job_id, "status": status, **fields}
+        if settings.get("session_id"):
+            data["session_id"] = settings["session_id"]
+        if status == "completed":
+            data["settings"] = settings.get("metadata") or {}
+        try:
+            await self._notifier(customer_id, {"type": "video_job", "data": data})
+        except Exception:  # pragma: no cover - push is best effort
+            logger.warning("Failed to push video job event", extra={"job_id": job_id}, exc_info=True)
+
+
+_poller: ProcessLoop[VideoJobPoller] = ProcessLoop(VideoJobPoller)
+
+
+def get_video_job_poller() -> Optional[VideoJobPoller]:
+    """Return the process-wide poller, if one was started."""
+
+    return _poller.get()
+
+
+def start_video_job_poller(session_factory: AsyncSessionFactory, **kwargs: Any) -> VideoJobPoller:
+    """Create and start the process-wide poller."""
+
+    return _poller.start(session_factory, **kwargs)
+
+
+async def stop_video_job_poller() -> None:
+    """Stop the process-wide poller if it is running."""
+
+    await _poller.stop()
+
+
+__all__ = [
+    "VideoJobPoller",
+    "create_video_job",
+    "get_video_job_poller",
+    "push_video_job_event",
+    "serialize_video_job",
+    "start_video_job_poller",
+    "stop_video_job_poller",
+    "supports_background_generation",
+]
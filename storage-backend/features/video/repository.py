@@ -0,0 +1,165 @@
+"""Repository for background video job persistence."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Collection, Dict, List, Optional
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from features.video.db_models import VideoJob
+
+
+class VideoJobRepository:
+    """CRUD helper for VideoJob records."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def create(
+        self,
+        *,
+        job_id: str,
+        customer_id: int,
+        provider: str,
+        model: str,
+        mode: str,
+        prompt: str,
+        input_image_url: Optional[str] = None,
+        settings: Optional[Dict[str, Any]] = None,
+    ) -> VideoJob:
+        job = VideoJob(
+            job_id=job_id,
+            customer_id=customer_id,
+            provider=provider,
+            model=model,
+            mode=mode,
+            status="queued",
+            prompt=prompt,
+            input_image_url=input_image_url,
+            settings=settings or {},
+        )
+        self.session.add(job)
+        await self.session.flush()
+        await self.session.refresh(job)
+        return job
+
+    async def get_by_job_id(self, job_id: str) -> Optional[VideoJob]:
+        stmt = select(VideoJob).where(VideoJob.job_id == job_id)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_active_jobs(self, limit: int = 100) -> List[VideoJob]:
+        stmt = (
+            select(VideoJob)
+            .where(VideoJob.status.in_(["queued", "processing"]))
+            .order_by(VideoJob.created_at)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def claim_for_submission(self, job_id: str, *, started_at: datetime) -> bool:
+        """Atomically move a queued job to ``processing``; ``False`` if another worker won."""
+
+        stmt = (
+            update(VideoJob)
+            .where(VideoJob.job_id == job_id, VideoJob.status == "queued")
+            .values(status="processing", started_at=started_at)
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount > 0
+
+    async def set_provider_handle(self, job_id: str, handle: Dict[str, Any]) -> None:
+        stmt = update(VideoJob).where(VideoJob.job_id == job_id).values(provider_handle=handle)
+        await self.session.execute(stmt)
+
+    async def acquire_leases(
+        self,
+        job_ids: Collection[str],
+        *,
+        owner: str,
+        now: datetime,
+        until: datetime,
+    ) -> List[str]:
+        """Lease active jobs to ``owner`` until ``until``; return the ids it holds.
+
+        A lease is taken when the job has none, already belongs to ``owner``
+        or expired before ``now``, so a worker renews its own leases with the
+        same call.
+        """
+
+        if not job_ids:
+            return []
+        active = ["queued", "processing"]
+        stmt = (
+            update(VideoJob)
+            .where(
+                VideoJob.job_id.in_(list(job_ids)),
+                VideoJob.status.in_(active),
+                or_(
+                    VideoJob.lease_owner.is_(None),
+                    VideoJob.lease_owner == owner,
+                    VideoJob.lease_expires_at.is_(None),
+                    VideoJob.lease_expires_at < now,
+                ),
+            )
+            .values(lease_owner=owner, lease_expires_at=until)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(stmt)
+        held = await self.session.execute(
+            select(VideoJob.job_id).where(
+                VideoJob.job_id.in_(list(job_ids)),
+                VideoJob.status.in_(active),
+                VideoJob.lease_owner == owner,
+            )
+        )
+        return list(held.scalars().all())
+
+    async def release_leases(self, job_ids: Collection[str], *, owner: str) -> None:
+        """Drop ``owner``'s leases on ``job_ids`` so another worker can take them."""
+
+        if not job_ids:
+            return
+        stmt = (
+            update(VideoJob)
+            .where(VideoJob.job_id.in_(list(job_ids)), VideoJob.lease_owner == owner)
+            .values(lease_owner=None, lease_expires_at=None)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(stmt)
+
+    async def mark_completed(
+        self,
+        job_id: str,
+        *,
+        video_url: str,
+        completed_at: datetime,
+        owner: Optional[str] = None,
+    ) -> bool:
+        """Complete a processing job; with ``owner``, only while it holds the lease."""
+
+        conditions = [VideoJob.job_id == job_id, VideoJob.status == "processing"]
+        if owner is not None:
+            conditions.append(VideoJob.lease_owner == owner)
+        stmt = (
+            update(VideoJob)
+            .where(*conditions)
+            .values(status="completed", video_url=video_url, completed_at=completed_at)
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount > 0
+
+    async def mark_failed(self, job_id: str, *, error_message: str, completed_at: datetime) -> bool:
+        stmt = (
+            update(VideoJob)
+            .where(VideoJob.job_id == job_id, VideoJob.status.in_(["queued", "processing"]))
+            .values(status="failed", error_message=error_message, completed_at=completed_at)
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount > 0
+
+
+__all__ = ["VideoJobRepository"]
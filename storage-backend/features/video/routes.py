@@ -5,7 +5,8 @@ from __future__ import annotations
 import base64
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.exceptions import (
     ConfigurationError,
@@ -21,6 +22,9 @@ from core.http.errors import (
     format_service_error,
     format_validation_error,
 )
+from features.video.dependencies import get_video_job_session
+from features.video.jobs import create_video_job, get_video_job_poller, serialize_video_job
+from features.video.repository import VideoJobRepository
 from features.video.service import VideoService
 
 router = APIRouter(prefix="/video", tags=["video"])
@@ -215,3 +219,68 @@ async def extend_video(
         result.get("source_video_id"),
     )
     return APIResponse(success=True, data=response.model_dump(), code=200)
+
+
+@router.post("/jobs", response_model=APIResponse, status_code=status.HTTP_202_ACCEPTED)
+async def submit_video_job(
+    request: VideoGenerationRequest,
+    auth_context: AuthContext = Depends(require_auth_context),
+    session: AsyncSession = Depends(get_video_job_session),
+) -> APIResponse:
+    """Queue a video generation and return its job id immediately.
+
+    Progress and the final S3 URL are pushed over the proactive WebSocket as
+    ``video_job`` events; ``GET /video/jobs/{job_id}`` returns the same state.
+    """
+
+    customer_id = auth_context["customer_id"]
+    if request.customer_id != customer_id:
+        raise HTTPException(status_code=403, detail="Access denied: customer ID mismatch")
+
+    poller = get_video_job_poller()
+    if poller is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Background video jobs are disabled",
+        )
+
+    logger.info(
+        "POST /video/jobs received (customer_id=%s, prompt='%s', has_image=%s)",
+        customer_id,
+        _prompt_preview(request.prompt),
+        bool(request.input_image_url),
+    )
+
+    try:
+        job = await create_video_job(
+            session,
+            prompt=request.prompt,
+            settings=request.settings,
+            customer_id=customer_id,
+            input_image_url=request.input_image_url,
+            session_id=request.session_id,
+        )
+        await session.commit()
+    except ValidationError as exc:
+        raise HTTPException(status_code=400, detail=format_validation_error(exc)) from exc
+    except ConfigurationError as exc:
+        raise HTTPException(status_code=400, detail=format_configuration_error(exc)) from exc
+    except NotImplementedError as exc:
+        raise HTTPException(status_code=501, detail=str(exc)) from exc
+
+    poller.notify()
+    return APIResponse(success=True, data=serialize_video_job(job), code=202)
+
+
+@router.get("/jobs/{job_id}", response_model=APIResponse)
+async def get_video_job(
+    job_id: str,
+    auth_context: AuthContext = Depends(require_auth_context),
+    session: AsyncSession = Depends(get_video_job_session),
+) -> APIResponse:
+    """Return the current state of a background video job."""
+
+    job = await VideoJobRepository(session).get_by_job_id(job_id)
+    if job is None or job.customer_id != auth_context["customer_id"]:
+        raise HTTPException(status_code=404, detail=f"Video job {job_id} not found")
+    return APIResponse(success=True, data=serialize_video_job(job), code=200)
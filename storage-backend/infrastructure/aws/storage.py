@@ -10,10 +10,11 @@ import re
 import uuid
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, AsyncIterable
 
 from config.aws import AWS_REGION, IMAGE_S3_BUCKET
 from core.exceptions import ConfigurationError, ServiceError
+from core.streaming.audio_buffer import open_view_reader
 
 from .clients import get_s3_client
 
@@ -25,6 +26,11 @@ DEFAULT_DISCUSSION_ID = 1
 
 _DEFAULT_ATTACHMENT_ACL = "public-read"
 
+MIN_MULTIPART_PART_SIZE = 5 * 1024 * 1024
+"""S3 rejects non-final multipart parts smaller than 5 MiB."""
+
+DEFAULT_MULTIPART_PART_SIZE = 8 * 1024 * 1024
+
 
 def _normalise_filename(filename: str) -> str:
     """Return a filesystem-safe filename preserving the original extension."""
@@ -129,10 +135,104 @@ class StorageService:
         logger.info("Video uploaded successfully to %s", url)
         return url
 
+    async def upload_video_stream(
+        self,
+        *,
+        chunks: AsyncIterable[bytes],
+        customer_id: int,
+        file_extension: str = "mp4",
+        part_size: int = DEFAULT_MULTIPART_PART_SIZE,
+    ) -> str:
+        """Stream video ``chunks`` into a multipart upload and return the public URL.
+
+        At most one part (``part_size`` bytes) is buffered at a time, so memory
+        stays flat regardless of the video length.  The upload is aborted when
+        the source stream or S3 fails, leaving no orphaned parts behind.
+        """
+
+        part_size = max(int(part_size), MIN_MULTIPART_PART_SIZE)
+        key = self._build_chat_asset_key(
+            customer_id=customer_id,
+            asset_category="video",
+            extension=file_extension,
+        )
+        logger.info(
+            "Streaming generated video to S3 bucket=%s key=%s",
+            self._bucket_name,
+            key,
+        )
+
+        created = await asyncio.to_thread(
+            self._s3_client.create_multipart_upload,
+            Bucket=self._bucket_name,
+            Key=key,
+            ContentType=f"video/{file_extension}",
+        )
+        upload_id = created["UploadId"]
+        parts: list[dict[str, Any]] = []
+        buffer = bytearray()
+        total_bytes = 0
+
+        async def _upload_part(body: bytes) -> None:
+            part_number = len(parts) + 1
+            response = await asyncio.to_thread(
+                self._s3_client.upload_part,
+                Bucket=self._bucket_name,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=body,
+            )
+            parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+        try:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                buffer.extend(chunk)
+                total_bytes += len(chunk)
+                while len(buffer) >= part_size:
+                    body = bytes(buffer[:part_size])
+                    del buffer[:part_size]
+                    await _upload_part(body)
+
+            if not total_bytes:
+                raise ServiceError("Cannot upload empty video payload")
+            if buffer or not parts:
+                await _upload_part(bytes(buffer))
+                buffer.clear()
+
+            await asyncio.to_thread(
+                self._s3_client.complete_multipart_upload,
+                Bucket=self._bucket_name,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            try:
+                await asyncio.to_thread(
+                    self._s3_client.abort_multipart_upload,
+                    Bucket=self._bucket_name,
+                    Key=key,
+                    UploadId=upload_id,
+                )
+            except Exception:  # pragma: no cover - best-effort cleanup
+                logger.warning("Failed to abort multipart upload for %s", key, exc_info=True)
+            raise
+
+        url = self._object_url(key)
+        logger.info(
+            "Video streamed successfully to %s",
+            url,
+            extra={"bytes": total_bytes, "parts": len(parts)},
+        )
+        return url
+
     async def upload_audio(
         self,
         *,
-        audio_bytes: bytes,
+        audio_bytes: bytes | memoryview | IO[bytes],
         customer_id: int,
         file_extension: str = "mp3",
         folder: str | None = None,
@@ -140,10 +240,20 @@ class StorageService:
         key: str | None = None,
         acl: str | None = None,
     ) -> str:
-        """Upload generated audio bytes to S3 and return the public URL."""
+        """Upload generated audio to S3 and return the public URL.
 
-        if not audio_bytes:
+        ``audio_bytes`` may also be a ``memoryview`` (streamed from without a
+        copy) or a seekable file object such as ``AudioAccumulator.open_wav``.
+        """
+
+        if isinstance(audio_bytes, (bytes, bytearray, memoryview)):
+            if not len(audio_bytes):
+                raise ServiceError("Cannot upload empty audio payload")
+            body: Any = open_view_reader(audio_bytes) if isinstance(audio_bytes, memoryview) else audio_bytes
+        elif audio_bytes is None:
             raise ServiceError("Cannot upload empty audio payload")
+        else:
+            body = audio_bytes
 
         resolved_key = self._resolve_audio_key(
             customer_id=customer_id,
@@ -161,7 +271,7 @@ class StorageService:
         put_kwargs = {
             "Bucket": self._bucket_name,
             "Key": resolved_key,
-            "Body": audio_bytes,
+            "Body": body,
             "ContentType": resolved_content_type,
         }
         if acl:
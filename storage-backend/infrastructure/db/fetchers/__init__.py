@@ -8,6 +8,7 @@ from core.pydantic_schemas import DataSource
 
 from .base import BaseDataFetcher
 from .blood import BloodDataFetcher
+from .cache import ChartDataCache, get_chart_data_cache, invalidate_after_commit
 from .garmin import GarminDataFetcher
 from .ufc import UFCDataFetcher
 
@@ -31,8 +32,11 @@ def get_data_fetcher(source: DataSource) -> BaseDataFetcher:
 __all__ = [
     "BaseDataFetcher",
     "BloodDataFetcher",
+    "ChartDataCache",
     "GarminDataFetcher",
     "UFCDataFetcher",
+    "get_chart_data_cache",
     "get_data_fetcher",
+    "invalidate_after_commit",
     "FETCHER_REGISTRY",
 ]
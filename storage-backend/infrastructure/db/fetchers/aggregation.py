@@ -0,0 +1,136 @@
+"""NumPy helpers shared by the chart data fetchers.
+
+Fetchers turn SQL rows into a :class:`SeriesFrame` (a date axis plus one value
+column per metric) and let :func:`aggregate_frame` apply the requested
+aggregation:
+
+- ``none`` / ``daily`` – rows unchanged;
+- ``weekly`` / ``monthly`` – mean per ISO week (``2024-W05``) or month
+  (``2024-02``);
+- ``rolling_<N>d`` – trailing mean over the last ``N`` calendar days, one
+  point per row.
+
+Any other value buckets by day.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+_ROLLING_PATTERN = re.compile(r"^rolling_(\d+)d$")
+
+
+@dataclass(slots=True)
+class SeriesFrame:
+    """Date axis (``datetime64[D]``, ascending) with one column per metric."""
+
+    days: np.ndarray
+    values: np.ndarray
+
+    @property
+    def labels(self) -> List[str]:
+        return np.datetime_as_string(self.days, unit="D").tolist()
+
+
+def frame_from_rows(rows: Sequence[Any], date_key: str, value_keys: Sequence[str]) -> SeriesFrame:
+    """Build a frame from result rows; missing values become ``0.0``."""
+
+    days = np.array([getattr(row, date_key) for row in rows], dtype="datetime64[D]")
+    values = np.array(
+        [[getattr(row, key) for key in value_keys] for row in rows],
+        dtype=float,
+    ).reshape(len(rows), len(value_keys))
+    return SeriesFrame(days=days, values=np.nan_to_num(values, nan=0.0))
+
+
+def align_frames(frames: Sequence[SeriesFrame]) -> SeriesFrame:
+    """Combine frames read from different tables on the union of their dates.
+
+    Dates missing from one frame are filled with ``0.0`` for its columns.
+    """
+
+    if len(frames) == 1:
+        return frames[0]
+
+    days = np.unique(np.concatenate([frame.days for frame in frames]))
+    columns: List[np.ndarray] = []
+    for frame in frames:
+        block = np.zeros((len(days), frame.values.shape[1]))
+        block[np.searchsorted(days, frame.days)] = frame.values
+        columns.append(block)
+    return SeriesFrame(days=days, values=np.hstack(columns))
+
+
+def aggregate_frame(frame: SeriesFrame, aggregation: Optional[str]) -> Tuple[List[str], np.ndarray]:
+    """Return chart labels and the aggregated value matrix."""
+
+    if not aggregation or aggregation in ("none", "daily") or len(frame.days) == 0:
+        return frame.labels, frame.values
+
+    rolling = _ROLLING_PATTERN.match(aggregation)
+    if rolling:
+        return frame.labels, rolling_mean(frame.days, frame.values, int(rolling.group(1)))
+
+    valid = ~np.isnat(frame.days)
+    days, values = frame.days[valid], frame.values[valid]
+
+    if aggregation == "weekly":
+        keys = days - _weekday(days)
+    elif aggregation == "monthly":
+        keys = days.astype("datetime64[M]")
+    else:
+        keys = days
+
+    buckets, inverse = np.unique(keys, return_inverse=True)
+    sums = np.zeros((len(buckets), values.shape[1]))
+    np.add.at(sums, inverse, values)
+    counts = np.bincount(inverse, minlength=len(buckets))
+    return _bucket_labels(buckets, aggregation), sums / counts[:, None]
+
+
+def rolling_mean(days: np.ndarray, values: np.ndarray, window_days: int) -> np.ndarray:
+    """Trailing mean over ``window_days`` calendar days ending at each row."""
+
+    window_days = max(window_days, 1)
+    day_numbers = days.astype("int64")
+    starts = np.searchsorted(day_numbers, day_numbers - (window_days - 1), side="left")
+    ends = np.arange(1, len(day_numbers) + 1)
+    totals = np.vstack([np.zeros((1, values.shape[1])), np.cumsum(values, axis=0)])
+    return (totals[ends] - totals[starts]) / (ends - starts)[:, None]
+
+
+def series_lists(values: np.ndarray) -> Iterable[List[float]]:
+    """Yield each metric column as a plain list (JSON-serialisable floats)."""
+
+    for index in range(values.shape[1]):
+        yield values[:, index].tolist()
+
+
+def _weekday(days: np.ndarray) -> np.ndarray:
+    # 1970-01-01 was a Thursday; Monday == 0
+    return ((days.astype("int64") + 3) % 7).astype("timedelta64[D]")
+
+
+def _bucket_labels(buckets: np.ndarray, aggregation: str) -> List[str]:
+    if aggregation == "monthly":
+        return np.datetime_as_string(buckets, unit="M").tolist()
+    if aggregation == "weekly":
+        thursdays = buckets + np.timedelta64(3, "D")
+        years = thursdays.astype("datetime64[Y]")
+        weeks = (thursdays - years.astype("datetime64[D]")).astype("int64") // 7 + 1
+        return [f"{year}-W{week:02d}" for year, week in zip(np.datetime_as_string(years).tolist(), weeks.tolist())]
+    return np.datetime_as_string(buckets, unit="D").tolist()
+
+
+__all__ = [
+    "SeriesFrame",
+    "aggregate_frame",
+    "align_frames",
+    "frame_from_rows",
+    "rolling_mean",
+    "series_lists",
+]
@@ -4,14 +4,39 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from typing import List, Optional, Tuple
+from typing import ClassVar, List, Optional, Tuple
 
-from core.pydantic_schemas import ChartData, DataQuery, Dataset, TimeRange
+from core.pydantic_schemas import ChartData, DataQuery, DataSource, Dataset, TimeRange
+
+from .cache import chart_cache_key, get_chart_data_cache
 
 
 class BaseDataFetcher(ABC):
     """Abstract base class for data source fetchers."""
 
+    source: ClassVar[DataSource]
+
+    async def fetch_cached(self, query: DataQuery, *, customer_id: Optional[int] = None) -> ChartData:
+        """Return :meth:`fetch` results through the shared chart data cache."""
+        cache = get_chart_data_cache()
+        if not cache.enabled:
+            return await self.fetch(query)
+
+        start_date, end_date = self.resolve_time_range(query.time_range)
+        key = chart_cache_key(self.source, customer_id, query, start_date.date(), end_date.date())
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+        generation = cache.generation(self.source)
+        data = await self.fetch(query)
+        cache.put(key, data, generation=generation)
+        return data
+
+    def requested_metrics(self, query: DataQuery) -> List[str]:
+        """Return ``metric`` plus any extra ``metrics``, without duplicates."""
+        return list(dict.fromkeys([query.metric, *(query.metrics or [])]))
+
     @abstractmethod
     async def fetch(self, query: DataQuery) -> ChartData:
         """Fetch data based on query specification."""
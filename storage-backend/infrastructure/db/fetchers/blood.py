@@ -3,14 +3,14 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
-from typing import List
+from typing import Dict, List
 
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
-from core.pydantic_schemas import ChartData, Dataset, DataQuery
+from core.pydantic_schemas import ChartData, Dataset, DataQuery, DataSource
 from infrastructure.db import require_blood_session_factory, session_scope
 
+from .aggregation import aggregate_frame, align_frames, frame_from_rows, series_lists
 from .base import BaseDataFetcher
 
 logger = logging.getLogger(__name__)
@@ -19,6 +19,8 @@ logger = logging.getLogger(__name__)
 class BloodDataFetcher(BaseDataFetcher):
     """Fetch blood metrics from the lab results database."""
 
+    source = DataSource.BLOOD
+
     # Mapping from short metric names to exact database test_names
     METRIC_MAPPING = {
         # Hematology
@@ -128,39 +130,47 @@ class BloodDataFetcher(BaseDataFetcher):
         return self.AVAILABLE_METRICS
 
     async def fetch(self, query: DataQuery) -> ChartData:
-        """Fetch blood tests for the requested metric."""
-        if query.metric not in self.AVAILABLE_METRICS:
-            raise ValueError(
-                f"Unknown blood metric '{query.metric}'. "
-                f"Available metrics: {', '.join(self.AVAILABLE_METRICS)}"
-            )
-
-        # Get the exact test_name from the mapping
-        test_name = self.METRIC_MAPPING[query.metric]
+        """Fetch blood tests for the requested metrics in a single query."""
+        metrics = self.requested_metrics(query)
+        for metric in metrics:
+            if metric not in self.AVAILABLE_METRICS:
+                raise ValueError(
+                    f"Unknown blood metric '{metric}'. "
+                    f"Available metrics: {', '.join(self.AVAILABLE_METRICS)}"
+                )
+
+        # Get the exact test_names from the mapping
+        test_names = [self.METRIC_MAPPING[metric] for metric in metrics]
 
         start_date, end_date = self.resolve_time_range(query.time_range)
 
+        # ``limit`` applies per test, as it did when each test had its own query
         sql = text(
             """
-            SELECT
-                bt.test_date,
-                bt.result_value,
-                bt.result_unit
-            FROM blood_tests bt
-            JOIN test_definitions td ON bt.test_definition_id = td.id
-            WHERE td.test_name = :test_name
-              AND bt.test_date BETWEEN :start_date AND :end_date
-            ORDER BY bt.test_date
-            LIMIT :limit
+            SELECT test_name, test_date, result_value, result_unit
+            FROM (
+                SELECT
+                    td.test_name,
+                    bt.test_date,
+                    bt.result_value,
+                    bt.result_unit,
+                    ROW_NUMBER() OVER (PARTITION BY td.test_name ORDER BY bt.test_date) AS test_rank
+                FROM blood_tests bt
+                JOIN test_definitions td ON bt.test_definition_id = td.id
+                WHERE td.test_name IN :test_names
+                  AND bt.test_date BETWEEN :start_date AND :end_date
+            ) ranked
+            WHERE test_rank <= :limit
+            ORDER BY test_date
         """
-        )
+        ).bindparams(bindparam("test_names", expanding=True))
 
         session_factory = require_blood_session_factory()
         async with session_scope(session_factory) as session:
             result = await session.execute(
                 sql,
                 {
-                    "test_name": test_name,
+                    "test_names": test_names,
                     "start_date": start_date.date(),
                     "end_date": end_date.date(),
                     "limit": query.limit,
@@ -168,25 +178,27 @@ class BloodDataFetcher(BaseDataFetcher):
             )
             rows = result.fetchall()
 
-        labels: List[str] = []
-        values: List[float] = []
-        unit: str | None = None
-
+        rows_by_test: Dict[str, list] = {test_name: [] for test_name in test_names}
+        units: Dict[str, str] = {}
         for row in rows:
-            test_date = row.test_date
-            if isinstance(test_date, datetime):
-                labels.append(test_date.strftime("%Y-%m-%d"))
-            else:
-                labels.append(str(test_date))
-            values.append(float(row.result_value) if row.result_value is not None else 0.0)
-            if unit is None:
-                unit = row.result_unit
-
-        metric_label = query.metric.replace("_", " ").title()
-        if unit:
-            metric_label = f"{metric_label} ({unit})"
-
-        return ChartData(labels=labels, datasets=[Dataset(label=metric_label, data=values)])
+            rows_by_test[row.test_name].append(row)
+            if row.result_unit and row.test_name not in units:
+                units[row.test_name] = row.result_unit
+
+        frame = align_frames(
+            [frame_from_rows(rows_by_test[test_name], "test_date", ["result_value"]) for test_name in test_names]
+        )
+        labels, values = aggregate_frame(frame, query.aggregation)
+
+        datasets = []
+        for metric, test_name, data in zip(metrics, test_names, series_lists(values)):
+            metric_label = metric.replace("_", " ").title()
+            unit = units.get(test_name)
+            if unit:
+                metric_label = f"{metric_label} ({unit})"
+            datasets.append(Dataset(label=metric_label, data=data))
+
+        return ChartData(labels=labels, datasets=datasets)
 
 
 __all__ = ["BloodDataFetcher"]
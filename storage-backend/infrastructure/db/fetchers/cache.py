@@ -0,0 +1,156 @@
+"""TTL cache for chart data returned by the fetchers.
+
+Chats keep asking for the same 30/90-day charts, each time re-running the SQL
+and the aggregation.  Results are cached per ``(source, customer, metrics,
+date range, aggregation, limit)`` for ``CHART_CACHE_TTL_SECONDS``.
+
+Garmin ingestion calls :func:`invalidate_after_commit`, which drops every
+cached Garmin chart once the transaction that wrote the rows commits.  The
+chart queries do not filter by customer, so the whole source is dropped
+rather than one customer's entries.  A fetch that was already running when
+the source was invalidated does not store its (possibly stale) result.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from config.database.defaults import CHART_CACHE_MAX_ENTRIES, CHART_CACHE_TTL_SECONDS
+from core.pydantic_schemas import ChartData, DataQuery, DataSource
+
+_PENDING_KEY = "chart_cache_pending_invalidations"
+_LISTENING_KEY = "chart_cache_listening"
+
+ChartCacheKey = Tuple[Hashable, ...]
+
+
+@dataclass(slots=True)
+class _Entry:
+    expires_at: float
+    data: ChartData
+
+
+def chart_cache_key(
+    source: DataSource,
+    customer_id: Optional[int],
+    query: DataQuery,
+    start_date: date,
+    end_date: date,
+) -> ChartCacheKey:
+    """Return the cache key for ``query`` resolved to ``start_date``..``end_date``."""
+
+    metrics = tuple(dict.fromkeys([query.metric, *(query.metrics or [])]))
+    return (source, customer_id, metrics, start_date, end_date, query.aggregation or "none", query.limit)
+
+
+class ChartDataCache:
+    """In-memory LRU with per-entry expiry and per-source invalidation."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = CHART_CACHE_TTL_SECONDS,
+        max_entries: int = CHART_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[ChartCacheKey, _Entry]" = OrderedDict()
+        self._generations: Dict[DataSource, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def generation(self, source: DataSource) -> int:
+        """Return the invalidation counter of ``source`` (pass it to :meth:`put`)."""
+
+        return self._generations.get(source, 0)
+
+    def get(self, key: ChartCacheKey) -> Optional[ChartData]:
+        """Return a copy of the cached chart data, if present and fresh."""
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry.data.model_copy(deep=True)
+
+    def put(self, key: ChartCacheKey, data: ChartData, *, generation: int) -> None:
+        """Store ``data`` unless its source was invalidated since ``generation``."""
+
+        if not self.enabled or generation != self.generation(key[0]):
+            return
+        self._entries[key] = _Entry(time.monotonic() + self.ttl_seconds, data.model_copy(deep=True))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, source: DataSource) -> None:
+        """Drop every entry of ``source`` and reject in-flight results for it."""
+
+        self._generations[source] = self.generation(source) + 1
+        for key in [key for key in self._entries if key[0] == source]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Module-level cache shared by all fetcher instances
+chart_data_cache = ChartDataCache()
+
+
+def get_chart_data_cache() -> ChartDataCache:
+    """Return the process-wide chart data cache."""
+    return chart_data_cache
+
+
+def _on_commit(session: Session) -> None:
+    for source in session.info.pop(_PENDING_KEY, ()):
+        chart_data_cache.invalidate(source)
+
+
+def _on_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def invalidate_after_commit(db_session: Any, source: DataSource) -> None:
+    """Invalidate cached charts of ``source`` when ``db_session`` commits.
+
+    The source is also invalidated at once so that fetches running during
+    the write do not cache the old rows.  Sessions that are not SQLAlchemy
+    sessions (test doubles) only get the immediate invalidation.
+    """
+    chart_data_cache.invalidate(source)
+
+    sync_session = getattr(db_session, "sync_session", db_session)
+    if not isinstance(sync_session, Session):
+        return
+
+    sync_session.info.setdefault(_PENDING_KEY, set()).add(source)
+    if not sync_session.info.get(_LISTENING_KEY):
+        event.listen(sync_session, "after_commit", _on_commit)
+        event.listen(sync_session, "after_rollback", _on_rollback)
+        sync_session.info[_LISTENING_KEY] = True
+
+
+__all__ = [
+    "ChartDataCache",
+    "chart_cache_key",
+    "chart_data_cache",
+    "get_chart_data_cache",
+    "invalidate_after_commit",
+]
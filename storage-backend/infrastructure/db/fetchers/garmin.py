@@ -3,22 +3,27 @@
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
-from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Dict, List
 
 from sqlalchemy import text
 
-from core.pydantic_schemas import ChartData, Dataset, DataQuery
+from core.pydantic_schemas import ChartData, Dataset, DataQuery, DataSource
 from infrastructure.db import require_garmin_session_factory, session_scope
 
+from .aggregation import SeriesFrame, aggregate_frame, align_frames, frame_from_rows, series_lists
 from .base import BaseDataFetcher
 
 logger = logging.getLogger(__name__)
 
 
 class GarminDataFetcher(BaseDataFetcher):
-    """Fetch garmin metrics from the health database."""
+    """Fetch garmin metrics from the health database.
+
+    Metrics stored in the same table are read with one query; tables are
+    combined on the union of their dates.
+    """
+
+    source = DataSource.GARMIN
 
     AVAILABLE_METRICS = [
         "resting_heart_rate",
@@ -163,107 +168,66 @@ class GarminDataFetcher(BaseDataFetcher):
 
     async def fetch(self, query: DataQuery) -> ChartData:
         """Fetch metric data and convert to chart-ready format."""
-        if query.metric not in self.METRIC_QUERIES:
-            raise ValueError(
-                f"Unknown Garmin metric '{query.metric}'. "
-                f"Available metrics: {', '.join(self.AVAILABLE_METRICS)}"
-            )
+        metrics = self.requested_metrics(query)
+        for metric in metrics:
+            if metric not in self.METRIC_QUERIES:
+                raise ValueError(
+                    f"Unknown Garmin metric '{metric}'. "
+                    f"Available metrics: {', '.join(self.AVAILABLE_METRICS)}"
+                )
 
-        metric_config = self.METRIC_QUERIES[query.metric]
-        start_date, end_date = self.resolve_time_range(query.time_range)
+        by_table: Dict[str, List[str]] = {}
+        for metric in metrics:
+            by_table.setdefault(self.METRIC_QUERIES[metric]["table"], []).append(metric)
 
-        sql = text(
-            f"""
-            SELECT
-                {metric_config['date_column']} as date_value,
-                {metric_config['value_column']} as metric_value
-            FROM {metric_config['table']}
-            WHERE {metric_config['date_column']} BETWEEN :start_date AND :end_date
-            ORDER BY {metric_config['date_column']}
-            LIMIT :limit
-        """
-        )
+        start_date, end_date = self.resolve_time_range(query.time_range)
+        params = {
+            "start_date": start_date.date(),
+            "end_date": end_date.date(),
+            "limit": query.limit,
+        }
 
+        frames: List[SeriesFrame] = []
         session_factory = require_garmin_session_factory()
         async with session_scope(session_factory) as session:
-            result = await session.execute(
-                sql,
-                {
-                    "start_date": start_date.date(),
-                    "end_date": end_date.date(),
-                    "limit": query.limit,
-                },
-            )
-            rows = result.fetchall()
-
-        labels: List[str] = []
-        values: List[float] = []
+            for table, table_metrics in by_table.items():
+                result = await session.execute(self._table_query(table, table_metrics), params)
+                value_keys = [f"metric_value_{index}" for index in range(len(table_metrics))]
+                frames.append(frame_from_rows(result.fetchall(), "date_value", value_keys))
 
-        for row in rows:
-            date_value = row.date_value
-            if isinstance(date_value, datetime):
-                labels.append(date_value.strftime("%Y-%m-%d"))
-            else:
-                labels.append(str(date_value))
-
-            value = row.metric_value
-            values.append(float(value) if value is not None else 0.0)
-
-        labels, values = self._maybe_aggregate(labels, values, query.aggregation)
+        # Columns follow table grouping; map them back to the requested order
+        column_order = [metric for table_metrics in by_table.values() for metric in table_metrics]
+        labels, values = aggregate_frame(align_frames(frames), query.aggregation)
+        series = dict(zip(column_order, series_lists(values)))
 
         return ChartData(
             labels=labels,
             datasets=[
-                Dataset(
-                    label=self._format_metric_label(query.metric),
-                    data=values,
-                )
+                Dataset(label=self._format_metric_label(metric), data=series[metric])
+                for metric in metrics
             ],
         )
 
+    def _table_query(self, table: str, metrics: List[str]):
+        date_column = self.METRIC_QUERIES[metrics[0]]["date_column"]
+        value_columns = ",\n                ".join(
+            f"{self.METRIC_QUERIES[metric]['value_column']} as metric_value_{index}"
+            for index, metric in enumerate(metrics)
+        )
+        return text(
+            f"""
+            SELECT
+                {date_column} as date_value,
+                {value_columns}
+            FROM {table}
+            WHERE {date_column} BETWEEN :start_date AND :end_date
+            ORDER BY {date_column}
+            LIMIT :limit
+        """
+        )
+
     def _format_metric_label(self, metric: str) -> str:
         return metric.replace("_", " ").title()
 
-    def _maybe_aggregate(
-        self, labels: List[str], values: List[float], aggregation: Optional[str]
-    ) -> Tuple[List[str], List[float]]:
-        if not aggregation or aggregation == "none":
-            return labels, values
-        if aggregation == "daily":
-            return labels, values
-
-        buckets: defaultdict[str, List[float]] = defaultdict(list)
-        for label, value in zip(labels, values):
-            bucket = self._bucket_label(label, aggregation)
-            buckets[bucket].append(value)
-
-        ordered_labels = sorted(buckets.keys())
-        aggregated_values = [
-            sum(buckets[label]) / max(len(buckets[label]), 1) for label in ordered_labels
-        ]
-        return ordered_labels, aggregated_values
-
-    def _bucket_label(self, label: str, aggregation: str) -> str:
-        dt = self._parse_label_to_datetime(label)
-        if not dt:
-            return label
-
-        if aggregation == "weekly":
-            return f"{dt.year}-W{dt.isocalendar().week:02d}"
-        if aggregation == "monthly":
-            return dt.strftime("%Y-%m")
-        return dt.strftime("%Y-%m-%d")
-
-    def _parse_label_to_datetime(self, label: str) -> Optional[datetime]:
-        try:
-            return datetime.fromisoformat(label)
-        except ValueError:
-            for fmt in ("%Y-%m-%d", "%Y/%m/%d"):
-                try:
-                    return datetime.strptime(label, fmt)
-                except ValueError:
-                    continue
-        return None
-
 
 __all__ = ["GarminDataFetcher"]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import List
 
-from core.pydantic_schemas import ChartData, DataQuery, Dataset
+from core.pydantic_schemas import ChartData, DataQuery, DataSource, Dataset
 
 from .base import BaseDataFetcher
 
@@ -12,6 +12,8 @@ from .base import BaseDataFetcher
 class UFCDataFetcher(BaseDataFetcher):
     """Fetch UFC statistics (placeholder until schema finalized)."""
 
+    source = DataSource.UFC
+
     AVAILABLE_METRICS = [
         "wins",
         "losses",
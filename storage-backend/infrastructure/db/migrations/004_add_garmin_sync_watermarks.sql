@@ -0,0 +1,20 @@
+-- Migration: Add garmin_sync_watermarks table for incremental Garmin/Withings sync
+-- Author: Storage Backend Team
+-- Date: 2026-10-18
+
+-- Up Migration
+CREATE TABLE IF NOT EXISTS garmin_sync_watermarks (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    customer_id INT NOT NULL COMMENT 'Customer whose data is synced',
+    dataset VARCHAR(64) NOT NULL COMMENT 'Garmin dataset key (sleep, summary, ...)',
+    last_synced_date DATE NOT NULL COMMENT 'Last calendar date synced successfully',
+    last_run_at TIMESTAMP NULL COMMENT 'When the watermark was last advanced',
+    rows_written INT NOT NULL DEFAULT 0 COMMENT 'Rows written by the last sync window',
+
+    UNIQUE KEY unique_customer_dataset (customer_id, dataset),
+    INDEX idx_garmin_sync_watermarks_customer (customer_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+COMMENT='Per-dataset sync frontier for incremental Garmin/Withings ingestion';
+
+-- Down Migration (for rollback)
+-- DROP TABLE IF EXISTS garmin_sync_watermarks;
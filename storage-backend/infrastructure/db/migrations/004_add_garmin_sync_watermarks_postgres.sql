@@ -0,0 +1,22 @@
+-- Migration: Add garmin_sync_watermarks table for incremental Garmin/Withings sync (PostgreSQL/Supabase)
+-- Author: Storage Backend Team
+-- Date: 2026-10-18
+
+-- Up Migration
+CREATE TABLE IF NOT EXISTS garmin_sync_watermarks (
+    id SERIAL PRIMARY KEY,
+    customer_id INT NOT NULL,
+    dataset VARCHAR(64) NOT NULL,
+    last_synced_date DATE NOT NULL,
+    last_run_at TIMESTAMP WITH TIME ZONE,
+    rows_written INT NOT NULL DEFAULT 0,
+
+    CONSTRAINT unique_customer_dataset UNIQUE (customer_id, dataset)
+);
+
+CREATE INDEX IF NOT EXISTS idx_garmin_sync_watermarks_customer ON garmin_sync_watermarks(customer_id);
+
+COMMENT ON TABLE garmin_sync_watermarks IS 'Per-dataset sync frontier for incremental Garmin/Withings ingestion';
+
+-- Down Migration (for rollback)
+-- DROP TABLE IF EXISTS garmin_sync_watermarks;
@@ -0,0 +1,34 @@
+-- Migration: Add video_jobs table for background video generation
+-- Author: Storage Backend Team
+-- Date: 2026-10-18
+
+-- Up Migration
+CREATE TABLE IF NOT EXISTS video_jobs (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    job_id VARCHAR(64) UNIQUE NOT NULL COMMENT 'Public job identifier returned to clients',
+    customer_id INT NOT NULL COMMENT 'User who requested the video',
+    provider VARCHAR(50) NOT NULL COMMENT 'Video provider (gemini, openai, klingai)',
+    model VARCHAR(100) NOT NULL COMMENT 'Requested video model',
+    mode VARCHAR(32) NOT NULL DEFAULT 'text_to_video' COMMENT 'text_to_video or image_to_video',
+    status ENUM('queued', 'processing', 'completed', 'failed') NOT NULL DEFAULT 'queued' COMMENT 'Current job status',
+
+    prompt TEXT NOT NULL COMMENT 'Generation prompt',
+    input_image_url TEXT COMMENT 'Source image for image-to-video',
+    settings JSON COMMENT 'Provider kwargs and response metadata',
+    provider_handle JSON COMMENT 'Provider operation reference used for polling',
+
+    video_url VARCHAR(1000) COMMENT 'S3 URL of the finished video',
+    error_message TEXT COMMENT 'Error details if the job failed',
+
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP COMMENT 'When the job was submitted',
+    started_at TIMESTAMP NULL COMMENT 'When the provider operation was started',
+    completed_at TIMESTAMP NULL COMMENT 'When the job finished',
+
+    INDEX idx_video_jobs_status_created (status, created_at),
+    INDEX idx_video_jobs_customer_created (customer_id, created_at),
+    FOREIGN KEY (customer_id) REFERENCES Users(customer_id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+COMMENT='Background video generations advanced by the shared job poller';
+
+-- Down Migration (for rollback)
+-- DROP TABLE IF EXISTS video_jobs;
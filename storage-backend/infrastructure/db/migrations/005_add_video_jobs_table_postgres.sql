@@ -0,0 +1,41 @@
+-- Migration: Add video_jobs table for background video generation (PostgreSQL/Supabase)
+-- Author: Storage Backend Team
+-- Date: 2026-10-18
+
+-- Up Migration
+DO $$ BEGIN
+    CREATE TYPE video_job_status AS ENUM ('queued', 'processing', 'completed', 'failed');
+EXCEPTION
+    WHEN duplicate_object THEN NULL;
+END $$;
+
+CREATE TABLE IF NOT EXISTS video_jobs (
+    id SERIAL PRIMARY KEY,
+    job_id VARCHAR(64) UNIQUE NOT NULL,
+    customer_id INT NOT NULL REFERENCES "Users"(customer_id) ON DELETE CASCADE,
+    provider VARCHAR(50) NOT NULL,
+    model VARCHAR(100) NOT NULL,
+    mode VARCHAR(32) NOT NULL DEFAULT 'text_to_video',
+    status video_job_status NOT NULL DEFAULT 'queued',
+
+    prompt TEXT NOT NULL,
+    input_image_url TEXT,
+    settings JSONB,
+    provider_handle JSONB,
+
+    video_url VARCHAR(1000),
+    error_message TEXT,
+
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    started_at TIMESTAMP WITH TIME ZONE,
+    completed_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE INDEX IF NOT EXISTS idx_video_jobs_status_created ON video_jobs(status, created_at);
+CREATE INDEX IF NOT EXISTS idx_video_jobs_customer_created ON video_jobs(customer_id, created_at);
+
+COMMENT ON TABLE video_jobs IS 'Background video generations advanced by the shared job poller';
+
+-- Down Migration (for rollback)
+-- DROP TABLE IF EXISTS video_jobs;
+-- DROP TYPE IF EXISTS video_job_status;
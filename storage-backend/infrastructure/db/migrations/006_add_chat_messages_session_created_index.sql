@@ -0,0 +1,9 @@
+-- Migration: Composite (session_id, created_at) index on ChatMessagesNG for message polling
+-- Author: Storage Backend Team
+-- Date: 2026-10-18
+
+-- Up Migration
+CREATE INDEX idx_chat_messages_session_created ON ChatMessagesNG (session_id, created_at);
+
+-- Down Migration (for rollback)
+-- DROP INDEX idx_chat_messages_session_created ON ChatMessagesNG;
@@ -0,0 +1,11 @@
+-- Migration: Composite (session_id, created_at) index on ChatMessagesNG for message polling (PostgreSQL/Supabase)
+-- Author: Storage Backend Team
+-- Date: 2026-10-18
+
+-- Up Migration
+-- CONCURRENTLY avoids locking the table; run outside a transaction block.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chat_messages_session_created
+    ON "ChatMessagesNG" (session_id, created_at);
+
+-- Down Migration (for rollback)
+-- DROP INDEX CONCURRENTLY IF EXISTS idx_chat_messages_session_created;
@@ -0,0 +1,11 @@
+-- Migration: Pipelined sequential mode settings on chat_groups
+-- Author: Storage Backend Team
+-- Date: 2026-10-18
+
+-- Up Migration
+ALTER TABLE chat_groups
+    ADD COLUMN pipelined BOOLEAN NOT NULL DEFAULT FALSE,
+    ADD COLUMN independent_agents JSON NULL;
+
+-- Down Migration (for rollback)
+-- ALTER TABLE chat_groups DROP COLUMN independent_agents, DROP COLUMN pipelined;
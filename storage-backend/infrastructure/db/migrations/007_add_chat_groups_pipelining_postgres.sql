@@ -0,0 +1,11 @@
+-- Migration: Pipelined sequential mode settings on chat_groups (PostgreSQL/Supabase)
+-- Author: Storage Backend Team
+-- Date: 2026-10-18
+
+-- Up Migration
+ALTER TABLE chat_groups
+    ADD COLUMN IF NOT EXISTS pipelined BOOLEAN NOT NULL DEFAULT FALSE,
+    ADD COLUMN IF NOT EXISTS independent_agents JSON;
+
+-- Down Migration (for rollback)
+-- ALTER TABLE chat_groups DROP COLUMN IF EXISTS independent_agents, DROP COLUMN IF EXISTS pipelined;
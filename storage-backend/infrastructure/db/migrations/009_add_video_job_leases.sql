@@ -0,0 +1,11 @@
+-- Migration: Poller leases on video_jobs
+-- Author: Storage Backend Team
+-- Date: 2026-10-19
+
+-- Up Migration
+ALTER TABLE video_jobs
+    ADD COLUMN lease_owner VARCHAR(64) NULL,
+    ADD COLUMN lease_expires_at TIMESTAMP NULL;
+
+-- Down Migration (for rollback)
+-- ALTER TABLE video_jobs DROP COLUMN lease_expires_at, DROP COLUMN lease_owner;
@@ -0,0 +1,11 @@
+-- Migration: Poller leases on video_jobs (PostgreSQL/Supabase)
+-- Author: Storage Backend Team
+-- Date: 2026-10-19
+
+-- Up Migration
+ALTER TABLE video_jobs
+    ADD COLUMN IF NOT EXISTS lease_owner VARCHAR(64),
+    ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMP WITH TIME ZONE;
+
+-- Down Migration (for rollback)
+-- ALTER TABLE video_jobs DROP COLUMN IF EXISTS lease_expires_at, DROP COLUMN IF EXISTS lease_owner;
@@ -15,49 +15,60 @@ Entry Points:
 """
 
 import logging
+import sys
 import time
 from contextlib import asynccontextmanager
-from typing import AsyncIterator
+from importlib import import_module
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Optional
 
 from core.utils.env import is_production
 # Track startup time in non-production environments
 start_time = time.time() if not is_production() else None
 
-import os
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from config.batch import BATCH_SCHEDULER_ENABLED
+from config.environment import ENABLED_ROUTERS
+from config.video import VIDEO_JOB_POLLER_ENABLED
 from core.auth import AuthenticationError
 from core.clients.semantic import close_qdrant_client
 from core.exceptions import ConfigurationError
 from core.logging import setup_logging
 from core.observability import register_http_request_logging
 from core.pydantic_schemas import error as api_error
-from features.admin.routes import router as admin_router
-from features.audio.routes import router as audio_router
-from features.batch.routes import router as batch_router
-from features.chat.routes import router as chat_router
-from features.db.blood.routes import router as blood_router
-from features.db.ufc.routes import router as ufc_router
-from features.image.routes import router as image_router
-from features.legacy_compat import router as legacy_compat_router
-from features.realtime.routes import (
-    router as realtime_router,
-    websocket_router as realtime_websocket_router,
+from infrastructure.db.mysql import main_session_factory
+
+# (feature, module, router attribute, include_router kwargs) in mount order.
+# Feature routers are imported inside ``create_app`` so ``APP_ROUTERS`` can
+# keep unused features (and the provider SDKs they pull in) out of the process.
+ROUTERS: tuple[tuple[str, str, str, dict[str, str]], ...] = (
+    ("admin", "features.admin.routes", "router", {"prefix": "/api/v1"}),
+    ("legacy_compat", "features.legacy_compat", "router", {}),  # Legacy compatibility for old mobile app
+    ("chat", "features.chat.routes", "router", {}),
+    ("audio", "features.audio.routes", "router", {}),
+    ("image", "features.image.routes", "router", {}),
+    ("storage", "features.storage", "router", {}),
+    ("video", "features.video.routes", "router", {}),
+    ("garmin", "features.garmin.routes", "router", {}),
+    ("blood", "features.db.blood.routes", "router", {}),
+    ("ufc", "features.db.ufc.routes", "router", {}),
+    ("tts", "features.tts", "router", {}),
+    ("tts", "features.tts", "websocket_router", {}),
+    ("realtime", "features.realtime.routes", "router", {}),
+    ("realtime", "features.realtime.routes", "websocket_router", {}),
+    ("semantic", "features.semantic_search.routes", "router", {}),
+    ("batch", "features.batch.routes", "router", {}),
+    ("automation", "features.automation.routes", "router", {}),
+    ("proactive_agent", "features.proactive_agent.routes", "router", {}),
+    ("journal", "features.journal.routes", "router", {}),
+    ("cc4life", "features.cc4life.routes", "router", {}),
 )
-from features.storage import router as storage_router
-from features.tts import router as tts_router
-from features.tts import websocket_router as tts_websocket_router
-from features.video.routes import router as video_router
-from features.semantic_search.routes import router as semantic_router
-from features.automation.routes import router as automation_router
-from features.proactive_agent.routes import router as proactive_agent_router
-from features.journal.routes import router as journal_router
-from features.cc4life.routes import router as cc4life_router
-
-# Only import Garmin in production to speed up dev reloads
-from features.garmin.routes import router as garmin_router
+
+# Features whose pushes to proactive WebSocket connections go through the
+# cross-worker push bus.
+PUSH_BUS_FEATURES = frozenset({"chat", "proactive_agent", "video"})
 
 setup_logging()
 
@@ -66,17 +77,73 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
-    """Manage application lifespan - startup and shutdown events."""
+    """Manage application lifespan - startup and shutdown events.
+
+    Background services are imported and started only for mounted features,
+    so ``APP_ROUTERS`` keeps them (and their imports) out of the process.
+    """
+    features = set(getattr(app.state, "features", ()))
+    stops: list[Callable[[], Awaitable[None]]] = []
+
     # Startup
+    if "batch" in features and BATCH_SCHEDULER_ENABLED and main_session_factory is not None:
+        from features.batch.services import start_batch_scheduler, stop_batch_scheduler
+
+        start_batch_scheduler(main_session_factory)
+        stops.append(stop_batch_scheduler)
+    if "video" in features and VIDEO_JOB_POLLER_ENABLED and main_session_factory is not None:
+        from features.video.jobs import start_video_job_poller, stop_video_job_poller
+
+        start_video_job_poller(main_session_factory)
+        stops.append(stop_video_job_poller)
+    if features & PUSH_BUS_FEATURES:
+        from core.connections.push_bus import start_push_bus, stop_push_bus
+
+        await start_push_bus()
+        stops.append(stop_push_bus)
     yield
     # Shutdown
     logger.info("Application shutting down...")
+    for stop in stops:
+        await stop()
     await close_qdrant_client()
+    # Only features that stream ElevenLabs TTS import (and fill) the pool.
+    websocket_pool = sys.modules.get("core.providers.tts.utils.websocket_pool")
+    if websocket_pool is not None:
+        await websocket_pool.close_websocket_pool()
     logger.info("Shutdown complete")
 
 
-def create_app() -> FastAPI:
-    """Application factory returning a configured FastAPI instance."""
+def include_routers(app: FastAPI, enabled: Optional[Iterable[str]] = None) -> list[str]:
+    """Import and mount feature routers; ``enabled=None`` mounts all of them.
+
+    Returns the names of the mounted features in mount order.
+    """
+
+    wanted = None if enabled is None else {name.lower() for name in enabled}
+    known = {feature for feature, *_ in ROUTERS}
+    if wanted is not None and wanted - known:
+        raise ConfigurationError(
+            f"Unknown router(s) in APP_ROUTERS: {', '.join(sorted(wanted - known))}",
+            key="APP_ROUTERS",
+        )
+
+    mounted: list[str] = []
+    for feature, module_path, attr, kwargs in ROUTERS:
+        if wanted is not None and feature not in wanted:
+            continue
+        router = getattr(import_module(module_path), attr)
+        app.include_router(router, **kwargs)
+        if feature not in mounted:
+            mounted.append(feature)
+    return mounted
+
+
+def create_app(routers: Optional[Iterable[str]] = None) -> FastAPI:
+    """Application factory returning a configured FastAPI instance.
+
+    ``routers`` limits the mounted features (defaults to ``APP_ROUTERS``).
+    """
 
     app = FastAPI(
         title="BetterAI Backend v2",
@@ -145,29 +212,11 @@ def create_app() -> FastAPI:
 
     register_http_request_logging(app)
 
-    app.include_router(admin_router, prefix="/api/v1")
-    app.include_router(legacy_compat_router)  # Legacy compatibility for old mobile app
-    app.include_router(chat_router)
-    app.include_router(audio_router)
-    app.include_router(image_router)
-    app.include_router(storage_router)
-    app.include_router(video_router)
-    app.include_router(garmin_router)
-    app.include_router(blood_router)
-    app.include_router(ufc_router)
-    app.include_router(tts_router)
-    app.include_router(tts_websocket_router)
-    app.include_router(realtime_router)
-    app.include_router(realtime_websocket_router)
-    app.include_router(semantic_router)
-    app.include_router(batch_router)
-    app.include_router(automation_router)
-    app.include_router(proactive_agent_router)
-    app.include_router(journal_router)
-    app.include_router(cc4life_router)
+    mounted = include_routers(app, ENABLED_ROUTERS if routers is None else routers)
+    app.state.features = tuple(mounted)
 
     # Build status message
-    routers_list = "chat, audio, image, video, Garmin, Blood, UFC, TTS, realtime, semantic, batch, automation, and proactive-agent routers"
+    routers_list = f"{', '.join(mounted)} routers" if mounted else "no feature routers"
 
     # Add timing info for non-production
     timing_info = ""
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Profile cold import time of the application (or any module).
+
+Runs ``python -X importtime -c "import <module>"`` in a fresh interpreter and
+prints the slowest imports by cumulative time, each with the chain of modules
+that pulled it in.
+
+Usage:
+    python profile_imports.py                  # profile ``main``
+    python profile_imports.py core.clients.ai --top 15
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, NamedTuple
+
+ROOT = Path(__file__).resolve().parent
+
+
+class ImportRecord(NamedTuple):
+    depth: int
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def collect(module: str) -> List[ImportRecord]:
+    """Import ``module`` in a subprocess and parse the ``-X importtime`` report."""
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        tail = "\n".join(line for line in result.stderr.splitlines() if not line.startswith("import time:"))
+        raise SystemExit(f"import {module} failed:\n{tail[-2000:]}")
+
+    records: List[ImportRecord] = []
+    for line in result.stderr.splitlines():
+        # "import time: <self us> | <cumulative us> | <indented module>"
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            continue  # header row
+        module = name.strip()
+        records.append(
+            ImportRecord(
+                depth=(len(name.rstrip()) - len(module) - 1) // 2,
+                module=module,
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+            )
+        )
+    return records
+
+
+def importer_chain(records: List[ImportRecord], index: int, limit: int = 4) -> List[str]:
+    """Return the modules whose import triggered ``records[index]``.
+
+    ``-X importtime`` prints children before their parent, so the importer is
+    the next record at a shallower depth.
+    """
+
+    chain: List[str] = []
+    depth = records[index].depth
+    for record in records[index + 1 :]:
+        if record.depth < depth:
+            chain.append(record.module)
+            depth = record.depth
+            if depth == 0 or len(chain) >= limit:
+                break
+    return chain
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("module", nargs="?", default="main", help="module to import (default: main)")
+    parser.add_argument("--top", type=int, default=25, help="number of entries to print")
+    parser.add_argument("--min-ms", type=float, default=0.0, help="hide imports faster than this")
+    args = parser.parse_args()
+
+    records = collect(args.module)
+    total = max((r.cumulative_us for r in records if r.depth == 0 and r.module == args.module), default=0)
+    print(f"import {args.module}: {total / 1000:.0f} ms cumulative")
+    print(f"{'cumul ms':>9} {'self ms':>8}  module  <- imported by")
+
+    ranked = sorted(range(len(records)), key=lambda i: records[i].cumulative_us, reverse=True)
+    shown = 0
+    for index in ranked:
+        record = records[index]
+        if record.cumulative_us / 1000 < args.min_ms:
+            break
+        chain = importer_chain(records, index)
+        via = f"  <- {' <- '.join(chain)}" if chain else ""
+        print(f"{record.cumulative_us / 1000:9.1f} {record.self_us / 1000:8.1f}  {record.module}{via}")
+        shown += 1
+        if shown >= args.top:
+            break
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
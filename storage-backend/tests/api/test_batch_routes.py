@@ -32,6 +32,9 @@ class _FakeBatchService:
     async def submit_batch(self, request, customer_id: int) -> BatchJobResponse:
         return self.job
 
+    async def submit_batch_async(self, request, customer_id: int) -> BatchJobResponse:
+        return self.job.model_copy(update={"status": "queued"})
+
     async def cancel_batch(self, job_id: str, customer_id: int) -> BatchJobResponse:
         return self.job
 
@@ -95,6 +98,25 @@ async def test_submit_batch_endpoint(monkeypatch: pytest.MonkeyPatch):
     assert response.json()["data"]["job_id"] == "batch_123"
 
 
+@pytest.mark.asyncio
+async def test_submit_batch_endpoint_queues_for_scheduler(monkeypatch: pytest.MonkeyPatch):
+    app = _build_app(monkeypatch)
+    notified: List[bool] = []
+    scheduler = type("Scheduler", (), {"notify": lambda self: notified.append(True)})()
+    monkeypatch.setattr("features.batch.routes.get_batch_scheduler", lambda: scheduler)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/batch/",
+            json={"requests": [{"custom_id": "req-1", "prompt": "Hello"}], "model": "gpt-4o"},
+        )
+
+    assert response.status_code == 200
+    assert response.json()["data"]["status"] == "queued"
+    assert notified == [True]
+
+
 @pytest.mark.asyncio
 async def test_get_batch_status_endpoint(monkeypatch: pytest.MonkeyPatch):
     app = _build_app(monkeypatch)
@@ -147,6 +147,33 @@ def cleanup_background_tasks():
     _cancel_pending_background_tasks()
 
 
+@pytest.fixture(autouse=True)
+def reset_tts_cache():
+    """Keep the process-wide TTS result cache from leaking between tests."""
+    yield
+    cache_module = sys.modules.get("features.tts.cache")
+    if cache_module is not None and cache_module._cache is not None:
+        cache_module._cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_history_compactor():
+    """Keep per-session history windows and summaries from leaking between tests."""
+    yield
+    compaction_module = sys.modules.get("features.chat.services.history.compaction")
+    if compaction_module is not None and compaction_module._compactor is not None:
+        compaction_module._compactor.reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_provider_resolution_cache():
+    """Resolve providers afresh in each test so patched clients and registries apply."""
+    cache_module = sys.modules.get("core.providers.resolver_cache")
+    if cache_module is not None:
+        cache_module.invalidate_provider_caches()
+    yield
+
+
 def pytest_sessionfinish(session: Any, exitstatus: int) -> None:
     """Ensure safe excepthooks are restored before pytest exits."""
     sys.excepthook = _safe_excepthook
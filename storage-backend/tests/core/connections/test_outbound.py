@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+
+from core.connections.outbound import SLOW_CONSUMER_CLOSE_CODE
+from core.connections.proactive_registry import ProactiveConnectionRegistry
+
+
+class FakeWebSocket:
+    def __init__(self) -> None:
+        self.sent = []
+        self.closed_with = None
+
+    async def send_json(self, message):
+        self.sent.append(message)
+
+    async def close(self, code=1000, reason=""):
+        self.closed_with = code
+
+
+class StalledWebSocket(FakeWebSocket):
+    """Client whose TCP window is full: sends never complete."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = asyncio.Event()
+
+    async def send_json(self, message):
+        await self.release.wait()
+        self.sent.append(message)
+
+
+class BrokenWebSocket(FakeWebSocket):
+    async def send_json(self, message):
+        raise RuntimeError("connection reset")
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_stalled_client_does_not_block_other_devices():
+    registry = ProactiveConnectionRegistry(send_timeout=5)
+    stalled, healthy = StalledWebSocket(), FakeWebSocket()
+    await registry.register(user_id=1, session_id="s", websocket=stalled, client_id="kotlin-1")
+    await registry.register(user_id=1, session_id="s", websocket=healthy, client_id="react-1")
+
+    for index in range(3):
+        pushed = await asyncio.wait_for(
+            registry.push_to_user(user_id=1, message={"type": "text_chunk", "i": index}),
+            timeout=1,
+        )
+        assert pushed is True
+
+    assert [item["i"] for item in healthy.sent] == [0, 1, 2]
+    assert stalled.sent == []
+
+    stalled.release.set()
+    await _settle()
+    assert [item["i"] for item in stalled.sent] == [0, 1, 2]
+    await registry.unregister(1)
+
+
+@pytest.mark.asyncio
+async def test_full_queue_evicts_slow_consumer():
+    registry = ProactiveConnectionRegistry(outbound_queue_size=2, send_timeout=5)
+    stalled, healthy = StalledWebSocket(), FakeWebSocket()
+    await registry.register(user_id=1, session_id="s", websocket=stalled, client_id="kotlin-1")
+    await registry.register(user_id=1, session_id="s", websocket=healthy, client_id="react-1")
+
+    for index in range(5):
+        await registry.push_to_user(user_id=1, message={"type": "text_chunk", "i": index})
+    await _settle()
+
+    assert stalled.closed_with == SLOW_CONSUMER_CLOSE_CODE
+    assert await registry.get_websockets(1) == [healthy]
+    assert len(healthy.sent) == 5
+    await registry.unregister(1)
+
+
+@pytest.mark.asyncio
+async def test_send_timeout_evicts_connection():
+    registry = ProactiveConnectionRegistry(send_timeout=0.01)
+    stalled = StalledWebSocket()
+    await registry.register(user_id=1, session_id="s", websocket=stalled)
+
+    assert await registry.push_to_user(user_id=1, message={"type": "ping"}) is True
+    await asyncio.sleep(0.05)
+    await _settle()
+
+    assert stalled.closed_with == SLOW_CONSUMER_CLOSE_CODE
+    assert registry.active_count == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_send_unregisters_connection():
+    registry = ProactiveConnectionRegistry()
+    broken = BrokenWebSocket()
+    await registry.register(user_id=1, session_id="s", websocket=broken)
+
+    await registry.push_to_user(user_id=1, message={"type": "ping"})
+    await _settle()
+
+    assert registry.active_count == 0
+    assert await registry.push_to_user(user_id=1, message={"type": "ping"}) is False
+
+
+@pytest.mark.asyncio
+async def test_zero_queue_size_sends_inline():
+    registry = ProactiveConnectionRegistry(outbound_queue_size=0)
+    ws = FakeWebSocket()
+    await registry.register(user_id=1, session_id="s", websocket=ws)
+
+    conn = await registry.get_connection(1)
+    assert conn.writer is None
+    assert await registry.push_to_user(user_id=1, message={"type": "ping"}) is True
+    assert ws.sent == [{"type": "ping"}]
@@ -0,0 +1,155 @@
+import pytest
+
+from core.connections.proactive_registry import ProactiveConnectionRegistry
+from core.connections.push_bus import (
+    InMemoryPushBus,
+    InMemoryPushHub,
+    PostgresPushBus,
+    PushEnvelope,
+    create_push_bus,
+)
+from core.exceptions import ConfigurationError
+
+
+class FakeWebSocket:
+    def __init__(self) -> None:
+        self.sent = []
+
+    async def send_json(self, message):
+        self.sent.append(message)
+
+    async def close(self, code=1000, reason=""):
+        pass
+
+
+async def _worker(hub: InMemoryPushHub, server_id: str) -> ProactiveConnectionRegistry:
+    registry = ProactiveConnectionRegistry()
+    await registry.attach_bus(InMemoryPushBus(hub, server_id=server_id), heartbeat_seconds=0)
+    return registry
+
+
+@pytest.mark.asyncio
+async def test_push_is_forwarded_to_the_worker_holding_the_connection():
+    hub = InMemoryPushHub()
+    worker_a = await _worker(hub, "a")
+    worker_b = await _worker(hub, "b")
+    ws = FakeWebSocket()
+    await worker_b.register(user_id=7, session_id="s1", websocket=ws)
+
+    pushed = await worker_a.push_to_user(
+        user_id=7, message={"type": "notification", "data": {"session_id": "s1"}}
+    )
+
+    assert pushed is True
+    assert ws.sent == [{"type": "notification", "data": {"session_id": "s1"}}]
+
+
+@pytest.mark.asyncio
+async def test_session_scoped_push_skips_workers_without_that_session():
+    hub = InMemoryPushHub()
+    worker_a = await _worker(hub, "a")
+    worker_b = await _worker(hub, "b")
+    ws = FakeWebSocket()
+    await worker_b.register(user_id=7, session_id="s1", websocket=ws)
+
+    scoped = await worker_a.push_to_user(
+        user_id=7, message={"type": "notification", "data": {"session_id": "other"}}
+    )
+    broadcast = await worker_a.push_to_user(
+        user_id=7,
+        message={"type": "notification", "data": {"session_id": "other"}},
+        session_scoped=False,
+    )
+
+    assert scoped is False
+    assert broadcast is True
+    assert len(ws.sent) == 1
+
+
+@pytest.mark.asyncio
+async def test_push_reaches_local_and_remote_connections_once_each():
+    hub = InMemoryPushHub()
+    worker_a = await _worker(hub, "a")
+    worker_b = await _worker(hub, "b")
+    ws_a, ws_b = FakeWebSocket(), FakeWebSocket()
+    await worker_a.register(user_id=7, session_id="s1", websocket=ws_a, client_id="react-1")
+    await worker_b.register(user_id=7, session_id="s1", websocket=ws_b, client_id="kotlin-1")
+
+    assert await worker_a.push_to_user(user_id=7, message={"type": "ping"}) is True
+    assert len(ws_a.sent) == 1
+    assert len(ws_b.sent) == 1
+
+
+@pytest.mark.asyncio
+async def test_presence_is_withdrawn_with_the_last_connection_and_on_detach():
+    hub = InMemoryPushHub()
+    worker_a = await _worker(hub, "a")
+    worker_b = await _worker(hub, "b")
+    ws = FakeWebSocket()
+    await worker_b.register(user_id=7, session_id="s1", websocket=ws)
+    assert set(await worker_a.bus.locate(7)) == {"b"}
+
+    await worker_b.unregister(7, ws)
+    assert await worker_a.bus.locate(7) == {}
+    assert await worker_a.push_to_user(user_id=7, message={"type": "ping"}) is False
+
+    await worker_b.register(user_id=7, session_id="s1", websocket=ws)
+    await worker_b.detach_bus()
+    assert await worker_a.bus.locate(7) == {}
+
+
+@pytest.mark.asyncio
+async def test_presence_is_published_outside_the_registry_lock():
+    registry = ProactiveConnectionRegistry()
+    locked_during_publish = []
+
+    class RecordingBus(InMemoryPushBus):
+        async def announce(self, user_id, session_ids):
+            locked_during_publish.append(registry._lock.locked())
+            await super().announce(user_id, session_ids)
+
+        async def withdraw(self, user_id):
+            locked_during_publish.append(registry._lock.locked())
+            await super().withdraw(user_id)
+
+    await registry.attach_bus(RecordingBus(InMemoryPushHub(), server_id="a"), heartbeat_seconds=0)
+    ws = FakeWebSocket()
+    locked_during_publish.clear()
+    await registry.register(user_id=7, session_id="s1", websocket=ws)
+    await registry.unregister(7, ws)
+
+    assert locked_during_publish == [False, False]
+
+
+@pytest.mark.asyncio
+async def test_expired_presence_is_ignored():
+    hub = InMemoryPushHub()
+    worker_a = await _worker(hub, "a")
+    stale = InMemoryPushBus(hub, server_id="b", presence_ttl=-1)
+    await stale.announce(7, {"s1"})
+
+    assert await worker_a.bus.locate(7) == {}
+
+
+def test_envelope_round_trip():
+    envelope = PushEnvelope(user_id=3, message={"type": "x"}, session_scoped=False, origin="a")
+
+    assert PushEnvelope.decode(envelope.encode()) == envelope
+
+
+def test_create_push_bus_selects_backend():
+    assert create_push_bus("none") is None
+    assert isinstance(create_push_bus("memory"), InMemoryPushBus)
+    bus = create_push_bus("postgres", "postgresql+asyncpg://u:p@db:5432/app?options=-csearch_path%3Daiapp")
+    assert isinstance(bus, PostgresPushBus)
+    assert bus.dsn == "postgresql://u:p@db:5432/app"
+    with pytest.raises(ConfigurationError):
+        create_push_bus("carrier-pigeon")
+
+
+def test_postgres_dsn_keeps_connection_params():
+    dsn = PostgresPushBus.to_dsn(
+        "postgresql+asyncpg://u:p@db/app?sslmode=require&options=-csearch_path%3Daiapp&application_name=api"
+    )
+
+    assert dsn == "postgresql://u:p@db/app?sslmode=require&application_name=api"
@@ -0,0 +1,182 @@
+"""Tests for long-poll and SSE delivery of proactive agent messages."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from core.connections.proactive_registry import ProactiveConnectionRegistry
+from core.connections.push_bus import InMemoryPushBus, InMemoryPushHub
+from features.proactive_agent import message_waiters as waiters_module
+from features.proactive_agent.dependencies import get_proactive_agent_repository, get_repository_opener
+from features.proactive_agent.message_waiters import message_waiters, notify_after_commit
+from features.proactive_agent.routes import router
+from features.proactive_agent.services.message_stream import stream_session_messages
+from features.proactive_agent.services.session_handler import SessionHandler
+
+from .conftest import MockSession
+
+
+def _message(message_id: int, created_at: datetime) -> MagicMock:
+    message = MagicMock()
+    message.message_id = message_id
+    message.created_at = created_at
+    return message
+
+
+def _repository(*results) -> MagicMock:
+    repo = MagicMock()
+    repo.get_session_by_id = AsyncMock(return_value=MockSession(session_id="s1", customer_id=1))
+    repo.get_new_agent_messages = AsyncMock(side_effect=list(results))
+    repo.release_connection = AsyncMock()
+    repo.message_to_dict = MagicMock(side_effect=lambda m: {"message_id": m.message_id})
+    return repo
+
+
+async def _notify_later(session_id: str, delay: float = 0.02) -> None:
+    await asyncio.sleep(delay)
+    message_waiters.notify(session_id)
+
+
+@pytest.mark.asyncio
+async def test_long_poll_returns_as_soon_as_a_message_is_stored():
+    now = datetime.now(UTC)
+    repo = _repository([], [_message(5, now)])
+    handler = SessionHandler(repo)
+
+    notifier = asyncio.create_task(_notify_later("s1"))
+    started = asyncio.get_running_loop().time()
+    messages = await handler.get_new_messages("s1", 1, since=None, wait=5)
+    await notifier
+
+    assert messages == [{"message_id": 5}]
+    assert asyncio.get_running_loop().time() - started < 1
+    repo.release_connection.assert_awaited_once()
+    assert message_waiters.waiting("s1") == 0
+
+
+@pytest.mark.asyncio
+async def test_long_poll_times_out_with_empty_result():
+    repo = _repository([], [])
+    handler = SessionHandler(repo)
+
+    assert await handler.get_new_messages("s1", 1, wait=0.05) == []
+    assert repo.get_new_agent_messages.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_long_poll_requeries_once_when_the_wait_expires():
+    now = datetime.now(UTC)
+    repo = _repository([], [_message(9, now)])
+    handler = SessionHandler(repo)
+
+    assert await handler.get_new_messages("s1", 1, wait=0.05) == [{"message_id": 9}]
+
+
+@pytest.mark.asyncio
+async def test_plain_poll_does_not_wait():
+    repo = _repository([])
+    handler = SessionHandler(repo)
+
+    assert await handler.get_new_messages("s1", 1) == []
+    repo.release_connection.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_notify_after_commit_waits_for_commit_and_skips_rollback():
+    engine = create_engine("sqlite://")
+    with message_waiters.subscribe("s1") as waiter:
+        with Session(engine) as db:
+            db.execute(text("SELECT 1"))
+            notify_after_commit(db, "s1")
+            assert not waiter.is_set()
+            db.rollback()
+            assert not waiter.is_set()
+
+            db.execute(text("SELECT 1"))
+            notify_after_commit(db, "s1")
+            db.commit()
+            assert waiter.is_set()
+
+
+@pytest.mark.asyncio
+async def test_commit_wakes_waiters_on_other_workers_through_the_push_bus(monkeypatch: pytest.MonkeyPatch):
+    hub = InMemoryPushHub()
+    registry = ProactiveConnectionRegistry()
+    await registry.attach_bus(InMemoryPushBus(hub, server_id="a"), heartbeat_seconds=0)
+    remote = InMemoryPushBus(hub, server_id="b")
+    await remote.start(AsyncMock(return_value=False))
+    monkeypatch.setattr(waiters_module, "get_proactive_registry", lambda: registry)
+    woken = []
+    monkeypatch.setattr(message_waiters, "notify", woken.append)
+
+    notify_after_commit(object(), "s1")
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    # Once directly, once through worker b's subscription to the signal
+    assert woken == ["s1", "s1"]
+    await registry.detach_bus()
+    await remote.close()
+
+
+@pytest.mark.asyncio
+async def test_sse_stream_emits_new_messages_with_resumable_ids():
+    first = datetime(2026, 1, 1, tzinfo=UTC)
+    second = first + timedelta(seconds=5)
+    results = [[_message(1, first)], [_message(2, second)]]
+    cursors = []
+
+    async def record(session_id, since):
+        cursors.append(since)
+        return results.pop(0) if results else []
+
+    repo = _repository()
+    repo.get_new_agent_messages = AsyncMock(side_effect=record)
+
+    @asynccontextmanager
+    async def opener():
+        yield repo
+
+    frames = []
+    stream = stream_session_messages("s1", None, opener, keepalive=5, max_duration=0.2)
+    async for frame in stream:
+        frames.append(frame)
+        if len(frames) == 1:
+            asyncio.get_running_loop().call_later(0.01, message_waiters.notify, "s1")
+
+    assert frames[0] == f'id: {first.isoformat()}\nevent: message\ndata: {{"message_id": 1}}\n\n'
+    assert frames[1].startswith(f"id: {second.isoformat()}\nevent: message")
+    assert frames[-1].startswith("event: close")
+    assert cursors == [None, first]
+
+
+@pytest.mark.asyncio
+async def test_sse_route_rejects_foreign_session(mock_repository: MagicMock):
+    mock_repository.get_session_by_id.return_value = MockSession(session_id="s1", customer_id=2)
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_proactive_agent_repository] = lambda: mock_repository
+
+    @asynccontextmanager
+    async def opener():
+        yield mock_repository
+
+    app.dependency_overrides[get_repository_opener] = lambda: opener
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/api/v1/proactive-agent/messages/s1/events", params={"user_id": 1})
+        poll = await client.get(
+            "/api/v1/proactive-agent/messages/s1/poll", params={"user_id": 1, "wait": 999}
+        )
+
+    assert response.status_code == 404
+    assert poll.status_code == 422
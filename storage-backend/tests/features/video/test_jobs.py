@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, List
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from core.providers.base import BaseVideoProvider, VideoOperationStatus
+from core.providers.capabilities import ProviderCapabilities
+from features.video.db_models import VideoJob
+from features.video.jobs import VideoJobPoller, create_video_job
+from features.video.repository import VideoJobRepository
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    # One connection per session: the poller runs steps concurrently, and a shared
+    # in-memory connection would let one session's reset roll back another's writes.
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'video_jobs.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(VideoJob.__table__.create)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeProvider(BaseVideoProvider):
+    provider_name = "gemini"
+
+    def __init__(self) -> None:
+        self.capabilities = ProviderCapabilities(streaming=False, image_to_video=True)
+        self.started: List[Dict[str, Any]] = []
+        self.checks: List[str] = []
+        self.statuses: Dict[str, VideoOperationStatus] = {}
+
+    async def generate(self, prompt, model=None, duration_seconds=5, aspect_ratio="16:9", runtime=None, **kwargs):
+        raise AssertionError("background jobs must not use the blocking path")
+
+    async def start_generation(self, prompt, *, image_url=None, model=None, **kwargs):
+        self.started.append({"prompt": prompt, "image_url": image_url, "model": model, **kwargs})
+        return {"operation_name": f"op_{len(self.started)}"}
+
+    async def check_generation(self, handle):
+        self.checks.append(handle["operation_name"])
+        return self.statuses.get(handle["operation_name"], VideoOperationStatus("processing", "running"))
+
+    async def _chunks(self) -> AsyncIterator[bytes]:
+        for chunk in (b"abc", b"def"):
+            yield chunk
+
+    def stream_generation(self, status):
+        assert status.asset == "asset"
+        return self._chunks()
+
+
+class FakeStorage:
+    def __init__(self) -> None:
+        self.uploads: List[bytes] = []
+
+    async def upload_video_stream(self, *, chunks, customer_id, file_extension="mp4"):
+        payload = b"".join([chunk async for chunk in chunks])
+        self.uploads.append(payload)
+        return f"https://bucket/{customer_id}/video.{file_extension}"
+
+
+class Setup:
+    def __init__(self, session_factory) -> None:
+        self.session_factory = session_factory
+        self.provider = FakeProvider()
+        self.storage = FakeStorage()
+        self.clock = FakeClock()
+        self.events: List[Dict[str, Any]] = []
+
+    async def notifier(self, customer_id: int, event: Dict[str, Any]) -> None:
+        self.events.append(event["data"])
+
+    def poller(self, **kwargs: Any) -> VideoJobPoller:
+        params = {
+            "provider_factory": lambda settings: self.provider,
+            "storage_factory": lambda: self.storage,
+            "notifier": self.notifier,
+            "base_interval": 5,
+            "max_interval": 20,
+            "backoff_factor": 2,
+            "refresh_interval": 60,
+            "clock": self.clock,
+        }
+        params.update(kwargs)
+        return VideoJobPoller(self.session_factory, **params)
+
+    async def submit(self, **kwargs: Any) -> str:
+        async with self.session_factory() as session:
+            job = await create_video_job(
+                session,
+                prompt="a cat surfing",
+                settings={"video": {"model": "veo-3.1-fast", "duration_seconds": 8}},
+                customer_id=1,
+                provider_factory=lambda settings: self.provider,
+                **kwargs,
+            )
+            await session.commit()
+            return job.job_id
+
+    async def load(self, job_id: str) -> VideoJob:
+        async with self.session_factory() as session:
+            job = await VideoJobRepository(session).get_by_job_id(job_id)
+            assert job is not None
+            return job
+
+
+@pytest.mark.asyncio
+async def test_queued_job_is_started_once_and_handle_persisted(session_factory):
+    setup = Setup(session_factory)
+    job_id = await setup.submit(session_id="sess-1")
+    poller = setup.poller()
+
+    await poller.run_once()
+    poller.notify()
+    await poller.run_once()
+
+    assert len(setup.provider.started) == 1
+    assert setup.provider.started[0]["duration_seconds"] == 8
+    job = await setup.load(job_id)
+    assert job.status == "processing"
+    assert job.provider_handle == {"operation_name": "op_1"}
+    assert setup.events == [{"job_id": job_id, "status": "processing", "session_id": "sess-1"}]
+
+
+@pytest.mark.asyncio
+async def test_completed_video_is_streamed_to_storage_and_pushed(session_factory):
+    setup = Setup(session_factory)
+    job_id = await setup.submit()
+    poller = setup.poller()
+    await poller.run_once()
+
+    setup.provider.statuses["op_1"] = VideoOperationStatus("completed", "done", asset="asset")
+    setup.clock.now = 5
+    await poller.run_once()
+    await poller.wait_for_handoffs()
+
+    assert setup.storage.uploads == [b"abcdef"]
+    job = await setup.load(job_id)
+    assert job.status == "completed"
+    assert job.video_url == "https://bucket/1/video.mp4"
+    assert setup.events[-1]["status"] == "completed"
+    assert setup.events[-1]["video_url"] == job.video_url
+    assert setup.events[-1]["settings"]["provider"] == "gemini"
+    assert poller.tracked_job_ids == []
+
+
+@pytest.mark.asyncio
+async def test_upload_runs_outside_the_polling_pass(session_factory):
+    setup = Setup(session_factory)
+    uploading_id = await setup.submit()
+    other_id = await setup.submit()
+    release = asyncio.Event()
+    upload_video_stream = setup.storage.upload_video_stream
+
+    async def slow_upload(**kwargs: Any) -> str:
+        await release.wait()
+        return await upload_video_stream(**kwargs)
+
+    setup.storage.upload_video_stream = slow_upload
+    poller = setup.poller()
+    await poller.run_once()
+
+    setup.provider.statuses["op_1"] = VideoOperationStatus("completed", "done", asset="asset")
+    setup.clock.now = 5
+    await poller.run_once()
+    poller.notify()
+    await poller.run_once()
+
+    # The upload is still running, yet the pass returned and the job is not re-tracked.
+    assert poller.tracked_job_ids == [other_id]
+    assert (await setup.load(uploading_id)).status == "processing"
+
+    release.set()
+    await poller.wait_for_handoffs()
+    assert (await setup.load(uploading_id)).status == "completed"
+
+
+@pytest.mark.asyncio
+async def test_only_the_lease_holder_polls_and_uploads(session_factory):
+    setup = Setup(session_factory)
+    job_id = await setup.submit()
+    worker_a = setup.poller(owner="a")
+    worker_b = setup.poller(owner="b")
+    await worker_a.run_once()
+    await worker_b.run_once()
+
+    assert worker_a.tracked_job_ids == [job_id]
+    assert worker_b.tracked_job_ids == []
+
+    setup.provider.statuses["op_1"] = VideoOperationStatus("completed", "done", asset="asset")
+    setup.clock.now = 5
+    await worker_a.run_once()
+    await worker_b.run_once()
+    await worker_a.wait_for_handoffs()
+
+    assert setup.provider.checks == ["op_1"]
+    assert setup.storage.uploads == [b"abcdef"]
+    assert (await setup.load(job_id)).status == "completed"
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_hands_the_job_to_another_worker(session_factory):
+    setup = Setup(session_factory)
+    job_id = await setup.submit()
+    await setup.poller(owner="a").run_once()
+    async with session_factory() as session:
+        await session.execute(update(VideoJob).values(lease_expires_at=datetime.now(timezone.utc) - timedelta(1)))
+        await session.commit()
+
+    worker_b = setup.poller(owner="b")
+    await worker_b.run_once()
+
+    assert worker_b.tracked_job_ids == [job_id]
+    assert (await setup.load(job_id)).lease_owner == "b"
+
+
+@pytest.mark.asyncio
+async def test_poll_interval_backs_off_until_progress(session_factory):
+    setup = Setup(session_factory)
+    await setup.submit()
+    poller = setup.poller()
+
+    assert await poller.run_once() == 5
+    setup.clock.now = 5
+    assert await poller.run_once() == 5  # first observation counts as progress
+    setup.clock.now = 10
+    assert await poller.run_once() == 10
+    setup.clock.now = 20
+    assert await poller.run_once() == 20
+    setup.clock.now = 40
+    setup.provider.statuses["op_1"] = VideoOperationStatus("processing", "running", progress=50)
+    assert await poller.run_once() == 5
+
+    assert len(setup.provider.checks) == 4
+
+
+@pytest.mark.asyncio
+async def test_restart_resumes_without_resubmitting(session_factory):
+    setup = Setup(session_factory)
+    job_id = await setup.submit()
+    await setup.poller().run_once()
+
+    restarted = setup.poller()
+    await restarted.run_once()
+
+    assert len(setup.provider.started) == 1
+    assert setup.provider.checks == ["op_1"]
+    assert restarted.tracked_job_ids == [job_id]
+
+
+@pytest.mark.asyncio
+async def test_provider_failure_and_timeout_mark_jobs_failed(session_factory):
+    setup = Setup(session_factory)
+    failed_id = await setup.submit()
+    slow_id = await setup.submit()
+    poller = setup.poller(timeout=30)
+    await poller.run_once()
+
+    setup.provider.statuses["op_1"] = VideoOperationStatus("failed", "error", error="safety filter")
+    setup.clock.now = 5
+    await poller.run_once()
+    setup.clock.now = 40
+    await poller.run_once()
+
+    failed = await setup.load(failed_id)
+    assert failed.status == "failed"
+    assert failed.error_message == "safety filter"
+    slow = await setup.load(slow_id)
+    assert slow.status == "failed"
+    assert slow.error_message == "Video generation timed out"
+    assert {event["status"] for event in setup.events[-2:]} == {"failed"}
+
+
+@pytest.mark.asyncio
+async def test_create_rejects_providers_without_background_support(session_factory):
+    class BlockingProvider(BaseVideoProvider):
+        async def generate(self, prompt, model=None, duration_seconds=5, aspect_ratio="16:9", runtime=None, **kwargs):
+            return b""
+
+    async with session_factory() as session:
+        with pytest.raises(NotImplementedError):
+            await create_video_job(
+                session,
+                prompt="a cat",
+                settings={},
+                customer_id=1,
+                provider_factory=lambda settings: BlockingProvider(),
+            )
+
+
+@pytest.mark.asyncio
+async def test_submit_route_rejects_other_customers(monkeypatch: pytest.MonkeyPatch):
+    from fastapi import FastAPI
+    from httpx import ASGITransport, AsyncClient
+
+    from core.auth import require_auth_context
+    from features.video.dependencies import get_video_job_session
+    from features.video.routes import router
+
+    created: List[int] = []
+
+    async def fake_create(session, *, customer_id, **kwargs):
+        created.append(customer_id)
+        raise AssertionError("job must not be created")
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[require_auth_context] = lambda: {"customer_id": 1}
+    app.dependency_overrides[get_video_job_session] = lambda: None
+    monkeypatch.setattr("features.video.routes.create_video_job", fake_create)
+    monkeypatch.setattr("features.video.routes.get_video_job_poller", lambda: object())
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/video/jobs", json={"prompt": "a cat", "customer_id": 2})
+
+    assert response.status_code == 403
+    assert created == []
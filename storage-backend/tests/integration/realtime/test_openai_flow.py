@@ -146,6 +146,10 @@ class StubStorageService:
         self.uploads: list[Mapping[str, object]] = []
 
     async def upload_audio(self, **kwargs) -> str:
+        body = kwargs.get("audio_bytes")
+        if hasattr(body, "read"):
+            # Streamed bodies are closed once the upload returns; keep their bytes.
+            kwargs["audio_bytes"] = body.read()
         self.uploads.append(kwargs)
         return "https://example.com/audio"
 
@@ -0,0 +1,128 @@
+"""Benchmark: single-pass marker/thinking scanning on large recorded streams.
+
+The recorded NDJSON fixtures are replayed many times over to build a long
+streamed answer and a tool result carrying many markers.  The current
+scanners are compared with the previous per-tag implementations, kept here
+as a reference.
+
+Run with ``pytest -s tests/performance/test_marker_scanner_benchmark.py``
+to see the timings.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import time
+
+from features.proactive_agent.poller_stream.marker_detector import MarkerDetector, MarkerType
+from features.proactive_agent.poller_stream.ndjson_parser import EventType, NDJSONLineParser
+from tests.fixtures.ndjson_samples import (
+    CHART_RESPONSE,
+    SPLIT_THINKING_RESPONSE,
+    THINKING_RESPONSE,
+)
+
+MARKER_REPEATS = 600
+DELTA_REPEATS = 4000
+
+
+def _deltas(lines: list[str]) -> list[str]:
+    texts = []
+    for line in lines:
+        payload = json.loads(line)
+        if payload["type"] == "stream_event":
+            text = payload["event"].get("delta", {}).get("text")
+            if text:
+                texts.append(text)
+    return texts
+
+
+def _tool_result(lines: list[str]) -> str:
+    for line in lines:
+        payload = json.loads(line)
+        if payload["type"] == "user":
+            return payload["message"]["content"][0]["content"]
+    raise AssertionError("fixture has no tool result")
+
+
+class _PerTagMarkerDetector(MarkerDetector):
+    """Previous implementation: one search and one rebuild pass per marker type."""
+
+    def detect(self, content):
+        markers, cleaned = [], content
+        for start_tag, (end_tag, marker_type) in self._PAIRS.items():
+            pos = 0
+            while (start := cleaned.find(start_tag, pos)) != -1:
+                end = cleaned.find(end_tag, start + len(start_tag))
+                if end == -1:
+                    break
+                raw = cleaned[start + len(start_tag):end].strip()
+                try:
+                    markers.append((marker_type, json.loads(raw)))
+                except json.JSONDecodeError:
+                    pass
+                pos = end + len(end_tag)
+            while (start := cleaned.find(start_tag)) != -1:
+                end = cleaned.find(end_tag, start)
+                if end == -1:
+                    break
+                cleaned = cleaned[:start] + cleaned[end + len(end_tag):]
+        return markers, cleaned
+
+
+def _seconds(func) -> float:
+    # Like timeit, pause the cyclic GC: its passes scale with the whole test
+    # session's heap, not with the work being measured.
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        func()
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def test_marker_detection_is_single_pass() -> None:
+    chart = _tool_result(CHART_RESPONSE)
+    update = '[SHERLOCK_COMPONENT_UPDATE:v1]\n{"component_id": "c", "content": "x"}\n[/SHERLOCK_COMPONENT_UPDATE]\n'
+    content = (chart + "\n" + update) * MARKER_REPEATS
+
+    detector, reference = MarkerDetector(), _PerTagMarkerDetector()
+    result = detector.detect(content)
+    expected_markers, expected_cleaned = reference.detect(content)
+
+    assert result.cleaned_content == expected_cleaned
+    assert [(m.type, m.data) for m in result.markers] == expected_markers
+    assert sum(m.type == MarkerType.CHART for m in result.markers) == MARKER_REPEATS
+
+    per_tag = _seconds(lambda: reference.detect(content))
+    single = _seconds(lambda: detector.detect(content))
+    print(f"\nMarkerDetector.detect ({len(content) // 1024} KiB, {2 * MARKER_REPEATS} markers): "
+          f"{per_tag * 1e3:.0f}ms -> {single * 1e3:.0f}ms ({per_tag / single:.1f}x)")
+    assert single * 2 < per_tag
+
+
+def test_thinking_stream_scales_linearly() -> None:
+    deltas = (_deltas(THINKING_RESPONSE) + _deltas(SPLIT_THINKING_RESPONSE)) * DELTA_REPEATS
+    lines = [
+        json.dumps({"type": "stream_event", "event": {"type": "content_block_delta", "delta": {"text": d}}})
+        for d in deltas
+    ]
+
+    parser = NDJSONLineParser()
+    events = [event for line in lines for event in parser.process_line(line)]
+    events += parser.finalize()
+    thinking = "".join(e.data["content"] for e in events if e.type == EventType.THINKING_CHUNK)
+    assert thinking.count("Let me think about this...") == DELTA_REPEATS
+    assert parser.get_accumulated_text() == "".join(deltas)
+
+    def run(count: int) -> float:
+        fresh = NDJSONLineParser()
+        return _seconds(lambda: [fresh.process_line(line) for line in lines[:count]])
+
+    small, large = run(len(lines) // 4), run(len(lines))
+    print(f"\nNDJSON thinking stream: {len(lines) // 4} lines {small * 1e3:.0f}ms, "
+          f"{len(lines)} lines {large * 1e3:.0f}ms")
+    # Four times the input should cost about four times as much, not sixteen
+    assert large < small * 8
@@ -0,0 +1,48 @@
+"""Microbenchmark: text provider resolution with and without the resolver cache.
+
+Run with ``pytest -s tests/performance/test_provider_resolution_benchmark.py``
+to see the per-call timings.
+"""
+
+from __future__ import annotations
+
+import time
+
+import core.providers  # noqa: F401 - registers the real provider classes
+from core.clients.ai import ai_clients
+from core.providers import resolver_cache
+from core.providers.factory import get_text_provider
+
+ITERATIONS = 2000
+
+# Mix of aliases, reasoning counterparts and plain names, as seen by batch
+# polling and group chat.
+TEXT_SETTINGS = [
+    {"text": {"model": "gpt-4o-mini"}},
+    {"text": {"model": "cheapest-openai"}},
+    {"text": {"model": "claude", "enable_reasoning": True}},
+    {"text": {"model": "gemini-2.5-flash"}},
+]
+
+
+def _per_call_us() -> float:
+    for settings in TEXT_SETTINGS:  # warm up (and fill the cache when enabled)
+        get_text_provider(settings)
+    start = time.perf_counter()
+    for index in range(ITERATIONS):
+        get_text_provider(TEXT_SETTINGS[index % len(TEXT_SETTINGS)])
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+def test_text_provider_resolution_overhead(monkeypatch) -> None:
+    # Stand-in SDK clients: the providers only store them.
+    for name in ("openai_async", "anthropic_async", "gemini"):
+        monkeypatch.setitem(ai_clients, name, object())
+
+    monkeypatch.setattr(resolver_cache, "PROVIDER_CACHE_ENABLED", False)
+    uncached = _per_call_us()
+    monkeypatch.setattr(resolver_cache, "PROVIDER_CACHE_ENABLED", True)
+    cached = _per_call_us()
+
+    print(f"\nget_text_provider: {uncached:.1f}us -> {cached:.1f}us per call ({uncached / cached:.1f}x)")
+    assert cached * 2 < uncached
@@ -3,6 +3,8 @@
 import importlib
 import sys
 
+import pytest
+
 
 def reload_module():
     if "core.clients.ai" in sys.modules:
@@ -30,7 +32,7 @@ def test_ai_clients_without_env(monkeypatch):
 
 
 def test_ai_clients_with_env(monkeypatch):
-    """Setting env variables should register corresponding clients."""
+    """Setting env variables should register corresponding clients, built on first use."""
 
     import openai
     import anthropic
@@ -46,7 +48,7 @@ def test_ai_clients_with_env(monkeypatch):
             self.api_key = api_key
 
     monkeypatch.setenv("OPENAI_API_KEY", "test")
-    monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+    monkeypatch.setenv("CLAUDE_KEY", "test")
     monkeypatch.setenv("GOOGLE_API_KEY", "test")
     monkeypatch.setenv("GROQ_API_KEY", "test")
     monkeypatch.setenv("PERPLEXITY_API_KEY", "test")
@@ -93,4 +95,20 @@ def test_ai_clients_with_env(monkeypatch):
 
     module = reload_module()
 
-    assert {"openai", "anthropic", "gemini", "groq", "perplexity", "deepseek", "xai"}.issubset(module.ai_clients.keys())
+    expected = {"openai", "anthropic", "gemini", "groq", "perplexity", "deepseek", "xai"}
+    assert expected.issubset(module.ai_clients.configured())
+    assert all(name in module.ai_clients for name in expected)
+    assert module.ai_clients == {}  # nothing is constructed until first use
+
+    assert isinstance(module.get_openai_async_client(), DummyClient)
+    assert module.get_anthropic_client() is module.ai_clients["anthropic"]
+    assert module.get_gemini_client().api_key == "test"
+    assert set(module.ai_clients) == {"openai_async", "anthropic", "gemini"}
+
+
+def test_get_client_requires_credentials(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    module = reload_module()
+
+    with pytest.raises(ValueError, match="OPENAI_API_KEY"):
+        module.get_openai_client()
@@ -0,0 +1,75 @@
+import logging
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+
+from core.observability.request_logging import _PAYLOAD_PREVIEW_LIMIT, register_http_request_logging
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    register_http_request_logging(app)
+
+    @app.post("/echo")
+    async def echo(request: Request):
+        body = await request.body()
+        return {"size": len(body)}
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+async def _request(method: str, url: str, **kwargs):
+    transport = httpx.ASGITransport(app=_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.request(method, url, **kwargs)
+
+
+def _payload_lines(caplog) -> list[str]:
+    return [r.getMessage() for r in caplog.records if r.name == "core.http" and " payload " in r.getMessage()]
+
+
+async def test_body_preview_is_capped_and_endpoint_still_reads_full_body(caplog):
+    caplog.set_level(logging.INFO, logger="core.http")
+    body = b"a" * (_PAYLOAD_PREVIEW_LIMIT * 3)
+
+    response = await _request("POST", "/echo", content=body, headers={"content-type": "text/plain"})
+
+    assert response.json() == {"size": len(body)}
+    (line,) = _payload_lines(caplog)
+    assert f"({len(body)} bytes)" in line
+    assert "a" * _PAYLOAD_PREVIEW_LIMIT in line
+    assert "a" * (_PAYLOAD_PREVIEW_LIMIT + 1) not in line
+
+
+async def test_multipart_uploads_are_not_previewed(caplog):
+    caplog.set_level(logging.INFO, logger="core.http")
+
+    response = await _request("POST", "/echo", files={"file": ("a.bin", b"secret-bytes" * 100)})
+
+    assert response.status_code == 200
+    (line,) = _payload_lines(caplog)
+    assert "multipart/form-data" in line
+    assert "not previewed" in line
+    assert "secret-bytes" not in line
+
+
+async def test_requests_without_body_log_query_once(caplog):
+    caplog.set_level(logging.INFO, logger="core.http")
+
+    await _request("GET", "/ping?token=abcdefghijklmnopqrstuvwxyz")
+
+    (line,) = _payload_lines(caplog)
+    assert "token=abcdefghijkl" in line
+    assert "mnopqrstuvwxyz" not in line
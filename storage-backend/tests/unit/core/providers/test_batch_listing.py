@@ -0,0 +1,45 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from core.providers.batch.polling_operations import BatchPollingOperations
+from features.batch.services.provider_adapters import OpenAIBatchAdapter
+
+
+def _batch(batch_id: str, status: str = "in_progress", **extra):
+    counts = SimpleNamespace(completed=extra.pop("completed", 0), failed=extra.pop("failed", 0), total=4)
+    return SimpleNamespace(id=batch_id, status=status, request_counts=counts, **extra)
+
+
+@pytest.mark.asyncio
+async def test_list_batches_uses_listing_and_retrieves_stragglers():
+    client = SimpleNamespace(
+        batches=SimpleNamespace(
+            list=AsyncMock(
+                side_effect=[
+                    SimpleNamespace(data=[_batch("b1"), _batch("other")], has_more=True),
+                    SimpleNamespace(data=[_batch("b2")], has_more=False),
+                ]
+            ),
+            retrieve=AsyncMock(return_value=_batch("b3", "completed")),
+        )
+    )
+
+    found = await BatchPollingOperations(client).list_batches(["b1", "b2", "b3"])
+
+    assert set(found) == {"b1", "b2", "b3"}
+    assert client.batches.list.await_count == 2
+    assert client.batches.list.await_args_list[1].kwargs == {"limit": 100, "after": "other"}
+    client.batches.retrieve.assert_awaited_once_with("b3")
+
+
+def test_openai_snapshot_normalises_status_and_result_files():
+    adapter = OpenAIBatchAdapter.__new__(OpenAIBatchAdapter)
+
+    running = adapter._snapshot(_batch("b1", "finalizing", completed=3))
+    done = adapter._snapshot(_batch("b2", "completed", completed=3, failed=1, output_file_id="out", error_file_id="err"))
+
+    assert (running.status, running.succeeded, running.result_sources) == ("processing", 3, ())
+    assert done.is_terminal
+    assert done.result_sources == ("out", "err")
@@ -273,3 +273,57 @@ def test_get_tts_provider_explicit_provider_takes_precedence() -> None:
     provider = get_tts_provider(settings)
 
     assert isinstance(provider, FakeOpenAITTSProvider)
+
+
+def test_text_provider_is_cached_per_model_and_reasoning() -> None:
+    from core.providers.resolver_cache import text_provider_cache
+
+    first = get_text_provider({"text": {"model": "gpt-4o-mini"}})
+    assert get_text_provider({"text": {"model": " GPT-4o-mini "}}) is first
+    assert text_provider_cache.hits == 1
+
+    reasoning = get_text_provider({"text": {"model": "claude", "enable_reasoning": True}})
+    plain = get_text_provider({"text": {"model": "claude"}})
+    assert reasoning is not plain
+    assert reasoning.get_model_config().is_reasoning_model
+    assert not plain.get_model_config().is_reasoning_model
+
+
+def test_text_provider_cache_follows_registry_changes() -> None:
+    from core.providers.registry import get_registry
+
+    first = get_text_provider({"text": {"model": "gpt-4o-mini"}})
+
+    class ReplacementProvider(FakeOpenAITextProvider):
+        pass
+
+    register_text_provider("openai", ReplacementProvider)
+    assert isinstance(get_text_provider({"text": {"model": "gpt-4o-mini"}}), ReplacementProvider)
+
+    _text_providers["openai"] = FakeOpenAITextProvider  # edited in place, no invalidation
+    second = get_text_provider({"text": {"model": "gpt-4o-mini"}})
+    assert type(second) is FakeOpenAITextProvider and second is not first
+
+    get_registry().reload()
+    assert get_text_provider({"text": {"model": "gpt-4o-mini"}}) is not second
+
+
+def test_text_provider_without_client_is_not_cached() -> None:
+    class UnconfiguredProvider(FakeOpenAITextProvider):
+        def __init__(self) -> None:
+            super().__init__()
+            self.client = None
+
+    register_text_provider("openai", UnconfiguredProvider)
+    settings = {"text": {"model": "gpt-4o-mini"}}
+    assert get_text_provider(settings) is not get_text_provider(settings)
+
+
+def test_image_and_tts_instances_stay_per_request() -> None:
+    image_settings = {"image": {"model": "openai mini"}}
+    assert get_image_provider(image_settings) is not get_image_provider(image_settings)
+
+    first = get_tts_provider({"tts": {"model": "gpt-4o-mini-tts", "voice": "alloy", "speed": 1.0}})
+    second = get_tts_provider({"tts": {"model": "gpt-4o-mini-tts", "voice": "alloy", "speed": 1.5}})
+    assert first is not second
+    assert (first.last_settings["speed"], second.last_settings["speed"]) == (1.0, 1.5)
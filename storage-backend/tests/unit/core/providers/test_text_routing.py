@@ -0,0 +1,238 @@
+"""Tests for text provider failover, hedging and the scoreboard."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from core.exceptions import ProviderError, RateLimitError, ValidationError
+from core.providers.base import BaseTextProvider
+from core.providers.capabilities import ProviderCapabilities
+import core.providers.text_routing as routing
+from core.providers.registry import ModelConfig
+from core.providers.text_routing import RoutedTextProvider, route_text_provider
+from core.providers.text_scoreboard import ProviderScoreboard
+from core.pydantic_schemas import ProviderResponse
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+class FakeTextProvider(BaseTextProvider):
+    def __init__(
+        self,
+        model: str,
+        provider: str,
+        *,
+        chunks: tuple[str, ...] = ("Hello", " world"),
+        error: Exception | None = None,
+        delay: float = 0.0,
+    ) -> None:
+        self.capabilities = ProviderCapabilities(streaming=True)
+        self.provider_name = provider
+        self.set_model_config(ModelConfig(model_name=model, provider_name=provider))
+        self.chunks = chunks
+        self.error = error
+        self.delay = delay
+        self.calls: list[dict[str, Any]] = []
+        self.closed = False
+
+    async def generate(self, prompt: str, **kwargs) -> ProviderResponse:
+        self.calls.append({"prompt": prompt, **kwargs})
+        if self.error:
+            raise self.error
+        return ProviderResponse(text="".join(self.chunks), model=kwargs.get("model") or "", provider=self.provider_name)
+
+    async def stream(self, prompt: str, **kwargs):  # type: ignore[override]
+        self.calls.append({"prompt": prompt, **kwargs})
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            if self.error:
+                raise self.error
+            for chunk in self.chunks:
+                yield chunk
+        finally:
+            self.closed = True
+
+
+@pytest.fixture
+def make_routed(monkeypatch):
+    """Build a routed provider whose fallbacks resolve to the given fakes."""
+
+    monkeypatch.setattr(routing, "FAILOVER_ENABLED", True)
+
+    def _make(primary, *fallbacks, scoreboard=None, hedging=False) -> RoutedTextProvider:
+        by_model = {provider.get_model_config().model_name: provider for provider in fallbacks}
+        monkeypatch.setattr(
+            routing,
+            "get_model_config",
+            lambda key, enable_reasoning=False: by_model[key].get_model_config(),
+        )
+        routed = route_text_provider(
+            primary,
+            {"text": {"model": primary.get_model_config().model_name}},
+            chains={"standard": tuple(by_model)},
+            hedging=hedging,
+            scoreboard=scoreboard or ProviderScoreboard(),
+            resolver=lambda settings: by_model[settings["text"]["model"]],
+        )
+        assert isinstance(routed, RoutedTextProvider)
+        return routed
+
+    return _make
+
+
+async def _collect(provider, **kwargs) -> list[Any]:
+    return [chunk async for chunk in provider.stream(prompt="hi", **kwargs)]
+
+
+@pytest.mark.anyio
+async def test_stream_fails_over_before_first_chunk_and_adapts_messages(make_routed) -> None:
+    primary = FakeTextProvider("claude-x", "anthropic", error=ProviderError("overloaded", provider="anthropic"))
+    fallback = FakeTextProvider("gpt-x", "openai", chunks=("from", " gpt"))
+    scoreboard = ProviderScoreboard()
+    routed = make_routed(primary, fallback, scoreboard=scoreboard)
+
+    chunks = await _collect(
+        routed,
+        model="claude-x",
+        system_prompt="Be brief.",
+        messages=[{"role": "user", "content": "hi"}],
+        enable_reasoning=True,
+    )
+
+    assert chunks == ["from", " gpt"]
+    call = fallback.calls[0]
+    assert call["model"] == "gpt-x"
+    assert call["messages"][0] == {"role": "system", "content": "Be brief."}
+    assert "enable_reasoning" not in call
+    assert primary.closed
+    assert scoreboard.stats("anthropic:claude-x").errors == 1
+    assert scoreboard.stats("openai:gpt-x").ttft_samples == 1
+
+
+@pytest.mark.anyio
+async def test_multimodal_history_does_not_cross_providers(make_routed) -> None:
+    primary = FakeTextProvider("claude-x", "anthropic", error=ProviderError("down"))
+    fallback = FakeTextProvider("gpt-x", "openai")
+    routed = make_routed(primary, fallback)
+
+    with pytest.raises(ProviderError):
+        await _collect(routed, messages=[{"role": "user", "content": [{"type": "image", "source": {}}]}])
+    assert fallback.calls == []
+
+
+@pytest.mark.anyio
+async def test_errors_after_first_chunk_and_validation_errors_are_not_retried(make_routed) -> None:
+    class BrokenMidStream(FakeTextProvider):
+        async def stream(self, prompt: str, **kwargs):  # type: ignore[override]
+            yield "partial"
+            raise ProviderError("connection reset")
+
+    fallback = FakeTextProvider("gpt-x", "openai")
+    routed = make_routed(BrokenMidStream("claude-x", "anthropic"), fallback)
+    received = []
+    with pytest.raises(ProviderError):
+        async for chunk in routed.stream(prompt="hi"):
+            received.append(chunk)
+    assert received == ["partial"]
+
+    invalid = make_routed(FakeTextProvider("claude-x", "anthropic", error=ValidationError("bad")), fallback)
+    with pytest.raises(ValidationError):
+        await _collect(invalid)
+    assert fallback.calls == []
+
+
+@pytest.mark.anyio
+async def test_rate_limited_primary_is_deprioritised(make_routed) -> None:
+    primary = FakeTextProvider("claude-x", "anthropic", error=RateLimitError("slow down"))
+    fallback = FakeTextProvider("gpt-x", "openai")
+    scoreboard = ProviderScoreboard()
+    routed = make_routed(primary, fallback, scoreboard=scoreboard)
+
+    response = await routed.generate(prompt="hi")
+    assert response.text == "Hello world"
+    assert scoreboard.stats("anthropic:claude-x").rate_limited == 1
+    assert scoreboard.is_degraded("anthropic:claude-x")
+
+    await routed.generate(prompt="again")
+    assert len(primary.calls) == 1  # skipped while cooling down
+
+
+@pytest.mark.anyio
+async def test_hedged_stream_uses_faster_backup_and_cancels_primary(make_routed, monkeypatch) -> None:
+    monkeypatch.setattr(routing, "HEDGE_DEFAULT_DELAY_MS", 10)
+    primary = FakeTextProvider("claude-x", "anthropic", delay=5)
+    backup = FakeTextProvider("gpt-x", "openai", chunks=("fast",))
+    routed = make_routed(primary, backup, hedging=True)
+
+    chunks = await asyncio.wait_for(_collect(routed), timeout=1)
+
+    assert chunks == ["fast"]
+    assert primary.closed  # the slow stream was cancelled
+
+
+@pytest.mark.anyio
+async def test_hedge_not_started_when_primary_answers_in_time(make_routed, monkeypatch) -> None:
+    monkeypatch.setattr(routing, "HEDGE_DEFAULT_DELAY_MS", 500)
+    primary = FakeTextProvider("claude-x", "anthropic")
+    backup = FakeTextProvider("gpt-x", "openai")
+    routed = make_routed(primary, backup, hedging=True)
+
+    assert await _collect(routed) == ["Hello", " world"]
+    assert backup.calls == []
+
+
+def test_scoreboard_percentiles_window_and_snapshot() -> None:
+    now = [0.0]
+    scoreboard = ProviderScoreboard(window=50, max_age=60, degraded_min_samples=4, clock=lambda: now[0])
+    for value in range(1, 21):
+        scoreboard.record_success("openai:gpt-x", float(value * 10))
+    scoreboard.record_failure("openai:gpt-x")
+
+    stats = scoreboard.stats("openai:gpt-x")
+    assert stats.requests == 21
+    assert stats.ttft_p50_ms == 100.0
+    assert stats.ttft_p95_ms == 190.0
+    assert not stats.degraded
+    assert scoreboard.snapshot()["openai:gpt-x"]["errors"] == 1
+
+    now[0] = 120.0
+    assert scoreboard.stats("openai:gpt-x").requests == 0
+
+
+def test_route_text_provider_leaves_unconfigured_providers_alone() -> None:
+    class Bare(FakeTextProvider):
+        def get_model_config(self):
+            return None
+
+    bare = Bare("x", "openai")
+    assert route_text_provider(bare, {}) is bare
+
+    primary = FakeTextProvider("gpt-x", "openai")
+    assert route_text_provider(primary, {"text": {"failover": False}}) is primary
+
+
+def test_route_text_provider_is_opt_in(monkeypatch) -> None:
+    monkeypatch.setattr(routing, "FAILOVER_ENABLED", False)
+    primary = FakeTextProvider("gpt-x", "openai")
+
+    assert route_text_provider(primary, {}, chains={"standard": ("claude-x",)}) is primary
+
+
+@pytest.mark.anyio
+async def test_reasoning_and_audio_calls_go_to_the_primary(make_routed) -> None:
+    class ReasoningProvider(FakeTextProvider):
+        async def generate_with_reasoning(self, prompt, reasoning_effort="medium", **kwargs):
+            return ProviderResponse(text=f"{prompt}:{reasoning_effort}", model="gpt-x", provider="openai")
+
+        async def generate_with_audio(self, audio_data, prompt=None, **kwargs):
+            return ProviderResponse(text=f"{len(audio_data)}:{prompt}", model="gpt-x", provider="openai")
+
+    routed = make_routed(ReasoningProvider("gpt-x", "openai"), FakeTextProvider("claude-x", "anthropic"))
+
+    assert (await routed.generate_with_reasoning("why", reasoning_effort="high")).text == "why:high"
+    assert (await routed.generate_with_audio(b"abc", prompt="transcribe")).text == "3:transcribe"
@@ -0,0 +1,120 @@
+"""Tests for provider prompt-prefix caching."""
+
+from types import SimpleNamespace
+
+import core.providers.text.prompt_cache as prompt_cache
+from core.providers.text.anthropic_params import build_api_params
+from core.providers.text.prompt_cache import (
+    apply_anthropic_cache_control,
+    openai_prompt_cache_key,
+    parse_prompt_cache_usage,
+    record_prompt_cache_usage,
+)
+from core.providers.text.responses_utils import build_responses_params
+
+LONG_SYSTEM = "You are a meticulous assistant. " * 200
+
+
+def _conversation() -> list[dict]:
+    return [
+        {"role": "user", "content": "first question " * 100},
+        {"role": "assistant", "content": [{"type": "thinking", "thinking": "..."}, {"type": "text", "text": "answer"}]},
+        {"role": "user", "content": "follow up"},
+    ]
+
+
+def test_breakpoints_on_system_previous_turn_and_current_turn() -> None:
+    messages = _conversation()
+    params = apply_anthropic_cache_control(
+        {"system": LONG_SYSTEM, "messages": messages, "tools": [{"name": "web_search"}]},
+        min_chars=1000,
+        enabled=True,
+    )
+
+    assert params["system"] == [{"type": "text", "text": LONG_SYSTEM, "cache_control": {"type": "ephemeral"}}]
+    assert "cache_control" not in params["tools"][-1]
+    assert params["messages"][0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert params["messages"][1] is messages[1]
+    assert params["messages"][2]["content"] == [
+        {"type": "text", "text": "follow up", "cache_control": {"type": "ephemeral"}}
+    ]
+    # The caller's history is left untouched so the next turn sends identical bytes.
+    assert messages == _conversation()
+
+
+def test_short_prompts_and_caller_breakpoints_are_left_alone() -> None:
+    short = {"system": "Be brief.", "messages": [{"role": "user", "content": "hi"}]}
+    assert apply_anthropic_cache_control(dict(short), min_chars=1000, enabled=True) == short
+
+    custom = {
+        "system": [{"type": "text", "text": LONG_SYSTEM, "cache_control": {"type": "ephemeral"}}],
+        "messages": _conversation(),
+    }
+    assert apply_anthropic_cache_control(dict(custom), min_chars=10, enabled=True) == custom
+
+
+def test_build_api_params_is_byte_stable_across_turns(monkeypatch) -> None:
+    monkeypatch.setattr(prompt_cache, "PROMPT_CACHE_MIN_CHARS", 1000)
+
+    def build(messages):
+        return build_api_params(
+            model="claude-x",
+            messages=messages,
+            max_tokens=100,
+            temperature=0.2,
+            system_prompt=LONG_SYSTEM,
+            enable_reasoning=False,
+            reasoning_value=None,
+            tools=[{"name": "web_search"}],
+        )
+
+    first = build(_conversation())
+    second = build(_conversation() + [{"role": "assistant", "content": "ok"}, {"role": "user", "content": "again"}])
+    assert first["system"] == second["system"]
+    assert first["tools"] == second["tools"]
+    # The turn cached by the first request is the read breakpoint of the second.
+    assert second["messages"][2] == first["messages"][2]
+
+
+def test_openai_prompt_cache_key_follows_conversation_head() -> None:
+    history = [{"role": "system", "content": "sys"}, {"role": "user", "content": "hello"}]
+    key = openai_prompt_cache_key("gpt-x", history)
+
+    assert key == openai_prompt_cache_key("gpt-x", history + [{"role": "assistant", "content": "hi"}])
+    assert key != openai_prompt_cache_key("gpt-y", history)
+    assert key != openai_prompt_cache_key("gpt-x", [{"role": "system", "content": "other"}, history[1]])
+
+    params = build_responses_params(
+        model="gpt-x",
+        messages=history,
+        model_config=None,
+        temperature=0.1,
+        max_tokens=10,
+        stream=False,
+        extra_kwargs={"prompt_cache_key": "session-1"},
+        enable_reasoning=False,
+    )
+    assert params["prompt_cache_key"] == "session-1"
+
+
+def test_usage_is_normalised_across_vendors(monkeypatch) -> None:
+    anthropic = parse_prompt_cache_usage(
+        SimpleNamespace(input_tokens=10, cache_read_input_tokens=900, cache_creation_input_tokens=90)
+    )
+    assert (anthropic.input_tokens, anthropic.cached_tokens, anthropic.cache_write_tokens) == (1000, 900, 90)
+
+    chat = parse_prompt_cache_usage({"prompt_tokens": 2048, "prompt_tokens_details": {"cached_tokens": 1024}})
+    assert chat.hit_ratio == 0.5
+
+    responses = parse_prompt_cache_usage({"input_tokens": 300, "input_tokens_details": {"cached_tokens": 0}})
+    assert (responses.input_tokens, responses.cached_tokens) == (300, 0)
+    assert parse_prompt_cache_usage(None) is None
+
+    emitted = []
+    monkeypatch.setattr(prompt_cache, "track_metric", lambda name, value, tags: emitted.append((name, value, tags)))
+    record_prompt_cache_usage(provider="anthropic", model="claude-x", usage={"input_tokens": 5, "cache_read_input_tokens": 95})
+    assert [(name, value) for name, value, _ in emitted] == [
+        ("text.prompt_input_tokens", 100),
+        ("text.prompt_cache_read_tokens", 95),
+    ]
+    assert emitted[0][2] == {"provider": "anthropic", "model": "claude-x", "hit": True}
@@ -0,0 +1,191 @@
+"""Tests for the pre-warmed ElevenLabs websocket pool."""
+
+import asyncio
+import base64
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from core.providers.tts.utils.queue_websocket_streaming import stream_websocket_audio_from_queue
+from core.providers.tts.utils.websocket_pool import WebSocketConnectionPool
+
+
+class FakeWebSocket:
+    def __init__(self, uri: str, *, messages: list[str] | None = None) -> None:
+        self.uri = uri
+        self.state = SimpleNamespace(name="OPEN")
+        self.sent: list[dict] = []
+        self.closed = False
+        self.ping_ok = True
+        self._messages = list(messages or [])
+
+    async def send(self, payload: str) -> None:
+        self.sent.append(json.loads(payload))
+
+    async def __aenter__(self) -> "FakeWebSocket":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.closed = True
+        self.state = SimpleNamespace(name="CLOSED")
+
+    async def ping(self):
+        future = asyncio.get_running_loop().create_future()
+        if self.ping_ok:
+            future.set_result(0.0)
+        return future
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for message in self._messages:
+            yield message
+
+
+class FakeConnector:
+    def __init__(self, *, delay: float = 0.0, fail: bool = False, messages: list[str] | None = None) -> None:
+        self.delay = delay
+        self.fail = fail
+        self.messages = messages
+        self.opened: list[FakeWebSocket] = []
+
+    def __call__(self, uri: str) -> "FakeConnector._Connect":
+        return FakeConnector._Connect(self, uri)
+
+    class _Connect:
+        def __init__(self, connector: "FakeConnector", uri: str) -> None:
+            self.connector = connector
+            self.uri = uri
+            self.websocket: FakeWebSocket | None = None
+
+        async def __aenter__(self) -> FakeWebSocket:
+            connector = self.connector
+            if connector.delay:
+                await asyncio.sleep(connector.delay)
+            if connector.fail:
+                raise OSError("connection refused")
+            self.websocket = FakeWebSocket(self.uri, messages=connector.messages)
+            connector.opened.append(self.websocket)
+            return self.websocket
+
+        async def __aexit__(self, *exc_info) -> None:
+            assert self.websocket is not None
+            await self.websocket.__aexit__(*exc_info)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _pool(connector, clock=None, **kwargs) -> WebSocketConnectionPool:
+    params = {"idle_size": 1, "max_idle_seconds": 60, "ping_after_seconds": 10}
+    params.update(kwargs)
+    return WebSocketConnectionPool(connect=connector, clock=clock or FakeClock(), **params)
+
+
+@pytest.mark.asyncio
+async def test_prewarmed_connection_is_reused_and_replenished():
+    connector = FakeConnector()
+    pool = _pool(connector)
+
+    assert pool.prewarm("wss://a") == 1
+    await asyncio.sleep(0.01)
+    assert pool.idle_count("wss://a") == 1
+
+    async with pool.connection("wss://a") as websocket:
+        assert websocket is connector.opened[0]
+        assert pool.pending_count("wss://a") == 1  # replacement handshake started
+    assert websocket.closed
+
+    await asyncio.sleep(0.01)
+    assert pool.idle_count("wss://a") == 1
+    assert len(connector.opened) == 2
+    await pool.aclose()
+    assert connector.opened[1].closed
+
+
+@pytest.mark.asyncio
+async def test_acquire_claims_in_flight_handshake():
+    connector = FakeConnector(delay=0.01)
+    pool = _pool(connector, idle_size=0)
+
+    pool.prewarm("wss://a")
+    async with pool.connection("wss://a") as websocket:
+        assert websocket is connector.opened[0]
+
+    assert pool.idle_count("wss://a") == 0
+    assert pool.pending_count("wss://a") == 0
+
+
+@pytest.mark.asyncio
+async def test_stale_and_unhealthy_connections_are_discarded():
+    connector = FakeConnector()
+    clock = FakeClock()
+    pool = _pool(connector, clock, idle_size=0, ping_timeout=0.01)
+
+    pool.prewarm("wss://a")
+    await asyncio.sleep(0.01)
+    clock.now = 61
+    async with pool.connection("wss://a") as fresh:
+        assert connector.opened[0].closed
+        assert fresh is connector.opened[1]
+
+    pool.prewarm("wss://a")
+    await asyncio.sleep(0.01)
+    connector.opened[2].ping_ok = False
+    clock.now = 75  # idle past ping_after_seconds, so the pool pings first
+    async with pool.connection("wss://a") as replacement:
+        assert connector.opened[2].closed
+        assert replacement is connector.opened[3]
+
+
+@pytest.mark.asyncio
+async def test_failed_prewarm_falls_back_to_fresh_connection():
+    connector = FakeConnector(fail=True)
+    pool = _pool(connector, idle_size=0)
+
+    pool.prewarm("wss://a")
+    await asyncio.sleep(0.01)
+    assert pool.idle_count("wss://a") == 0
+
+    connector.fail = False
+    async with pool.connection("wss://a") as websocket:
+        assert websocket.uri == "wss://a"
+
+
+@pytest.mark.asyncio
+async def test_queue_stream_uses_pooled_connection():
+    audio = base64.b64encode(b"\x01\x02").decode()
+    connector = FakeConnector(messages=[json.dumps({"audio": audio}), json.dumps({"status": "finished"})])
+    pool = _pool(connector, idle_size=0)
+    pool.prewarm("wss://voice")
+    await asyncio.sleep(0.01)
+
+    text_queue: asyncio.Queue[str | None] = asyncio.Queue()
+    await text_queue.put("Hello")
+    await text_queue.put(None)
+
+    chunks = [
+        chunk
+        async for chunk in stream_websocket_audio_from_queue(
+            uri="wss://voice",
+            text_queue=text_queue,
+            api_key="key",
+            voice_settings={},
+            chunk_length_schedule=[120],
+            provider_name="elevenlabs",
+            connection_pool=pool,
+        )
+    ]
+
+    websocket = connector.opened[0]
+    assert len(connector.opened) == 1
+    assert chunks == [b"\x01\x02"]
+    assert [message["text"] for message in websocket.sent] == [" ", "Hello", ""]
+    assert websocket.closed
@@ -0,0 +1,114 @@
+import io
+import wave
+
+import pytest
+
+from core.streaming.audio_buffer import AudioAccumulator, open_view_reader, wav_header
+
+
+def test_accumulator_keeps_small_streams_in_memory():
+    audio = AudioAccumulator(spill_threshold=1024)
+    audio.append(b"abc")
+    audio.append(b"")
+    audio.extend(bytearray(b"def"))
+
+    assert len(audio) == 6
+    assert audio.chunk_count == 2
+    assert not audio.spilled
+    with audio.getbuffer() as view:
+        assert view.readonly
+        assert view.tobytes() == b"abcdef"
+    assert audio.to_bytes() == b"abcdef"
+
+
+def test_accumulator_respects_preallocated_capacity():
+    audio = AudioAccumulator(initial_capacity=4)
+    audio.append(b"ab")
+    audio.append(b"cdef")
+
+    assert audio.to_bytes() == b"abcdef"
+
+
+def test_accumulator_spills_past_threshold_and_keeps_appending():
+    audio = AudioAccumulator(spill_threshold=8)
+    audio.append(b"12345")
+    audio.append(b"67890")
+
+    assert audio.spilled
+    with audio.getbuffer() as view:
+        assert view.tobytes() == b"1234567890"
+
+    audio.append(b"ab")
+    assert audio.to_bytes() == b"1234567890ab"
+
+    audio.clear()
+    assert not audio
+    assert not audio.spilled
+    assert audio.to_bytes() == b""
+
+
+@pytest.mark.parametrize("threshold", [0, 4])
+def test_live_views_survive_append_and_clear(threshold):
+    audio = AudioAccumulator(spill_threshold=threshold)
+    audio.append(b"12345")
+    view = audio.getbuffer()
+    reader = audio.open_wav(sample_rate=16_000)
+
+    audio.append(b"67890")
+    assert audio.to_bytes() == b"1234567890"
+    audio.clear()
+
+    assert view.tobytes() == b"12345"
+    assert reader.read()[44:] == b"12345"
+    view.release()
+    reader.close()
+
+
+def test_open_wav_serves_header_and_samples():
+    samples = bytes(range(200)) * 3
+    audio = AudioAccumulator(spill_threshold=256)
+    for offset in range(0, len(samples), 100):
+        audio.append(samples[offset : offset + 100])
+
+    with audio.open_wav(sample_rate=16_000) as stream:
+        payload = stream.read()
+        stream.seek(0)
+        with wave.open(stream, "rb") as wav_file:
+            assert wav_file.getframerate() == 16_000
+            assert wav_file.getnchannels() == 1
+            assert wav_file.getsampwidth() == 2
+            assert wav_file.readframes(wav_file.getnframes()) == samples
+
+    assert payload[:44] == wav_header(len(samples), sample_rate=16_000)
+    assert len(payload) == 44 + len(samples)
+
+
+def test_view_reader_does_not_release_callers_view():
+    view = memoryview(b"payload")
+    with open_view_reader(view, prefix=b">") as reader:
+        reader.seek(3)
+        assert reader.read(2) == b"yl"
+        reader.seek(0)
+        assert reader.read() == b">payload"
+
+    assert view.tobytes() == b"payload"
+
+
+def test_wav_header_matches_wave_module():
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(24_000)
+        wav_file.writeframes(b"\x00\x01" * 10)
+
+    assert buffer.getvalue()[:44] == wav_header(20, sample_rate=24_000)
+
+
+@pytest.mark.parametrize("threshold", [0, 4])
+def test_append_memoryview_chunks(threshold):
+    audio = AudioAccumulator(spill_threshold=threshold)
+    audio.append(memoryview(b"xyz"))
+    audio.append(memoryview(b"uvw"))
+
+    assert audio.to_bytes() == b"xyzuvw"
@@ -0,0 +1,122 @@
+"""Tests for binary audio framing and its use on the chat websocket."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+from typing import Any
+
+import pytest
+
+from core.streaming.audio_frames import (
+    AUDIO_FORMAT_CODES,
+    AUDIO_FRAME_HEADER_SIZE,
+    AUDIO_TRANSPORT_BINARY,
+    AUDIO_TRANSPORT_JSON,
+    AudioFrameEncoder,
+    audio_event_as_json,
+    audio_format_code,
+    decode_audio_frame,
+    requested_audio_transport,
+)
+from core.streaming.manager import StreamingManager
+from features.chat.utils.websocket_streaming import send_to_frontend
+
+
+class RecordingWebSocket:
+    def __init__(self, query: dict[str, str] | None = None) -> None:
+        self.query_params = query or {}
+        self.json: list[dict[str, Any]] = []
+        self.binary: list[bytes] = []
+
+    async def send_json(self, payload: dict[str, Any]) -> None:
+        self.json.append(payload)
+
+    async def send_bytes(self, payload: bytes) -> None:
+        self.binary.append(payload)
+
+
+def test_frame_round_trip_and_sequence_per_stream() -> None:
+    encoder = AudioFrameEncoder()
+
+    first = decode_audio_frame(encoder.encode(b"abc", audio_format="mp3_44100_128"))
+    second = decode_audio_frame(encoder.encode(b"def", audio_format="mp3_44100_128"))
+    encoder.new_stream()
+    third = decode_audio_frame(encoder.encode(b"ghi", audio_format="pcm_24000"))
+
+    assert (first.stream_id, first.sequence, first.audio) == (1, 1, b"abc")
+    assert (second.stream_id, second.sequence) == (1, 2)
+    assert (third.stream_id, third.sequence, third.format_code) == (2, 1, AUDIO_FORMAT_CODES["pcm"])
+    assert first.format_code == AUDIO_FORMAT_CODES["mp3"]
+    assert len(encoder.encode(b"")) == AUDIO_FRAME_HEADER_SIZE
+
+
+def test_stream_key_change_opens_new_stream() -> None:
+    encoder = AudioFrameEncoder()
+
+    ids = [
+        decode_audio_frame(encoder.encode(b"x", stream_key=key)).stream_id
+        for key in ("resp_1", "resp_1", "resp_2")
+    ]
+
+    assert ids == [1, 1, 2]
+
+
+def test_format_codes_and_transport_negotiation() -> None:
+    assert audio_format_code("pcm16") == AUDIO_FORMAT_CODES["pcm"]
+    assert audio_format_code("ulaw_8000") == AUDIO_FORMAT_CODES["ulaw"]
+    assert audio_format_code(None) == AUDIO_FORMAT_CODES["unknown"]
+    assert requested_audio_transport(RecordingWebSocket({"audio_transport": "BINARY"})) == AUDIO_TRANSPORT_BINARY
+    assert requested_audio_transport(RecordingWebSocket(), "json") == AUDIO_TRANSPORT_JSON
+    assert requested_audio_transport(RecordingWebSocket()) == AUDIO_TRANSPORT_JSON
+
+
+def test_audio_event_as_json_encodes_raw_audio_only() -> None:
+    raw = {"type": "audio_chunk", "content": b"\x00\x01"}
+
+    assert audio_event_as_json(raw)["content"] == base64.b64encode(b"\x00\x01").decode()
+    assert audio_event_as_json({"type": "audio_chunk", "content": "AAE="})["content"] == "AAE="
+
+
+@pytest.mark.anyio("asyncio")
+async def test_manager_keeps_raw_audio_unencoded() -> None:
+    manager = StreamingManager()
+    queue: asyncio.Queue = asyncio.Queue()
+    manager.add_queue(queue)
+
+    await manager.send_to_queues({"type": "audio_chunk", "content": b"\xff\xfb", "format": "mp3"})
+
+    assert (await queue.get())["content"] == b"\xff\xfb"
+
+
+async def _drain(events: list[Any], *, audio_frames: AudioFrameEncoder | None) -> RecordingWebSocket:
+    websocket = RecordingWebSocket()
+    queue: asyncio.Queue = asyncio.Queue()
+    for event in [*events, None]:
+        queue.put_nowait(event)
+    await send_to_frontend(queue, websocket, audio_frames=audio_frames)
+    return websocket
+
+
+@pytest.mark.anyio("asyncio")
+async def test_send_to_frontend_sends_binary_frames_when_negotiated() -> None:
+    events = [
+        {"type": "tts_started", "content": {"format": "mp3"}},
+        {"type": "audio_chunk", "content": b"one", "format": "mp3"},
+        {"type": "audio_chunk", "content": b"two", "format": "mp3"},
+        {"type": "tts_completed", "content": ""},
+    ]
+
+    websocket = await _drain(events, audio_frames=AudioFrameEncoder())
+
+    assert [event["type"] for event in websocket.json] == ["tts_started", "tts_completed"]
+    frames = [decode_audio_frame(frame) for frame in websocket.binary]
+    assert [(f.stream_id, f.sequence, f.audio) for f in frames] == [(1, 1, b"one"), (1, 2, b"two")]
+
+
+@pytest.mark.anyio("asyncio")
+async def test_send_to_frontend_falls_back_to_base64_json() -> None:
+    websocket = await _drain([{"type": "audio_chunk", "content": b"one", "format": "mp3"}], audio_frames=None)
+
+    assert websocket.binary == []
+    assert websocket.json[0]["content"] == base64.b64encode(b"one").decode()
@@ -0,0 +1,90 @@
+import json
+import logging
+import queue
+import threading
+
+from core.logging import JsonLogFormatter, LogThrottleFilter, install_queue_logging
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _record(level: int = logging.INFO, msg: str = "chunk %d", *args, **extra) -> logging.LogRecord:
+    record = logging.LogRecord("test.chunks", level, __file__, 10, msg, args or (1,), None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_sampling_keeps_every_nth_record_and_counts_suppressed():
+    throttle = LogThrottleFilter(sample_every=3)
+
+    kept = [throttle.filter(_record()) for _ in range(7)]
+
+    assert kept == [True, False, False, True, False, False, True]
+    throttle.filter(_record())
+    throttle.filter(_record())
+    passed = _record()
+    assert throttle.filter(passed) is True
+    assert passed.suppressed == 2
+
+
+def test_rate_limit_caps_records_per_second_but_never_drops_warnings():
+    clock = FakeClock()
+    throttle = LogThrottleFilter(max_per_second=2, clock=clock)
+
+    assert [throttle.filter(_record()) for _ in range(4)] == [True, True, False, False]
+    assert throttle.filter(_record(logging.WARNING)) is True
+
+    clock.now = 1.5
+    passed = _record()
+    assert throttle.filter(passed) is True
+    assert passed.suppressed == 2
+
+
+def test_json_formatter_includes_extra_fields_and_exception():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        import sys
+
+        record = logging.LogRecord("core.http", logging.ERROR, __file__, 42, "failed %s", ("job",), sys.exc_info())
+    record.job_id = "job_1"
+
+    payload = json.loads(JsonLogFormatter().format(record))
+
+    assert payload["level"] == "ERROR"
+    assert payload["logger"] == "core.http"
+    assert payload["message"] == "failed job"
+    assert payload["job_id"] == "job_1"
+    assert "ValueError: boom" in payload["exception"]
+
+
+def test_queue_logging_writes_from_listener_thread():
+    written: "queue.SimpleQueue[tuple[str, str]]" = queue.SimpleQueue()
+
+    class CapturingHandler(logging.Handler):
+        def emit(self, record: logging.LogRecord) -> None:
+            written.put((threading.current_thread().name, self.format(record)))
+
+    target = logging.getLogger("tests.queue_logging")
+    target.propagate = False
+    target.setLevel(logging.INFO)
+    handler = CapturingHandler()
+    target.addHandler(handler)
+    listeners = install_queue_logging([target])
+    try:
+        assert handler not in target.handlers
+        target.info("hello %s", "world")
+        thread_name, message = written.get(timeout=2)
+    finally:
+        for listener in listeners:
+            listener.stop()
+        target.handlers.clear()
+
+    assert message == "hello world"
+    assert thread_name != threading.current_thread().name
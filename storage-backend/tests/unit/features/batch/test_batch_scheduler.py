@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Sequence
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from core.pydantic_schemas import ProviderResponse
+from features.batch.db_models import BatchJob
+from features.batch.repositories.batch_job_repository import BatchJobRepository
+from features.batch.services.batch_scheduler import BatchScheduler
+from features.batch.services.provider_adapters import BatchProviderAdapter, ProviderBatchSnapshot
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(BatchJob.__table__.create)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeAdapter(BatchProviderAdapter):
+    provider_name = "openai"
+
+    def __init__(self) -> None:
+        self.submitted: List[List[Dict[str, Any]]] = []
+        self.poll_calls: List[List[str]] = []
+        self.snapshots: Dict[str, ProviderBatchSnapshot] = {}
+        self.results: List[Dict[str, Any]] = []
+        self.converted: List[List[str]] = []
+
+    async def submit(self, requests, *, description=None):
+        self.submitted.append(requests)
+        return {"batch_id": f"prov_{len(self.submitted)}"}
+
+    async def poll(self, batch_ids: Sequence[str]):
+        self.poll_calls.append(list(batch_ids))
+        return {
+            batch_id: self.snapshots.get(batch_id, ProviderBatchSnapshot(batch_id, "processing", "in_progress"))
+            for batch_id in batch_ids
+        }
+
+    async def iter_raw_results(self, snapshot):
+        for entry in self.results:
+            yield entry
+
+    async def to_responses(self, requests, raw, *, offset):
+        self.converted.append([entry["custom_id"] for entry in raw])
+        return [
+            ProviderResponse(
+                text=entry["text"],
+                model="gpt-4o",
+                provider="openai",
+                metadata={"custom_id": entry["custom_id"]},
+            )
+            for entry in raw
+        ]
+
+
+async def _create_job(session_factory, job_id: str, *, status: str = "queued", **metadata: Any) -> None:
+    payload = {"dispatch": "scheduler", "provider_requests": [{"custom_id": f"r{i}", "prompt": "hi"} for i in range(4)]}
+    payload.update(metadata)
+    async with session_factory() as session:
+        repository = BatchJobRepository(session)
+        await repository.create(
+            job_id=job_id,
+            customer_id=1,
+            provider="openai",
+            model="gpt-4o",
+            request_count=4,
+            metadata=payload,
+        )
+        if status != "queued":
+            await repository.update_status(job_id=job_id, status=status)
+        await session.commit()
+
+
+async def _load(session_factory, job_id: str) -> BatchJob:
+    async with session_factory() as session:
+        job = await BatchJobRepository(session).get_by_job_id(job_id)
+        assert job is not None
+        return job
+
+
+def _scheduler(session_factory, adapter: FakeAdapter, clock: FakeClock, **kwargs: Any) -> BatchScheduler:
+    params = {
+        "base_interval": 10,
+        "max_interval": 40,
+        "backoff_factor": 2,
+        "initial_delay": 0,
+        "refresh_interval": 60,
+        "chunk_size": 2,
+        "clock": clock,
+    }
+    params.update(kwargs)
+    return BatchScheduler(session_factory, adapter_factory=lambda provider, model: adapter, **params)
+
+
+@pytest.mark.asyncio
+async def test_queued_jobs_are_submitted_once_and_inline_jobs_ignored(session_factory):
+    await _create_job(session_factory, "job_a")
+    await _create_job(session_factory, "job_inline", dispatch="inline")
+    adapter, clock = FakeAdapter(), FakeClock()
+    scheduler = _scheduler(session_factory, adapter, clock)
+
+    await scheduler.run_once()
+    scheduler.notify()
+    await scheduler.run_once()
+
+    assert len(adapter.submitted) == 1
+    job = await _load(session_factory, "job_a")
+    assert job.status == "processing"
+    assert job.metadata_payload["provider_batch"] == {"batch_id": "prov_1"}
+    assert scheduler.tracked_job_ids == ["job_a"]
+    assert (await _load(session_factory, "job_inline")).status == "queued"
+
+
+@pytest.mark.asyncio
+async def test_restart_resumes_jobs_and_polls_them_in_one_call(session_factory):
+    for index in range(3):
+        await _create_job(
+            session_factory,
+            f"job_{index}",
+            status="processing",
+            provider_batch={"batch_id": f"prov_{index}"},
+        )
+    adapter, clock = FakeAdapter(), FakeClock()
+    scheduler = _scheduler(session_factory, adapter, clock)
+
+    await scheduler.run_once()
+
+    assert adapter.submitted == []
+    assert adapter.poll_calls == [["prov_0", "prov_1", "prov_2"]]
+
+
+@pytest.mark.asyncio
+async def test_polling_interval_backs_off_until_progress(session_factory):
+    await _create_job(session_factory, "job_a", status="processing", provider_batch={"batch_id": "prov_a"})
+    adapter, clock = FakeAdapter(), FakeClock()
+    scheduler = _scheduler(session_factory, adapter, clock)
+
+    assert await scheduler.run_once() == 10  # first observation counts as progress
+    clock.now = 10
+    assert await scheduler.run_once() == 20
+    clock.now = 30
+    assert await scheduler.run_once() == 30  # next poll at 70 (capped to 40s), refresh at 60
+    clock.now = 70
+    adapter.snapshots["prov_a"] = ProviderBatchSnapshot("prov_a", "processing", "in_progress", succeeded=2)
+    assert await scheduler.run_once() == 10
+
+    assert len(adapter.poll_calls) == 4
+    assert (await _load(session_factory, "job_a")).succeeded_count == 2
+
+
+@pytest.mark.asyncio
+async def test_completed_batch_streams_results_in_chunks_and_resumes(session_factory):
+    already_persisted = [
+        ProviderResponse(text="r0", model="gpt-4o", provider="openai", metadata={"custom_id": "r0"}).model_dump()
+    ]
+    await _create_job(
+        session_factory,
+        "job_a",
+        status="processing",
+        provider_batch={"batch_id": "prov_a"},
+        responses=already_persisted,
+        results_consumed=1,
+    )
+    adapter, clock = FakeAdapter(), FakeClock()
+    adapter.snapshots["prov_a"] = ProviderBatchSnapshot("prov_a", "completed", "completed", result_sources=("file",))
+    adapter.results = [{"custom_id": cid, "text": cid} for cid in ("r0", "r2", "r1")]
+    scheduler = _scheduler(session_factory, adapter, clock)
+
+    await scheduler.run_once()
+
+    # r0 was persisted before the restart and is not converted again.
+    assert adapter.converted == [["r2", "r1"]]
+    job = await _load(session_factory, "job_a")
+    assert job.status == "completed"
+    assert job.succeeded_count == 3
+    assert job.failed_count == 1
+    responses = job.metadata_payload["responses"]
+    assert [entry["metadata"]["custom_id"] for entry in responses] == ["r0", "r1", "r2", "r3"]
+    assert responses[3]["metadata"]["error_type"] == "MissingResult"
+    assert "provider_requests" not in job.metadata_payload
+    assert "results_consumed" not in job.metadata_payload
+    assert scheduler.tracked_job_ids == []
+
+
+@pytest.mark.asyncio
+async def test_provider_failure_marks_job_failed(session_factory):
+    await _create_job(session_factory, "job_a", status="processing", provider_batch={"batch_id": "prov_a"})
+    adapter, clock = FakeAdapter(), FakeClock()
+    adapter.snapshots["prov_a"] = ProviderBatchSnapshot("prov_a", "expired", "expired", error="Batch job expired")
+    scheduler = _scheduler(session_factory, adapter, clock)
+
+    await scheduler.run_once()
+
+    job = await _load(session_factory, "job_a")
+    assert job.status == "expired"
+    assert job.error_message == "Batch job expired"
+
+
+@pytest.mark.asyncio
+async def test_leased_jobs_are_polled_and_finished_by_one_worker(session_factory):
+    await _create_job(session_factory, "job_a", status="processing", provider_batch={"batch_id": "prov_a"})
+    clock = FakeClock()
+    first_adapter, second_adapter = FakeAdapter(), FakeAdapter()
+    first = _scheduler(session_factory, first_adapter, clock, owner="worker-1")
+    second = _scheduler(session_factory, second_adapter, clock, owner="worker-2")
+
+    await first.run_once()
+    await second.run_once()
+    assert first.tracked_job_ids == ["job_a"]
+    assert second.tracked_job_ids == []
+    assert second_adapter.poll_calls == []
+
+    # worker-1 stops renewing: once its lease expires the job moves over.
+    async with session_factory() as session:
+        job = await BatchJobRepository(session).get_by_job_id("job_a")
+        job.lease_expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        await session.commit()
+    second.notify()
+    await second.run_once()
+    first.notify()
+    await first.run_once()
+    assert second.tracked_job_ids == ["job_a"]
+    assert first.tracked_job_ids == []
+    assert (await _load(session_factory, "job_a")).lease_owner == "worker-2"
+
+
+@pytest.mark.asyncio
+async def test_worker_that_lost_its_lease_does_not_persist_results(session_factory):
+    await _create_job(session_factory, "job_a", status="processing", provider_batch={"batch_id": "prov_a"})
+    adapter, clock = FakeAdapter(), FakeClock()
+    scheduler = _scheduler(session_factory, adapter, clock, owner="worker-1")
+    await scheduler.run_once()
+
+    async with session_factory() as session:
+        job = await BatchJobRepository(session).get_by_job_id("job_a")
+        job.lease_owner = "worker-2"
+        await session.commit()
+    adapter.snapshots["prov_a"] = ProviderBatchSnapshot("prov_a", "completed", "completed", result_sources=("file",))
+    adapter.results = [{"custom_id": "r0", "text": "r0"}]
+    clock.now = 10
+    await scheduler.run_once()
+
+    assert adapter.converted == []
+    assert (await _load(session_factory, "job_a")).status == "processing"
+    assert scheduler.tracked_job_ids == []
+
+
+@pytest.mark.asyncio
+async def test_gemini_poll_keeps_snapshots_of_batches_that_answered():
+    from types import SimpleNamespace
+
+    from features.batch.services.provider_adapters import GeminiBatchAdapter
+
+    class FakeOps:
+        async def get_batch(self, batch_id: str):
+            if batch_id == "broken":
+                raise RuntimeError("boom")
+            return SimpleNamespace(state=SimpleNamespace(name="JOB_STATE_RUNNING"), completion_stats=None)
+
+    adapter = GeminiBatchAdapter.__new__(GeminiBatchAdapter)
+    adapter.ops = FakeOps()
+
+    snapshots = await adapter.poll(["ok", "broken"])
+
+    assert list(snapshots) == ["ok"]
+    assert snapshots["ok"].status == "processing"
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from features.chat.services.streaming.deep_research import (
+    DeepResearchFindings,
+    StagePipeline,
+    stages,
+    workflow,
+)
+from features.chat.services.streaming.deep_research_helpers import split_research_queries
+
+LATENCY = 0.1
+SETTINGS = {"text": {"deep_research_enabled": True, "model": "gpt-4o"}}
+
+
+def test_split_research_queries_repeats_date_and_caps_count() -> None:
+    prompt = "Today is 2025-01-01\nFirst topic\n---\nSecond topic\n---\nThird topic"
+
+    assert split_research_queries(prompt, 3) == [
+        "Today is 2025-01-01\nFirst topic",
+        "Today is 2025-01-01\nSecond topic",
+        "Today is 2025-01-01\nThird topic",
+    ]
+    assert split_research_queries(prompt, 2) == [
+        "Today is 2025-01-01\nFirst topic",
+        "Today is 2025-01-01\nSecond topic\n\nThird topic",
+    ]
+
+
+def test_split_research_queries_keeps_single_prompt_untouched() -> None:
+    prompt = "Today is 2025-01-01\nOne topic only\n---\n"
+
+    assert split_research_queries(prompt, 3) == [prompt]
+
+
+@pytest.mark.asyncio
+async def test_run_parallel_reports_in_completion_order_returns_in_call_order() -> None:
+    pipeline = StagePipeline()
+    seen: List[int] = []
+
+    async def call(value: int, delay: float) -> int:
+        await asyncio.sleep(delay)
+        if value < 0:
+            raise ValueError("boom")
+        return value
+
+    async def on_result(index: int, value: int) -> None:
+        seen.append(index)
+
+    results = await pipeline.run_parallel(
+        "research",
+        [lambda: call(1, 0.03), lambda: call(-1, 0.0), lambda: call(3, 0.01)],
+        on_result=on_result,
+    )
+
+    assert results[0] == 1 and results[2] == 3
+    assert isinstance(results[1], ValueError)
+    assert seen == [2, 0]
+    assert "research" in pipeline.timings
+
+
+def _manager() -> MagicMock:
+    manager = MagicMock()
+    manager.send_to_queues = AsyncMock()
+    return manager
+
+
+def _patch_stages(monkeypatch: pytest.MonkeyPatch, optimized_prompt: str, events: List[str]) -> None:
+    async def optimize(**_: Any) -> str:
+        return optimized_prompt
+
+    async def research(*, query: str, **_: Any):
+        await asyncio.sleep(LATENCY)
+        topic = query.splitlines()[-1]
+        return f"report on {topic}", [{"url": f"https://example.com/{topic}"}, {"url": "https://example.com/shared"}]
+
+    async def analyze(**_: Any):
+        for chunk in ("a", "b"):
+            await asyncio.sleep(LATENCY / 2)
+            events.append(f"chunk:{chunk}")
+            yield chunk
+
+    monkeypatch.setattr(workflow, "optimize_research_prompt", optimize)
+    monkeypatch.setattr(stages, "_run_research_query", research)
+    monkeypatch.setattr(workflow, "analyze_research_findings", analyze)
+
+
+@pytest.mark.asyncio
+async def test_workflow_runs_sub_queries_in_parallel_and_persists_during_analysis(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    events: List[str] = []
+    _patch_stages(monkeypatch, "Today is 2025-01-01\nalpha\n---\nbeta\n---\ngamma", events)
+    stored: List[DeepResearchFindings] = []
+
+    async def persist(findings: DeepResearchFindings):
+        events.append("persist:start")
+        await asyncio.sleep(LATENCY)
+        stored.append(findings)
+        events.append("persist:done")
+        return "session-7", {"user_message_id": 1, "research_message_id": 3}
+
+    manager = _manager()
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    outcome = await workflow.stream_deep_research_response(
+        prompt=[{"role": "user", "content": "question"}],
+        settings=SETTINGS,
+        customer_id=1,
+        manager=manager,
+        session_id=None,
+        persist_findings=persist,
+    )
+    elapsed = loop.time() - started
+
+    # three sub-queries and persistence overlap: research ~1x, analysis ~1x
+    assert elapsed < LATENCY * 3
+    assert events.index("persist:start") < events.index("chunk:a")
+    assert outcome.research_response == "report on alpha\n\nreport on beta\n\nreport on gamma"
+    assert [c["url"] for c in outcome.citations].count("https://example.com/shared") == 1
+    assert outcome.session_id == "session-7"
+    assert outcome.message_ids == {"user_message_id": 1, "research_message_id": 3}
+    assert outcome.notification_tagged is True
+    assert stored[0].research_response == outcome.research_response
+
+    sent: List[Dict[str, Any]] = [call.args[0] for call in manager.send_to_queues.await_args_list]
+    contents = [e["content"] for e in sent if isinstance(e.get("content"), dict)]
+    partials = [c for c in contents if c.get("type") == "deepResearchPartialFindings"]
+    assert sorted(p["index"] for p in partials) == [0, 1, 2]
+    assert all(p["total"] == 3 for p in partials)
+
+
+@pytest.mark.asyncio
+async def test_workflow_survives_findings_persistence_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    events: List[str] = []
+    _patch_stages(monkeypatch, "Today is 2025-01-01\nalpha", events)
+
+    async def persist(findings: DeepResearchFindings):
+        raise RuntimeError("db down")
+
+    outcome = await workflow.stream_deep_research_response(
+        prompt=[{"role": "user", "content": "question"}],
+        settings=SETTINGS,
+        customer_id=1,
+        manager=_manager(),
+        session_id="session-1",
+        persist_findings=persist,
+    )
+
+    assert outcome.analysis_chunks == ["a", "b"]
+    assert outcome.message_ids is None
+    assert outcome.notification_tagged is False
+    assert outcome.session_id == "session-1"
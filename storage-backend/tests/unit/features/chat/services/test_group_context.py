@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from features.chat.db_models import ChatGroupMember, ChatMessage
+from features.chat.group_request_models import GroupChatAgentRequest, GroupChatRequest
+from features.chat.repositories.group_request_repository import GroupChatRequestRepository
+from features.chat.services import group_router
+from features.chat.services.group_router import GroupChatRouter, handle_sequential_responses
+
+AGENTS = ["sherlock", "bugsy", "watson", "moriarty"]
+SESSION_ID = "group-session-1"
+START = datetime(2026, 1, 1, 12, 0)
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        for model in (ChatGroupMember, ChatMessage, GroupChatRequest, GroupChatAgentRequest):
+            await conn.run_sync(model.__table__.create)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def seeded(engine):
+    """A group whose agents last responded at different points of a 12-message session."""
+    group_id = uuid4()
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as db:
+        for index in range(12):
+            db.add(ChatMessage(
+                session_id=SESSION_ID,
+                customer_id=1,
+                sender="User" if index % 2 == 0 else "AI",
+                message=f"m{index}",
+                responding_agent=None if index % 2 == 0 else AGENTS[index % len(AGENTS)],
+                created_at=START + timedelta(minutes=index),
+            ))
+        last_responses = [None, START + timedelta(minutes=3), START + timedelta(minutes=9), None]
+        for position, (agent, last) in enumerate(zip(AGENTS, last_responses)):
+            db.add(ChatGroupMember(group_id=group_id, agent_name=agent, position=position, last_response_at=last))
+        for round_index in range(2):
+            request = GroupChatRequest(
+                group_id=group_id,
+                group_session_id=SESSION_ID,
+                user_id=1,
+                mode="sequential",
+                created_at=START + timedelta(hours=round_index),
+            )
+            db.add(request)
+            await db.flush()
+            for agent in AGENTS[:2]:
+                db.add(GroupChatAgentRequest(
+                    group_request_id=request.id,
+                    proactive_session_id=f"{agent}-{round_index}",
+                    agent_name=agent,
+                    created_at=START + timedelta(hours=round_index),
+                ))
+        await db.commit()
+    return factory, group_id
+
+
+def _count_selects(engine) -> list[str]:
+    statements: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def record(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    return statements
+
+
+@pytest.mark.asyncio
+async def test_snapshot_matches_per_agent_queries(seeded) -> None:
+    factory, group_id = seeded
+    async with factory() as db:
+        router = GroupChatRouter(db)
+        repo = GroupChatRequestRepository(db)
+        group = SimpleNamespace(id=group_id, context_window_size=4)
+
+        snapshot = await router.get_turn_snapshot(group, SESSION_ID, repo)
+
+        for agent in AGENTS:
+            expected = await router.get_context_for_agent(group_id, agent, SESSION_ID, 4)
+            assert snapshot.context_for_agent(agent, 4) == expected
+            assert snapshot.agent_session(agent) == await repo.get_latest_agent_session(group_id, agent)
+
+    assert [c["content"] for c in snapshot.context_for_agent("watson", 4)] == ["m10", "m11"]
+    assert snapshot.agent_sessions == {"sherlock": "sherlock-1", "bugsy": "bugsy-1"}
+
+
+@pytest.mark.asyncio
+async def test_sequential_turn_loads_context_once(engine, seeded, monkeypatch) -> None:
+    factory, group_id = seeded
+    monkeypatch.setattr(group_router.GroupService, "update_member_response_time", AsyncMock())
+    statements = _count_selects(engine)
+    route = AsyncMock(return_value=SimpleNamespace(queued=False, response="ok", proactive_session_id=None))
+    members = [SimpleNamespace(agent_name=agent, position=index) for index, agent in enumerate(AGENTS)]
+    group = SimpleNamespace(
+        id=group_id, name="g", mode="sequential", leader_agent="sherlock", context_window_size=4,
+        pipelined=False, independent_agents=[], members=members,
+    )
+
+    async with factory() as db:
+        await handle_sequential_responses(
+            websocket=SimpleNamespace(send_json=AsyncMock()),
+            db=db,
+            group=group,
+            user_message="hi",
+            session_id=SESSION_ID,
+            router=GroupChatRouter(db),
+            route_to_agent_fn=route,
+            request_repo=GroupChatRequestRepository(db),
+        )
+
+    assert route.await_count == len(AGENTS)
+    assert len(statements) == 3  # members, message window, latest sessions
+    bugsy_payload = route.await_args_list[1].args[1]
+    assert bugsy_payload["group_metadata"]["proactive_session_id"] == "bugsy-1"
+    assert [c["content"] for c in bugsy_payload["context"]] == ["m8", "m9", "m10", "m11"]
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from features.chat.services import group_router
+from features.chat.services.group_context import GroupTurnSnapshot
+from features.chat.services.group_router import handle_sequential_responses, message_queue
+
+AGENTS = ["sherlock", "bugsy", "watson", "moriarty"]
+LATENCY = 0.1
+
+
+def _group(*, pipelined: bool, independent: list[str]) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid4(),
+        name="g",
+        mode="sequential",
+        leader_agent="sherlock",
+        context_window_size=6,
+        pipelined=pipelined,
+        independent_agents=independent,
+        members=[SimpleNamespace(agent_name=a, position=i) for i, a in enumerate(AGENTS)],
+    )
+
+
+def _router() -> SimpleNamespace:
+    router = SimpleNamespace(get_turn_snapshot=AsyncMock(return_value=GroupTurnSnapshot(messages=[])))
+    router.format_context_for_forwarding = lambda msg, ctx, group, pos: (
+        group_router.GroupChatRouter.format_context_for_forwarding(None, msg, ctx, group, pos)
+    )
+    return router
+
+
+class Agents:
+    """Fake agents that answer after a fixed latency and record their payloads."""
+
+    def __init__(self, latency: dict[str, float] | None = None) -> None:
+        self.latency = latency or {}
+        self.payloads: dict[str, dict] = {}
+        self.cancelled: list[str] = []
+
+    async def __call__(self, agent_name: str, payload: dict, session_id: str):
+        self.payloads[agent_name] = payload
+        try:
+            await asyncio.sleep(self.latency.get(agent_name, LATENCY))
+        except asyncio.CancelledError:
+            self.cancelled.append(agent_name)
+            raise
+        return SimpleNamespace(queued=False, response=f"{agent_name} says hi", proactive_session_id=None)
+
+
+async def _run(group, agents: Agents, persisted: list | None = None):
+    websocket = SimpleNamespace(send_json=AsyncMock())
+
+    async def persist(agent_name: str, content: str) -> None:
+        if persisted is not None:
+            persisted.append(agent_name)
+
+    message_queue.set_pending(group.id, AGENTS)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await handle_sequential_responses(
+        websocket=websocket,
+        db=None,
+        group=group,
+        user_message="hi",
+        session_id="s1",
+        router=_router(),
+        route_to_agent_fn=agents,
+        persist_response_fn=persist,
+    )
+    return [call.args[0] for call in websocket.send_json.await_args_list], loop.time() - started
+
+
+@pytest.fixture(autouse=True)
+def _no_db(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(group_router.GroupService, "update_member_response_time", AsyncMock())
+
+
+@pytest.mark.asyncio
+async def test_independent_agents_run_concurrently_but_emit_in_order() -> None:
+    group = _group(pipelined=True, independent=["bugsy", "watson"])
+    agents = Agents(latency={"watson": 0.05})
+    persisted: list[str] = []
+
+    events, elapsed = await _run(group, agents, persisted)
+
+    responses = [e["agent_name"] for e in events if e["type"] == "agent_response"]
+    assert responses == AGENTS
+    assert persisted == AGENTS
+    # sherlock, bugsy and watson overlap; only moriarty waits for them
+    assert elapsed < LATENCY * 3
+    moriarty = agents.payloads["moriarty"]["group_metadata"]
+    assert [c["agent"] for c in moriarty["accumulated_context"]] == ["sherlock", "bugsy", "watson"]
+    assert agents.payloads["watson"]["group_metadata"]["accumulated_context"] == []
+    assert "in parallel" in agents.payloads["watson"]["group_metadata"]["sequential_hint"]
+
+
+@pytest.mark.asyncio
+async def test_groups_without_pipelining_stay_strictly_sequential() -> None:
+    group = _group(pipelined=False, independent=["bugsy", "watson"])
+    agents = Agents()
+
+    events, elapsed = await _run(group, agents)
+
+    assert elapsed >= LATENCY * len(AGENTS)
+    watson = agents.payloads["watson"]["group_metadata"]
+    assert [c["agent"] for c in watson["accumulated_context"]] == ["sherlock", "bugsy"]
+
+
+@pytest.mark.asyncio
+async def test_interrupted_round_cancels_in_flight_agents() -> None:
+    group = _group(pipelined=True, independent=["watson", "moriarty"])
+    agents = Agents(latency={"watson": 5, "moriarty": 5})
+
+    original = agents.__call__
+
+    async def route(agent_name, payload, session_id):
+        result = await original(agent_name, payload, session_id)
+        if agent_name == "sherlock":
+            message_queue.cancel_pending(group.id)
+        return result
+
+    events, elapsed = await _run(group, route)
+
+    assert any(e["type"] == "sequence_interrupted" for e in events)
+    assert sorted(agents.cancelled) == ["moriarty", "watson"]
+    assert elapsed < 1
@@ -0,0 +1,160 @@
+"""Tests for token-budgeted chat history assembly."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import pytest
+
+from core.providers.registry import ModelConfig
+from features.chat.services.history import compaction
+from features.chat.services.history.compaction import (
+    SUMMARY_HEADER,
+    HistoryCompactor,
+    HistoryTurn,
+    MessageTokenCache,
+    compact_history_payload,
+    history_token_budget,
+)
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+class WordCounter:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def count_tokens(self, text: str) -> int:
+        self.calls += 1
+        return len(text.split())
+
+
+class FakeLoader:
+    """In-memory stand-in for the keyset-paged message table."""
+
+    def __init__(self, count: int, words: int = 20) -> None:
+        self.rows = [
+            HistoryTurn(message_id=i, role="user" if i % 2 else "assistant", content=f"m{i} " + "w " * (words - 1))
+            for i in range(1, count + 1)
+        ]
+        self.loaded = 0
+
+    def add(self, words: int = 20) -> None:
+        i = len(self.rows) + 1
+        self.rows.append(HistoryTurn(message_id=i, role="user" if i % 2 else "assistant", content=f"m{i} " + "w " * (words - 1)))
+
+    async def load(self, *, session_id, customer_id, after_id=None, before_id=None, limit, newest_first=False):
+        rows = [
+            row
+            for row in self.rows
+            if (after_id is None or row.message_id > after_id) and (before_id is None or row.message_id < before_id)
+        ]
+        if newest_first:
+            rows.reverse()
+        page = [HistoryTurn(row.message_id, row.role, row.content) for row in rows[:limit]]
+        self.loaded += len(page)
+        return page
+
+
+def _compactor(loader: FakeLoader, summaries: list, counter: Optional[WordCounter] = None) -> HistoryCompactor:
+    async def summarizer(previous, turns):
+        summaries.append((previous, [turn.message_id for turn in turns]))
+        return f"summary through m{turns[-1].message_id}"
+
+    return HistoryCompactor(
+        loader=loader,
+        summarizer=summarizer,
+        token_cache=MessageTokenCache(counter or WordCounter()),
+        page_size=10,
+        target_ratio=0.5,
+    )
+
+
+@pytest.mark.anyio
+async def test_short_sessions_are_sent_verbatim() -> None:
+    loader = FakeLoader(6)
+    compactor = _compactor(loader, [])
+
+    history = await compactor.assemble(session_id="s", customer_id=1, budget=1000)
+
+    assert [m["content"].split()[0] for m in history.messages] == ["m1", "m2", "m3", "m4", "m5", "m6"]
+    assert not history.compacted
+    assert compactor.summary_for("s") is None
+
+
+@pytest.mark.anyio
+async def test_long_session_stays_within_budget_and_summarizes_in_background() -> None:
+    loader = FakeLoader(101)  # 24 tokens per message
+    summaries: list = []
+    compactor = _compactor(loader, summaries)
+
+    first = await compactor.assemble(session_id="s", customer_id=1, budget=500)
+    assert first.compacted and first.tokens <= 250
+    assert first.messages[0]["role"] == "user"
+    assert loader.loaded < 40  # only the tail was read
+
+    await compactor.drain()
+    summary = compactor.summary_for("s")
+    assert summary is not None
+    boundary = int(first.messages[0]["content"].split()[0][1:])
+    assert summary.upto_message_id == boundary - 1
+    assert summaries[-1][0] is not None  # later batches fold into the previous summary
+
+    # Following turns reuse the same window start (stable prefix) plus the summary.
+    loader.add()
+    second = await compactor.assemble(session_id="s", customer_id=1, budget=500)
+    assert second.messages[0]["content"].startswith(SUMMARY_HEADER)
+    assert second.messages[1] == first.messages[0]
+    assert not second.compacted
+
+    # Per-turn size stays flat as the session keeps growing.
+    sizes = []
+    for _ in range(40):
+        loader.add()
+        history = await compactor.assemble(session_id="s", customer_id=1, budget=500)
+        await compactor.drain()
+        sizes.append(history.tokens)
+    assert max(sizes) <= 500
+
+
+def test_token_counts_are_cached_per_message_text() -> None:
+    counter = WordCounter()
+    cache = MessageTokenCache(counter)
+    assert cache.count("hello there") == cache.count("hello there") == 6
+    assert counter.calls == 1
+
+    compactor = HistoryCompactor(loader=FakeLoader(0), token_cache=cache)
+    history = [{"role": "user", "content": "w " * 100}, {"role": "assistant", "content": "a"}, {"role": "user", "content": "b"}]
+    assert compactor.fit_client_history(history, budget=50) == history[2:]
+    assert compactor.fit_client_history(history[1:], budget=50) is not history
+
+
+def test_budget_follows_model_context_window() -> None:
+    assert history_token_budget(ModelConfig(model_name="m", provider_name="p", context_window=8000), 2000) == 2000
+    assert history_token_budget(None, 4096) == compaction.HISTORY_MAX_TOKENS
+    assert history_token_budget(ModelConfig(model_name="m", provider_name="p", context_window=2000), 4000) == compaction.HISTORY_MIN_TOKENS
+
+
+@pytest.mark.anyio
+async def test_payload_falls_back_to_client_history(monkeypatch) -> None:
+    class BrokenLoader(FakeLoader):
+        async def load(self, **kwargs):
+            raise RuntimeError("no database")
+
+    monkeypatch.setattr(compaction, "_compactor", HistoryCompactor(loader=BrokenLoader(0)))
+    client_history = [{"role": "user", "content": "hi"}, {"role": "assistant", "content": "hello"}]
+    payload = {"session_id": "s", "chat_history": client_history, "prompt": "next"}
+
+    result = await compact_history_payload(payload, customer_id=1, provider=object(), max_tokens=1000)
+    assert result["chat_history"] == client_history
+
+    monkeypatch.setattr(compaction, "_compactor", HistoryCompactor(loader=FakeLoader(4)))
+    edited = {"session_id": "s", "chat_history": client_history, "is_edited_message": True}
+    assert (await compact_history_payload(edited, customer_id=1, provider=object(), max_tokens=1000))["chat_history"] is client_history
+
+    fresh = {"session_id": "s", "chat_history": []}
+    result = await compact_history_payload(fresh, customer_id=1, provider=object(), max_tokens=1000)
+    assert [m["role"] for m in result["chat_history"]] == ["user", "assistant", "user", "assistant"]
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import date
+
+import pytest
+
+from core.exceptions import ProviderError
+from features.garmin.dataset_fetchers import fetch_hrv
+from features.garmin.dataset_registry import FetchWindow, GarminDatasetContext
+from features.garmin.fetch_engine import FetchEngineSettings, GarminFetchEngine, is_rate_limited_error
+from features.garmin.schemas.queries import GarminDataQuery
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+def _engine(**overrides) -> GarminFetchEngine:
+    params = {"rate_limit_per_second": 0.0, "rate_limit_backoff_seconds": 0.01}
+    params.update(overrides)
+    return GarminFetchEngine(FetchEngineSettings(**params))
+
+
+class SlowHrvClient:
+    def __init__(self) -> None:
+        self.threads: set[str] = set()
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def fetch_hrv(self, *, target_date: date):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        self.threads.add(threading.current_thread().name)
+        # Later days finish first to prove results are re-ordered.
+        time.sleep(0.05 - target_date.day * 0.005)
+        with self._lock:
+            self.active -= 1
+        return {"calendarDate": target_date.isoformat()}
+
+
+@pytest.mark.anyio
+async def test_map_days_runs_off_loop_with_bounded_concurrency_in_order():
+    client = SlowHrvClient()
+    engine = _engine(concurrency=3)
+
+    results = await engine.map_days(
+        lambda day: client.fetch_hrv(target_date=day), date(2024, 7, 1), date(2024, 7, 6)
+    )
+
+    assert [item["calendarDate"] for item in results] == [f"2024-07-0{day}" for day in range(1, 7)]
+    assert client.peak == 3
+    assert all(name.startswith("garmin-fetch") for name in client.threads)
+    engine.shutdown()
+
+
+@pytest.mark.anyio
+async def test_call_retries_after_rate_limit():
+    attempts = {"count": 0}
+
+    def flaky() -> str:
+        attempts["count"] += 1
+        if attempts["count"] < 3:
+            raise ProviderError("Garmin Connect request failed: 429 Too Many Requests", provider="garmin")
+        return "ok"
+
+    engine = _engine(max_rate_limit_retries=3)
+    assert await engine.call(flaky) == "ok"
+    assert attempts["count"] == 3
+    engine.shutdown()
+
+
+@pytest.mark.anyio
+async def test_call_gives_up_after_max_rate_limit_retries():
+    def always_limited() -> None:
+        raise ProviderError("429", provider="garmin")
+
+    engine = _engine(max_rate_limit_retries=1)
+    with pytest.raises(ProviderError):
+        await engine.call(always_limited)
+    engine.shutdown()
+
+
+@pytest.mark.anyio
+async def test_call_does_not_retry_other_provider_errors():
+    attempts = {"count": 0}
+
+    def broken() -> None:
+        attempts["count"] += 1
+        raise ProviderError("500 Server Error", provider="garmin")
+
+    engine = _engine()
+    with pytest.raises(ProviderError):
+        await engine.call(broken)
+    assert attempts["count"] == 1
+    engine.shutdown()
+
+
+@pytest.mark.anyio
+async def test_rate_limit_spaces_requests():
+    engine = _engine(rate_limit_per_second=50.0, concurrency=10)
+    started = time.monotonic()
+    await engine.map_days(lambda day: day, date(2024, 7, 1), date(2024, 7, 6))
+    assert time.monotonic() - started >= 0.09
+    engine.shutdown()
+
+
+@pytest.mark.anyio
+async def test_fetch_hrv_fans_out_through_engine():
+    client = SlowHrvClient()
+    engine = _engine(concurrency=4)
+    context = GarminDatasetContext(client=client, engine=engine)  # type: ignore[arg-type]
+    window = FetchWindow(start=date(2024, 7, 1), end=date(2024, 7, 4), display_name=None)
+
+    results = await fetch_hrv(context, window, GarminDataQuery())
+
+    assert len(results) == 4
+    assert client.peak > 1
+    engine.shutdown()
+
+
+def test_is_rate_limited_error_detects_status_code():
+    class Response:
+        status_code = 429
+
+    class HttpError(Exception):
+        response = Response()
+
+    assert is_rate_limited_error(ProviderError("failed", provider="garmin", original_error=HttpError()))
+    assert not is_rate_limited_error(ProviderError("404 not found", provider="garmin"))
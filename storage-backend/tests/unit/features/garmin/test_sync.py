@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from features.db.garmin.db_models import UserSummary
+from features.db.garmin.repositories import GarminSummaryRepository
+from features.db.garmin.repositories._base import _get_upsert_statement
+from features.db.garmin.repositories.sync import missing_dates
+from features.garmin.service import DatasetResult
+from features.garmin.settings import GarminSyncSettings
+from features.garmin.sync import GarminSyncEngine, SyncWindow, group_gap_windows, plan_incremental_window
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+SETTINGS = GarminSyncSettings(initial_backfill_days=7, overlap_days=1, gap_lookback_days=14, max_window_days=31)
+
+
+def test_plan_initial_window_uses_backfill_days():
+    window = plan_incremental_window(None, date(2024, 7, 10), SETTINGS)
+    assert window == SyncWindow(date(2024, 7, 4), date(2024, 7, 10), "initial")
+
+
+def test_plan_incremental_window_refetches_overlap_day():
+    window = plan_incremental_window(date(2024, 7, 7), date(2024, 7, 10), SETTINGS)
+    assert window == SyncWindow(date(2024, 7, 7), date(2024, 7, 10), "incremental")
+
+
+def test_missing_dates_grouped_into_gap_windows():
+    stored = {date(2024, 7, 1), date(2024, 7, 4), date(2024, 7, 5)}
+    gaps = group_gap_windows(missing_dates(stored, date(2024, 7, 1), date(2024, 7, 7)))
+    assert gaps == [
+        SyncWindow(date(2024, 7, 2), date(2024, 7, 3), "gap"),
+        SyncWindow(date(2024, 7, 6), date(2024, 7, 7), "gap"),
+    ]
+
+
+def test_window_split_bounds_large_imports():
+    chunks = SyncWindow(date(2024, 1, 1), date(2024, 3, 1), "initial").split(31)
+    assert [(chunk.start, chunk.end) for chunk in chunks] == [
+        (date(2024, 1, 1), date(2024, 1, 31)),
+        (date(2024, 2, 1), date(2024, 3, 1)),
+    ]
+
+
+class Session:
+    async def commit(self) -> None:
+        pass
+
+    async def rollback(self) -> None:  # pragma: no cover - defensive
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+class Repository:
+    def __init__(self, watermarks: dict[str, date], stored: set[date]) -> None:
+        self.watermarks = dict(watermarks)
+        self.stored = stored
+
+    async def fetch_watermarks(self, session, customer_id, datasets):
+        return {dataset: self.watermarks[dataset] for dataset in datasets if dataset in self.watermarks}
+
+    async def fetch_stored_dates(self, session, model, customer_id, *, start, end):
+        return self.stored
+
+    async def upsert_watermark(self, session, customer_id, dataset, last_synced_date, *, rows_written=0):
+        self.watermarks[dataset] = last_synced_date
+        return SimpleNamespace(last_synced_date=last_synced_date)
+
+
+class Provider:
+    def __init__(self, failing: set[str] | None = None) -> None:
+        self.windows: list[tuple[tuple[str, ...], date, date]] = []
+        self.failing = failing or set()
+
+    async def fetch_datasets(self, datasets, query, *, customer_id, save_to_db, session):
+        self.windows.append((tuple(datasets), query.start_date, query.end_date))
+        return {
+            dataset: RuntimeError("boom")
+            if dataset in self.failing
+            else DatasetResult(dataset=dataset, items=[{}], raw=[], ingested=[], saved=True)
+            for dataset in datasets
+        }
+
+
+@pytest.mark.anyio
+async def test_sync_fetches_only_new_range_and_gaps():
+    today = date(2024, 7, 14)
+    stored = {date(2024, 7, day) for day in range(1, 13) if day not in (5, 6)}
+    repository = Repository({"sleep": date(2024, 7, 12), "body_composition": date(2024, 7, 12)}, stored)
+    provider = Provider()
+    engine = GarminSyncEngine(provider, Session, sync_repository=repository, settings=SETTINGS)  # type: ignore[arg-type]
+
+    summary = await engine.sync(1, ["sleep", "body_composition"], today=today)
+
+    assert provider.windows == [
+        (("sleep",), date(2024, 7, 5), date(2024, 7, 6)),
+        (("sleep", "body_composition"), date(2024, 7, 12), date(2024, 7, 14)),
+    ]
+    assert repository.watermarks == {"sleep": today, "body_composition": today}
+    assert summary["sleep"]["watermark"] == "2024-07-14"
+
+
+@pytest.mark.anyio
+async def test_failed_window_does_not_advance_watermark():
+    repository = Repository({}, set())
+    provider = Provider(failing={"summary"})
+    settings = GarminSyncSettings(initial_backfill_days=10, overlap_days=1, gap_lookback_days=0, max_window_days=5)
+    engine = GarminSyncEngine(provider, Session, sync_repository=repository, settings=settings)  # type: ignore[arg-type]
+
+    summary = await engine.sync(1, ["sleep", "summary"], today=date(2024, 7, 10))
+
+    assert summary["summary"]["status"] == "error"
+    assert "summary" not in repository.watermarks
+    assert repository.watermarks["sleep"] == date(2024, 7, 10)
+    # The failed dataset is dropped from the second chunk.
+    assert provider.windows[1][0] == ("sleep",)
+
+
+def test_upsert_statement_renders_multi_row_insert():
+    rows = [
+        {"customer_id": 1, "calendar_date": date(2024, 7, 1), "total_steps": 100},
+        {"customer_id": 1, "calendar_date": date(2024, 7, 2), "total_steps": 200},
+    ]
+    statement = _get_upsert_statement(UserSummary, rows, True, ["customer_id", "calendar_date"])
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+
+    assert sql.count("INSERT") == 1
+    assert "ON CONFLICT (customer_id, calendar_date) DO UPDATE SET total_steps = excluded.total_steps" in sql
+
+
+@pytest.mark.anyio
+async def test_bulk_upsert_merges_duplicate_keys_and_batches(monkeypatch):
+    import features.db.garmin.repositories._base as base
+
+    monkeypatch.setattr(base, "IS_POSTGRESQL", True)
+    session = SimpleNamespace(execute=AsyncMock(), flush=AsyncMock())
+    rows = [
+        {"customer_id": 1, "calendar_date": date(2024, 7, 1), "total_steps": 1},
+        {"customer_id": 1, "calendar_date": date(2024, 7, 1), "total_steps": 2},
+        {"customer_id": 1, "calendar_date": date(2024, 7, 2), "total_steps": 3},
+        {"customer_id": 1, "calendar_date": date(2024, 7, 3), "total_steps": 4},
+    ]
+
+    written = await GarminSummaryRepository().bulk_upsert(
+        session, UserSummary, rows, ("customer_id", "calendar_date"), operation="test", batch_size=2
+    )
+
+    assert written == 3
+    assert session.execute.await_count == 2
+    session.flush.assert_awaited_once()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import date
+from types import SimpleNamespace
 
 import pytest
 
@@ -29,13 +30,35 @@ class DummyFactory:
         return DummySession()
 
 
+class SyncRepositoryStub:
+    def __init__(self) -> None:
+        self.watermarks: dict[str, date] = {}
+
+    async def fetch_watermarks(self, session, customer_id: int, datasets):
+        return {dataset: self.watermarks[dataset] for dataset in datasets if dataset in self.watermarks}
+
+    async def fetch_stored_dates(self, session, model, customer_id: int, *, start: date, end: date):
+        return set()
+
+    async def upsert_watermark(self, session, customer_id: int, dataset: str, last_synced_date: date, *, rows_written: int = 0):
+        self.watermarks[dataset] = last_synced_date
+        return SimpleNamespace(last_synced_date=last_synced_date)
+
+
 class ProviderStub:
     def __init__(self) -> None:
         self.calls: list[str] = []
+        self.sync_repository = SyncRepositoryStub()
 
-    async def fetch_dataset(self, dataset: str, query, customer_id: int, save_to_db: bool, session) -> DatasetResult:
-        self.calls.append(dataset)
-        return DatasetResult(dataset=dataset, items=[{"id": 1}], raw=[], ingested=[], saved=True)
+    async def fetch_datasets(self, datasets, query, customer_id: int, save_to_db: bool, session):
+        results = {}
+        for dataset in datasets:
+            self.calls.append(dataset)
+            if dataset == "broken":
+                results[dataset] = RuntimeError("garmin down")
+            else:
+                results[dataset] = DatasetResult(dataset=dataset, items=[{"id": 1}], raw=[], ingested=[], saved=True)
+        return results
 
 
 @pytest.mark.anyio
@@ -54,6 +77,21 @@ async def test_run_nightly_sync_returns_summary():
     assert summary["sleep"]["saved"] is True
 
 
+@pytest.mark.anyio
+async def test_run_nightly_sync_reports_dataset_errors():
+    provider = ProviderStub()
+    summary = await run_nightly_sync(
+        provider,
+        DummyFactory(),
+        customer_id=42,
+        target_date=date(2024, 7, 1),
+        datasets=("broken", "sleep"),
+    )
+
+    assert summary["broken"] == {"status": "error", "message": "garmin down"}
+    assert summary["sleep"]["status"] == "ok"
+
+
 @pytest.mark.anyio
 async def test_build_nightly_sync_job_wraps_callable():
     provider = ProviderStub()
@@ -62,3 +100,4 @@ async def test_build_nightly_sync_job_wraps_callable():
 
     assert set(provider.calls) == set(DEFAULT_SYNC_DATASETS)
     assert set(result.keys()) == set(DEFAULT_SYNC_DATASETS)
+    assert set(provider.sync_repository.watermarks) == set(DEFAULT_SYNC_DATASETS)
@@ -0,0 +1,208 @@
+"""Unit tests for OpenClaw connection pooling and stream indexes."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from features.proactive_agent.openclaw.adapter import OpenClawAdapter, StreamContext
+from features.proactive_agent.openclaw.client import ConnectionMetrics
+from features.proactive_agent.openclaw.connection_pool import OpenClawConnectionPool
+from features.proactive_agent.openclaw.exceptions import OpenClawError
+from features.proactive_agent.openclaw.stream_registry import StreamRegistry
+
+
+def _client(connected: bool = True) -> MagicMock:
+    client = MagicMock()
+    client.connected = connected
+    client.pending_request_count = 0
+    client.metrics = ConnectionMetrics()
+    client.request = AsyncMock(return_value={"status": "accepted"})
+    return client
+
+
+def _context(run_id: str, session_id: str) -> StreamContext:
+    return StreamContext(user_id=1, session_id=session_id, run_id=run_id, session_key=f"k-{session_id}")
+
+
+async def _send(adapter: OpenClawAdapter, session_id: str, **callbacks) -> str:
+    return await adapter.send_message(
+        user_id=1,
+        session_id=session_id,
+        session_key=f"agent:sherlock:{session_id}",
+        message="Hello",
+        on_stream_start=callbacks.get("on_stream_start", AsyncMock()),
+        on_text_chunk=callbacks.get("on_text_chunk", AsyncMock()),
+        on_stream_end=callbacks.get("on_stream_end", AsyncMock()),
+        on_error=AsyncMock(),
+    )
+
+
+class TestOpenClawConnectionPool:
+    """Test run assignment across connections."""
+
+    def test_acquire_picks_least_loaded_connected_slot(self):
+        """New runs go to the live connection with the fewest runs."""
+        clients = [_client(), _client(connected=False), _client()]
+        pool = OpenClawConnectionPool(clients)
+
+        assert pool.acquire("r1") is clients[0]
+        assert pool.acquire("r2") is clients[2]
+        assert pool.acquire("r3") is clients[0]
+        pool.release("r1")
+        pool.release("r3")
+        assert pool.acquire("r4") is clients[0]
+        assert [pool.load(slot) for slot in range(3)] == [1, 0, 1]
+
+    def test_acquire_without_live_connection_raises(self):
+        """Acquire fails when every slot is empty or disconnected."""
+        pool = OpenClawConnectionPool([None, _client(connected=False)])
+
+        with pytest.raises(OpenClawError):
+            pool.acquire("r1")
+
+    def test_rebind_keeps_owner(self):
+        """Gateway-assigned run ids stay on the original connection."""
+        clients = [_client(), _client()]
+        pool = OpenClawConnectionPool(clients)
+        pool.acquire("r1")
+        pool.acquire("r2")
+
+        pool.rebind("r2", "gateway-r2")
+
+        assert pool.owner("gateway-r2") == 1
+        assert pool.owner("r2") is None
+        assert pool.run_ids(1) == ["gateway-r2"]
+
+    def test_stats_include_flow_control_metrics(self):
+        """stats() reports load and send/receive counters per connection."""
+        client = _client()
+        client.metrics.record_send(100, 0.25)
+        client.metrics.record_send(50, 0.5)
+        client.metrics.record_receive(10)
+        pool = OpenClawConnectionPool([client, None])
+        pool.acquire("r1")
+
+        stats = pool.stats()
+
+        assert stats[0]["active_runs"] == 1
+        assert stats[0]["requests_sent"] == 2
+        assert stats[0]["bytes_sent"] == 150
+        assert stats[0]["send_wait_seconds"] == pytest.approx(0.75)
+        assert stats[0]["max_send_wait_seconds"] == 0.5
+        assert stats[0]["frames_received"] == 1
+        assert stats[1] == {"slot": 1, "connected": False, "active_runs": 0}
+
+
+class TestStreamRegistry:
+    """Test the indexed run registry."""
+
+    def test_session_index_follows_mutations(self):
+        """Session lookups stay in sync with inserts, removals and re-keying."""
+        registry = StreamRegistry()
+        registry["r1"] = _context("r1", "s1")
+        registry["r2"] = _context("r2", "s1")
+        registry["r3"] = _context("r3", "s2")
+
+        assert registry.first_run_for_session("s1") == "r1"
+        assert registry.run_ids_for_session("s1") == ["r1", "r2"]
+
+        del registry["r1"]
+        assert registry.first_run_for_session("s1") == "r2"
+        registry.pop("r2")
+        assert registry.first_run_for_session("s1") is None
+        assert registry.run_ids_for_session("s2") == ["r3"]
+
+        registry.clear()
+        assert registry.first_run_for_session("s2") is None
+        assert len(registry) == 0
+
+    def test_stale_scan_stops_at_first_live_run(self):
+        """Stale runs are found from the idle end of the activity order."""
+        registry = StreamRegistry()
+        for index in range(4):
+            registry[f"r{index}"] = _context(f"r{index}", f"s{index}")
+        registry["r0"].last_activity -= 1000
+        registry["r1"].last_activity -= 1000
+        registry["r2"].last_activity -= 1000
+        registry.touch("r1")
+
+        assert registry.stale_run_ids(timeout_seconds=600) == ["r0", "r2"]
+
+        # Activity order is now r0, r2, r3, r1: the scan stops at r3
+        first_live, touched = registry["r3"], registry["r1"]
+        first_live.idle_seconds = MagicMock(return_value=0.0)
+        touched.idle_seconds = MagicMock(return_value=0.0)
+        registry.stale_run_ids(timeout_seconds=600)
+        first_live.idle_seconds.assert_called_once()
+        touched.idle_seconds.assert_not_called()
+
+
+class TestPooledAdapter:
+    """Test adapter routing over several connections."""
+
+    @pytest.mark.asyncio
+    async def test_runs_spread_over_connections(self):
+        """Concurrent sends are spread and each run is sent on its own connection."""
+        clients = [_client(), _client()]
+        adapter = OpenClawAdapter(OpenClawConnectionPool(clients))
+
+        run_a = await _send(adapter, "s1")
+        run_b = await _send(adapter, "s2")
+
+        assert adapter.pool.owner(run_a) == 0
+        assert adapter.pool.owner(run_b) == 1
+        clients[0].request.assert_awaited_once()
+        clients[1].request.assert_awaited_once()
+        assert adapter.get_run_id_for_session("s2") == run_b
+        assert adapter.get_active_run_ids(connection=1) == [run_b]
+
+    @pytest.mark.asyncio
+    async def test_broadcast_copies_from_other_connections_are_ignored(self):
+        """Only the owning connection's copy of a broadcast event is handled."""
+        clients = [_client(), _client()]
+        adapter = OpenClawAdapter(OpenClawConnectionPool(clients))
+        on_text_chunk = AsyncMock()
+        on_stream_end = AsyncMock()
+        run_id = await _send(adapter, "s1", on_text_chunk=on_text_chunk, on_stream_end=on_stream_end)
+        delta = {"event": "chat", "payload": {"runId": run_id, "state": "delta", "seq": 1, "message": "Hi"}}
+        final = {"event": "chat", "payload": {"runId": run_id, "state": "final", "message": "Hi there"}}
+
+        for connection in (1, 0):
+            await adapter.handle_event(delta, connection=connection)
+        await adapter.handle_event(final, connection=1)
+        assert adapter.active_stream_count == 1
+        await adapter.handle_event(final, connection=0)
+
+        on_text_chunk.assert_any_await("Hi")
+        on_stream_end.assert_awaited_once_with("s1", run_id, "Hi there")
+        assert adapter.active_stream_count == 0
+        assert adapter.pool.load(0) == 0
+
+    @pytest.mark.asyncio
+    async def test_abort_uses_owning_connection(self):
+        """chat.abort is sent on the connection that carries the run."""
+        clients = [_client(), _client()]
+        adapter = OpenClawAdapter(OpenClawConnectionPool(clients))
+        await _send(adapter, "s1")
+        run_id = await _send(adapter, "s2")
+
+        assert await adapter.abort(run_id) is True
+
+        method, params = clients[1].request.await_args.args
+        assert method == "chat.abort"
+        assert params["runId"] == run_id
+
+    @pytest.mark.asyncio
+    async def test_failed_send_releases_connection(self):
+        """A rejected chat.send frees the slot it was assigned to."""
+        client = _client()
+        client.request = AsyncMock(side_effect=RuntimeError("boom"))
+        adapter = OpenClawAdapter(OpenClawConnectionPool([client]))
+
+        with pytest.raises(RuntimeError):
+            await _send(adapter, "s1")
+
+        assert adapter.pool.load(0) == 0
+        assert adapter.get_run_id_for_session("s1") is None
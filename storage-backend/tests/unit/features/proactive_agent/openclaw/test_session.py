@@ -177,3 +177,64 @@ class TestCloseOpenClawSession:
         """close_openclaw_session handles no session gracefully."""
         # Should not raise
         await close_openclaw_session()
+
+
+class TestSessionManagerPool:
+    """Test pooled connections."""
+
+    @pytest.mark.asyncio
+    async def test_pool_connects_every_slot_and_tags_events(self, mock_config, tmp_path):
+        """Each slot gets its own client whose events carry the slot index."""
+        mock_config.keypair_path = str(tmp_path / "device.json")
+        mock_config.token_cache_path = str(tmp_path / "tokens.json")
+        mock_config.pool_size = 2
+        manager = OpenClawSessionManager(mock_config)
+
+        created = []
+
+        def make_client(**kwargs):
+            client = MagicMock()
+            client.connected = True
+            client.connect = AsyncMock(return_value="nonce")
+            client.handshake = AsyncMock(return_value={"server": {}})
+            client.callbacks = kwargs
+            created.append(client)
+            return client
+
+        with patch(
+            "features.proactive_agent.openclaw.session.OpenClawClient",
+            side_effect=make_client,
+        ):
+            adapter = await manager.get_adapter()
+
+        assert len(created) == 2
+        assert adapter.pool.client(1) is created[1]
+
+        adapter.handle_event = AsyncMock()
+        await created[1].callbacks["on_event"]({"event": "chat"})
+        adapter.handle_event.assert_awaited_once_with({"event": "chat"}, connection=1)
+
+    @pytest.mark.asyncio
+    async def test_disconnect_only_completes_streams_of_that_connection(self, mock_config):
+        """A dropped connection force-completes its own runs; others stay live."""
+        mock_config.pool_size = 2
+        manager = OpenClawSessionManager(mock_config)
+        for slot in range(2):
+            client = MagicMock()
+            client.connected = slot == 1
+            manager._pool.attach(slot, client)
+        manager._connected = True
+
+        mock_adapter = MagicMock()
+        mock_adapter.get_active_run_ids = MagicMock(return_value=["run-1"])
+        mock_adapter.force_complete_stream = AsyncMock(return_value=True)
+        manager._adapter = mock_adapter
+        manager._reconnect_loop = AsyncMock()
+
+        await manager._handle_disconnected(Exception("Connection lost"), connection=0)
+        await manager._reconnect_task
+
+        mock_adapter.get_active_run_ids.assert_called_once_with(0)
+        mock_adapter.force_complete_stream.assert_awaited_once_with("run-1", reason="disconnect")
+        assert manager.connected is True
+        manager._reconnect_loop.assert_awaited_once()
@@ -334,3 +334,28 @@ Between
         marker_types = {m.type for m in result.markers}
         assert MarkerType.SCENE in marker_types
         assert MarkerType.COMPONENT_UPDATE in marker_types
+
+    def test_markers_reported_grouped_by_type(self):
+        """Markers come back charts first, then research, scenes and updates."""
+        detector = MarkerDetector()
+        content = (
+            '[SHERLOCK_COMPONENT_UPDATE:v1]{"n": 1}[/SHERLOCK_COMPONENT_UPDATE]'
+            '[SHERLOCK_SCENE:v1]{"n": 2}[/SHERLOCK_SCENE]'
+            '[SHERLOCK_CHART:v1]{"n": 3}[/SHERLOCK_CHART]'
+            '[SHERLOCK_COMPONENT_UPDATE:v1]{"n": 4}[/SHERLOCK_COMPONENT_UPDATE]'
+        )
+
+        result = detector.detect(content)
+
+        assert [m.data["n"] for m in result.markers] == [3, 2, 1, 4]
+        assert result.cleaned_content == ""
+
+    def test_unclosed_marker_does_not_hide_later_markers(self):
+        """An unclosed marker of one type leaves other markers detectable."""
+        detector = MarkerDetector()
+        content = 'a[SHERLOCK_CHART:v1]{"x": 1} b[SHERLOCK_SCENE:v1]{"s": 1}[/SHERLOCK_SCENE]c'
+
+        result = detector.detect(content)
+
+        assert [m.type for m in result.markers] == [MarkerType.SCENE]
+        assert result.cleaned_content == 'a[SHERLOCK_CHART:v1]{"x": 1} bc'
@@ -8,6 +8,7 @@ from features.proactive_agent.poller_stream.ndjson_parser import (
     EventType,
     NDJSONLineParser,
     ParsedEvent,
+    coalesce_events,
 )
 
 
@@ -677,3 +678,34 @@ Output text'''
         assert len(update_events) == 2
         assert update_events[0].data["update_data"]["content"] == "Part 1 "
         assert update_events[1].data["update_data"]["content"] == "Part 2"
+
+
+class TestCoalesceEvents:
+    """Adjacent text/thinking deltas are merged before emitting."""
+
+    def test_merges_adjacent_chunks_and_preserves_order(self):
+        events = [
+            ParsedEvent(EventType.TEXT_CHUNK, {"content": "Hel"}),
+            ParsedEvent(EventType.TEXT_CHUNK, {"content": "lo"}),
+            ParsedEvent(EventType.TOOL_START, {"tool_name": "Bash"}),
+            ParsedEvent(EventType.THINKING_CHUNK, {"content": "a"}),
+            ParsedEvent(EventType.THINKING_CHUNK, {"content": "b"}),
+            ParsedEvent(EventType.TEXT_CHUNK, {"content": "!"}),
+        ]
+
+        merged = coalesce_events(events)
+
+        assert [e.type for e in merged] == [
+            EventType.TEXT_CHUNK,
+            EventType.TOOL_START,
+            EventType.THINKING_CHUNK,
+            EventType.TEXT_CHUNK,
+        ]
+        assert merged[0].data["content"] == "Hello"
+        assert merged[2].data["content"] == "ab"
+        assert events[0].data["content"] == "Hel"
+
+    def test_non_object_line_is_parse_error(self):
+        events = NDJSONLineParser().process_line("[1, 2]")
+
+        assert [e.type for e in events] == [EventType.PARSE_ERROR]
@@ -167,3 +167,20 @@ class TestThinkingParser:
         assert parser.get_accumulated_text() == ""
         assert parser.get_clean_text() == ""
         assert parser.get_accumulated_thinking() == ""
+
+    def test_stray_closing_tag_in_text_mode_is_text(self):
+        """A closing tag outside a thinking block is passed through as text."""
+        parser = ThinkingParser()
+        chunks = parser.process("a</thinking>b")
+
+        assert [(c.type, c.content) for c in chunks] == [(ChunkType.TEXT, "a</thinking>b")]
+
+    def test_tags_split_one_character_per_delta(self):
+        """Tags streamed a character at a time are still recognised."""
+        parser = ThinkingParser()
+        chunks = [c for ch in "x<thinking>deep</thinking>y" for c in parser.process(ch)]
+        chunks += parser.flush()
+
+        assert "".join(c.content for c in chunks if c.type == ChunkType.THINKING) == "deep"
+        assert "".join(c.content for c in chunks if c.type == ChunkType.TEXT) == "xy"
+        assert parser.get_accumulated_text() == "x<thinking>deep</thinking>y"
@@ -258,6 +258,54 @@ class TestPollerStreamSession:
         mock_ws.close.assert_called_once()
 
 
+class TestBatchedFrames:
+    """Frames may carry several NDJSON lines and are coalesced per batch."""
+
+    @staticmethod
+    def _delta(text: str) -> str:
+        return json.dumps({
+            "type": "stream_event",
+            "event": {"type": "content_block_delta", "delta": {"text": text}},
+        })
+
+    def _session(self):
+        init = InitMessage(
+            type="init",
+            user_id=1,
+            session_id="test",
+            ai_character_name="sherlock",
+            source="text",
+        )
+        return PollerStreamSession(AsyncMock(), init, AsyncMock())
+
+    @pytest.mark.asyncio
+    async def test_multi_line_frame_coalesces_text_deltas(self):
+        session = self._session()
+
+        await session.queue.put("\n".join(self._delta(t) for t in ("He", "ll", "o")))
+        await session.queue.put(self._delta(" there"))
+        await session.queue.put(None)
+        await session.consumer()
+
+        emitted = [call.args[0] for call in session.emitter.emit.await_args_list]
+        assert len(emitted) == 1
+        assert emitted[0].data["content"] == "Hello there"
+        assert session._chunk_count == 4
+
+    @pytest.mark.asyncio
+    async def test_complete_inside_batch_finalizes_after_flushing(self):
+        session = self._session()
+        session.emitter.finalize = AsyncMock()
+        complete = json.dumps({"type": "complete", "exit_code": 0})
+
+        await session.queue.put("\n".join([self._delta("Hi"), complete, self._delta("late")]))
+        await session.consumer()
+
+        emitted = [call.args[0] for call in session.emitter.emit.await_args_list]
+        assert [e.data["content"] for e in emitted] == ["Hi"]
+        assert session._completed
+
+
 class TestInitMessageSchema:
     """Tests for InitMessage Pydantic schema."""
 
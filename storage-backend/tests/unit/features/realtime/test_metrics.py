@@ -0,0 +1,108 @@
+"""Tests for bounded-cardinality realtime metrics and the recent-sessions buffer."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from core.auth import require_auth_context
+from features.admin.routes import router as admin_router
+from features.realtime import metrics
+from features.realtime.metrics import (
+    BoundedLabelValues,
+    RealtimeMetricsCollector,
+    RecentRealtimeSessions,
+)
+
+
+@pytest.fixture
+def recent(monkeypatch) -> RecentRealtimeSessions:
+    buffer = RecentRealtimeSessions(limit=3)
+    monkeypatch.setattr(metrics, "recent_sessions", buffer)
+    return buffer
+
+
+def test_collector_summarises_session_once(recent) -> None:
+    collector = RealtimeMetricsCollector(session_id="s1", customer_id=7, provider="openai", model="gpt-realtime")
+    collector.start_turn()
+    collector.end_turn()
+    collector.record_audio_received(320)
+    collector.record_audio_sent(640)
+    collector.record_audio_sent(0)
+
+    collector.cleanup()
+    collector.cleanup()  # error path and session closer both call cleanup
+
+    assert len(recent) == 1
+    (summary,) = recent.snapshot()
+    assert summary["session_id"] == "s1" and summary["customer_id"] == 7
+    assert (summary["turns"], summary["audio_bytes_received"], summary["audio_bytes_sent"]) == (1, 320, 640)
+    assert summary["outcome"] == "completed"
+    assert summary["ended_at"] is not None
+
+
+def test_outcome_reflects_errors_and_empty_sessions(recent) -> None:
+    failed = RealtimeMetricsCollector(session_id="s1", customer_id=1)
+    failed.record_error("connection_failed")
+    failed.cleanup()
+    RealtimeMetricsCollector(session_id="s2", customer_id=2).cleanup()
+
+    newest, oldest = recent.snapshot()
+    assert (newest["session_id"], newest["outcome"]) == ("s2", "no_turns")
+    assert oldest["errors"] == {"connection_failed": 1} and oldest["outcome"] == "error"
+    assert oldest["provider"] == oldest["model"] == "unknown"
+
+
+def test_ring_buffer_is_bounded(recent) -> None:
+    for index in range(5):
+        RealtimeMetricsCollector(session_id=f"s{index}", customer_id=index % 2).cleanup()
+
+    assert [item["session_id"] for item in recent.snapshot()] == ["s4", "s3", "s2"]
+    assert [item["session_id"] for item in recent.snapshot(customer_id=1)] == ["s3"]
+    assert len(recent.snapshot(limit=1)) == 1
+
+
+def test_label_values_are_bounded() -> None:
+    labels = BoundedLabelValues(limit=2)
+    assert labels("GPT-Realtime ") == "gpt-realtime"
+    assert labels(None) == "unknown"
+    assert labels("client-invented-model") == "other"
+    assert labels("gpt-realtime") == "gpt-realtime"
+
+
+async def _get_recent(auth: dict, **params) -> Any:
+    app = FastAPI()
+    app.include_router(admin_router, prefix="/api/v1")
+    app.dependency_overrides[require_auth_context] = lambda: auth
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        return await client.get("/api/v1/admin/realtime/sessions/recent", params={"limit": 10, **params})
+
+
+@pytest.mark.asyncio
+async def test_recent_sessions_admin_endpoint(recent) -> None:
+    RealtimeMetricsCollector(session_id="s1", customer_id=5, provider="google", model="gemini-live").cleanup()
+    RealtimeMetricsCollector(session_id="s2", customer_id=6, provider="openai", model="gpt-realtime").cleanup()
+
+    response = await _get_recent({"customer_id": 5, "payload": {}})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["capacity"] == 3
+    assert [item["session_id"] for item in body["sessions"]] == ["s1"]
+    assert body["sessions"][0]["provider"] == "google"
+
+
+@pytest.mark.asyncio
+async def test_recent_sessions_of_other_customers_require_admin(recent) -> None:
+    RealtimeMetricsCollector(session_id="s1", customer_id=5, provider="google", model="gemini-live").cleanup()
+    RealtimeMetricsCollector(session_id="s2", customer_id=6, provider="openai", model="gpt-realtime").cleanup()
+    user = {"customer_id": 5, "payload": {}}
+    admin = {"customer_id": 1, "payload": {"role": "admin"}}
+
+    assert (await _get_recent(user, customer_id=6)).status_code == 403
+    assert (await _get_recent(user, all_customers="true")).status_code == 403
+    assert [item["session_id"] for item in (await _get_recent(admin, customer_id=6)).json()["sessions"]] == ["s2"]
+    assert len((await _get_recent(admin, all_customers="true")).json()["sessions"]) == 2
@@ -14,6 +14,7 @@ from features.tts.schemas.requests import (
     TTSUserInput,
     TTSUserSettings,
 )
+from features.tts.cache import CachedTTSResult, TTSResultCache, cache_storage_key, tts_cache_key
 from features.tts.service import TTSService
 
 
@@ -61,6 +62,7 @@ class FakeProvider:
 class FakeStorage:
     def __init__(self) -> None:
         self.uploads: list[tuple[bytes, int, str, str | None]] = []
+        self.keys: list[str | None] = []
 
     async def upload_audio(
         self,
@@ -69,8 +71,10 @@ class FakeStorage:
         customer_id: int,
         file_extension: str,
         content_type: str | None = None,
+        key: str | None = None,
     ) -> str:
         self.uploads.append((audio_bytes, customer_id, file_extension, content_type))
+        self.keys.append(key)
         return f"https://s3.example/{customer_id}/tts.{file_extension}"
 
 
@@ -205,18 +209,121 @@ async def test_stream_text_emits_audio_events() -> None:
     assert "tts_completed" in event_types
     assert "tts_file_uploaded" in event_types
 
-    expected_chunks = [
-        base64.b64encode(f"audio-1-0".encode()).decode(),
-        base64.b64encode(f"audio-1-1".encode()).decode(),
-    ]
-    assert manager.results["audio_chunks"] == expected_chunks
+    expected_chunks = [b"audio-1-0", b"audio-1-1"]
+    audio_events = [event for event in events if event.get("type") == "audio_chunk"]
+    assert [event["content"] for event in audio_events] == expected_chunks
+    # The TTS accumulator is the only copy of the audio; the manager no longer buffers it.
+    assert manager.results["audio_chunks"] == []
     assert metadata.audio_chunk_count == len(expected_chunks)
     assert "tts_first_response_time" in timings
     assert metadata.audio_file_url is not None
     assert metadata.audio_file_url.startswith("data:audio/")
+    encoded = metadata.audio_file_url.split("base64,", 1)[1]
+    assert base64.b64decode(encoded).endswith(b"".join(expected_chunks))
     assert metadata.storage_metadata is not None
 
 
+def test_generate_serves_repeat_request_from_cache():
+    provider = FakeProvider()
+    storage = FakeStorage()
+
+    service = TTSService(
+        provider_resolver=lambda _: provider,
+        storage_service_factory=lambda: storage,
+        cache=TTSResultCache(),
+    )
+
+    request = TTSGenerateRequest(
+        action=TTSAction.TTS_NO_STREAM,
+        user_input=TTSUserInput(text="Good morning!"),
+        user_settings=TTSUserSettings(
+            general=TTSGeneralSettings(),
+            tts=TTSProviderSettings(model="gpt-4o-mini-tts", format="pcm"),
+        ),
+        customer_id=42,
+    )
+
+    first = asyncio.run(service.generate(request))
+    second = asyncio.run(service.generate(request))
+
+    assert len(provider.calls) == 1
+    assert len(storage.uploads) == 1
+    assert storage.keys[0] is not None and storage.keys[0].startswith("42/assets/tts/cache/")
+    assert second.result == first.result
+    assert second.metadata["cache_hit"] is True
+    assert "cache_hit" not in first.metadata
+
+
+def test_generate_treats_cache_entry_without_audio_as_miss():
+    class UrlOnlyCache(TTSResultCache):
+        def get(self, key, *, need_url=False, need_audio=False):
+            return _entry(key, url="https://s3/cached.mp3")
+
+    provider = FakeProvider()
+    service = TTSService(
+        provider_resolver=lambda _: provider,
+        storage_service_factory=FakeStorage,
+        cache=UrlOnlyCache(),
+    )
+    request = TTSGenerateRequest(
+        action=TTSAction.TTS_NO_STREAM,
+        user_input=TTSUserInput(text="Good morning!"),
+        user_settings=TTSUserSettings(
+            general=TTSGeneralSettings(save_to_s3=False),
+            tts=TTSProviderSettings(model="gpt-4o-mini-tts", format="pcm"),
+        ),
+        customer_id=42,
+    )
+
+    result = asyncio.run(service.generate(request))
+
+    assert len(provider.calls) == 1
+    assert result.result.startswith("data:audio/wav;base64,")
+    assert "cache_hit" not in result.metadata
+
+
+@pytest.mark.anyio("asyncio")
+async def test_stream_text_replays_cached_clip_without_provider() -> None:
+    provider = FakeProvider()
+    service = TTSService(
+        provider_resolver=lambda _: provider,
+        storage_service_factory=FakeStorage,
+        cache=TTSResultCache(),
+    )
+    settings = TTSUserSettings(
+        general=TTSGeneralSettings(save_to_s3=False),
+        tts=TTSProviderSettings(model="gpt-4o-mini-tts", format="mp3", streaming=True),
+    )
+
+    async def _stream() -> list[dict[str, object]]:
+        manager = StreamingManager()
+        queue: asyncio.Queue = asyncio.Queue()
+        manager.add_queue(queue)
+        await service.stream_text(
+            text="hello again",
+            customer_id=9,
+            user_settings=settings,
+            manager=manager,
+            timings={},
+        )
+        items = []
+        while not queue.empty():
+            item = await queue.get()
+            if isinstance(item, dict):
+                items.append(item)
+        return items
+
+    await _stream()
+    replayed = await _stream()
+
+    assert len(provider.stream_calls) == 1
+    started = next(event for event in replayed if event.get("type") == "tts_started")
+    assert started["content"]["cached"] is True
+    audio = b"".join(event["content"] for event in replayed if event.get("type") == "audio_chunk")
+    assert audio == b"audio-1-0audio-1-1"
+    assert any(event.get("type") == "tts_file_uploaded" for event in replayed)
+
+
 class FailingStreamProvider(FakeProvider):
     def get_websocket_format(self) -> str:
         return "pcm"
@@ -290,3 +397,101 @@ async def test_stream_http_returns_iterator() -> None:
 
     chunks = [chunk async for chunk in iterator]
     assert chunks  # ensure audio yielded
+
+
+def test_prewarm_stream_opens_provider_connection_with_stream_arguments():
+    class PrewarmingProvider(FakeProvider):
+        supports_input_stream = True
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.prewarmed: list[dict[str, object]] = []
+
+        def prewarm_stream(self, **kwargs: object) -> None:
+            self.prewarmed.append(kwargs)
+
+    provider = PrewarmingProvider()
+    service = TTSService(provider_resolver=lambda _: provider, storage_service_factory=FakeStorage)
+    settings = TTSUserSettings(
+        general=TTSGeneralSettings(),
+        tts=TTSProviderSettings(provider="elevenlabs", voice="sarah", model="eleven_turbo_v2"),
+    )
+
+    assert service.prewarm_stream(settings) is True
+    assert provider.prewarmed == [
+        {"voice": "sarah", "model": "eleven_turbo_v2", "audio_format": provider.get_websocket_format()}
+    ]
+
+    assert TTSService(provider_resolver=lambda _: FakeProvider()).prewarm_stream(settings) is False
+
+
+def _key(**overrides):
+    params = {
+        "text": "Hello there",
+        "customer_id": 1,
+        "provider": "elevenlabs",
+        "model": "eleven_flash_v2_5",
+        "voice": "Sherlock",
+        "audio_format": "mp3",
+        "settings": {"stability": 0.5, "streaming": False},
+    }
+    params.update(overrides)
+    return tts_cache_key(**params)
+
+
+def _entry(key: str, *, audio: bytes | None = None, url: str | None = None) -> CachedTTSResult:
+    return CachedTTSResult(
+        key=key,
+        provider="elevenlabs",
+        model="eleven_flash_v2_5",
+        voice="Sherlock",
+        audio_format="mp3",
+        chunk_count=1,
+        url=url,
+        audio=audio,
+    )
+
+
+def test_cache_key_ignores_delivery_settings_only():
+    base = _key()
+
+    assert _key(settings={"streaming": True, "stability": 0.5}) == base
+    assert _key(audio_format="MP3") == base
+    assert _key(settings={"stability": 0.7}) != base
+    assert _key(voice="Other") != base
+    assert _key(customer_id=2) != base
+    assert _key(text="Hello there!") != base
+    assert cache_storage_key(customer_id=1, key=base, extension="mp3") == f"1/assets/tts/cache/{base}.mp3"
+
+
+def test_get_requires_requested_payload():
+    cache = TTSResultCache()
+    cache.put(_entry("a", url="https://s3/a.mp3"))
+
+    assert cache.get("a", need_url=True) is not None
+    assert cache.get("a", need_audio=True) is None
+
+    cache.put(_entry("a", audio=b"clip"))
+    entry = cache.get("a", need_url=True, need_audio=True)
+    assert entry is not None
+    assert entry.url == "https://s3/a.mp3"
+    assert entry.audio == b"clip"
+
+
+def test_lru_eviction_and_audio_budget():
+    cache = TTSResultCache(max_entries=2, max_clip_bytes=4, max_audio_bytes=6)
+    cache.put(_entry("a", audio=b"aaaa", url="u-a"))
+    cache.put(_entry("b", audio=b"bbbb", url="u-b"))
+
+    # "b" pushed the audio total past the budget, so the older clip was dropped.
+    assert cache.audio_bytes == 4
+    assert cache.get("a", need_audio=True) is None
+    assert cache.get("a", need_url=True) is not None
+
+    cache.put(_entry("c", url="u-c"))
+    assert len(cache) == 2
+    assert cache.get("b") is None  # least recently used after "a" was read
+    assert cache.audio_bytes == 0
+
+    cache.put(_entry("d", audio=b"too long"))
+    assert cache.get("d").audio is None
@@ -0,0 +1,80 @@
+from typing import Any, AsyncIterator
+
+import pytest
+
+from core.exceptions import ServiceError
+from infrastructure.aws.storage import MIN_MULTIPART_PART_SIZE, StorageService
+
+
+class DummyS3Client:
+    def __init__(self) -> None:
+        self.parts: list[int] = []
+        self.completed: dict[str, Any] | None = None
+        self.aborted = False
+
+    def create_multipart_upload(self, **kwargs: Any) -> dict[str, Any]:
+        return {"UploadId": "upload-1"}
+
+    def upload_part(self, **kwargs: Any) -> dict[str, Any]:
+        self.parts.append(len(kwargs["Body"]))
+        return {"ETag": f"etag-{kwargs['PartNumber']}"}
+
+    def complete_multipart_upload(self, **kwargs: Any) -> None:
+        self.completed = kwargs
+
+    def abort_multipart_upload(self, **kwargs: Any) -> None:
+        self.aborted = True
+
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+async def _chunks(sizes: list[int], *, fail_after: int | None = None) -> AsyncIterator[bytes]:
+    for index, size in enumerate(sizes):
+        if fail_after is not None and index == fail_after:
+            raise RuntimeError("provider stream dropped")
+        yield b"x" * size
+
+
+async def test_stream_upload_buffers_chunks_into_parts():
+    client = DummyS3Client()
+    service = StorageService(bucket_name="bucket", s3_client=client)
+    megabyte = 1024 * 1024
+
+    url = await service.upload_video_stream(
+        chunks=_chunks([3 * megabyte, 3 * megabyte, 3 * megabyte]),
+        customer_id=7,
+        part_size=MIN_MULTIPART_PART_SIZE,
+    )
+
+    assert url.startswith("https://bucket.s3")
+    assert client.parts == [MIN_MULTIPART_PART_SIZE, 9 * megabyte - MIN_MULTIPART_PART_SIZE]
+    assert client.completed is not None
+    assert [part["PartNumber"] for part in client.completed["MultipartUpload"]["Parts"]] == [1, 2]
+    assert not client.aborted
+
+
+async def test_stream_upload_aborts_when_source_fails():
+    client = DummyS3Client()
+    service = StorageService(bucket_name="bucket", s3_client=client)
+
+    with pytest.raises(RuntimeError):
+        await service.upload_video_stream(chunks=_chunks([10, 10], fail_after=1), customer_id=7)
+
+    assert client.aborted
+    assert client.completed is None
+
+
+async def test_stream_upload_rejects_empty_stream():
+    client = DummyS3Client()
+    service = StorageService(bucket_name="bucket", s3_client=client)
+
+    with pytest.raises(ServiceError):
+        await service.upload_video_stream(chunks=_chunks([]), customer_id=7)
+
+    assert client.aborted
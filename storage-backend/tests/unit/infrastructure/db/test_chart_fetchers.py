@@ -0,0 +1,178 @@
+"""Tests for the chart data fetchers, their aggregation and cache."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from core.pydantic_schemas import ChartData, DataQuery, DataSource, Dataset, TimeRange
+from infrastructure.db.fetchers import BloodDataFetcher, GarminDataFetcher, blood, garmin
+from infrastructure.db.fetchers import base as fetchers_base
+from infrastructure.db.fetchers import cache as fetchers_cache
+from infrastructure.db.fetchers.aggregation import SeriesFrame, aggregate_frame
+from infrastructure.db.fetchers.cache import ChartDataCache, invalidate_after_commit
+
+TODAY = datetime.utcnow().date()
+
+
+def _day(offset: int) -> date:
+    return TODAY - timedelta(days=offset)
+
+
+@pytest.fixture
+async def database(monkeypatch: pytest.MonkeyPatch):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    statements: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):  # noqa: ANN001
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE get_user_summary (calendar_date DATE, total_steps INT, resting_heart_rate INT,"
+            " total_kilocalories INT)"
+        ))
+        await conn.execute(text("CREATE TABLE get_sleep_data (calendar_date DATE, sleep_time_seconds INT)"))
+        await conn.execute(text("CREATE TABLE test_definitions (id INT, test_name TEXT)"))
+        await conn.execute(text(
+            "CREATE TABLE blood_tests (test_definition_id INT, test_date DATE, result_value REAL, result_unit TEXT)"
+        ))
+        for offset in range(3):
+            await conn.execute(
+                text("INSERT INTO get_user_summary VALUES (:d, :steps, :rhr, NULL)"),
+                {"d": _day(offset), "steps": 1000 * (offset + 1), "rhr": 50 + offset},
+            )
+        await conn.execute(text("INSERT INTO get_sleep_data VALUES (:d, 7200)"), {"d": _day(1)})
+        await conn.execute(text("INSERT INTO test_definitions VALUES (1, 'Glucose'), (2, 'Ferritin')"))
+        for offset in range(3):
+            await conn.execute(
+                text("INSERT INTO blood_tests VALUES (1, :d, :v, 'mg/dL')"), {"d": _day(10 * offset), "v": 90 + offset}
+            )
+        await conn.execute(text("INSERT INTO blood_tests VALUES (2, :d, 120, NULL)"), {"d": _day(10)})
+
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    monkeypatch.setattr(garmin, "require_garmin_session_factory", lambda: factory)
+    monkeypatch.setattr(blood, "require_blood_session_factory", lambda: factory)
+    yield factory, statements
+    await engine.dispose()
+
+
+@pytest.fixture
+def cache(monkeypatch: pytest.MonkeyPatch) -> ChartDataCache:
+    chart_cache = ChartDataCache(ttl_seconds=60, max_entries=8)
+    monkeypatch.setattr(fetchers_cache, "chart_data_cache", chart_cache)
+    monkeypatch.setattr(fetchers_base, "get_chart_data_cache", lambda: chart_cache)
+    return chart_cache
+
+
+def _query(source: DataSource, metric: str, *metrics: str, **kwargs) -> DataQuery:
+    return DataQuery(
+        source=source,
+        metric=metric,
+        metrics=list(metrics) or None,
+        time_range=TimeRange(last_n_days=30),
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_garmin_reads_each_table_once(database) -> None:
+    _, statements = database
+
+    data = await GarminDataFetcher().fetch(
+        _query(DataSource.GARMIN, "steps", "sleep_hours", "resting_heart_rate", "calories")
+    )
+
+    assert len(statements) == 2
+    assert data.labels == [_day(2).isoformat(), _day(1).isoformat(), _day(0).isoformat()]
+    assert [dataset.label for dataset in data.datasets] == ["Steps", "Sleep Hours", "Resting Heart Rate", "Calories"]
+    assert data.datasets[0].data == [3000.0, 2000.0, 1000.0]
+    assert data.datasets[1].data == [0.0, 2.0, 0.0]
+    assert data.datasets[2].data == [52.0, 51.0, 50.0]
+    assert data.datasets[3].data == [0.0, 0.0, 0.0]
+
+
+@pytest.mark.asyncio
+async def test_garmin_rolling_average(database) -> None:
+    data = await GarminDataFetcher().fetch(_query(DataSource.GARMIN, "steps", aggregation="rolling_2d"))
+
+    assert data.datasets[0].data == [3000.0, 2500.0, 1500.0]
+
+
+@pytest.mark.asyncio
+async def test_garmin_rejects_unknown_extra_metric(database) -> None:
+    with pytest.raises(ValueError, match="Unknown Garmin metric 'nope'"):
+        await GarminDataFetcher().fetch(_query(DataSource.GARMIN, "steps", "nope"))
+
+
+@pytest.mark.asyncio
+async def test_blood_fetches_tests_in_one_query_with_per_test_limit(database) -> None:
+    _, statements = database
+
+    data = await BloodDataFetcher().fetch(_query(DataSource.BLOOD, "glucose", "ferritin", limit=2))
+
+    assert len(statements) == 1
+    assert data.labels == [_day(20).isoformat(), _day(10).isoformat()]
+    assert data.datasets[0].label == "Glucose (mg/dL)"
+    assert data.datasets[0].data == [92.0, 91.0]
+    assert data.datasets[1].label == "Ferritin"
+    assert data.datasets[1].data == [0.0, 120.0]
+
+
+def test_weekly_and_monthly_buckets_use_iso_weeks() -> None:
+    days = np.array(["2024-12-29", "2024-12-30", "2025-01-05", "2025-01-06"], dtype="datetime64[D]")
+    frame = SeriesFrame(days=days, values=np.array([[1.0], [2.0], [4.0], [8.0]]))
+
+    assert aggregate_frame(frame, "weekly")[0] == ["2024-W52", "2025-W01", "2025-W02"]
+    assert aggregate_frame(frame, "weekly")[1][:, 0].tolist() == [1.0, 3.0, 8.0]
+    assert aggregate_frame(frame, "monthly")[0] == ["2024-12", "2025-01"]
+    assert aggregate_frame(frame, "monthly")[1][:, 0].tolist() == [1.5, 6.0]
+
+
+@pytest.mark.asyncio
+async def test_cached_charts_are_dropped_when_ingestion_commits(database, cache) -> None:
+    factory, statements = database
+    fetcher = GarminDataFetcher()
+    query = _query(DataSource.GARMIN, "steps")
+
+    first = await fetcher.fetch_cached(query, customer_id=1)
+    first.datasets[0].data[0] = -1.0
+    second = await fetcher.fetch_cached(query, customer_id=1)
+    assert len(statements) == 1
+    assert second.datasets[0].data[0] == 3000.0
+
+    await fetcher.fetch_cached(query, customer_id=2)
+    assert len(statements) == 2
+
+    async with factory() as session:
+        await session.execute(text("INSERT INTO get_user_summary VALUES (:d, 5, 5, 5)"), {"d": _day(3)})
+        invalidate_after_commit(session, DataSource.GARMIN)
+        # Reads during the write may still see old rows; they are dropped on commit
+        await fetcher.fetch_cached(query, customer_id=1)
+        await session.commit()
+    assert len(cache) == 0
+
+    refreshed = await fetcher.fetch_cached(query, customer_id=1)
+    assert refreshed.datasets[0].data[0] == 5.0
+
+
+def test_cache_rejects_results_started_before_invalidation() -> None:
+    chart_cache = ChartDataCache(ttl_seconds=60, max_entries=2)
+    data = ChartData(labels=["a"], datasets=[Dataset(label="x", data=[1.0])])
+    generation = chart_cache.generation(DataSource.GARMIN)
+
+    chart_cache.invalidate(DataSource.GARMIN)
+    chart_cache.put((DataSource.GARMIN, "stale"), data, generation=generation)
+    chart_cache.put((DataSource.BLOOD, "k1"), data, generation=0)
+    chart_cache.put((DataSource.BLOOD, "k2"), data, generation=0)
+    chart_cache.put((DataSource.BLOOD, "k3"), data, generation=0)
+
+    assert chart_cache.get((DataSource.GARMIN, "stale")) is None
+    assert chart_cache.get((DataSource.BLOOD, "k1")) is None
+    assert chart_cache.get((DataSource.BLOOD, "k3")) is not None